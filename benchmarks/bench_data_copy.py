@@ -0,0 +1,64 @@
+"""Time of :meth:`compas.data.Data.copy` for data structures and geometry primitives.
+
+The direct copy of the internal state (:meth:`Data.__copy_state__`) is compared
+with the reconstruction from a deep copy of the data of the object.
+
+Usage
+-----
+python benchmarks/bench_data_copy.py [N]
+
+with N the number of faces in the X and Y direction of the mesh grid (default 100).
+
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+from copy import deepcopy
+
+from compas.datastructures import CellNetwork
+from compas.datastructures import Graph
+from compas.datastructures import Mesh
+from compas.datastructures import VolMesh
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Polygon
+
+
+def from_data(obj):
+    return type(obj).__from_data__(deepcopy(obj.__data__))
+
+
+def best(func, number, repeat=3):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main(n=100):
+    mesh = Mesh.from_meshgrid(dx=10, nx=n)
+    compact = Mesh.from_vertices_and_faces(*mesh.to_vertices_and_faces(), compact=True)
+    graph = Graph.from_lines([(mesh.vertex_coordinates(u), mesh.vertex_coordinates(v)) for u, v in mesh.edges()])
+    volmesh = VolMesh.from_meshgrid(dx=10, nx=n // 10, ny=n // 10, nz=n // 10)
+    cellnetwork = CellNetwork.from_vertices_and_cells(*volmesh.to_vertices_and_cells())
+
+    objects = [
+        ("Mesh", mesh, 3),
+        ("Mesh (compact)", compact, 3),
+        ("Graph", graph, 3),
+        ("VolMesh", volmesh, 3),
+        ("CellNetwork", cellnetwork, 3),
+        ("Point", Point(1, 2, 3), 10000),
+        ("Frame", Frame([1, 2, 3], [1, 0, 0], [0, 1, 0]), 10000),
+        ("Polygon", Polygon([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]), 10000),
+    ]
+
+    print("{:<16}{:>16}{:>16}{:>10}".format("type", "from data [s]", "copy [s]", "speedup"))
+
+    for name, obj, number in objects:
+        t0 = best(lambda: from_data(obj), number)
+        t1 = best(lambda: obj.copy(), number)
+        print("{:<16}{:>16.6f}{:>16.6f}{:>10.1f}".format(name, t0, t1, t0 / t1))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:]])
@@ -0,0 +1,44 @@
+"""Size and speed of the JSON and binary serialization of :class:`compas.datastructures.Mesh`.
+
+Usage
+-----
+python benchmarks/bench_data_serialization.py [N [N ...]]
+
+with N the number of faces in the X and Y direction of the grids (default 100 300 500).
+
+"""
+
+from __future__ import print_function
+
+import random
+import sys
+import timeit
+
+import compas
+from compas.data import binary_dumps
+from compas.data import binary_loads
+from compas.datastructures import Mesh
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(sizes):
+    print("{:>10}{:>8}{:>12}{:>12}{:>12}".format("vertices", "format", "size [MB]", "dump [s]", "load [s]"))
+
+    for n in sizes:
+        mesh = Mesh.from_meshgrid(dx=10, nx=n)
+        # full precision coordinates, as in most real meshes
+        for vertex in mesh.vertices():
+            mesh.vertex_attribute(vertex, "z", random.random())
+
+        for name, dumps, loads in (("json", compas.json_dumps, compas.json_loads), ("binary", binary_dumps, binary_loads)):
+            data = dumps(mesh)
+            t0 = best(lambda: dumps(mesh))
+            t1 = best(lambda: loads(data))
+            print("{:>10}{:>8}{:>12.2f}{:>12.3f}{:>12.3f}".format(mesh.number_of_vertices(), name, len(data) / 1e6, t0, t1))
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [100, 300, 500])
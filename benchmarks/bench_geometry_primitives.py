@@ -0,0 +1,78 @@
+"""Time of the construction of and arithmetic with geometry primitives, and their memory per instance.
+
+The memory per instance is the memory allocated for a list of instances, divided by the number of instances,
+including the memory of the coordinates and of the components of the instances.
+
+Usage
+-----
+python benchmarks/bench_geometry_primitives.py [N]
+
+with N the number of instances (default 100000).
+
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+import tracemalloc
+
+from compas.colors import Color
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Quaternion
+from compas.geometry import Vector
+
+
+def best(func, number=1, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def memory(func):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = func()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(objects)
+
+
+def main(n=100000):
+    values = [(float(i), i + 0.5, i + 0.25) for i in range(n)]
+    integers = [(i, i + 1, i + 2) for i in range(n)]
+    colors = [(i / n, 0.5, 0.25) for i in range(n)]
+    frames = [(Point(*xyz), Vector(1.0, 0.0, 0.0), Vector(0.0, 1.0, 0.0)) for xyz in values[: n // 10]]
+
+    constructors = [
+        ("Point(float)", lambda: [Point(x, y, z) for x, y, z in values], n),
+        ("Point(int)", lambda: [Point(x, y, z) for x, y, z in integers], n),
+        ("Vector(float)", lambda: [Vector(x, y, z) for x, y, z in values], n),
+        ("Quaternion(float)", lambda: [Quaternion(1.0, x, y, z) for x, y, z in values], n),
+        ("Color(float)", lambda: [Color(r, g, b) for r, g, b in colors], n),
+        ("Frame", lambda: [Frame(*args) for args in frames], n // 10),
+    ]
+
+    print("{:<20}{:>16}{:>16}".format("construction", "time [us]", "memory [B]"))
+    for label, func, count in constructors:
+        print("{:<20}{:>16.3f}{:>16.1f}".format(label, 1e6 * best(func) / count, memory(func)))
+
+    points = [Point(x, y, z) for x, y, z in values]
+    vectors = [Vector(x, y, z) for x, y, z in values]
+
+    operations = [
+        ("Point + Vector", lambda: [a + b for a, b in zip(points, vectors)]),
+        ("Vector + Vector", lambda: [a + b for a, b in zip(vectors, vectors)]),
+        ("Point - Point", lambda: [a - b for a, b in zip(points, points)]),
+        ("Vector * float", lambda: [a * 2.0 for a in vectors]),
+        ("Vector.cross", lambda: [a.cross(b) for a, b in zip(vectors, vectors)]),
+        ("Vector.dot", lambda: [a.dot(b) for a, b in zip(vectors, vectors)]),
+    ]
+
+    print()
+    print("{:<20}{:>16}".format("arithmetic", "time [us]"))
+    for label, func in operations:
+        print("{:<20}{:>16.3f}".format(label, 1e6 * best(func) / n))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:]])
@@ -0,0 +1,83 @@
+"""Time of the search for crossing edges in random (nearly) planar graphs.
+
+The graphs are the edges of a grid of randomly perturbed points,
+with a few additional random edges that cross some of the grid edges.
+The search with a uniform grid of buckets (:func:`compas.geometry.intersection_segments_segments_xy`)
+is compared with testing all pairs of edges, for the smaller graphs.
+
+Usage
+-----
+python benchmarks/bench_graph_crossings.py [N]
+
+with N the maximum number of points in the X and Y direction of the grid (default 160).
+
+"""
+
+from __future__ import print_function
+
+import random
+import sys
+import timeit
+from itertools import combinations
+
+from compas.datastructures import Graph
+from compas.geometry._core.predicates_2 import is_intersection_segment_segment_xy
+
+
+def random_graph(n):
+    graph = Graph()
+    for i in range(n):
+        for j in range(n):
+            graph.add_node(i * n + j, x=i + random.uniform(-0.3, 0.3), y=j + random.uniform(-0.3, 0.3), z=0.0)
+    for i in range(n):
+        for j in range(n):
+            if i + 1 < n:
+                graph.add_edge(i * n + j, (i + 1) * n + j)
+            if j + 1 < n:
+                graph.add_edge(i * n + j, i * n + j + 1)
+    for _ in range(n):
+        i, j = random.randrange(n - 1), random.randrange(n - 1)
+        graph.add_edge(i * n + j, (i + 1) * n + j + 1)
+        graph.add_edge((i + 1) * n + j, i * n + j + 1)
+    return graph
+
+
+def find_crossings_pairwise(graph):
+    crossings = []
+    for (u1, v1), (u2, v2) in combinations(list(graph.edges()), 2):
+        if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
+            continue
+        a = graph.node_attributes(u1, "xy")
+        b = graph.node_attributes(v1, "xy")
+        c = graph.node_attributes(u2, "xy")
+        d = graph.node_attributes(v2, "xy")
+        if is_intersection_segment_segment_xy((a, b), (c, d)):
+            crossings.append(((u1, v1), (u2, v2)))
+    return crossings
+
+
+def best(func, number=1, repeat=3):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main(n=160):
+    random.seed(0)
+
+    print("{:>10}{:>12}{:>16}{:>16}".format("edges", "crossings", "pairwise [s]", "grid [s]"))
+
+    size = 10
+    while size <= n:
+        graph = random_graph(size)
+        crossings = graph.find_crossings()
+        t1 = best(lambda: graph.find_crossings())
+        if size <= 20:
+            assert len(find_crossings_pairwise(graph)) == len(crossings)
+            t0 = "{:>16.4f}".format(best(lambda: find_crossings_pairwise(graph), repeat=1))
+        else:
+            t0 = "{:>16}".format("-")
+        print("{:>10}{:>12}{}{:>16.4f}".format(graph.number_of_edges(), len(crossings), t0, t1))
+        size *= 2
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:]])
@@ -0,0 +1,54 @@
+"""Import time of the COMPAS packages.
+
+Every import statement is timed in a fresh interpreter.
+The submodules of the packages are imported lazily,
+and the last measurement loads all public attributes of the packages,
+which corresponds to importing all submodules immediately.
+
+Usage
+-----
+python benchmarks/bench_import.py [N]
+
+with N the number of repetitions of every measurement (default 5).
+
+"""
+
+from __future__ import print_function
+
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import compas",
+    "import compas.colors",
+    "import compas.files",
+    "import compas.geometry",
+    "import compas.datastructures",
+    "from compas.geometry import Point",
+    "from compas.datastructures import Mesh",
+]
+
+EAGER = "; ".join(["import compas.{0}; [getattr(compas.{0}, name) for name in dir(compas.{0})]".format(package) for package in ["colors", "files", "geometry", "datastructures"]])
+
+TEMPLATE = "import time; t0 = time.perf_counter(); {}; print(time.perf_counter() - t0)"
+
+
+def best(statement, repeat):
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", TEMPLATE.format(statement)])
+        times.append(float(output))
+    return min(times)
+
+
+def main(repeat=5):
+    print("{:<42}{:>12}".format("statement", "time [s]"))
+
+    for statement in STATEMENTS:
+        print("{:<42}{:>12.3f}".format(statement, best(statement, repeat)))
+
+    print("{:<42}{:>12.3f}".format("(all public attributes)", best(EAGER, repeat)))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:]])
@@ -0,0 +1,62 @@
+"""Construction time of :class:`compas.datastructures.Mesh` from vertices and faces, and from data.
+
+The bulk construction routines are compared with the incremental construction
+through repeated calls to :meth:`Mesh.add_vertex` and :meth:`Mesh.add_face`.
+
+Usage
+-----
+python benchmarks/bench_mesh_construction.py [N [N ...]]
+
+with N the number of faces in the X and Y direction of the grids (default 100 300 500).
+
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from compas.datastructures import Mesh
+
+
+def incremental_from_vertices_and_faces(vertices, faces):
+    mesh = Mesh()
+    for x, y, z in vertices:
+        mesh.add_vertex(x=x, y=y, z=z)
+    for face in faces:
+        mesh.add_face(face)
+    return mesh
+
+
+def incremental_from_data(data):
+    mesh = Mesh()
+    for key, attr in data["vertex"].items():
+        mesh.add_vertex(key=key, attr_dict=attr)
+    for fkey, vertices in data["face"].items():
+        mesh.add_face(vertices, fkey=fkey, attr_dict=data["facedata"].get(fkey))
+    return mesh
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(sizes):
+    print("{:>10}{:>16}{:>12}{:>12}{:>16}{:>12}".format("faces", "incremental [s]", "bulk [s]", "trusted [s]", "from data [s]", "bulk [s]"))
+
+    for n in sizes:
+        grid = Mesh.from_meshgrid(dx=10, nx=n)
+        vertices, faces = grid.to_vertices_and_faces()
+        data = grid.__data__
+
+        t0 = best(lambda: incremental_from_vertices_and_faces(vertices, faces))
+        t1 = best(lambda: Mesh.from_vertices_and_faces(vertices, faces))
+        t2 = best(lambda: Mesh.from_vertices_and_faces(vertices, faces, trusted=True))
+        t3 = best(lambda: incremental_from_data(data))
+        t4 = best(lambda: Mesh.__from_data__(data))
+
+        print("{:>10}{:>16.3f}{:>12.3f}{:>12.3f}{:>16.3f}{:>12.3f}".format(len(faces), t0, t1, t2, t3, t4))
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [100, 300, 500])
@@ -0,0 +1,73 @@
+"""Memory footprint of the default and the compact storage of :class:`compas.datastructures.Mesh`.
+
+Usage
+-----
+python benchmarks/bench_mesh_storage.py [N]
+
+with N the number of faces in the X and Y direction of the grid (default 300).
+
+"""
+
+from __future__ import print_function
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from compas.datastructures import Mesh
+
+
+def measure(vertices, faces, compact):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    mesh = Mesh.from_vertices_and_faces(vertices, faces, compact=compact)
+    t1 = time.perf_counter()
+    total = tracemalloc.get_traced_memory()[0]
+
+    # measure the vertex and face storage separately
+    # by measuring how much memory is released when they are removed
+    vertex = mesh.vertex
+    mesh.vertex = None
+    del vertex
+    gc.collect()
+    without_vertex = tracemalloc.get_traced_memory()[0]
+
+    face = mesh.face
+    mesh.face = None
+    del face
+    gc.collect()
+    without_face = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+    return t1 - t0, total, total - without_vertex, without_vertex - without_face
+
+
+def main(n=300):
+    grid = Mesh.from_meshgrid(dx=10, nx=n)
+    vertices, faces = grid.to_vertices_and_faces()
+    del grid
+
+    V = len(vertices)
+    F = len(faces)
+
+    print("Grid with {} vertices and {} faces".format(V, F))
+    print()
+    print("{:<10}{:>12}{:>14}{:>16}{:>14}".format("storage", "build [s]", "total [MB]", "per vertex [B]", "per face [B]"))
+
+    for compact in (False, True):
+        t, total, vertex, face = measure(vertices, faces, compact)
+        print(
+            "{:<10}{:>12.3f}{:>14.1f}{:>16.1f}{:>14.1f}".format(
+                "compact" if compact else "dict",
+                t,
+                total / 1e6,
+                vertex / V,
+                face / F,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,64 @@
+"""Overhead of the dispatch of calls to pluggable functions.
+
+A call to a pluggable function without plugins (which runs the default implementation)
+and a call to a pluggable function with a plugin are compared with a direct call of the same function.
+
+Usage
+-----
+python benchmarks/bench_pluggable_dispatch.py [N]
+
+with N the number of calls (default 100000).
+
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+import types
+
+from compas.plugins import pluggable
+from compas.plugins import plugin
+from compas.plugins import plugin_manager
+
+
+def function(a, b):
+    return a + b
+
+
+@pluggable(category="benchmarks")
+def bench_default(a, b):
+    return a + b
+
+
+@pluggable(category="benchmarks")
+def bench_plugin(a, b):
+    raise NotImplementedError
+
+
+@plugin(category="benchmarks", requires=["compas"], pluggable_name="bench_plugin")
+def bench_plugin_impl(a, b):
+    return a + b
+
+
+def best(func, number, repeat=3):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main(n=100000):
+    module = types.ModuleType("bench_plugins")
+    module.bench_plugin_impl = bench_plugin_impl
+    plugin_manager.register_module(module)
+
+    t0 = best(lambda: function(1, 2), n)
+
+    print("{:<24}{:>16}{:>12}".format("call", "time [us]", "overhead"))
+    print("{:<24}{:>16.3f}{:>12}".format("direct", t0 * 1e6, ""))
+
+    for name, func in [("pluggable (default)", bench_default), ("pluggable (plugin)", bench_plugin)]:
+        t = best(lambda: func(1, 2), n)
+        print("{:<24}{:>16.3f}{:>12.1f}".format(name, t * 1e6, t / t0))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:]])
@@ -0,0 +1,65 @@
+"""Time of the construction of, the queries on, and the bulk operations for scan processing with pointclouds.
+
+The closest point queries are compared with ``closest_point_in_cloud``,
+which sorts all points by distance to the query point, and was used by ``Pointcloud.closest_point`` before.
+
+Usage
+-----
+python benchmarks/bench_pointcloud.py [N] [Q]
+
+with N the number of points (default 200000), and Q the number of closest point queries (default 100).
+
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import tempfile
+import timeit
+
+from compas.files import PCD
+from compas.geometry import Pointcloud
+from compas.geometry import closest_point_in_cloud
+
+
+def best(func, number=1, repeat=3):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main(n=200000, q=100):
+    cloud = Pointcloud.from_bounds(10, 10, 1, n)
+    points = cloud.array.to_list()
+    queries = Pointcloud.from_bounds(10, 10, 1, q).array.to_list()
+
+    folder = tempfile.mkdtemp()
+    filepath = os.path.join(folder, "cloud.pcd")
+    cloud.to_pcd(filepath, binary=True)
+
+    def closest_points():
+        cloud.invalidate()
+        return [cloud.closest_point(point) for point in queries]
+
+    timings = [
+        ("Pointcloud(list)", lambda: Pointcloud(points), 1),
+        ("Pointcloud.from_pcd (binary)", lambda: Pointcloud.from_pcd(filepath), 1),
+        ("PCDReader.points (binary)", lambda: PCD(filepath).reader.points, 1),
+        ("closest_point_in_cloud", lambda: [closest_point_in_cloud(point, points) for point in queries[:10]], 10),
+        ("closest_point (with index)", closest_points, q),
+        ("voxel_downsample", lambda: cloud.voxel_downsample(0.1), 1),
+        ("remove_radius_outliers", lambda: cloud.remove_radius_outliers(0.05, min_neighbors=2), 1),
+        ("estimate_normals", lambda: cloud.estimate_normals(k=10), 1),
+    ]
+
+    print("{} points".format(n))
+    print()
+    print("{:<32}{:>16}".format("", "time [ms]"))
+    for label, func, count in timings:
+        print("{:<32}{:>16.3f}".format(label + (" (per query)" if count > 1 else ""), 1e3 * best(func) / count))
+
+    os.remove(filepath)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:]])
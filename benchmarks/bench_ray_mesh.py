@@ -0,0 +1,63 @@
+"""Time of the intersection of many rays with a triangle mesh, using the bounding volume hierarchy of the default plugin of ``intersection_ray_mesh``.
+
+The reference is a brute-force test of every ray against all triangles of the mesh,
+timed for a subset of the rays.
+
+Usage
+-----
+python benchmarks/bench_ray_mesh.py [N] [F]
+
+with N the number of rays (default 1000000), and F the approximate number of triangles of the mesh (default 100000).
+
+"""
+
+from __future__ import print_function
+
+import math
+import sys
+import timeit
+from random import random
+from random import seed
+
+from compas.datastructures import Mesh
+from compas.geometry import BVH
+from compas.geometry import Sphere
+
+
+def best(func, number=1, repeat=3):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main(n=1000000, f=100000):
+    m = int(math.sqrt(f / 2))
+    vertices, faces = Mesh.from_shape(Sphere(radius=1.0), u=m, v=m, triangulated=True).to_vertices_and_faces()
+
+    # rays from random points around the sphere towards random points inside the sphere
+    seed(0)
+    rays = []
+    for _ in range(n):
+        start = [4 * random() - 2 for _ in range(3)]
+        end = [random() - 0.5 for _ in range(3)]
+        rays.append((start, [b - a for a, b in zip(start, end)]))
+
+    bvh = BVH((vertices, faces))
+    reference = BVH((vertices, faces), leafsize=len(faces))
+    sample = rays[:100]
+
+    timings = [
+        ("build", lambda: BVH((vertices, faces)), 1, 3),
+        ("brute force (all hits)", lambda: reference.intersect_rays(sample), len(sample), 1),
+        ("intersect_rays (all hits)", lambda: bvh.intersect_rays(rays), n, 1),
+        ("intersect_rays (first hit)", lambda: bvh.intersect_rays(rays, first=True), n, 1),
+    ]
+
+    print("{} rays, {} triangles".format(n, len(faces)))
+    print()
+    print("{:<32}{:>16}{:>16}".format("", "time [ms]", "per ray [us]"))
+    for label, func, count, repeat in timings:
+        time = best(func, repeat=repeat)
+        print("{:<32}{:>16.1f}{:>16}".format(label, 1e3 * time, "{:.3f}".format(1e6 * time / count) if count > 1 else ""))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:]])
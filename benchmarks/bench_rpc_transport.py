@@ -0,0 +1,78 @@
+"""Round-trip latency of :class:`compas.rpc.Proxy` calls with the JSON and binary transports.
+
+A local server is started in a background thread for each transport,
+and an "echo" function is called with a list of points of increasing size,
+and with a mesh of increasing size.
+The round trip includes serialization on the client, transport, deserialization and serialization
+of the arguments and result on the server, and deserialization of the result on the client.
+
+Finally, the time for many small calls is compared with the time for the same calls
+combined in a single request with :meth:`compas.rpc.Proxy.map`.
+
+Usage
+-----
+python benchmarks/bench_rpc_transport.py [N [N ...]]
+
+with N the number of points in the payload (default 1 1000 10000 100000 300000).
+
+"""
+
+from __future__ import print_function
+
+import random
+import sys
+import threading
+import timeit
+
+from compas.datastructures import Mesh
+from compas.rpc import BinaryServer
+from compas.rpc import Dispatcher
+from compas.rpc import Proxy
+from compas.rpc import Server
+
+
+class EchoService(Dispatcher):
+    def echo(self, data):
+        return data
+
+
+def serve(server):
+    server.register_instance(EchoService())
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server.server_address[1]
+
+
+def best(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(sizes):
+    json_proxy = Proxy(port=serve(Server(("127.0.0.1", 0), logRequests=False)))
+    binary_proxy = Proxy(port=serve(BinaryServer(("127.0.0.1", 0))), transport="binary")
+
+    print("{:>10}{:>10}{:>12}{:>14}{:>10}".format("payload", "size", "json [ms]", "binary [ms]", "speedup"))
+
+    for n in sizes:
+        points = [[random.random(), random.random(), random.random()] for _ in range(n)]
+        side = max(1, int(round((n / 2.0) ** 0.5)))
+        mesh = Mesh.from_meshgrid(dx=10, nx=side)
+
+        for name, payload, size in [("points", points, n), ("mesh", mesh, mesh.number_of_vertices())]:
+            t0 = best(lambda: json_proxy.echo(payload))
+            t1 = best(lambda: binary_proxy.echo(payload))
+            print("{:>10}{:>10}{:>12.2f}{:>14.2f}{:>10.1f}".format(name, size, 1e3 * t0, 1e3 * t1, t0 / t1))
+
+    print()
+    print("{:>10}{:>10}{:>16}{:>12}".format("transport", "calls", "separate [ms]", "map [ms]"))
+
+    for name, proxy in [("json", json_proxy), ("binary", binary_proxy)]:
+        for n in [100, 1000]:
+            t0 = best(lambda: [proxy.echo(i) for i in range(n)])
+            t1 = best(lambda: proxy.map("echo", range(n)))
+            print("{:>10}{:>10}{:>16.2f}{:>12.2f}".format(name, n, 1e3 * t0, 1e3 * t1))
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [1, 1000, 10000, 100000, 300000])
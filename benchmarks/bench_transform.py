@@ -0,0 +1,79 @@
+"""Time of the transformation of the vertices of a mesh, and of the underlying transformations of coordinate buffers.
+
+The reference is the multiplication of homogeneous coordinates with nested lists,
+which was used by ``transform_points`` and ``Mesh.transform`` before.
+
+Usage
+-----
+python benchmarks/bench_transform.py [N]
+
+with N the number of vertices (default 1000000).
+
+"""
+
+from __future__ import print_function
+
+import math
+import sys
+import timeit
+from array import array
+
+from compas.datastructures import Mesh
+from compas.geometry import Projection
+from compas.geometry import Rotation
+from compas.geometry import Translation
+from compas.geometry import multiply_matrices
+from compas.geometry import transform_points
+from compas.geometry import transform_points_buffer
+from compas.geometry import transform_points_buffer_numpy
+from compas.geometry import transform_points_numpy
+from compas.geometry import transpose_matrix
+from compas.geometry._core.transformations import dehomogenize
+from compas.geometry._core.transformations import homogenize
+
+
+def best(func, number=1, repeat=3):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def reference(points, T):
+    return dehomogenize(multiply_matrices(homogenize(points, w=1.0), transpose_matrix(T)))
+
+
+def main(n=1000000):
+    m = int(math.sqrt(n))
+    mesh = Mesh.from_meshgrid(dx=10, nx=m - 1)
+    compact = Mesh.from_vertices_and_faces(*mesh.to_vertices_and_faces(), compact=True)
+    points = mesh.vertices_attributes("xyz")
+    xyz = array("d", [value for point in points for value in point])
+
+    T = Translation.from_vector([1.0, 2.0, 3.0]) * Rotation.from_axis_and_angle([0.0, 0.0, 1.0], 0.1)
+    P = Projection.from_plane_and_point(([0.0, 0.0, 0.0], [0.0, 0.0, 1.0]), [1.0, 2.0, 100.0])
+
+    def old_mesh_transform():
+        # the previous implementation of Mesh.transform
+        for vertex, point in zip(mesh.vertices(), reference(mesh.vertices_attributes("xyz"), T)):
+            mesh.vertex_attributes(vertex, "xyz", point)
+
+    timings = [
+        ("reference (affine)", lambda: reference(points, T)),
+        ("transform_points (affine)", lambda: transform_points(points, T)),
+        ("transform_points (projective)", lambda: transform_points(points, P)),
+        ("transform_points_numpy", lambda: transform_points_numpy(points, T)),
+        ("buffer (affine)", lambda: transform_points_buffer(xyz, T)),
+        ("buffer_numpy (affine)", lambda: transform_points_buffer_numpy(xyz, T)),
+        ("buffer_numpy (projective)", lambda: transform_points_buffer_numpy(xyz, P)),
+        ("Mesh.transform (before)", old_mesh_transform),
+        ("Mesh.transform", lambda: mesh.transform(T)),
+        ("Mesh.transform (compact)", lambda: compact.transform(T)),
+    ]
+
+    print("{} vertices".format(mesh.number_of_vertices()))
+    print()
+    print("{:<32}{:>16}".format("", "time [ms]"))
+    for label, func in timings:
+        print("{:<32}{:>16.1f}".format(label, 1e3 * best(func)))
+
+
+if __name__ == "__main__":
+    main(*[int(n) for n in sys.argv[1:]])
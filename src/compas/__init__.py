@@ -133,6 +133,7 @@ __all__ = [
 
 __all_plugins__ = [
     "compas.geometry.booleans_shapely",
+    "compas.geometry.intersections_bvh",
     "compas.scene",
 ]
 
@@ -0,0 +1,88 @@
+"""Lazy loading of the public attributes of packages.
+
+For the time being, this is only for internal use.
+
+A package lists the public attributes of its submodules,
+and the submodules are only imported when one of their attributes is accessed for the first time,
+through a module-level ``__getattr__`` (:pep:`562`).
+On IronPython, and on Python versions before 3.7, all attributes are imported immediately.
+"""
+
+from __future__ import absolute_import
+
+import importlib
+import sys
+import types
+
+LAZY = not sys.platform == "cli" and sys.version_info >= (3, 7)
+
+
+class _LazyPackage(types.ModuleType):
+    # the import system sets every submodule as an attribute of its package after loading it
+    # a submodule should not hide a lazy attribute with the same name,
+    # for example the module ``compas.geometry.icp_numpy`` and the function ``compas.geometry.icp_numpy``
+
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and name in self.__dict__.get("__lazy__", ()):
+            if value.__name__ == "{}.{}".format(self.__name__, name):
+                return
+        super(_LazyPackage, self).__setattr__(name, value)
+
+
+def lazy_attributes(package, namespace, submodules, aliases=None):
+    """Make the public attributes of the submodules of a package available as attributes of the package.
+
+    Parameters
+    ----------
+    package : str
+        The name of the package.
+    namespace : dict
+        The global namespace of the package.
+    submodules : list[tuple[str, list[str]]]
+        The relative names of the submodules, and the names of their public attributes.
+        If the attributes are imported immediately, this is done in the order of the list.
+    aliases : dict[str, str], optional
+        Alternative names of attributes.
+
+    Returns
+    -------
+    None
+
+    """
+    aliases = aliases or {}
+
+    if not LAZY:
+        for module, names in submodules:
+            module = importlib.import_module(module, package)
+            for name in names:
+                namespace[name] = getattr(module, name)
+        for alias, name in aliases.items():
+            namespace[alias] = namespace[name]
+        return
+
+    from importlib.util import find_spec
+
+    index = {}
+    for module, names in submodules:
+        for name in names:
+            index[name] = module
+
+    def __getattr__(name):
+        if name in aliases:
+            value = __getattr__(aliases[name])
+        elif name in index:
+            value = getattr(importlib.import_module(index[name], package), name)
+        elif not name.startswith("__") and find_spec("{}.{}".format(package, name)):
+            return importlib.import_module("{}.{}".format(package, name))
+        else:
+            raise AttributeError("module {!r} has no attribute {!r}".format(package, name))
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(index) | set(aliases))
+
+    namespace["__getattr__"] = __getattr__
+    namespace["__dir__"] = __dir__
+    namespace["__lazy__"] = frozenset(index) | frozenset(aliases)
+    sys.modules[package].__class__ = _LazyPackage
@@ -7,8 +7,14 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from .color import Color
-from .colormap import ColorMap
-from .colordict import ColorDict
+from compas._lazy import lazy_attributes as _lazy_attributes
+
+_submodules = [
+    (".color", ["Color"]),
+    (".colormap", ["ColorMap"]),
+    (".colordict", ["ColorDict"]),
+]
 
 __all__ = ["Color", "ColorMap", "ColorDict"]
+
+_lazy_attributes(__name__, globals(), _submodules)
@@ -146,6 +146,8 @@ class Color(Data):
 
     """
 
+    __slots__ = ("_r", "_g", "_b", "_a")
+
     DATASCHEMA = {
         "type": "object",
         "properties": {
@@ -1,6 +1,6 @@
 """
 This package defines the core infrastructure for data serialisation in the COMPAS framework.
-It provides a base class for data objects, a JSON encoder and decoder, serialisers and deserialisers, and schema validation.
+It provides a base class for data objects, a JSON encoder and decoder, JSON and binary serialisers and deserialisers, and schema validation.
 """
 
 from __future__ import absolute_import
@@ -10,6 +10,7 @@ from .encoders import DataEncoder
 from .encoders import DataDecoder
 from .data import Data
 from .json import json_load, json_loads, json_loadz, json_dump, json_dumps, json_dumpz
+from .binary import binary_load, binary_loads, binary_dump, binary_dumps
 from .schema import dataclass_dataschema, dataclass_typeschema, dataclass_jsonschema
 from .schema import compas_dataclasses
 
@@ -24,6 +25,10 @@ __all__ = [
     "json_dump",
     "json_dumps",
     "json_dumpz",
+    "binary_load",
+    "binary_loads",
+    "binary_dump",
+    "binary_dumps",
     "dataclass_dataschema",
     "dataclass_typeschema",
     "dataclass_jsonschema",
@@ -0,0 +1,136 @@
+"""Conversion of numeric values to and from little-endian binary buffers.
+
+These helpers are shared by the binary serialization of COMPAS data (:mod:`compas.data.binary`)
+and the binary transport for RPC calls (:mod:`compas.rpc.transport`).
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+import struct
+import sys
+from array import array
+from itertools import chain
+
+try:
+    basestring  # type: ignore
+except NameError:
+    basestring = str
+
+try:
+    long  # type: ignore
+except NameError:
+    long = int
+
+try:
+    import numpy as np
+except (ImportError, SyntaxError):
+    np = None
+
+INT_TYPES = set([int, long])
+INT_MIN = -(2**63)
+INT_MAX = 2**63 - 1
+
+NUMPY_TYPECODES = {
+    "f8": "d",
+    "f4": "f",
+    "i8": "q",
+    "i4": "i",
+    "i2": "h",
+    "i1": "b",
+    "u8": "Q",
+    "u4": "I",
+    "u2": "H",
+    "u1": "B",
+    "b1": "?",
+}
+
+
+def _native(typecode):
+    # check if the array module provides the typecode with the size of the standard struct format
+    try:
+        return array(typecode).itemsize == struct.calcsize("<" + typecode)
+    except ValueError:
+        return False
+
+
+NATIVE = {typecode: _native(typecode) for typecode in "dfqihbQIHB"}
+
+
+def _tobytes(typecode, values):
+    if typecode == "?":
+        typecode = "B"
+    if NATIVE[typecode]:
+        values = array(typecode, values)
+        if sys.byteorder == "big":
+            values.byteswap()
+        try:
+            return values.tobytes()
+        except AttributeError:
+            return values.tostring()
+    return struct.pack("<{}{}".format(len(values), typecode), *values)
+
+
+def _frombytes(typecode, data):
+    if typecode == "?":
+        return [bool(value) for value in _frombytes("B", data)]
+    if NATIVE[typecode]:
+        values = array(typecode)
+        try:
+            values.frombytes(data)
+        except AttributeError:
+            values.fromstring(bytes(data))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tolist()
+    n = len(data) // struct.calcsize("<" + typecode)
+    return list(struct.unpack("<{}{}".format(n, typecode), bytes(data)))
+
+
+def _reshape(values, shape):
+    if len(shape) < 2:
+        return values
+    if not values:
+        return [_reshape([], shape[1:]) for _ in range(shape[0])]
+    size = len(values) // shape[0]
+    if len(shape) == 2:
+        return [values[i : i + size] for i in range(0, len(values), size)]
+    return [_reshape(values[i : i + size], shape[1:]) for i in range(0, len(values), size)]
+
+
+def _flatten_rows(values):
+    # the values of a list of lists or tuples, one after the other, and the length of the lists or tuples
+    # or None if they don't all have the same length
+    sizes = set(map(len, values))
+    if len(sizes) != 1:
+        return None
+    return list(chain.from_iterable(values)), sizes.pop()
+
+
+def _ndarray_tobytes(obj):
+    # the typecode and the little-endian buffer of a NumPy array with a numeric or boolean data type
+    # or None if the data type is not supported
+    typecode = NUMPY_TYPECODES.get(obj.dtype.kind + str(obj.dtype.itemsize))
+    if not typecode or obj.dtype.kind not in "fiub":
+        return None
+    return typecode, np.ascontiguousarray(obj, dtype=obj.dtype.newbyteorder("<")).tobytes()
+
+
+def _json_key(key):
+    # the string representation of a dict key in JSON
+    if isinstance(key, basestring):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if type(key) in INT_TYPES:
+        return str(key)
+    if isinstance(key, float):
+        return json.dumps(key)
+    raise TypeError("Keys must be str, int, float, bool or None, not {}".format(type(key).__name__))
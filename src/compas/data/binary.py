@@ -0,0 +1,489 @@
+"""Compact binary serialization of COMPAS data.
+
+The binary format encodes the same information as the JSON format,
+in a tagged, length-prefixed framing similar to MessagePack or CBOR.
+Every value starts with a one-byte tag, followed by its contents.
+All numbers are stored in little-endian byte order.
+
+========  ===================================================================
+Tag       Contents
+========  ===================================================================
+``N``     None.
+``T``     True.
+``F``     False.
+``i``     A signed 64-bit integer.
+``I``     An integer outside of the 64-bit range, as a length-prefixed decimal string.
+``d``     A 64-bit float.
+``s``     A string, as a length-prefixed UTF-8 byte string.
+``l``     A list: the number of items, followed by the items.
+``m``     A dict: the string keys, followed by the values.
+``a``     A typed array: an :mod:`array` typecode, the number of dimensions, the shape, and the raw values.
+``r``     A dict of lists of numbers: the string keys, an array with the lengths of the lists, and an array with all values.
+``t``     A dict of dicts with the same keys: the string keys, the names of the columns, and the columns.
+========  ===================================================================
+
+Lists of (at least ``MIN_ARRAY_SIZE``) floats or integers, lists of lists of numbers of the same length,
+and NumPy arrays with a numeric data type are stored as typed arrays.
+Integer arrays use the smallest integer type that fits their values.
+The keys of dicts are stored as a single string, preceded by an array with the lengths of the keys.
+The vertex and face dicts of data structures are stored as tables and ragged arrays.
+
+As with JSON, tuples and arrays are loaded as lists, dict keys are loaded as strings,
+and dicts with a ``dtype`` and ``data`` entry are converted back to COMPAS data objects.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import struct
+from itertools import chain
+
+from compas import _iotools
+from compas.data import DataDecoder
+from compas.data import DataEncoder
+from compas.data._buffers import INT_MAX
+from compas.data._buffers import INT_MIN
+from compas.data._buffers import INT_TYPES
+from compas.data._buffers import _flatten_rows
+from compas.data._buffers import _frombytes
+from compas.data._buffers import _json_key
+from compas.data._buffers import _ndarray_tobytes
+from compas.data._buffers import _reshape
+from compas.data._buffers import _tobytes
+from compas.data._buffers import basestring
+from compas.data._buffers import long
+
+try:
+    import numpy as np
+except (ImportError, SyntaxError):
+    np = None
+
+MAGIC = b"COMPAS\x00\x01"
+MIN_ARRAY_SIZE = 8
+
+UINT32 = struct.Struct("<I")
+INT64 = struct.Struct("<q")
+FLOAT64 = struct.Struct("<d")
+
+
+# ==============================================================================
+# Buffers
+# ==============================================================================
+
+
+def _int_typecode(minimum, maximum):
+    # the smallest signed integer typecode for the given range
+    for typecode, bound in (("b", 2**7), ("h", 2**15), ("i", 2**31)):
+        if -bound <= minimum and maximum < bound:
+            return typecode
+    return "q"
+
+
+def _uint_typecode(maximum):
+    # the smallest unsigned integer typecode for the given maximum
+    for typecode, bound in (("B", 2**8), ("H", 2**16), ("I", 2**32)):
+        if maximum < bound:
+            return typecode
+    return "Q"
+
+
+# ==============================================================================
+# Encoding
+# ==============================================================================
+
+
+class _Encoder(object):
+    # write an object as a list of binary chunks
+
+    def __init__(self, minimal=False):
+        self.minimal = minimal
+        self.chunks = []
+        self.default = DataEncoder().default
+
+    def write_string(self, value):
+        data = value.encode("utf-8")
+        self.chunks.append(UINT32.pack(len(data)))
+        self.chunks.append(data)
+
+    def write_keys(self, keys):
+        # all keys are written as a single UTF-8 byte string, preceded by an array with their lengths
+        keys = [_json_key(key).encode("utf-8") for key in keys]
+        sizes = [len(key) for key in keys]
+        typecode = _uint_typecode(max(sizes) if sizes else 0)
+        self.chunks.append(UINT32.pack(len(keys)) + typecode.encode("ascii"))
+        self.chunks.append(_tobytes(typecode, sizes))
+        self.chunks.append(b"".join(keys))
+
+    def write_array(self, typecode, data, shape):
+        self.chunks.append(b"a" + typecode.encode("ascii") + struct.pack("<B{}I".format(len(shape)), len(shape), *shape))
+        self.chunks.append(data)
+
+    def typecode(self, values):
+        types = set(map(type, values))
+        if types == set([float]):
+            return "d"
+        if types and types <= INT_TYPES:
+            minimum = min(values)
+            maximum = max(values)
+            if INT_MIN <= minimum and maximum <= INT_MAX:
+                return _int_typecode(minimum, maximum)
+
+    def pack_list(self, values):
+        if len(values) < MIN_ARRAY_SIZE:
+            return False
+        if set(map(type, values)) <= set([list, tuple]):
+            rows = _flatten_rows(values)
+            if not rows:
+                return False
+            flat, size = rows
+            typecode = self.typecode(flat)
+            if not typecode:
+                return False
+            self.write_array(typecode, _tobytes(typecode, flat), [len(values), size])
+            return True
+        typecode = self.typecode(values)
+        if not typecode:
+            return False
+        self.write_array(typecode, _tobytes(typecode, values), [len(values)])
+        return True
+
+    def pack_dict(self, obj):
+        if len(obj) < MIN_ARRAY_SIZE:
+            return False
+        values = list(obj.values())
+        types = set(map(type, values))
+        if types <= set([list, tuple]):
+            flat = list(chain.from_iterable(values))
+            typecode = self.typecode(flat)
+            if not typecode:
+                return False
+            sizes = [len(value) for value in values]
+            sizes_typecode = _uint_typecode(max(sizes))
+            self.chunks.append(b"r")
+            self.write_keys(list(obj))
+            self.write_array(sizes_typecode, _tobytes(sizes_typecode, sizes), [len(sizes)])
+            self.write_array(typecode, _tobytes(typecode, flat), [len(flat)])
+            return True
+        if types == set([dict]):
+            names = list(values[0])
+            if not all(len(value) == len(names) for value in values):
+                return False
+            try:
+                columns = [[value[name] for value in values] for name in names]
+            except KeyError:
+                return False
+            self.chunks.append(b"t")
+            self.write_keys(list(obj))
+            self.write_keys(names)
+            for column in columns:
+                if not self.pack_list(column):
+                    self.write_list(column)
+            return True
+        return False
+
+    def pack_ndarray(self, obj):
+        packed = _ndarray_tobytes(obj)
+        if not packed:
+            self.write(obj.tolist())
+            return
+        typecode, data = packed
+        self.write_array(typecode, data, list(obj.shape))
+
+    def write_list(self, values):
+        self.chunks.append(b"l" + UINT32.pack(len(values)))
+        for value in values:
+            self.write(value)
+
+    def write(self, obj):
+        if obj is None:
+            self.chunks.append(b"N")
+        elif obj is True:
+            self.chunks.append(b"T")
+        elif obj is False:
+            self.chunks.append(b"F")
+        elif isinstance(obj, float):
+            self.chunks.append(b"d" + FLOAT64.pack(obj))
+        elif isinstance(obj, (int, long)):
+            if INT_MIN <= obj <= INT_MAX:
+                self.chunks.append(b"i" + INT64.pack(obj))
+            else:
+                self.chunks.append(b"I")
+                self.write_string(str(obj))
+        elif isinstance(obj, basestring):
+            self.chunks.append(b"s")
+            self.write_string(obj)
+        elif isinstance(obj, (list, tuple)):
+            if not self.pack_list(obj):
+                self.write_list(obj)
+        elif isinstance(obj, dict):
+            if not self.pack_dict(obj):
+                self.chunks.append(b"m")
+                self.write_keys(list(obj))
+                for value in obj.values():
+                    self.write(value)
+        elif np is not None and isinstance(obj, np.ndarray):
+            self.pack_ndarray(obj)
+        elif hasattr(obj, "__jsondump__"):
+            self.write(obj.__jsondump__(minimal=self.minimal))
+        else:
+            self.write(self.default(obj))
+
+
+# ==============================================================================
+# Decoding
+# ==============================================================================
+
+
+class _Decoder(object):
+    # read an object from a binary buffer
+
+    def __init__(self, data):
+        self.data = data
+        self.offset = 0
+        self.object_hook = DataDecoder().object_hook
+        self.readers = {
+            b"N": lambda: None,
+            b"T": lambda: True,
+            b"F": lambda: False,
+            b"i": self.read_int,
+            b"I": self.read_bigint,
+            b"d": self.read_float,
+            b"s": self.read_string,
+            b"l": self.read_list,
+            b"m": self.read_dict,
+            b"a": self.read_array,
+            b"r": self.read_ragged,
+            b"t": self.read_table,
+        }
+
+    def read_bytes(self, size):
+        start = self.offset
+        end = start + size
+        if end > len(self.data):
+            raise ValueError("Unexpected end of binary data.")
+        self.offset = end
+        return self.data[start:end]
+
+    def read_uint32(self):
+        return UINT32.unpack(self.read_bytes(4))[0]
+
+    def read_int(self):
+        return INT64.unpack(self.read_bytes(8))[0]
+
+    def read_bigint(self):
+        return int(self.read_string())
+
+    def read_float(self):
+        return FLOAT64.unpack(self.read_bytes(8))[0]
+
+    def read_string(self):
+        size = self.read_uint32()
+        return bytes(self.read_bytes(size)).decode("utf-8")
+
+    def read_keys(self):
+        count = self.read_uint32()
+        typecode = bytes(self.read_bytes(1)).decode("ascii")
+        sizes = _frombytes(typecode, self.read_bytes(count * struct.calcsize("<" + typecode)))
+        data = bytes(self.read_bytes(sum(sizes)))
+        keys = []
+        start = 0
+        for size in sizes:
+            keys.append(data[start : start + size].decode("utf-8"))
+            start += size
+        return keys
+
+    def read_list(self):
+        return [self.read() for _ in range(self.read_uint32())]
+
+    def read_dict(self):
+        keys = self.read_keys()
+        return self.hook({key: self.read() for key in keys})
+
+    def read_array(self):
+        typecode = bytes(self.read_bytes(1)).decode("ascii")
+        ndim = struct.unpack("<B", self.read_bytes(1))[0]
+        shape = struct.unpack("<{}I".format(ndim), self.read_bytes(4 * ndim))
+        count = 1
+        for size in shape:
+            count *= size
+        itemsize = 1 if typecode == "?" else struct.calcsize("<" + typecode)
+        values = _frombytes(typecode, self.read_bytes(count * itemsize))
+        if not shape:
+            # zero-dimensional array
+            return values[0]
+        return _reshape(values, shape)
+
+    def read_ragged(self):
+        keys = self.read_keys()
+        sizes = self.read()
+        values = self.read()
+        result = {}
+        start = 0
+        for key, size in zip(keys, sizes):
+            result[key] = values[start : start + size]
+            start += size
+        return result
+
+    def read_table(self):
+        keys = self.read_keys()
+        names = self.read_keys()
+        columns = [self.read() for _ in names]
+        rows = zip(keys, zip(*columns))
+        if "dtype" in names:
+            return {key: self.hook(dict(zip(names, row))) for key, row in rows}
+        return {key: dict(zip(names, row)) for key, row in rows}
+
+    def hook(self, o):
+        if "dtype" in o:
+            return self.object_hook(o)
+        return o
+
+    def read(self):
+        tag = bytes(self.read_bytes(1))
+        try:
+            reader = self.readers[tag]
+        except KeyError:
+            raise ValueError("Invalid tag in binary data: {!r}".format(tag))
+        return reader()
+
+
+# ==============================================================================
+# API
+# ==============================================================================
+
+
+def binary_dump(data, fp, minimal=False):
+    """Write a collection of COMPAS object data to a binary file.
+
+    Parameters
+    ----------
+    data : object
+        Any JSON serializable object.
+        This includes any (combination of) COMPAS object(s).
+    fp : path string or file-like object
+        A writeable file-like object or the path to a file.
+    minimal : bool, optional
+        If True, exclude the GUID from the output.
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    :func:`compas.data.binary_dumps`
+    :func:`compas.data.binary_load`
+    :func:`compas.data.json_dump`
+
+    Examples
+    --------
+    >>> from compas.data import binary_dump, binary_load
+    >>> from compas.geometry import Point, Vector
+    >>> data1 = [Point(0, 0, 0), Vector(0, 0, 0)]
+    >>> binary_dump(data1, "data.bin")
+    >>> data2 = binary_load("data.bin")
+    >>> data1 == data2
+    True
+
+    """
+    encoder = _Encoder(minimal=minimal)
+    encoder.write(data)
+    with _iotools.open_file(fp, "wb") as f:
+        f.write(MAGIC)
+        for chunk in encoder.chunks:
+            f.write(chunk)
+
+
+def binary_dumps(data, minimal=False):  # type: (...) -> bytes
+    """Write a collection of COMPAS objects to a binary string.
+
+    Parameters
+    ----------
+    data : object
+        Any JSON serializable object.
+        This includes any (combination of) COMPAS object(s).
+    minimal : bool, optional
+        If True, exclude the GUID from the output.
+
+    Returns
+    -------
+    bytes
+
+    See Also
+    --------
+    :func:`compas.data.binary_dump`
+    :func:`compas.data.binary_loads`
+    :func:`compas.data.json_dumps`
+
+    Examples
+    --------
+    >>> from compas.data import binary_dumps, binary_loads
+    >>> from compas.geometry import Point, Vector
+    >>> data1 = [Point(0, 0, 0), Vector(0, 0, 0)]
+    >>> s = binary_dumps(data1)
+    >>> data2 = binary_loads(s)
+    >>> data1 == data2
+    True
+
+    """
+    encoder = _Encoder(minimal=minimal)
+    encoder.write(data)
+    return MAGIC + b"".join(encoder.chunks)
+
+
+def binary_load(fp):
+    """Read COMPAS object data from a binary file.
+
+    Parameters
+    ----------
+    fp : path string | file-like object | URL string
+        A readable path, a file-like object or a URL pointing to a file.
+
+    Returns
+    -------
+    object
+        The (COMPAS) data contained in the file.
+
+    See Also
+    --------
+    :func:`compas.data.binary_dump`
+    :func:`compas.data.binary_loads`
+    :func:`compas.data.json_load`
+
+    """
+    with _iotools.open_file(fp, "rb") as f:
+        return binary_loads(f.read())
+
+
+def binary_loads(s):
+    """Read COMPAS object data from a binary string.
+
+    Parameters
+    ----------
+    s : bytes
+        The binary data.
+
+    Returns
+    -------
+    object
+        The (COMPAS) data contained in the string.
+
+    Raises
+    ------
+    ValueError
+        If the data is not in the COMPAS binary format.
+
+    See Also
+    --------
+    :func:`compas.data.binary_dumps`
+    :func:`compas.data.binary_load`
+    :func:`compas.data.json_loads`
+
+    """
+    if bytes(s[: len(MAGIC)]) != MAGIC:
+        raise ValueError("The data is not in the COMPAS binary format.")
+    decoder = _Decoder(s)
+    decoder.offset = len(MAGIC)
+    return decoder.read()
@@ -9,7 +9,6 @@ try:
 except ImportError:
     pass
 
-import hashlib
 from copy import deepcopy
 from uuid import UUID
 from uuid import uuid4
@@ -28,6 +27,48 @@ import compas
 # ==============================================================================
 
 
+_COPY_STATE = {}
+_SLOTS = {}
+
+
+def _copies_state(cls):
+    # the state of an object can only be copied directly
+    # if the class that implements the copy also defines the data of the object,
+    # otherwise the data of subclasses could be lost
+    try:
+        return _COPY_STATE[cls]
+    except KeyError:
+        pass
+    owners = {}
+    for name in ("__copy_state__", "__data__", "__from_data__"):
+        for base in cls.__mro__:
+            if name in base.__dict__:
+                owners[name] = base
+                break
+    owner = owners["__copy_state__"]
+    result = owner is not Data and issubclass(owner, owners["__data__"]) and issubclass(owner, owners["__from_data__"])
+    _COPY_STATE[cls] = result
+    return result
+
+
+def _slot_names(cls):
+    # the names of the attributes of the objects of a class that are stored in slots rather than in the instance dict
+    try:
+        return _SLOTS[cls]
+    except KeyError:
+        pass
+    names = []
+    for base in reversed(cls.__mro__):
+        slots = base.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ("__dict__", "__weakref__"):
+                names.append(name)
+    _SLOTS[cls] = names
+    return names
+
+
 class Data(object):
     """Abstract base class for all COMPAS data objects.
 
@@ -61,8 +102,21 @@ class Data(object):
     * :func:`compas.data.json_load`
     * :func:`compas.data.json_loads`
 
+    or to a compact binary format using:
+
+    * :func:`compas.data.binary_dump`
+    * :func:`compas.data.binary_dumps`
+    * :func:`compas.data.binary_load`
+    * :func:`compas.data.binary_loads`
+
     """
 
+    # the attributes of the base classes are stored in slots
+    # such that small data types, such as points and vectors, can also use slots and do without an instance dict
+    # subclasses that don't define slots themselves still have an instance dict
+    # all objects can be referenced weakly, for example in caches keyed by geometry
+    __slots__ = ("_guid", "_name", "__weakref__")
+
     DATASCHEMA = {}
 
     def __init__(self, name=None):
@@ -134,11 +188,20 @@ class Data(object):
 
     def __getstate__(self):
         state = self.__jsondump__()
-        state["__dict__"] = self.__dict__
+        attributes = dict(getattr(self, "__dict__", {}))
+        for name in _slot_names(type(self)):
+            if hasattr(self, name):
+                attributes[name] = getattr(self, name)
+        state["__dict__"] = attributes
         return state
 
     def __setstate__(self, state):
-        self.__dict__.update(state["__dict__"])
+        attributes = dict(state["__dict__"])
+        for name in _slot_names(type(self)):
+            if name in attributes:
+                setattr(self, name, attributes.pop(name))
+        if attributes:
+            self.__dict__.update(attributes)
         if "guid" in state:
             self._guid = UUID(state["guid"])
         if "name" in state:
@@ -161,6 +224,20 @@ class Data(object):
         """
         return cls(**data)
 
+    def __copy_state__(self):  # type: () -> Data
+        """Construct an object of this type with an independent copy of the state of this object.
+
+        This is used by :meth:`copy`. By default, the copy is constructed from a deep copy of the data of this object.
+        Data types can override this method to copy their internal state directly, which is usually much faster.
+        The name and guid of the copy are handled by :meth:`copy`.
+
+        Returns
+        -------
+        :class:`compas.data.Data`
+
+        """
+        return type(self).__from_data__(deepcopy(self.__data__))
+
     def ToString(self):
         """Converts the instance to a string.
 
@@ -276,6 +353,48 @@ class Data(object):
         """
         return compas.json_dumps(self, pretty=pretty, compact=compact, minimal=minimal)
 
+    @classmethod
+    def from_binary(cls, filepath):  # type: (...) -> Data
+        """Construct an object of this type from a binary file.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the binary file.
+
+        Returns
+        -------
+        :class:`compas.data.Data`
+            An instance of this object type if the data contained in the file has the correct schema.
+
+        Raises
+        ------
+        TypeError
+            If the data in the file is not a :class:`compas.data.Data`.
+
+        """
+        from compas.data import binary_load
+
+        data = binary_load(filepath)
+        if not isinstance(data, cls):
+            raise TypeError("The data in the file is not a {}.".format(cls))
+        return data
+
+    def to_binary(self, filepath, minimal=False):
+        """Convert an object to its native data representation and save it to a binary file.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the binary file.
+        minimal : bool, optional
+            If True, exclude the GUID from the output.
+
+        """
+        from compas.data import binary_dump
+
+        binary_dump(self, filepath, minimal=minimal)
+
     def copy(self, cls=None, copy_guid=False):  # type: (...) -> D
         """Make an independent copy of the data object.
 
@@ -292,23 +411,42 @@ class Data(object):
         :class:`compas.data.Data`
             An independent copy of this object.
 
+        Notes
+        -----
+        If the copy has the same type as this object, it is made with :meth:`__copy_state__`.
+        This is only the case if the class that implements :meth:`__copy_state__`
+        also defines ``__data__`` and ``__from_data__``.
+        Otherwise, the copy is constructed from a deep copy of the data of this object.
+
         """
         if not cls:
             cls = type(self)
-        obj = cls.__from_data__(deepcopy(self.__data__))
+        if cls is type(self) and _copies_state(cls):
+            obj = self.__copy_state__()
+        else:
+            obj = cls.__from_data__(deepcopy(self.__data__))
         if self._name is not None:
             obj._name = self.name
         if copy_guid:
             obj._guid = self.guid
         return obj  # type: ignore
 
-    def sha256(self, as_string=False):
+    def sha256(self, as_string=False, version=1):
         """Compute a hash of the data for comparison during version control using the sha256 algorithm.
 
+        The data is fed to the hash algorithm in chunks,
+        without creating the full serialized representation of the object in memory.
+
         Parameters
         ----------
         as_string : bool, optional
             If True, return the digest in hexadecimal format rather than as bytes.
+        version : {1, 2}, optional
+            The version of the hash.
+            Version 1 is the hash of the JSON serialization of the object, including its guid and name.
+            Version 2 is the hash of the data type and the data of the object only,
+            independent of the guid, the name, and the order of the items of dicts.
+            With version 2, an object and its copy have the same hash.
 
         Returns
         -------
@@ -326,10 +464,19 @@ class Data(object):
         True
         >>> v2 == v3
         False
+        >>> mesh.sha256(version=2) == mesh.copy().sha256(version=2)
+        True
 
         """
-        h = hashlib.sha256()
-        h.update(compas.json_dumps(self).encode())
+        from compas.data.hashing import json_sha256
+        from compas.data.hashing import structural_sha256
+
+        if version == 1:
+            h = json_sha256(self)
+        elif version == 2:
+            h = structural_sha256(self)
+        else:
+            raise ValueError("Unsupported hash version: {}".format(version))
         if as_string:
             return h.hexdigest()
         return h.digest()
@@ -0,0 +1,264 @@
+"""Streaming computation of the hashes of COMPAS data.
+
+The content of an object is fed to the hash algorithm in chunks,
+without creating a serialized representation of the entire object in memory.
+
+Two versions of the digest are available.
+
+* Version 1 is the digest of the JSON serialization of the object,
+  as produced by :func:`compas.data.json_dumps`, including the guid and the name of the object.
+  The JSON text is generated in chunks, but the digest is identical to ``sha256(json_dumps(obj).encode())``.
+* Version 2 is a structural digest of the data type and the data of the object.
+  The guid and the name of the object are not included, and neither is the order of the items of dicts.
+  Two objects with the same type and the same data therefore have the same digest,
+  for example an object and its copy.
+  Numeric lists are hashed in bulk as arrays of little-endian values.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import hashlib
+import struct
+import sys
+from array import array
+from itertools import chain
+from operator import itemgetter
+
+from compas.data import DataEncoder
+from compas.data._buffers import _json_key
+
+try:
+    basestring  # type: ignore
+except NameError:
+    basestring = str
+
+try:
+    long  # type: ignore
+except NameError:
+    long = int
+
+try:
+    import numpy as np
+except (ImportError, SyntaxError):
+    np = None
+
+#: Containers with at least this number of items are serialized item by item in version 1.
+CHUNK_SIZE = 256
+
+#: Numeric lists with at least this number of items are hashed as arrays in version 2.
+MIN_ARRAY_SIZE = 8
+
+INT_TYPES = set([int, long])
+INT_MIN = -(2**63)
+INT_MAX = 2**63 - 1
+
+UINT32 = struct.Struct("<I")
+FLOAT64 = struct.Struct("<d")
+
+
+def _packed(typecode, values):
+    values = array(typecode, values)
+    if sys.byteorder == "big":
+        values.byteswap()
+    try:
+        return values.tobytes()
+    except AttributeError:
+        return values.tostring()
+
+
+# ==============================================================================
+# Version 1
+# ==============================================================================
+
+
+class _JSONChunks(object):
+    # generate the JSON text of an object in chunks,
+    # identical to the output of ``json.dumps(obj, cls=DataEncoder)``
+
+    def __init__(self):
+        self.encoder = DataEncoder()
+
+    def is_large(self, obj):
+        # large dicts, and dicts with large values, such as the data dict of a data structure
+        if len(obj) >= CHUNK_SIZE:
+            return True
+        return any(isinstance(value, (dict, list, tuple)) and len(value) >= CHUNK_SIZE for value in obj.values())
+
+    def iterencode(self, obj):
+        if hasattr(obj, "__jsondump__"):
+            obj = obj.__jsondump__(minimal=DataEncoder.minimal)
+        if isinstance(obj, dict) and self.is_large(obj):
+            yield "{"
+            first = True
+            for key, value in obj.items():
+                if first:
+                    first = False
+                else:
+                    yield ", "
+                yield self.encoder.encode(_json_key(key))
+                yield ": "
+                for chunk in self.iterencode(value):
+                    yield chunk
+            yield "}"
+        elif isinstance(obj, (list, tuple)) and len(obj) >= CHUNK_SIZE:
+            yield "["
+            first = True
+            for value in obj:
+                if first:
+                    first = False
+                else:
+                    yield ", "
+                for chunk in self.iterencode(value):
+                    yield chunk
+            yield "]"
+        else:
+            yield self.encoder.encode(obj)
+
+
+def json_sha256(obj):
+    """Compute the version 1 hash of an object: the hash of its JSON serialization.
+
+    Parameters
+    ----------
+    obj : object
+        Any JSON serializable object.
+
+    Returns
+    -------
+    :class:`hashlib.sha256`
+        The hash object.
+
+    """
+    DataEncoder.minimal = False
+    h = hashlib.sha256()
+    for chunk in _JSONChunks().iterencode(obj):
+        h.update(chunk.encode())
+    return h
+
+
+# ==============================================================================
+# Version 2
+# ==============================================================================
+
+
+class _StructuralHasher(object):
+    # feed a canonical, typed encoding of an object to a hash object
+
+    def __init__(self, h):
+        self.h = h
+        self.default = DataEncoder().default
+
+    def update_string(self, value):
+        data = value.encode("utf-8")
+        self.h.update(UINT32.pack(len(data)))
+        self.h.update(data)
+
+    def typecode(self, values):
+        types = set(map(type, values))
+        if types == set([float]):
+            return "d"
+        if types and types <= INT_TYPES and INT_MIN <= min(values) and max(values) <= INT_MAX:
+            return "q"
+
+    def update_array(self, typecode, values):
+        self.h.update(b"a" + typecode.encode("ascii") + UINT32.pack(len(values)))
+        self.h.update(_packed(typecode, values))
+
+    def update_list(self, values):
+        if len(values) >= MIN_ARRAY_SIZE:
+            typecode = self.typecode(values)
+            if typecode:
+                self.update_array(typecode, values)
+                return
+        self.h.update(b"l" + UINT32.pack(len(values)))
+        for value in values:
+            self.update(value)
+
+    def update_dict(self, obj):
+        items = sorted(((_json_key(key), value) for key, value in obj.items()), key=itemgetter(0))
+        values = [value for _, value in items]
+        types = set(map(type, values))
+        if len(items) >= MIN_ARRAY_SIZE and types <= set([list, tuple]):
+            flat = list(chain.from_iterable(values))
+            typecode = self.typecode(flat)
+            if typecode:
+                # for example the faces of a mesh
+                self.h.update(b"r" + UINT32.pack(len(items)))
+                for key, _ in items:
+                    self.update_string(key)
+                self.update_array("q", [len(value) for value in values])
+                self.update_array(typecode, flat)
+                return
+        if len(items) >= MIN_ARRAY_SIZE and types == set([dict]):
+            # only string keys can be sorted reliably, other keys are hashed item by item
+            names = sorted(values[0]) if all(isinstance(name, basestring) for name in values[0]) else None
+            if names is not None and all(len(value) == len(names) for value in values):
+                try:
+                    columns = [[value[name] for value in values] for name in names]
+                except KeyError:
+                    columns = None
+                if columns is not None:
+                    # for example the vertices of a mesh
+                    self.h.update(b"t" + UINT32.pack(len(items)))
+                    for key, _ in items:
+                        self.update_string(key)
+                    self.h.update(UINT32.pack(len(names)))
+                    for name in names:
+                        self.update_string(name)
+                    for column in columns:
+                        self.update_list(column)
+                    return
+        self.h.update(b"m" + UINT32.pack(len(items)))
+        for key, value in items:
+            self.update_string(key)
+            self.update(value)
+
+    def update(self, obj):
+        if obj is None:
+            self.h.update(b"N")
+        elif obj is True:
+            self.h.update(b"T")
+        elif obj is False:
+            self.h.update(b"F")
+        elif isinstance(obj, float):
+            self.h.update(b"d" + FLOAT64.pack(obj))
+        elif isinstance(obj, (int, long)):
+            self.h.update(b"i")
+            self.update_string(str(int(obj)))
+        elif isinstance(obj, basestring):
+            self.h.update(b"s")
+            self.update_string(obj)
+        elif isinstance(obj, (list, tuple)):
+            self.update_list(obj)
+        elif isinstance(obj, dict):
+            self.update_dict(obj)
+        elif hasattr(obj, "__jsondump__"):
+            self.h.update(b"o")
+            self.update_string(obj.__dtype__)
+            self.update(obj.__data__)
+        elif np is not None and isinstance(obj, np.ndarray):
+            self.update(obj.tolist())
+        else:
+            self.update(self.default(obj))
+
+
+def structural_sha256(obj):
+    """Compute the version 2 hash of an object: the structural hash of its data.
+
+    Parameters
+    ----------
+    obj : object
+        Any JSON serializable object.
+
+    Returns
+    -------
+    :class:`hashlib.sha256`
+        The hash object.
+
+    """
+    h = hashlib.sha256()
+    _StructuralHasher(h).update(obj)
+    return h
@@ -5,35 +5,46 @@ The data structures provide a structured way of storing and accessing data on in
 
 from __future__ import absolute_import
 
-from .datastructure import Datastructure
+from compas._lazy import lazy_attributes as _lazy_attributes
+
+_submodules = [
+    (".datastructure", ["Datastructure"]),
+]
 
 # =============================================================================
 # Graphs
 # =============================================================================
 
-from .graph.planarity import graph_embed_in_plane_proxy  # noqa: F401
+_submodules += [
+    (".graph.planarity", ["graph_embed_in_plane_proxy"]),
+]
 
 # =============================================================================
 # Meshes
 # =============================================================================
 
-from .mesh.conway import (  # noqa: F401
-    mesh_conway_ambo,
-    mesh_conway_bevel,
-    mesh_conway_dual,
-    mesh_conway_expand,
-    mesh_conway_gyro,
-    mesh_conway_join,
-    mesh_conway_kis,
-    mesh_conway_meta,
-    mesh_conway_needle,
-    mesh_conway_ortho,
-    mesh_conway_snub,
-    mesh_conway_truncate,
-    mesh_conway_zip,
-)
-from .mesh.smoothing import mesh_smooth_centerofmass  # noqa: F401
-from .mesh.subdivision import trimesh_subdivide_loop  # noqa: F401
+_submodules += [
+    (
+        ".mesh.conway",
+        [
+            "mesh_conway_ambo",
+            "mesh_conway_bevel",
+            "mesh_conway_dual",
+            "mesh_conway_expand",
+            "mesh_conway_gyro",
+            "mesh_conway_join",
+            "mesh_conway_kis",
+            "mesh_conway_meta",
+            "mesh_conway_needle",
+            "mesh_conway_ortho",
+            "mesh_conway_snub",
+            "mesh_conway_truncate",
+            "mesh_conway_zip",
+        ],
+    ),
+    (".mesh.smoothing", ["mesh_smooth_centerofmass"]),
+    (".mesh.subdivision", ["trimesh_subdivide_loop"]),
+]
 
 # =============================================================================
 # Halffaces
@@ -47,17 +58,17 @@ from .mesh.subdivision import trimesh_subdivide_loop  # noqa: F401
 # Class APIs
 # =============================================================================
 
-from .graph.graph import Graph
-from .mesh.mesh import Mesh
-from .volmesh.volmesh import VolMesh
-from .assembly.exceptions import AssemblyError, FeatureError
-from .assembly.assembly import Assembly
-from .assembly.part import Feature, GeometricFeature, ParametricFeature, Part
-from .cell_network.cell_network import CellNetwork
-from .tree.tree import Tree, TreeNode
-from .tree.hashtree import HashTree, HashNode
-
-Network = Graph
+_submodules += [
+    (".graph.graph", ["Graph"]),
+    (".mesh.mesh", ["Mesh"]),
+    (".volmesh.volmesh", ["VolMesh"]),
+    (".assembly.exceptions", ["AssemblyError", "FeatureError"]),
+    (".assembly.assembly", ["Assembly"]),
+    (".assembly.part", ["Feature", "GeometricFeature", "ParametricFeature", "Part"]),
+    (".cell_network.cell_network", ["CellNetwork"]),
+    (".tree.tree", ["Tree", "TreeNode"]),
+    (".tree.hashtree", ["HashTree", "HashNode"]),
+]
 
 __all__ = [
     "Datastructure",
@@ -76,3 +87,5 @@ __all__ = [
     "HashTree",
     "HashNode",
 ]
+
+_lazy_attributes(__name__, globals(), _submodules, aliases={"Network": "Graph"})
@@ -4,6 +4,7 @@ from __future__ import division
 from __future__ import print_function
 
 from ast import literal_eval
+from copy import deepcopy
 from random import sample
 
 from compas.datastructures import Graph
@@ -13,6 +14,9 @@ from compas.datastructures.attributes import EdgeAttributeView
 from compas.datastructures.attributes import FaceAttributeView
 from compas.datastructures.attributes import VertexAttributeView
 from compas.datastructures.datastructure import Datastructure
+from compas.datastructures.datastructure import _copy_attributes
+from compas.datastructures.datastructure import _copy_nested
+from compas.datastructures.datastructure import _transform_attributes
 from compas.files import OBJ
 from compas.geometry import Line
 from compas.geometry import Plane
@@ -239,6 +243,27 @@ class CellNetwork(Datastructure):
 
         return cell_network
 
+    def __copy_state__(self):
+        cell_network = type(self)(
+            default_vertex_attributes=deepcopy(self.default_vertex_attributes),
+            default_edge_attributes=deepcopy(self.default_edge_attributes),
+            default_face_attributes=deepcopy(self.default_face_attributes),
+            default_cell_attributes=deepcopy(self.default_cell_attributes),
+        )
+        cell_network.attributes.update(deepcopy(self.attributes))
+        cell_network._vertex = _copy_attributes(self._vertex)
+        cell_network._edge = _copy_nested(self._edge, 3)
+        cell_network._face = {face: vertices[:] for face, vertices in self._face.items()}
+        cell_network._plane = _copy_nested(self._plane, 3)
+        cell_network._cell = _copy_nested(self._cell, 3)
+        cell_network._edge_data = _copy_attributes(self._edge_data)
+        cell_network._face_data = _copy_attributes(self._face_data)
+        cell_network._cell_data = _copy_attributes(self._cell_data)
+        cell_network._max_vertex = self._max_vertex
+        cell_network._max_face = self._max_face
+        cell_network._max_cell = self._max_cell
+        return cell_network
+
     def __init__(self, default_vertex_attributes=None, default_edge_attributes=None, default_face_attributes=None, default_cell_attributes=None, name=None, **kwargs):  # fmt: skip
         super(CellNetwork, self).__init__(kwargs, name=name)
         self._max_vertex = -1
@@ -4289,32 +4314,32 @@ class CellNetwork(Datastructure):
     #         cells.add(self.halfface_cell(face))
     #     return list(cells)
 
-    # # --------------------------------------------------------------------------
-    # # Transformations
-    # # --------------------------------------------------------------------------
+    # --------------------------------------------------------------------------
+    # Transformations
+    # --------------------------------------------------------------------------
 
-    # def transform(self, T):
-    #     """Transform the mesh.
+    def transform(self, T):
+        """Transform the cell network.
 
-    #     Parameters
-    #     ----------
-    #     T : :class:`Transformation`
-    #         The transformation used to transform the mesh.
+        Parameters
+        ----------
+        T : :class:`Transformation`
+            The transformation used to transform the cell network.
 
-    #     Returns
-    #     -------
-    #     None
-    #         The mesh is modified in-place.
+        Returns
+        -------
+        None
+            The cell network is modified in-place.
 
-    #     Examples
-    #     --------
-    #     >>> from compas.datastructures import Mesh
-    #     >>> from compas.geometry import matrix_from_axis_and_angle
-    #     >>> mesh = Mesh.from_polyhedron(6)
-    #     >>> T = matrix_from_axis_and_angle([0, 0, 1], math.pi / 4)
-    #     >>> mesh.transform(T)
+        Examples
+        --------
+        >>> from compas.datastructures import CellNetwork
+        >>> from compas.geometry import Translation
+        >>> cell_network = CellNetwork()
+        >>> vertex = cell_network.add_vertex(x=1.0, y=2.0, z=3.0)
+        >>> cell_network.transform(Translation.from_vector([1.0, 0.0, 0.0]))
+        >>> cell_network.vertex_coordinates(vertex)
+        [2.0, 2.0, 3.0]
 
-    #     """
-    #     points = transform_points(self.vertices_attributes("xyz"), T)
-    #     for vertex, point in zip(self.vertices(), points):
-    #         self.vertex_attributes(vertex, "xyz", point)
+        """
+        _transform_attributes(self._vertex.values(), self.default_vertex_attributes, T)
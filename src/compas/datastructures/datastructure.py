@@ -9,8 +9,96 @@ except ImportError:
 else:
     G = TypeVar("G", bound="Datastructure")
 
+from array import array
+from copy import deepcopy
+from itertools import chain
+
+import compas
 from compas.data import Data
 
+try:
+    IMMUTABLE = set([int, long, float, str, unicode, bool, type(None)])  # type: ignore
+except NameError:
+    IMMUTABLE = set([int, float, str, bool, type(None)])
+
+
+def _copy_attributes(attributes):
+    """Copy a dict of attribute dicts.
+
+    The attribute values are only deep-copied if any of them is mutable.
+
+    Parameters
+    ----------
+    attributes : dict[hashable, dict[str, Any]]
+
+    Returns
+    -------
+    dict[hashable, dict[str, Any]]
+
+    """
+    types = set(map(type, chain.from_iterable(attr.values() for attr in attributes.values())))
+    if types <= IMMUTABLE:
+        return {key: dict(attr) for key, attr in attributes.items()}
+    return {key: deepcopy(dict(attr)) for key, attr in attributes.items()}
+
+
+def _copy_nested(d, depth):
+    """Copy nested dicts with immutable values, such as the adjacency dicts of data structures.
+
+    Parameters
+    ----------
+    d : dict
+    depth : int
+        The number of levels of nested dicts.
+
+    Returns
+    -------
+    dict
+
+    """
+    if depth == 1:
+        return dict(d)
+    if depth == 2:
+        return {key: dict(value) for key, value in d.items()}
+    return {key: _copy_nested(value, depth - 1) for key, value in d.items()}
+
+
+def _transform_attributes(attributes, defaults, transformation):
+    """Transform the coordinates stored in a collection of attribute dicts, in place.
+
+    The coordinates are gathered in a single buffer, transformed in bulk, and written back.
+
+    Parameters
+    ----------
+    attributes : iterable[dict[str, Any]]
+        The attribute dicts of the vertices or nodes.
+    defaults : dict[str, Any]
+        The default attributes, used for unset coordinates.
+    transformation : :class:`compas.geometry.Transformation` | list[list[float]]
+        The transformation.
+
+    Returns
+    -------
+    None
+
+    """
+    if compas.IPY:
+        from compas.geometry import transform_points_buffer as transform
+    else:
+        from compas.geometry import transform_points_buffer_numpy as transform
+
+    attributes = list(attributes)
+    x0 = defaults.get("x", 0.0)
+    y0 = defaults.get("y", 0.0)
+    z0 = defaults.get("z", 0.0)
+    xyz = array("d", chain.from_iterable((attr.get("x", x0), attr.get("y", y0), attr.get("z", z0)) for attr in attributes))
+    transform(xyz, transformation)
+    values = iter(xyz.tolist())
+    for attr, x, y, z in zip(attributes, values, values, values):
+        attr["x"] = x
+        attr["y"] = y
+        attr["z"] = z
+
 
 class Datastructure(Data):
     """Base class for all data structures."""
@@ -3,6 +3,7 @@ from __future__ import division
 from __future__ import print_function
 
 from ast import literal_eval
+from copy import deepcopy
 from itertools import combinations
 from random import sample
 from random import shuffle
@@ -17,8 +18,12 @@ else:
 from compas.datastructures.attributes import EdgeAttributeView
 from compas.datastructures.attributes import NodeAttributeView
 from compas.datastructures.datastructure import Datastructure
+from compas.datastructures.datastructure import _copy_attributes
+from compas.datastructures.datastructure import _copy_nested
+from compas.datastructures.datastructure import _transform_attributes
 from compas.files import OBJ
 from compas.geometry import Box
+from compas.geometry import KDTree
 from compas.geometry import Line
 from compas.geometry import Point
 from compas.geometry import Vector
@@ -31,7 +36,6 @@ from compas.geometry import normalize_vector
 from compas.geometry import oriented_bounding_box
 from compas.geometry import scale_vector
 from compas.geometry import subtract_vectors
-from compas.geometry import transform_points
 from compas.tolerance import TOL
 from compas.topology import astar_shortest_path
 from compas.topology import breadth_first_traverse
@@ -160,6 +164,18 @@ class Graph(Datastructure):
         graph._max_node = data.get("max_node", graph._max_node)
         return graph
 
+    def __copy_state__(self):
+        graph = type(self)(
+            default_node_attributes=deepcopy(self.default_node_attributes),
+            default_edge_attributes=deepcopy(self.default_edge_attributes),
+        )
+        graph.attributes.update(deepcopy(self.attributes))
+        graph.node = _copy_attributes(self.node)
+        graph.edge = {u: _copy_attributes(nbrs) for u, nbrs in self.edge.items()}
+        graph.adjacency = _copy_nested(self.adjacency, 2)
+        graph._max_node = self._max_node
+        return graph
+
     def __init__(
         self,
         default_node_attributes=None,
@@ -358,7 +374,7 @@ class Graph(Datastructure):
         return graph
 
     @classmethod
-    def from_pointcloud(cls, cloud, degree=3):
+    def from_pointcloud(cls, cloud, degree=3, nearest=False):
         """Construct a graph from random connections between the points of a pointcloud.
 
         Parameters
@@ -367,6 +383,9 @@ class Graph(Datastructure):
             A pointcloud object.
         degree : int, optional
             The number of connections per node.
+        nearest : bool, optional
+            If True, connect every node to its `degree` nearest neighbors, instead of to random nodes.
+            In that case, `degree` is the minimum number of connections per node.
 
         Returns
         -------
@@ -382,6 +401,16 @@ class Graph(Datastructure):
         graph = cls()
         for x, y, z in cloud:
             graph.add_node(x=x, y=y, z=z)
+        if nearest:
+            nodes = list(graph.nodes())
+            points = graph.nodes_attributes("xyz")
+            _, nbrs = KDTree(points).query(points, degree + 1)
+            for u, indices in zip(nodes, nbrs):
+                for index in indices:
+                    v = nodes[index]
+                    if v != u and not graph.has_edge((u, v), directed=False):
+                        graph.add_edge(u, v)
+            return graph
         nodes = list(graph.nodes())
         for u in graph.nodes():
             shuffle(nodes)
@@ -2278,10 +2307,7 @@ class Graph(Datastructure):
         None
 
         """
-        nodes = self.nodes_attributes("xyz")
-        points = transform_points(nodes, transformation)
-        for point, node in zip(points, self.nodes()):
-            self.node_attributes(node, "xyz", point)
+        _transform_attributes(self.node.values(), self.default_node_attributes, transformation)
 
     def aabb(self):
         """Calculate the axis aligned bounding box of the graph.
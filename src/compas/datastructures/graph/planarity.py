@@ -2,7 +2,6 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from itertools import product
 from math import cos
 from math import pi
 from math import sin
@@ -10,7 +9,7 @@ from math import sin
 from compas.geometry import angle_vectors_xy
 from compas.geometry import is_ccw_xy
 from compas.geometry import subtract_vectors_xy
-from compas.geometry._core.predicates_2 import is_intersection_segment_segment_xy
+from compas.geometry.intersections import _intersection_segments_segments_xy
 
 
 def graph_embed_in_plane_proxy(data, fixed=None):
@@ -38,30 +37,28 @@ def graph_is_crossed(graph):
     Notes
     -----
     This algorithm assumes that the graph lies in the XY plane.
+    Only the edges that are close to each other are tested for crossings,
+    using :func:`compas.geometry.intersection_segments_segments_xy`.
 
     """
-    for (u1, v1), (u2, v2) in product(graph.edges(), graph.edges()):
+    edges = list(graph.edges())
+    xy = {node: graph.node_attributes(node, "xy") for node in graph.nodes()}
+    return _are_edges_crossed(edges, xy)
+
+
+def _edge_crossings(edges, vertices):
+    # generate the pairs of crossing edges that do not share a vertex
+    segments = [(vertices[u], vertices[v]) for u, v in edges]
+    for i, j in _intersection_segments_segments_xy(segments):
+        (u1, v1), (u2, v2) = edges[i], edges[j]
         if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
             continue
-        a = graph.node_attributes(u1, "xy")
-        b = graph.node_attributes(v1, "xy")
-        c = graph.node_attributes(u2, "xy")
-        d = graph.node_attributes(v2, "xy")
-        if is_intersection_segment_segment_xy((a, b), (c, d)):
-            return True
-    return False
+        yield edges[i], edges[j]
 
 
 def _are_edges_crossed(edges, vertices):
-    for (u1, v1), (u2, v2) in product(edges, edges):
-        if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
-            continue
-        a = vertices[u1]
-        b = vertices[v1]
-        c = vertices[u2]
-        d = vertices[v2]
-        if is_intersection_segment_segment_xy((a, b), (c, d)):
-            return True
+    for _ in _edge_crossings(edges, vertices):
+        return True
     return False
 
 
@@ -81,6 +78,8 @@ def graph_count_crossings(graph):
     Notes
     -----
     This algorithm assumes that the graph lies in the XY plane.
+    Only the edges that are close to each other are tested for crossings,
+    using :func:`compas.geometry.intersection_segments_segments_xy`.
 
     """
     return len(graph_find_crossings(graph))
@@ -102,23 +101,13 @@ def graph_find_crossings(graph):
     Notes
     -----
     This algorithm assumes that the graph lies in the XY plane.
+    Only the edges that are close to each other are tested for crossings,
+    using :func:`compas.geometry.intersection_segments_segments_xy`.
 
     """
-    crossings = set()
-    for (u1, v1), (u2, v2) in product(graph.edges(), graph.edges()):
-        if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
-            continue
-        if ((u1, v1), (u2, v2)) in crossings:
-            continue
-        if ((u2, v2), (u1, v1)) in crossings:
-            continue
-        a = graph.node_attributes(u1, "xy")
-        b = graph.node_attributes(v1, "xy")
-        c = graph.node_attributes(u2, "xy")
-        d = graph.node_attributes(v2, "xy")
-        if is_intersection_segment_segment_xy((a, b), (c, d)):
-            crossings.add(((u1, v1), (u2, v2)))
-    return list(crossings)
+    edges = list(graph.edges())
+    xy = {node: graph.node_attributes(node, "xy") for node in graph.nodes()}
+    return list(_edge_crossings(edges, xy))
 
 
 def graph_is_xy(graph):
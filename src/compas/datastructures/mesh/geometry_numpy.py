@@ -0,0 +1,203 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from itertools import chain
+
+import numpy as np
+
+from compas.datastructures.storage import CompactFaceStore
+from compas.datastructures.storage import CompactVertexStore
+
+
+def _vertex_xyz(mesh):
+    if isinstance(mesh.vertex, CompactVertexStore):
+        return mesh.vertex.points_numpy()
+    return np.array(mesh.vertices_attributes("xyz"), dtype=np.float64).reshape((-1, 3))
+
+
+def _vertex_indices(mesh, keys):
+    # map vertex identifiers to positions in the vertex array
+    vertices = np.fromiter(mesh.vertices(), dtype=np.int64, count=mesh.number_of_vertices())
+    keys = np.asarray(keys, dtype=np.int64)
+    if np.array_equal(vertices, np.arange(len(vertices))):
+        return keys
+    order = np.argsort(vertices)
+    return order[np.searchsorted(vertices, keys, sorter=order)]
+
+
+def _face_indices(mesh):
+    if isinstance(mesh.face, CompactFaceStore):
+        store = mesh.face
+        slots = np.fromiter(store.slot.values(), dtype=np.intp, count=len(store))
+        start = np.frombuffer(store.start, dtype=np.dtype(store.start.typecode))[slots]
+        size = np.frombuffer(store.size, dtype=np.dtype(store.size.typecode))[slots]
+        offset = np.cumsum(size) - size
+        position = np.repeat(start - offset, size) + np.arange(size.sum())
+        flat = np.frombuffer(store.index, dtype=np.dtype(store.index.typecode))[position]
+    else:
+        faces = [mesh.face[face] for face in mesh.faces()]
+        size = np.fromiter(map(len, faces), dtype=np.intp, count=len(faces))
+        flat = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=size.sum())
+    return _vertex_indices(mesh, flat), size
+
+
+def mesh_face_groups_numpy(mesh):
+    """Pack the vertex indices of the faces of a mesh in arrays of faces with the same number of vertices.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    list[tuple[numpy.ndarray, numpy.ndarray]]
+        Per face degree, a pair of arrays with the positions of the faces in :meth:`Mesh.faces` order,
+        and the indices of the face vertices in :meth:`Mesh.vertices` order, of shape (m, degree).
+
+    """
+    flat, size = _face_indices(mesh)
+    offset = np.cumsum(size) - size
+    groups = []
+    for degree in np.unique(size):
+        position = np.nonzero(size == degree)[0]
+        indices = flat[offset[position][:, None] + np.arange(degree)]
+        groups.append((position, indices))
+    return groups
+
+
+def _faces_cross(xyz, indices):
+    # cross products of the triangles formed by the centroid of each face
+    # and the consecutive pairs of face vertices, with the pair (last, first) in first position
+    # similar to compas.geometry.normal_polygon and compas.geometry.area_polygon
+    points = xyz[indices]
+    centroids = points.mean(axis=1)
+    b = points - centroids[:, None, :]
+    a = np.roll(b, 1, axis=1)
+    return np.cross(a, b), centroids
+
+
+def _unitize(vectors):
+    length = np.linalg.norm(vectors, axis=1)
+    nonzero = length > 0
+    vectors[nonzero] /= length[nonzero][:, None]
+    return vectors
+
+
+def mesh_faces_normals_numpy(mesh, unitized=True):
+    """Compute the normals of all faces of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A mesh object.
+    unitized : bool, optional
+        If True, unitize the normal vectors.
+
+    Returns
+    -------
+    numpy.ndarray
+        The face normals in :meth:`Mesh.faces` order, as an array of shape (F, 3).
+
+    """
+    xyz = _vertex_xyz(mesh)
+    normals = np.zeros((mesh.number_of_faces(), 3))
+    for position, indices in mesh_face_groups_numpy(mesh):
+        cross, _ = _faces_cross(xyz, indices)
+        normals[position] = 0.5 * cross.sum(axis=1)
+    if unitized:
+        _unitize(normals)
+    return normals
+
+
+def mesh_faces_areas_numpy(mesh):
+    """Compute the areas of all faces of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    numpy.ndarray
+        The face areas in :meth:`Mesh.faces` order, as an array of shape (F,).
+
+    """
+    xyz = _vertex_xyz(mesh)
+    areas = np.zeros(mesh.number_of_faces())
+    for position, indices in mesh_face_groups_numpy(mesh):
+        cross, _ = _faces_cross(xyz, indices)
+        length = np.linalg.norm(cross, axis=2)
+        sign = np.where(np.einsum("ijk,ik->ij", cross, cross[:, 0]) > 0, 1.0, -1.0)
+        sign[:, 0] = 1.0
+        areas[position] = np.abs(0.5 * (sign * length).sum(axis=1))
+    return areas
+
+
+def mesh_faces_centroids_numpy(mesh):
+    """Compute the centroids of all faces of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    numpy.ndarray
+        The face centroids in :meth:`Mesh.faces` order, as an array of shape (F, 3).
+
+    """
+    xyz = _vertex_xyz(mesh)
+    centroids = np.zeros((mesh.number_of_faces(), 3))
+    for position, indices in mesh_face_groups_numpy(mesh):
+        centroids[position] = xyz[indices].mean(axis=1)
+    return centroids
+
+
+def mesh_edges_lengths_numpy(mesh):
+    """Compute the lengths of all edges of a mesh.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    numpy.ndarray
+        The edge lengths in :meth:`Mesh.edges` order, as an array of shape (E,).
+
+    """
+    xyz = _vertex_xyz(mesh)
+    edges = np.array(list(mesh.edges()), dtype=np.int64).reshape((-1, 2))
+    edges = _vertex_indices(mesh, edges)
+    return np.linalg.norm(xyz[edges[:, 1]] - xyz[edges[:, 0]], axis=1)
+
+
+def mesh_vertices_normals_numpy(mesh):
+    """Compute the normals of all vertices of a mesh,
+    as the normalized sum of the normals of the connected faces.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A mesh object.
+
+    Returns
+    -------
+    numpy.ndarray
+        The vertex normals in :meth:`Mesh.vertices` order, as an array of shape (V, 3).
+        The normal of a vertex without faces is the zero vector.
+
+    """
+    xyz = _vertex_xyz(mesh)
+    normals = np.zeros((len(xyz), 3))
+    for _, indices in mesh_face_groups_numpy(mesh):
+        cross, _ = _faces_cross(xyz, indices)
+        facenormals = 0.5 * cross.sum(axis=1)
+        for i in range(indices.shape[1]):
+            np.add.at(normals, indices[:, i], facenormals)
+    return _unitize(normals)
@@ -2,6 +2,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from copy import deepcopy
 from itertools import product
 from math import pi
 from random import sample
@@ -13,10 +14,16 @@ if compas.PY2:
 else:
     from collections.abc import Mapping
 
+from compas.data.hashing import structural_sha256
 from compas.datastructures.attributes import EdgeAttributeView
 from compas.datastructures.attributes import FaceAttributeView
 from compas.datastructures.attributes import VertexAttributeView
 from compas.datastructures.datastructure import Datastructure
+from compas.datastructures.datastructure import _copy_attributes
+from compas.datastructures.datastructure import _copy_nested
+from compas.datastructures.datastructure import _transform_attributes
+from compas.datastructures.storage import CompactFaceStore
+from compas.datastructures.storage import CompactVertexStore
 from compas.files import OBJ
 from compas.files import OFF
 from compas.files import PLY
@@ -51,7 +58,6 @@ from compas.geometry import oriented_bounding_box
 from compas.geometry import scale_vector
 from compas.geometry import subtract_vectors
 from compas.geometry import sum_vectors
-from compas.geometry import transform_points
 from compas.geometry import vector_average
 from compas.itertools import linspace
 from compas.itertools import pairwise
@@ -69,6 +75,7 @@ from .operations.split import mesh_split_face
 from .operations.split import mesh_split_strip
 from .operations.weld import mesh_unweld_edges
 from .operations.weld import mesh_unweld_vertices
+from .operations.weld import points_cluster_labels
 from .slice import mesh_slice_plane
 from .smoothing import mesh_smooth_area
 from .smoothing import mesh_smooth_centroid
@@ -88,6 +95,10 @@ class Mesh(Datastructure):
         Default values for face attributes.
     name : str, optional
         Then name of the mesh.
+    compact : bool, optional
+        If True, store the vertex coordinates and the face vertices in contiguous buffers,
+        instead of in a dict per vertex and a list per face.
+        This reduces the memory footprint of large meshes considerably.
     **kwargs : dict, optional
         Additional keyword arguments, which are stored in the attributes dict.
 
@@ -105,6 +116,15 @@ class Mesh(Datastructure):
         Dictionary contnaining default values for the attributes of faces.
         It is recommended to add a default to this dictionary using :meth:`update_default_face_attributes`
         for every face attribute used in the data structure.
+    compact : bool, read-only
+        True if the vertex coordinates and face vertices are stored in contiguous buffers.
+
+    Notes
+    -----
+    With compact storage, the face vertex lists returned by :meth:`face_vertices`
+    are copies of the stored connectivity.
+    Modifications of the vertices of a face should therefore be written back explicitly,
+    for example with ``mesh.face[face] = vertices``.
 
     Examples
     --------
@@ -166,6 +186,7 @@ class Mesh(Datastructure):
             },
             "max_vertex": {"type": "integer", "minimum": -1},
             "max_face": {"type": "integer", "minimum": -1},
+            "compact": {"type": "boolean"},
         },
         "required": [
             "attributes",
@@ -183,23 +204,27 @@ class Mesh(Datastructure):
 
     @property
     def __data__(self):
-        return self.__before_json_dump__(
-            {
-                "attributes": self.attributes,
-                "default_vertex_attributes": self.default_vertex_attributes,
-                "default_edge_attributes": self.default_edge_attributes,
-                "default_face_attributes": self.default_face_attributes,
-                "vertex": self.vertex,
-                "face": self.face,
-                "facedata": self.facedata,
-                "edgedata": self.edgedata,
-                "max_vertex": self._max_vertex,
-                "max_face": self._max_face,
-            }
-        )
+        data = {
+            "attributes": self.attributes,
+            "default_vertex_attributes": self.default_vertex_attributes,
+            "default_edge_attributes": self.default_edge_attributes,
+            "default_face_attributes": self.default_face_attributes,
+            "vertex": self.vertex,
+            "face": self.face,
+            "facedata": self.facedata,
+            "edgedata": self.edgedata,
+            "max_vertex": self._max_vertex,
+            "max_face": self._max_face,
+        }
+        if self._compact:
+            data["compact"] = True
+        return self.__before_json_dump__(data)
 
     def __before_json_dump__(self, data):
-        data["vertex"] = {str(vertex): attr for vertex, attr in data["vertex"].items()}
+        if self._compact:
+            data["vertex"] = {str(vertex): dict(attr) for vertex, attr in data["vertex"].items()}
+        else:
+            data["vertex"] = {str(vertex): attr for vertex, attr in data["vertex"].items()}
         data["face"] = {str(face): vertices for face, vertices in data["face"].items()}
         data["facedata"] = {str(face): attr for face, attr in data["facedata"].items()}
         return data
@@ -210,6 +235,7 @@ class Mesh(Datastructure):
             default_vertex_attributes=data.get("default_vertex_attributes"),
             default_face_attributes=data.get("default_face_attributes"),
             default_edge_attributes=data.get("default_edge_attributes"),
+            compact=data.get("compact", False),
         )
         mesh.attributes.update(data.get("attributes") or {})
 
@@ -218,11 +244,10 @@ class Mesh(Datastructure):
         facedata = data.get("facedata") or {}
         edgedata = data.get("edgedata") or {}
 
-        for key, attr in iter(vertex.items()):
-            mesh.add_vertex(key=key, attr_dict=attr)
-
-        for fkey, vertices in iter(face.items()):
-            mesh.add_face(vertices, fkey=fkey, attr_dict=facedata.get(fkey))
+        mesh._add_vertices_and_faces(
+            ((key, dict(attr)) for key, attr in vertex.items()),
+            ((fkey, vertices, facedata.get(fkey)) for fkey, vertices in face.items()),
+        )
 
         mesh.edgedata = edgedata
         mesh._max_vertex = data.get("max_vertex", mesh._max_vertex)
@@ -230,22 +255,40 @@ class Mesh(Datastructure):
 
         return mesh
 
+    def __copy_state__(self):
+        mesh = type(self)(
+            default_vertex_attributes=deepcopy(self.default_vertex_attributes),
+            default_face_attributes=deepcopy(self.default_face_attributes),
+            default_edge_attributes=deepcopy(self.default_edge_attributes),
+            compact=self._compact,
+        )
+        mesh.attributes.update(deepcopy(self.attributes))
+        if self._compact:
+            mesh.vertex = self.vertex.copy(mesh.default_vertex_attributes)
+            mesh.face = self.face.copy()
+        else:
+            mesh.vertex = _copy_attributes(self.vertex)
+            mesh.face = {face: vertices[:] for face, vertices in self.face.items()}
+        mesh.halfedge = _copy_nested(self.halfedge, 2)
+        mesh.facedata = _copy_attributes(self.facedata)
+        mesh.edgedata = _copy_attributes(self.edgedata)
+        mesh._max_vertex = self._max_vertex
+        mesh._max_face = self._max_face
+        return mesh
+
     def __init__(
             self,
             default_vertex_attributes=None,
             default_edge_attributes=None,
             default_face_attributes=None,
             name=None,
+            compact=False,
             **kwargs
         ):  # fmt: skip
         super(Mesh, self).__init__(kwargs, name=name)
         self._max_vertex = -1
         self._max_face = -1
-        self.vertex = {}
-        self.halfedge = {}
-        self.face = {}
-        self.facedata = {}
-        self.edgedata = {}
+        self._compact = compact
         self.default_vertex_attributes = {"x": 0.0, "y": 0.0, "z": 0.0}
         self.default_edge_attributes = {}
         self.default_face_attributes = {}
@@ -255,6 +298,11 @@ class Mesh(Datastructure):
             self.default_edge_attributes.update(default_edge_attributes)
         if default_face_attributes:
             self.default_face_attributes.update(default_face_attributes)
+        self.vertex = self._new_vertex_store()
+        self.halfedge = {}
+        self.face = self._new_face_store()
+        self.facedata = {}
+        self.edgedata = {}
 
     def __str__(self):
         tpl = "<Mesh with {} vertices, {} faces, {} edges>"
@@ -268,12 +316,26 @@ class Mesh(Datastructure):
     def adjacency(self):
         return self.halfedge
 
+    @property
+    def compact(self):
+        return self._compact
+
+    def _new_vertex_store(self):
+        if self._compact:
+            return CompactVertexStore(self.default_vertex_attributes)
+        return {}
+
+    def _new_face_store(self):
+        if self._compact:
+            return CompactFaceStore()
+        return {}
+
     # --------------------------------------------------------------------------
     # Constructors
     # --------------------------------------------------------------------------
 
     @classmethod
-    def from_obj(cls, filepath, precision=None):  # type: (...) -> Mesh
+    def from_obj(cls, filepath, precision=None, weld=True, name=None):  # type: (...) -> Mesh
         """Construct a mesh object from the data described in an OBJ file.
 
         Parameters
@@ -282,12 +344,27 @@ class Mesh(Datastructure):
             The path to the file.
         precision: str, optional
             The precision of the geometric map that is used to connect the lines.
+        weld : bool, optional
+            If True, vertices with the same geometric key are merged.
+            If False, the vertices are used as they are in the file, which is faster for files that are already indexed.
+        name : str, optional
+            The name of an object in the file.
+            If provided, only the faces of this object are read, and the mesh gets the same name.
 
         Returns
         -------
         :class:`compas.datastructures.Mesh`
             A mesh object.
 
+        Raises
+        ------
+        ValueError
+            If the file has no object with the given name.
+
+        See Also
+        --------
+        :meth:`compas.files.OBJ.iter_objects`
+
         Notes
         -----
         There are a few sample files available for testing and debugging:
@@ -300,7 +377,15 @@ class Mesh(Datastructure):
         * quadmesh.obj
 
         """
-        obj = OBJ(filepath, precision)
+        if name is not None:
+            for objectname, vertices, faces in OBJ(filepath, precision, weld).iter_objects():
+                if objectname == name:
+                    mesh = cls.from_vertices_and_faces(vertices, faces)
+                    mesh.name = name
+                    return mesh
+            raise ValueError("The file has no object with name: {}".format(name))
+
+        obj = OBJ(filepath, precision, weld)
         obj.read()
         vertices = obj.vertices
         faces = obj.faces
@@ -483,7 +568,7 @@ class Mesh(Datastructure):
         return cls.from_vertices_and_faces(vertices, faces)
 
     @classmethod
-    def from_vertices_and_faces(cls, vertices, faces):  # type: (...) -> Mesh
+    def from_vertices_and_faces(cls, vertices, faces, compact=False, trusted=False):  # type: (...) -> Mesh
         """Construct a mesh object from a list of vertices and faces.
 
         Parameters
@@ -494,6 +579,12 @@ class Mesh(Datastructure):
         faces : list[list[int]] | dict[int, list[int]]
             A list of faces, represented by a list of indices referencing the list of vertex coordinates,
             or a dictionary of face keys pointing to a list of indices referencing the list of vertex coordinates.
+        compact : bool, optional
+            If True, construct a mesh with compact storage of vertex coordinates and face vertices.
+        trusted : bool, optional
+            If True, the faces are trusted to be lists of (integer) vertex identifiers
+            without consecutive duplicates and with at least three vertices,
+            and they are stored without validation or copying.
 
         Returns
         -------
@@ -501,22 +592,19 @@ class Mesh(Datastructure):
             A mesh object.
 
         """
-        mesh = cls()
+        mesh = cls(compact=compact)
 
         if isinstance(vertices, Mapping):
-            for key, xyz in vertices.items():
-                mesh.add_vertex(key=key, attr_dict=dict(zip(("x", "y", "z"), xyz)))
+            vertices = ((key, dict(zip("xyz", xyz))) for key, xyz in vertices.items())
         else:
-            for x, y, z in iter(vertices):
-                mesh.add_vertex(x=x, y=y, z=z)
+            vertices = ((None, {"x": x, "y": y, "z": z}) for x, y, z in vertices)
 
         if isinstance(faces, Mapping):
-            for fkey, vertices in faces.items():
-                mesh.add_face(vertices, fkey)
+            faces = ((fkey, face, None) for fkey, face in faces.items())
         else:
-            for face in iter(faces):
-                mesh.add_face(face)
+            faces = ((None, face, None) for face in faces)
 
+        mesh._add_vertices_and_faces(vertices, faces, trusted=trusted)
         return mesh
 
     @classmethod
@@ -772,13 +860,15 @@ class Mesh(Datastructure):
         obj = OBJ(filepath, precision=precision)
         obj.write(self, unweld=unweld, **kwargs)
 
-    def to_ply(self, filepath, **kwargs):
+    def to_ply(self, filepath, binary=False, **kwargs):
         """Write a mesh object to a PLY file.
 
         Parameters
         ----------
         filepath : str
             The path to the file.
+        binary : bool, optional
+            If True, write the file in binary little-endian format.
 
         Returns
         -------
@@ -786,7 +876,7 @@ class Mesh(Datastructure):
 
         """
         ply = PLY(filepath)
-        ply.write(self, **kwargs)
+        ply.write(self, binary=binary, **kwargs)
 
     def to_stl(self, filepath, precision=None, binary=False, **kwargs):
         """Write a mesh to an STL file.
@@ -849,10 +939,10 @@ class Mesh(Datastructure):
         del self.halfedge
         del self.face
         del self.facedata
-        self.vertex = {}
+        self.vertex = self._new_vertex_store()
         self.edgedata = {}
         self.halfedge = {}
-        self.face = {}
+        self.face = self._new_face_store()
         self.facedata = {}
         self._max_vertex = -1
         self._max_face = -1
@@ -1109,6 +1199,76 @@ class Mesh(Datastructure):
                 self.halfedge[v][u] = None
         return fkey
 
+    def _add_vertices_and_faces(self, vertices, faces, trusted=False):
+        """Add vertices and faces to the mesh in a single pass over the input.
+
+        This is the bulk equivalent of calling :meth:`add_vertex` and :meth:`add_face` repeatedly,
+        and produces exactly the same data structure.
+
+        Parameters
+        ----------
+        vertices : iterable[tuple[int | None, dict[str, Any]]]
+            The vertices as pairs of an identifier, or None for an automatic identifier, and an attribute dict.
+            The attribute dicts of new vertices are stored as-is.
+        faces : iterable[tuple[int | None, list[int], dict[str, Any] | None]]
+            The faces as triplets of an identifier, or None for an automatic identifier,
+            a list of vertex identifiers, and an attribute dict or None.
+        trusted : bool, optional
+            If True, the face vertices are not validated or copied.
+
+        Returns
+        -------
+        None
+
+        """
+        vertex = self.vertex
+        halfedge = self.halfedge
+        face = self.face
+        facedata = self.facedata
+
+        max_vertex = self._max_vertex
+        for key, attr in vertices:
+            if key is None:
+                key = max_vertex = max_vertex + 1
+            else:
+                key = int(key)
+                if key > max_vertex:
+                    max_vertex = key
+            if key in vertex:
+                vertex[key].update(attr)
+            else:
+                vertex[key] = attr
+                halfedge[key] = {}
+        self._max_vertex = max_vertex
+
+        max_face = self._max_face
+        for fkey, vertices, attr in faces:
+            if not trusted:
+                if vertices[-1] == vertices[0]:
+                    vertices = vertices[:-1]
+                vertices = [int(key) for key in vertices]
+                n = len(vertices)
+                vertices = [vertices[i] for i in range(n) if vertices[i] != vertices[i + 1 - n]]
+                if len(vertices) < 3:
+                    continue
+            if fkey is None:
+                fkey = max_face = max_face + 1
+            else:
+                fkey = int(fkey)
+                if fkey > max_face:
+                    max_face = fkey
+            face[fkey] = vertices
+            facedata.setdefault(fkey, attr or {})
+            n = len(vertices)
+            for i in range(n):
+                u = vertices[i]
+                v = vertices[i + 1 - n]
+                halfedge[u][v] = fkey
+                nbrs = halfedge[v]
+                if u not in nbrs:
+                    nbrs[u] = None
+        self._max_face = max_face
+
     # rename this to "add"
     # and add an alias
     def join(self, other, weld=False, precision=None):
@@ -1301,7 +1461,7 @@ class Mesh(Datastructure):
         """
         self.halfedge = {key: {} for key in self.vertices()}
         for fkey in self.faces():
-            self.face[fkey][:] = self.face[fkey][::-1]
+            self.face[fkey] = self.face[fkey][::-1]
             for u, v in self.face_halfedges(fkey):
                 self.halfedge[u][v] = fkey
                 if u not in self.halfedge[v]:
@@ -1898,6 +2058,8 @@ class Mesh(Datastructure):
             for name, value in zip(names, values):
                 self.vertex[key][name] = value
             return
+        if self._compact and names == "xyz":
+            return self.vertex.point(key)
         # use it as a getter
         if not names:
             # return all vertex attributes as a dict
@@ -1990,6 +2152,8 @@ class Mesh(Datastructure):
             for key in keys:
                 self.vertex_attributes(key, names, values)
             return
+        if self._compact and names == "xyz":
+            return self.vertex.points(keys)
         return [self.vertex_attributes(key, names) for key in keys]
 
     def update_default_face_attributes(self, attr_dict=None, **kwattr):
@@ -2478,6 +2642,93 @@ class Mesh(Datastructure):
             return
         return [self.edge_attributes(edge, names) for edge in edges]
 
+    # --------------------------------------------------------------------------
+    # Hashing
+    # --------------------------------------------------------------------------
+
+    def vertices_sha256(self, as_string=False):
+        """Compute a structural hash of every vertex of the mesh.
+
+        The hash of a vertex only depends on its attributes, including the default attributes.
+
+        Parameters
+        ----------
+        as_string : bool, optional
+            If True, return the digests in hexadecimal format rather than as bytes.
+
+        Returns
+        -------
+        dict[int, bytes | str]
+            A dictionary mapping each vertex to its hash.
+
+        See Also
+        --------
+        :meth:`faces_sha256`, :meth:`edges_sha256`
+        :meth:`compas.data.Data.sha256`
+
+        """
+        hashes = {}
+        for vertex in self.vertices():
+            h = structural_sha256(dict(self.vertex_attributes(vertex)))
+            hashes[vertex] = h.hexdigest() if as_string else h.digest()
+        return hashes
+
+    def faces_sha256(self, as_string=False):
+        """Compute a structural hash of every face of the mesh.
+
+        The hash of a face depends on its vertices and its attributes, including the default attributes.
+
+        Parameters
+        ----------
+        as_string : bool, optional
+            If True, return the digests in hexadecimal format rather than as bytes.
+
+        Returns
+        -------
+        dict[int, bytes | str]
+            A dictionary mapping each face to its hash.
+
+        See Also
+        --------
+        :meth:`vertices_sha256`, :meth:`edges_sha256`
+        :meth:`compas.data.Data.sha256`
+
+        """
+        hashes = {}
+        for face in self.faces():
+            h = structural_sha256([self.face_vertices(face), dict(self.face_attributes(face))])
+            hashes[face] = h.hexdigest() if as_string else h.digest()
+        return hashes
+
+    def edges_sha256(self, as_string=False):
+        """Compute a structural hash of every edge of the mesh.
+
+        The hash of an edge depends on its (sorted) vertices and its attributes, including the default attributes.
+
+        Parameters
+        ----------
+        as_string : bool, optional
+            If True, return the digests in hexadecimal format rather than as bytes.
+
+        Returns
+        -------
+        dict[tuple[int, int], bytes | str]
+            A dictionary mapping each edge to its hash.
+
+        See Also
+        --------
+        :meth:`vertices_sha256`, :meth:`faces_sha256`
+        :meth:`compas.data.Data.sha256`
+
+        """
+        hashes = {}
+        for edge in self.edges():
+            attr = dict(self.default_edge_attributes)
+            attr.update(self.edgedata.get(str(tuple(sorted(edge))), {}))
+            h = structural_sha256([sorted(edge), attr])
+            hashes[edge] = h.hexdigest() if as_string else h.digest()
+        return hashes
+
     # --------------------------------------------------------------------------
     # Info
     # --------------------------------------------------------------------------
@@ -2823,7 +3074,7 @@ class Mesh(Datastructure):
     # Cleanup
     # --------------------------------------------------------------------------
 
-    def weld(self, precision=None):
+    def weld(self, precision=None, tolerance=None):
         """Weld vertices that are closer than a given precision.
 
         Parameters
@@ -2831,16 +3082,23 @@ class Mesh(Datastructure):
         precision : int, optional
             The precision of the geometric map that is used to connect the lines.
             Defaults to the value of :attr:`compas.PRECISION`.
+        tolerance : float, optional
+            If provided, weld vertices that are closer than this distance,
+            instead of vertices with the same geometric key.
 
         Returns
         -------
         None
             The mesh is modified in place.
 
+        See Also
+        --------
+        :meth:`remove_duplicate_vertices`
+
         """
-        self.remove_duplicate_vertices(precision=precision)
+        self.remove_duplicate_vertices(precision=precision, tolerance=tolerance)
 
-    def remove_duplicate_vertices(self, precision=None):
+    def remove_duplicate_vertices(self, precision=None, tolerance=None):
         """Remove all duplicate vertices and clean up any affected faces.
 
         Parameters
@@ -2848,12 +3106,26 @@ class Mesh(Datastructure):
         precision : int, optional
             Precision for converting numbers to strings.
             Default is :attr:`TOL.precision`.
+        tolerance : float, optional
+            If provided, vertices are considered duplicates if they are closer than this distance,
+            rather than if they have the same geometric key.
+            This also merges near-duplicates that straddle a rounding boundary.
 
         Returns
         -------
         None
             The mesh is modified in-place.
 
+        Notes
+        -----
+        Of every group of duplicate vertices, a vertex on the boundary is kept if there is one.
+        Otherwise, the last vertex of the group in :meth:`vertices` order is kept.
+        Faces that are reduced to less than three vertices are removed.
+
+        The duplicates are identified with a spatial hash of the vertex coordinates,
+        and the faces and halfedges are rebuilt in a single pass.
+        The operation is therefore linear in the size of the mesh.
+
         Examples
         --------
         >>> import compas
@@ -2875,38 +3147,51 @@ class Mesh(Datastructure):
         36
 
         """
-        vertex_gkey = {}
-        for vertex in self.vertices():
-            gkey = TOL.geometric_key(self.vertex_coordinates(vertex), precision=precision)
-            vertex_gkey[vertex] = gkey
+        vertices = list(self.vertices())
+        points = self.vertices_attributes("xyz", keys=vertices)
+
+        if tolerance is None:
+            labels = [TOL.geometric_key(point, precision=precision) for point in points]
+        else:
+            labels = points_cluster_labels(points, tolerance)
+
+        vertex_label = dict(zip(vertices, labels))
+        label_vertex = dict(zip(labels, vertices))
+        if len(label_vertex) == len(vertices):
+            return
 
-        gkey_vertex = {gkey: vertex for vertex, gkey in iter(vertex_gkey.items())}
+        boundary = set()
+        for u in self.halfedge:
+            for v, face in self.halfedge[u].items():
+                if face is None:
+                    boundary.add(u)
+                    boundary.add(v)
+        for vertex in vertices:
+            if vertex in boundary:
+                label_vertex[vertex_label[vertex]] = vertex
 
-        for boundary in self.vertices_on_boundaries():
-            for vertex in boundary:
-                gkey = TOL.geometric_key(self.vertex_coordinates(vertex), precision=precision)
-                gkey_vertex[gkey] = vertex
+        vertex_vertex = {vertex: label_vertex[label] for vertex, label in vertex_label.items()}
 
-        for vertex in list(self.vertices()):
-            test = gkey_vertex[vertex_gkey[vertex]]
-            if test != vertex:
+        for vertex in vertices:
+            if vertex_vertex[vertex] != vertex:
                 del self.vertex[vertex]
-                del self.halfedge[vertex]
-                for u in self.halfedge:
-                    nbrs = list(self.halfedge[u].keys())
-                    for v in nbrs:
-                        if v == vertex:
-                            del self.halfedge[u][v]
 
-        for face in self.faces():
+        self.halfedge = {vertex: {} for vertex in self.vertex}
+
+        for face in list(self.faces()):
             seen = set()
-            vertices = []
-            for vertex in [gkey_vertex[vertex_gkey[vertex]] for vertex in self.face_vertices(face)]:
+            face_vertices = []
+            for vertex in self.face[face]:
+                vertex = vertex_vertex[vertex]
                 if vertex not in seen:
                     seen.add(vertex)
-                    vertices.append(vertex)
-            self.face[face] = vertices
-            for u, v in self.face_halfedges(face):
+                    face_vertices.append(vertex)
+            if len(face_vertices) < 3:
+                del self.face[face]
+                self.facedata.pop(face, None)
+                continue
+            self.face[face] = face_vertices
+            for u, v in pairwise(face_vertices + face_vertices[:1]):
                 self.halfedge[u][v] = face
                 if u not in self.halfedge[v]:
                     self.halfedge[v][u] = None
@@ -3881,7 +4166,7 @@ class Mesh(Datastructure):
             The area.
 
         """
-        return sum(self.face_area(fkey) for fkey in self.faces())
+        return sum(self.faces_areas())
 
     def volume(self, copy=True, unify_cycles=True):
         """Calculate the volume of the mesh.
@@ -3961,9 +4246,10 @@ class Mesh(Datastructure):
             The coordinates of the mesh centroid.
 
         """
+        areas = self.faces_areas()
         return scale_vector(
-            sum_vectors([scale_vector(self.face_centroid(fkey), self.face_area(fkey)) for fkey in self.faces()]),
-            1.0 / self.area(),
+            sum_vectors([scale_vector(centroid, area) for centroid, area in zip(self.faces_centroids(), areas)]),
+            1.0 / sum(areas),
         )
 
     def normal(self):
@@ -3975,9 +4261,10 @@ class Mesh(Datastructure):
             The coordinates of the mesh normal.
 
         """
+        areas = self.faces_areas()
         return scale_vector(
-            sum_vectors([scale_vector(self.face_normal(fkey), self.face_area(fkey)) for fkey in self.faces()]),
-            1.0 / self.area(),
+            sum_vectors([scale_vector(normal, area) for normal, area in zip(self.faces_normals(), areas)]),
+            1.0 / sum(areas),
         )
 
     def aabb(self):
@@ -4160,6 +4447,39 @@ class Mesh(Datastructure):
         vectors = [self.face_normal(fkey, False) for fkey in self.vertex_faces(key) if fkey is not None]
         return Vector(*normalize_vector(centroid_points(vectors)))
 
+    def vertices_normals(self):
+        """Compute the normals of all vertices of the mesh in one call.
+
+        Returns
+        -------
+        list[list[float]]
+            The normal vectors in the order of :meth:`vertices`.
+            The normal of a vertex without faces is the zero vector.
+
+        See Also
+        --------
+        :meth:`vertex_normal`
+        :meth:`faces_normals`
+
+        Notes
+        -----
+        The normals are computed with NumPy if it is available.
+
+        """
+        if not compas.IPY:
+            from .geometry_numpy import mesh_vertices_normals_numpy
+
+            return mesh_vertices_normals_numpy(self).tolist()
+
+        vertex_normal = {vertex: [0.0, 0.0, 0.0] for vertex in self.vertices()}
+        for face, normal in zip(self.faces(), self.faces_normals(unitized=False)):
+            for vertex in self.face_vertices(face):
+                n = vertex_normal[vertex]
+                n[0] += normal[0]
+                n[1] += normal[1]
+                n[2] += normal[2]
+        return [normalize_vector(normal) for normal in vertex_normal.values()]
+
     def vertex_curvature(self, vkey):
         """Dimensionless vertex curvature.
 
@@ -4261,6 +4581,31 @@ class Mesh(Datastructure):
         a, b = self.edge_coordinates(edge)
         return distance_point_point(a, b)
 
+    def edges_lengths(self):
+        """Compute the lengths of all edges of the mesh in one call.
+
+        Returns
+        -------
+        list[float]
+            The edge lengths in the order of :meth:`edges`.
+
+        See Also
+        --------
+        :meth:`edge_length`
+
+        Notes
+        -----
+        The lengths are computed with NumPy if it is available.
+
+        """
+        if not compas.IPY:
+            from .geometry_numpy import mesh_edges_lengths_numpy
+
+            return mesh_edges_lengths_numpy(self).tolist()
+
+        xyz = dict(zip(self.vertices(), self.vertices_attributes("xyz")))
+        return [distance_point_point(xyz[u], xyz[v]) for u, v in self.edges()]
+
     def edge_vector(self, edge):
         """Return the vector of an edge.
 
@@ -4407,6 +4752,37 @@ class Mesh(Datastructure):
         """
         return Vector(*normal_polygon(self.face_coordinates(fkey), unitized=unitized))
 
+    def faces_normals(self, unitized=True):
+        """Compute the normals of all faces of the mesh in one call.
+
+        Parameters
+        ----------
+        unitized : bool, optional
+            If True, the vectors are unitized.
+
+        Returns
+        -------
+        list[list[float]]
+            The normal vectors in the order of :meth:`faces`.
+
+        See Also
+        --------
+        :meth:`face_normal`
+        :meth:`vertices_normals`
+
+        Notes
+        -----
+        The normals are computed with NumPy if it is available.
+
+        """
+        if not compas.IPY:
+            from .geometry_numpy import mesh_faces_normals_numpy
+
+            return mesh_faces_normals_numpy(self, unitized=unitized).tolist()
+
+        xyz = dict(zip(self.vertices(), self.vertices_attributes("xyz")))
+        return [normal_polygon([xyz[vertex] for vertex in self.face_vertices(face)], unitized=unitized) for face in self.faces()]
+
     def face_centroid(self, fkey):
         """Compute the point at the centroid of a face.
 
@@ -4423,6 +4799,31 @@ class Mesh(Datastructure):
         """
         return Point(*centroid_points(self.face_coordinates(fkey)))
 
+    def faces_centroids(self):
+        """Compute the centroids of all faces of the mesh in one call.
+
+        Returns
+        -------
+        list[list[float]]
+            The XYZ coordinates of the centroids in the order of :meth:`faces`.
+
+        See Also
+        --------
+        :meth:`face_centroid`
+
+        Notes
+        -----
+        The centroids are computed with NumPy if it is available.
+
+        """
+        if not compas.IPY:
+            from .geometry_numpy import mesh_faces_centroids_numpy
+
+            return mesh_faces_centroids_numpy(self).tolist()
+
+        xyz = dict(zip(self.vertices(), self.vertices_attributes("xyz")))
+        return [centroid_points([xyz[vertex] for vertex in self.face_vertices(face)]) for face in self.faces()]
+
     def face_center(self, fkey):
         """Compute the point at the center of mass of a face.
 
@@ -4455,6 +4856,31 @@ class Mesh(Datastructure):
         """
         return area_polygon(self.face_coordinates(fkey))
 
+    def faces_areas(self):
+        """Compute the areas of all faces of the mesh in one call.
+
+        Returns
+        -------
+        list[float]
+            The face areas in the order of :meth:`faces`.
+
+        See Also
+        --------
+        :meth:`face_area`
+
+        Notes
+        -----
+        The areas are computed with NumPy if it is available.
+
+        """
+        if not compas.IPY:
+            from .geometry_numpy import mesh_faces_areas_numpy
+
+            return mesh_faces_areas_numpy(self).tolist()
+
+        xyz = dict(zip(self.vertices(), self.vertices_attributes("xyz")))
+        return [area_polygon([xyz[vertex] for vertex in self.face_vertices(face)]) for face in self.faces()]
+
     def face_flatness(self, fkey, maxdev=0.02):
         """Compute the flatness of the mesh face.
 
@@ -4859,9 +5285,10 @@ class Mesh(Datastructure):
         >>> mesh.transform(T)
 
         """
-        points = transform_points(self.vertices_attributes("xyz"), T)
-        for vertex, point in zip(self.vertices(), points):
-            self.vertex_attributes(vertex, "xyz", point)
+        if self._compact:
+            self.vertex.transform(T)
+        else:
+            _transform_attributes(self.vertex.values(), self.default_vertex_attributes, T)
 
     def transform_numpy(self, T):
         """Transform the mesh.
@@ -4885,11 +5312,7 @@ class Mesh(Datastructure):
         >>> mesh.transform_numpy(T)
 
         """
-        from compas.geometry import transform_points_numpy
-
-        points = transform_points_numpy(self.vertices_attributes("xyz"), T)
-        for vertex, point in zip(self.vertices(), points):
-            self.vertex_attributes(vertex, "xyz", point)
+        self.transform(T)
 
     # --------------------------------------------------------------------------
     # Matrices
@@ -147,6 +147,7 @@ def mesh_collapse_edge(mesh, edge, t=0.5, allow_boundary=False, fixed=None):
             # u > v > d => u > d
             d = mesh.face_vertex_descendant(fkey, v)
             face.remove(v)
+            mesh.face[fkey] = face
             del mesh.halfedge[u][v]
             del mesh.halfedge[v][d]
             mesh.halfedge[u][d] = fkey
@@ -176,6 +177,7 @@ def mesh_collapse_edge(mesh, edge, t=0.5, allow_boundary=False, fixed=None):
             # a > v > u => a > u
             a = mesh.face_vertex_ancestor(fkey, v)
             face.remove(v)
+            mesh.face[fkey] = face
             del mesh.halfedge[a][v]
             del mesh.halfedge[v][u]
             mesh.halfedge[a][u] = fkey
@@ -190,6 +192,7 @@ def mesh_collapse_edge(mesh, edge, t=0.5, allow_boundary=False, fixed=None):
             face = mesh.face[fkey]
             a = mesh.face_vertex_ancestor(fkey, v)
             face[face.index(v)] = u
+            mesh.face[fkey] = face
 
             if v in mesh.halfedge[a]:
                 del mesh.halfedge[a][v]
@@ -42,8 +42,8 @@ def mesh_add_vertex_to_face_edge(mesh, key, fkey, v):
     To add the isolated vertex to the single mesh face
 
     >>> mesh_add_vertex_to_face_edge(mesh, 4, 0, 1)
-    >>> len(mesh.face_vertices(0))
-    5
+    >>> mesh.face_vertices(0)
+    [0, 4, 1, 2, 3]
     >>> mesh.vertex_degree(4)
     2
 
@@ -51,7 +51,8 @@ def mesh_add_vertex_to_face_edge(mesh, key, fkey, v):
     vertices = mesh.face_vertices(fkey)
     i = vertices.index(v)
     u = vertices[i - 1]
-    vertices.insert(key, i - 1)
+    vertices.insert(i, key)
+    mesh.face[fkey] = vertices
     mesh.halfedge[u][key] = fkey
     mesh.halfedge[key][v] = fkey
     if u not in mesh.halfedge[key]:
@@ -72,12 +72,17 @@ def mesh_merge_faces(mesh, faces):
         if v in mesh.halfedge and u in mesh.halfedge[v]:
             del mesh.halfedge[v][u]
     # remove unused vertices
-    for vertex in mesh.face_vertices(key):
+    # the vertex list is written back explicitly
+    # to support meshes with compact face storage
+    vertices = mesh.face_vertices(key)
+    for vertex in vertices:
         if len(mesh.vertex_neighbors(vertex)) < 2:
             mesh.delete_vertex(vertex)
-            mesh.face[key].remove(vertex)
+            vertices.remove(vertex)
+    mesh.face[key] = vertices
     # remove degenerate edges
     for u, v in mesh.face_halfedges(key):
         if u == v:
-            mesh.face[key].remove(v)
+            vertices.remove(v)
+    mesh.face[key] = vertices
     return key
@@ -2,6 +2,9 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from itertools import product
+from math import floor
+
 from compas.itertools import pairwise
 from compas.topology import connected_components
 from compas.topology import vertex_adjacency_from_edges
@@ -9,6 +12,61 @@ from compas.topology import vertex_adjacency_from_edges
 from .substitute import mesh_substitute_vertex_in_faces
 
 
+def points_cluster_labels(points, tolerance):
+    """Label points such that points closer to each other than a given tolerance get the same label.
+
+    Parameters
+    ----------
+    points : list[[float, float, float]]
+        The XYZ coordinates of the points.
+    tolerance : float
+        The maximum distance between two points of the same cluster.
+
+    Returns
+    -------
+    list[int]
+        Per point, the index of the first point of its cluster.
+
+    Notes
+    -----
+    The points are hashed into a uniform grid with cells of size `tolerance`,
+    such that only the points in the 27 cells surrounding every point have to be checked.
+    Clusters are the connected components of the "closer than tolerance" relation,
+    therefore points in a chain of near-duplicates end up in the same cluster
+    even if the ends of the chain are further apart than `tolerance`.
+
+    """
+    if tolerance <= 0:
+        raise ValueError("The tolerance should be positive: {}".format(tolerance))
+
+    tolerance2 = tolerance**2
+    parent = list(range(len(points)))
+
+    def find(i):
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    grid = {}
+    offsets = list(product((-1, 0, 1), repeat=3))
+    for i, (x, y, z) in enumerate(points):
+        a, b, c = int(floor(x / tolerance)), int(floor(y / tolerance)), int(floor(z / tolerance))
+        for da, db, dc in offsets:
+            for j in grid.get((a + da, b + db, c + dc), ()):
+                u, v, w = points[j]
+                if (x - u) ** 2 + (y - v) ** 2 + (z - w) ** 2 <= tolerance2:
+                    ri, rj = find(i), find(j)
+                    if ri != rj:
+                        # keep the lowest index as root
+                        parent[max(ri, rj)] = min(ri, rj)
+        grid.setdefault((a, b, c), []).append(i)
+
+    return [find(i) for i in range(len(points))]
+
+
 def mesh_unweld_vertices(mesh, fkey, where=None):
     """Unweld a face of the mesh.
 
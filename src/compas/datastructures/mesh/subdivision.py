@@ -51,9 +51,13 @@ def subd_factory(cls):
 
 def mesh_fast_copy(other):
     SubdMesh = subd_factory(type(other))
-    subd = SubdMesh()
-    subd.vertex = deepcopy(other.vertex)
-    subd.face = deepcopy(other.face)
+    subd = SubdMesh(compact=other.compact)
+    if other.compact:
+        subd.vertex = other.vertex.copy(subd.default_vertex_attributes)
+        subd.face = other.face.copy()
+    else:
+        subd.vertex = deepcopy(other.vertex)
+        subd.face = deepcopy(other.face)
     subd.facedata = deepcopy(other.facedata)
     subd.halfedge = deepcopy(other.halfedge)
     subd._max_vertex = other._max_vertex
@@ -0,0 +1,432 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from array import array
+
+import compas
+from compas.datastructures._mutablemapping import MutableMapping
+from compas.datastructures.datastructure import _copy_attributes
+
+AXES = {"x": 0, "y": 1, "z": 2}
+
+
+class CompactVertexAttributes(MutableMapping):
+    """Mutable Mapping that provides a read/write view of the attributes of a single vertex in a :class:`CompactVertexStore`.
+
+    The coordinates are read from and written to the coordinate buffer of the store.
+    All other attributes are stored in a (sparse) dict per vertex.
+
+    """
+
+    __slots__ = ("store", "key", "slot")
+
+    def __init__(self, store, key, slot):
+        self.store = store
+        self.key = key
+        self.slot = slot
+
+    def __str__(self):
+        return str(dict(self))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __getitem__(self, name):
+        if name in AXES:
+            i = 3 * self.slot + AXES[name]
+            if i in self.store.unset:
+                raise KeyError(name)
+            return self.store.xyz[i]
+        return self.store.attr[self.key][name]
+
+    def __setitem__(self, name, value):
+        if name in AXES:
+            i = 3 * self.slot + AXES[name]
+            self.store.xyz[i] = value
+            self.store.unset.discard(i)
+        else:
+            self.store.attr.setdefault(self.key, {})[name] = value
+
+    def __delitem__(self, name):
+        if name in AXES:
+            if name not in self:
+                raise KeyError(name)
+            self.store.unset.add(3 * self.slot + AXES[name])
+        else:
+            attr = self.store.attr[self.key]
+            del attr[name]
+            if not attr:
+                del self.store.attr[self.key]
+
+    def __iter__(self):
+        unset = self.store.unset
+        for name, i in zip("xyz", range(3 * self.slot, 3 * self.slot + 3)):
+            if i not in unset:
+                yield name
+        for name in self.store.attr.get(self.key, ()):
+            yield name
+
+    def update(self, attr=None, **kwattr):
+        for attr in (attr, kwattr):
+            if attr:
+                for name in attr:
+                    self[name] = attr[name]
+
+    def copy(self):
+        return dict(self)
+
+
+class CompactVertexStore(MutableMapping):
+    """Mutable Mapping of vertex identifiers to vertex attributes,
+    with the vertex coordinates stored in a single contiguous buffer of 64-bit floats.
+
+    Parameters
+    ----------
+    defaults : dict[str, Any], optional
+        The default vertex attributes of the data structure,
+        used to resolve unset coordinates in bulk queries.
+
+    Attributes
+    ----------
+    xyz : array.array
+        The coordinate buffer, with the XYZ coordinates of a vertex stored at ``3 * slot``.
+    unset : set[int]
+        The positions in the coordinate buffer of the coordinates that are not set.
+        Any value in the buffer, including ``nan``, is a valid coordinate.
+    attr : dict[int, dict[str, Any]]
+        The non-coordinate attributes of the vertices that have any.
+
+    Notes
+    -----
+    The values of this mapping are lightweight views (:class:`CompactVertexAttributes`)
+    that are created on access.
+    Their contents are stored in the store itself, not in the view.
+
+    """
+
+    def __init__(self, defaults=None):
+        super(CompactVertexStore, self).__init__()
+        self.defaults = defaults if defaults is not None else {}
+        self.slot = {}
+        self.xyz = array("d")
+        self.unset = set()
+        self.attr = {}
+        self.free = []
+
+    def __len__(self):
+        return len(self.slot)
+
+    def __iter__(self):
+        return iter(self.slot)
+
+    def __contains__(self, key):
+        return key in self.slot
+
+    def __getitem__(self, key):
+        return CompactVertexAttributes(self, key, self.slot[key])
+
+    def __setitem__(self, key, attr):
+        if isinstance(attr, CompactVertexAttributes):
+            attr = dict(attr)
+        slot = self.slot.get(key)
+        if slot is None:
+            if self.free:
+                slot = self.free.pop()
+            else:
+                slot = len(self.xyz) // 3
+                self.xyz.extend((0.0, 0.0, 0.0))
+            # reuse the key object as slot number if possible
+            # to avoid allocating an additional int per vertex
+            self.slot[key] = key if key == slot else slot
+        self.attr.pop(key, None)
+        for name, i in AXES.items():
+            if name in attr:
+                self.xyz[3 * slot + i] = attr[name]
+                self.unset.discard(3 * slot + i)
+            else:
+                self.xyz[3 * slot + i] = 0.0
+                self.unset.add(3 * slot + i)
+        for name in attr:
+            if name not in AXES:
+                self.attr.setdefault(key, {})[name] = attr[name]
+
+    def __delitem__(self, key):
+        slot = self.slot.pop(key)
+        self.attr.pop(key, None)
+        if self.unset:
+            self.unset.difference_update(range(3 * slot, 3 * slot + 3))
+        self.free.append(slot)
+
+    def _default(self, i):
+        return self.defaults.get("xyz"[i], 0.0)
+
+    def copy(self, defaults=None):
+        """Make an independent copy of the store.
+
+        Parameters
+        ----------
+        defaults : dict[str, Any], optional
+            The default vertex attributes of the data structure of the copy.
+
+        Returns
+        -------
+        :class:`CompactVertexStore`
+
+        """
+        store = CompactVertexStore(defaults)
+        store.slot = dict(self.slot)
+        store.xyz = array("d", self.xyz)
+        store.unset = set(self.unset)
+        store.attr = _copy_attributes(self.attr)
+        store.free = self.free[:]
+        return store
+
+    def point(self, key):
+        """Return the coordinates of a single vertex.
+
+        Parameters
+        ----------
+        key : int
+            The identifier of the vertex.
+
+        Returns
+        -------
+        list[float]
+
+        Raises
+        ------
+        KeyError
+            If the vertex does not exist.
+
+        """
+        i = 3 * self.slot[key]
+        xyz = self.xyz[i : i + 3].tolist()
+        if self.unset:
+            xyz = [self._default(j) if i + j in self.unset else value for j, value in enumerate(xyz)]
+        return xyz
+
+    def points(self, keys=None):
+        """Return the coordinates of multiple vertices.
+
+        Parameters
+        ----------
+        keys : iterable[int], optional
+            The identifiers of the vertices.
+            Defaults to all vertices, in iteration order.
+
+        Returns
+        -------
+        list[list[float]]
+
+        """
+        xyz = self.xyz
+        slot = self.slot
+        unset = self.unset
+        if keys is None:
+            keys = slot
+        coordinates = []
+        for key in keys:
+            i = 3 * slot[key]
+            point = xyz[i : i + 3].tolist()
+            if unset and (i in unset or i + 1 in unset or i + 2 in unset):
+                point = [self._default(j) if i + j in unset else value for j, value in enumerate(point)]
+            coordinates.append(point)
+        return coordinates
+
+    def set_points(self, keys, coordinates):
+        """Set the coordinates of multiple vertices.
+
+        Parameters
+        ----------
+        keys : iterable[int]
+            The identifiers of the vertices.
+        coordinates : iterable[[float, float, float]]
+            The new coordinates, one set per vertex.
+
+        Returns
+        -------
+        None
+
+        """
+        xyz = self.xyz
+        slot = self.slot
+        unset = self.unset
+        for key, (x, y, z) in zip(keys, coordinates):
+            i = 3 * slot[key]
+            xyz[i] = x
+            xyz[i + 1] = y
+            xyz[i + 2] = z
+            if unset:
+                unset.difference_update((i, i + 1, i + 2))
+
+    def transform(self, transformation):
+        """Transform the coordinates of all vertices in place.
+
+        Unset coordinates are set to their default values before the transformation.
+
+        Parameters
+        ----------
+        transformation : :class:`compas.geometry.Transformation` | list[list[float]]
+            The transformation.
+
+        Returns
+        -------
+        None
+
+        """
+        for i in self.unset:
+            self.xyz[i] = self._default(i % 3)
+        self.unset.clear()
+        if compas.IPY:
+            from compas.geometry import transform_points_buffer
+
+            transform_points_buffer(self.xyz, transformation)
+        else:
+            import numpy as np
+
+            from compas.geometry import transform_points_buffer_numpy
+
+            # the view on the buffer is released when the function returns
+            # a buffer with exported views cannot be resized
+            xyz = np.frombuffer(self.xyz, dtype=np.float64).reshape((-1, 3))
+            transform_points_buffer_numpy(xyz, transformation)
+
+    def points_numpy(self, keys=None):
+        """Return the coordinates of multiple vertices as a NumPy array.
+
+        Parameters
+        ----------
+        keys : iterable[int], optional
+            The identifiers of the vertices.
+            Defaults to all vertices, in iteration order.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of shape (n, 3).
+
+        """
+        import numpy as np
+
+        buffer = np.frombuffer(self.xyz, dtype=np.float64).reshape((-1, 3))
+        if keys is None:
+            keys = self.slot
+        slots = np.fromiter((self.slot[key] for key in keys), dtype=np.intp)
+        xyz = buffer[slots]
+        if self.unset:
+            mask = np.zeros(len(self.xyz), dtype=bool)
+            mask[np.fromiter(self.unset, dtype=np.intp, count=len(self.unset))] = True
+            unset = mask.reshape((-1, 3))[slots]
+            xyz[unset] = np.broadcast_to(np.array([self._default(i) for i in range(3)]), xyz.shape)[unset]
+        return xyz
+
+
+class CompactFaceStore(MutableMapping):
+    """Mutable Mapping of face identifiers to lists of vertex identifiers,
+    with the face vertices of all faces packed into a single contiguous index buffer.
+
+    Attributes
+    ----------
+    index : array.array
+        The packed vertex identifiers of all faces.
+    start : array.array
+        The position in the index buffer of the first vertex of every face slot.
+    size : array.array
+        The number of vertices of every face slot.
+
+    Notes
+    -----
+    The values returned by this mapping are new lists.
+    Changes to the vertices of a face should therefore be written back explicitly,
+    for example ``faces[fkey] = vertices``.
+
+    Replaced and deleted faces leave unused space in the index buffer,
+    which is reclaimed when it makes up more than half of the buffer.
+
+    """
+
+    def __init__(self):
+        super(CompactFaceStore, self).__init__()
+        self.slot = {}
+        self.index = array("l")
+        self.start = array("l")
+        self.size = array("l")
+        self.free = []
+        self.garbage = 0
+
+    def __len__(self):
+        return len(self.slot)
+
+    def __iter__(self):
+        return iter(self.slot)
+
+    def __contains__(self, key):
+        return key in self.slot
+
+    def __getitem__(self, key):
+        slot = self.slot[key]
+        start = self.start[slot]
+        return self.index[start : start + self.size[slot]].tolist()
+
+    def __setitem__(self, key, vertices):
+        n = len(vertices)
+        slot = self.slot.get(key)
+        if slot is not None and self.size[slot] == n:
+            start = self.start[slot]
+            self.index[start : start + n] = array("l", vertices)
+            return
+        if slot is None:
+            if self.free:
+                slot = self.free.pop()
+            else:
+                slot = len(self.start)
+                self.start.append(0)
+                self.size.append(0)
+            self.slot[key] = key if key == slot else slot
+        else:
+            self.garbage += self.size[slot]
+        self.start[slot] = len(self.index)
+        self.size[slot] = n
+        self.index.extend(vertices)
+        if self.garbage > len(self.index) // 2:
+            self.compact()
+
+    def __delitem__(self, key):
+        slot = self.slot.pop(key)
+        self.garbage += self.size[slot]
+        self.size[slot] = 0
+        self.free.append(slot)
+
+    def copy(self):
+        """Make an independent copy of the store.
+
+        Returns
+        -------
+        :class:`CompactFaceStore`
+
+        """
+        store = CompactFaceStore()
+        store.slot = dict(self.slot)
+        store.index = array("l", self.index)
+        store.start = array("l", self.start)
+        store.size = array("l", self.size)
+        store.free = self.free[:]
+        store.garbage = self.garbage
+        return store
+
+    def compact(self):
+        """Reclaim the unused space in the index buffer.
+
+        Returns
+        -------
+        None
+
+        """
+        index = array("l")
+        for slot in self.slot.values():
+            start = self.start[slot]
+            self.start[slot] = len(index)
+            index.extend(self.index[start : start + self.size[slot]])
+        self.index = index
+        self.garbage = 0
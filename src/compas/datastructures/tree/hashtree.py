@@ -7,6 +7,32 @@ from compas.datastructures import Tree
 from compas.datastructures import TreeNode
 
 
+def _snapshot(value):
+    # copy mutable values, such that later changes to the original object do not affect the tree
+    if isinstance(value, list):
+        return [_snapshot(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_snapshot(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _snapshot(item) for key, item in value.items()}
+    return value
+
+
+def _identical(a, b):
+    # check if two values have the same JSON representation, without serializing them
+    if type(a) is not type(b):
+        return False
+    if a is None or isinstance(a, (bool, int, str)):
+        return a == b
+    if isinstance(a, float):
+        return a.hex() == b.hex()
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(_identical(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict):
+        return list(a.keys()) == list(b.keys()) and all(_identical(a[key], b[key]) for key in a)
+    return False
+
+
 class HashNode(TreeNode):
     """A node in a HashTree. This class is used internally by the HashTree class.
 
@@ -41,6 +67,7 @@ class HashNode(TreeNode):
         self.path = path
         self.value = value
         self._signature = None
+        self._children_dict = {}
 
     def __repr__(self):
         path = self.path or "ROOT"
@@ -65,12 +92,58 @@ class HashNode(TreeNode):
 
     @property
     def children_dict(self):
-        return {child.path: child for child in self.children}
+        return self._children_dict
 
     @property
     def children_paths(self):
         return [child.path for child in self.children]
 
+    def add(self, node):
+        """Add a child node to this node.
+
+        Parameters
+        ----------
+        node : :class:`compas.datastructures.HashNode`
+            The node to add.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        TypeError
+            If the node is not a :class:`compas.datastructures.HashNode` object.
+        ValueError
+            If this node already has a different child with the same path.
+
+        """
+        if not isinstance(node, HashNode):
+            raise TypeError("The node is not a HashNode object.")
+        child = self._children_dict.get(node.path)
+        if child is None:
+            self._children.append(node)
+            self._children_dict[node.path] = node
+        elif child is not node:
+            raise ValueError("The node already has a child with path: {}".format(node.path))
+        node._parent = self
+
+    def remove(self, node):
+        """Remove a child node from this node.
+
+        Parameters
+        ----------
+        node : :class:`compas.datastructures.HashNode`
+            The node to remove.
+
+        Returns
+        -------
+        None
+
+        """
+        super(HashNode, self).remove(node)
+        del self._children_dict[node.path]
+
     @classmethod
     def from_dict(cls, data_dict, path=""):
         """Construct a HashNode from a dictionary.
@@ -95,7 +168,7 @@ class HashNode(TreeNode):
                 child = cls.from_dict(data_dict[key], path=path)
                 node.add(child)
             else:
-                node.add(cls(path, value=data_dict[key]))
+                node.add(cls(path, value=_snapshot(data_dict[key])))
 
         return node
 
@@ -146,13 +219,16 @@ class HashTree(Tree):
         self.signatures = {}
 
     @classmethod
-    def from_dict(cls, data_dict):
+    def from_dict(cls, data_dict, previous=None):
         """Construct a HashTree from a dictionary.
 
         Parameters
         ----------
         data_dict : dict
             A dictionary to construct the HashTree from.
+        previous : :class:`compas.datastructures.HashTree`, optional
+            A HashTree of a previous version of the dictionary.
+            The signatures of the subtrees that did not change are reused instead of recomputed.
 
         Returns
         -------
@@ -163,15 +239,175 @@ class HashTree(Tree):
         tree = cls()
         root = HashNode.from_dict(data_dict)
         tree.add(root)
+        if previous is not None and previous.root is not None:
+            tree._reuse_signatures(root, previous.root)
         tree.node_signature(tree.root)
         return tree
 
     @classmethod
-    def from_object(cls, obj):
-        """Construct a HashTree from a COMPAS data object."""
+    def from_object(cls, obj, previous=None):
+        """Construct a HashTree from a COMPAS data object.
+
+        Parameters
+        ----------
+        obj : :class:`compas.data.Data`
+            The data object.
+        previous : :class:`compas.datastructures.HashTree`, optional
+            A HashTree of a previous version of the object.
+            The signatures of the subtrees that did not change are reused instead of recomputed.
+
+        Returns
+        -------
+        :class:`compas.datastructures.HashTree`
+            A HashTree constructed from the data of the object.
+
+        """
         if not isinstance(obj, Data):
             raise TypeError("The object must be a COMPAS data object.")
-        return cls.from_dict(obj.__data__)
+        return cls.from_dict(obj.__data__, previous=previous)
+
+    def _set_signature(self, node, absolute_path, signature):
+        self.signatures[absolute_path] = signature
+        node._signature = signature
+
+    def _reuse_signatures(self, node, previous, parent_path=""):
+        # copy the signatures of the subtrees that are identical in a previous version of the tree
+        # and return True if the subtree of the node is identical
+        absolute_path = parent_path + node.path
+        if node.is_value or previous.is_value:
+            identical = not node.children and not previous.children and _identical(node.value, previous.value)
+        else:
+            identical = len(node.children) == len(previous.children)
+            previous_children = previous.children_dict
+            for index, child in enumerate(node.children):
+                other = previous_children.get(child.path)
+                if other is None:
+                    identical = False
+                    continue
+                if not self._reuse_signatures(child, other, absolute_path):
+                    identical = False
+                elif identical and previous.children[index] is not other:
+                    # the signature depends on the order of the children
+                    identical = False
+        if identical and previous.signature is not None:
+            self._set_signature(node, absolute_path, previous.signature)
+            return True
+        return False
+
+    def get_node(self, path):
+        """Get a node of the tree by its absolute path.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path of the node, for example ``".vertex.0.x"``.
+
+        Returns
+        -------
+        :class:`compas.datastructures.HashNode`
+
+        Raises
+        ------
+        KeyError
+            If the tree has no node with this path.
+
+        """
+
+        def _find(node, rest):
+            if not rest:
+                return node
+            child = node.children_dict.get(rest)
+            if child is not None:
+                return child
+            # the keys of the dict can contain dots themselves
+            index = rest.find(".", 1)
+            while index != -1:
+                child = node.children_dict.get(rest[:index])
+                if child is not None:
+                    found = _find(child, rest[index:])
+                    if found is not None:
+                        return found
+                index = rest.find(".", index + 1)
+
+        node = None
+        if self.root is not None and path.startswith(self.root.path):
+            node = _find(self.root, path[len(self.root.path) :])
+        if node is None:
+            raise KeyError(path)
+        return node
+
+    def invalidate(self, node):
+        """Mark a node as modified, by removing the signatures of the node and its ancestors.
+
+        The signatures are recomputed by the next call to :meth:`node_signature` on the root.
+
+        Parameters
+        ----------
+        node : :class:`compas.datastructures.HashNode`
+            The modified node.
+
+        Returns
+        -------
+        None
+
+        """
+        for this in [node] + list(node.ancestors):
+            self.signatures.pop(this.absolute_path, None)
+            this._signature = None
+
+    def update(self, path, value):
+        """Update the value at a path, and recompute only the signatures of the affected nodes.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path of an existing node.
+        value : dict | str | int | float | list | bool | None
+            The new value.
+            If the value is a dict, the subtree of the node is replaced by a subtree constructed from the dict.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            If the tree has no node with this path.
+
+        Examples
+        --------
+        >>> tree = HashTree.from_dict({"a": {"b": 1, "c": 3}, "d": [1, 2, 3]})
+        >>> tree.update(".a.c", 2)
+        >>> tree.root.signature == HashTree.from_dict({"a": {"b": 1, "c": 2}, "d": [1, 2, 3]}).root.signature
+        True
+
+        """
+        node = self.get_node(path)
+        absolute_path = node.absolute_path
+        for descendant in node.descendants:
+            self.signatures.pop(descendant.absolute_path, None)
+        self.invalidate(node)
+
+        if isinstance(value, dict):
+            new = HashNode.from_dict(value, path=node.path)
+        else:
+            new = HashNode(node.path, value=_snapshot(value))
+
+        parent = node.parent
+        if parent is None:
+            self.remove(node)
+            self.add(new)
+        else:
+            # replace the node in place, because the signature of the parent depends on the order of its children
+            index = parent.children.index(node)
+            parent.children[index] = new
+            parent.children_dict[new.path] = new
+            new._parent = parent
+            node._parent = None
+
+        self.node_signature(new, absolute_path[: len(absolute_path) - len(new.path)])
+        self.node_signature(self.root)
 
     def node_signature(self, node, parent_path=""):
         """Compute the SHA256 signature of a node. The computed nodes are cached in `self.signatures` dictionary.
@@ -225,21 +461,25 @@ class HashTree(Tree):
         modified = []
 
         def _diff(node1, node2):
+            # identical subtrees are skipped entirely
             if node1.signature == node2.signature:
                 return
-            else:
-                if node1.is_value or node2.is_value:
-                    modified.append({"path": node1.absolute_path, "old": node2.value, "new": node1.value})
-
-                for path in node1.children_paths:
-                    if path in node2.children_dict:
-                        _diff(node1.children_dict[path], node2.children_dict[path])
-                    else:
-                        added.append({"path": node1.children_dict[path].absolute_path, "value": node1.children_dict[path].value})
-
-                for path in node2.children_paths:
-                    if path not in node1.children_dict:
-                        removed.append({"path": node2.children_dict[path].absolute_path, "value": node2.children_dict[path].value})
+
+            if node1.is_value or node2.is_value:
+                modified.append({"path": node1.absolute_path, "old": node2.value, "new": node1.value})
+
+            children2 = node2.children_dict
+            for child in node1.children:
+                other = children2.get(child.path)
+                if other is not None:
+                    _diff(child, other)
+                else:
+                    added.append({"path": child.absolute_path, "value": child.value})
+
+            children1 = node1.children_dict
+            for child in node2.children:
+                if child.path not in children1:
+                    removed.append({"path": child.absolute_path, "value": child.value})
 
         _diff(self.root, other.root)
 
@@ -2,6 +2,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from copy import deepcopy
 from itertools import product
 from random import sample
 
@@ -18,6 +19,9 @@ from compas.datastructures.attributes import EdgeAttributeView
 from compas.datastructures.attributes import FaceAttributeView
 from compas.datastructures.attributes import VertexAttributeView
 from compas.datastructures.datastructure import Datastructure
+from compas.datastructures.datastructure import _copy_attributes
+from compas.datastructures.datastructure import _copy_nested
+from compas.datastructures.datastructure import _transform_attributes
 from compas.files import OBJ
 from compas.geometry import Box
 from compas.geometry import Line
@@ -39,7 +43,6 @@ from compas.geometry import oriented_bounding_box
 from compas.geometry import project_point_plane
 from compas.geometry import scale_vector
 from compas.geometry import subtract_vectors
-from compas.geometry import transform_points
 from compas.itertools import linspace
 from compas.itertools import pairwise
 from compas.tolerance import TOL
@@ -170,7 +173,7 @@ class VolMesh(Datastructure):
             "cell": {str(cell): faces for cell, faces in _cell.items()},
             "edge_data": self._edge_data,
             "face_data": self._face_data,
-            "cell_data": {str(cell): attr for cell, attr in self._cell_data},
+            "cell_data": {str(cell): attr for cell, attr in self._cell_data.items()},
             "max_vertex": self._max_vertex,
             "max_face": self._max_face,
             "max_cell": self._max_cell,
@@ -211,6 +214,27 @@ class VolMesh(Datastructure):
 
         return volmesh
 
+    def __copy_state__(self):
+        # type: () -> VolMesh
+        volmesh = type(self)(
+            default_vertex_attributes=deepcopy(self.default_vertex_attributes),
+            default_edge_attributes=deepcopy(self.default_edge_attributes),
+            default_face_attributes=deepcopy(self.default_face_attributes),
+            default_cell_attributes=deepcopy(self.default_cell_attributes),
+        )
+        volmesh.attributes.update(deepcopy(self.attributes))
+        volmesh._vertex = _copy_attributes(self._vertex)
+        volmesh._halfface = {face: vertices[:] for face, vertices in self._halfface.items()}
+        volmesh._cell = _copy_nested(self._cell, 3)
+        volmesh._plane = _copy_nested(self._plane, 3)
+        volmesh._edge_data = _copy_attributes(self._edge_data)
+        volmesh._face_data = _copy_attributes(self._face_data)
+        volmesh._cell_data = _copy_attributes(self._cell_data)
+        volmesh._max_vertex = self._max_vertex
+        volmesh._max_face = self._max_face
+        volmesh._max_cell = self._max_cell
+        return volmesh
+
     def __init__(self, default_vertex_attributes=None, default_edge_attributes=None, default_face_attributes=None, default_cell_attributes=None, name=None, **kwargs):  # fmt: skip
         # type: (dict | None, dict | None, dict | None, dict | None, str | None, dict) -> None
         super(VolMesh, self).__init__(kwargs, name=name)
@@ -4409,6 +4433,4 @@ class VolMesh(Datastructure):
         >>> mesh.transform(T)
 
         """
-        points = transform_points(self.vertices_attributes("xyz"), T)
-        for vertex, point in zip(self.vertices(), points):
-            self.vertex_attributes(vertex, "xyz", point)
+        _transform_attributes(self._vertex.values(), self.default_vertex_attributes, T)
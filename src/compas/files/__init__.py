@@ -4,24 +4,32 @@ This package defines a number of file formats and provides functionality for rea
 
 from __future__ import absolute_import
 
-from .gltf.gltf import GLTF
-from .gltf.gltf_content import GLTFContent  # noqa: F401
-from .gltf.gltf_exporter import GLTFExporter  # noqa: F401
-from .gltf.gltf_mesh import GLTFMesh  # noqa: F401
-from .gltf.gltf_parser import GLTFParser  # noqa: F401
-from .gltf.gltf_reader import GLTFReader  # noqa: F401
-from .obj import OBJ, OBJParser, OBJReader, OBJWriter  # noqa: F401
-from .off import OFF, OFFReader, OFFWriter  # noqa: F401
-from .ply import PLY, PLYParser, PLYReader, PLYWriter  # noqa: F401
-from .stl import STL, STLParser, STLReader, STLWriter  # noqa: F401
-from .xml import XML, XMLElement, XMLReader, XMLWriter, prettify_string  # noqa: F401
+from compas._lazy import lazy_attributes as _lazy_attributes
+
+_submodules = [
+    (".gltf.gltf", ["GLTF"]),
+    (".gltf.gltf_content", ["GLTFContent"]),
+    (".gltf.gltf_exporter", ["GLTFExporter"]),
+    (".gltf.gltf_mesh", ["GLTFMesh"]),
+    (".gltf.gltf_parser", ["GLTFParser"]),
+    (".gltf.gltf_reader", ["GLTFReader"]),
+    (".obj", ["OBJ", "OBJParser", "OBJReader", "OBJWriter"]),
+    (".off", ["OFF", "OFFReader", "OFFWriter"]),
+    (".pcd", ["PCD", "PCDReader", "PCDWriter"]),
+    (".ply", ["PLY", "PLYParser", "PLYReader", "PLYWriter"]),
+    (".stl", ["STL", "STLParser", "STLReader", "STLWriter"]),
+    (".xml", ["XML", "XMLElement", "XMLReader", "XMLWriter", "prettify_string"]),
+]
 
 __all__ = [
     "GLTF",
     "OBJ",
     "OFF",
+    "PCD",
     "PLY",
     "STL",
     "XML",
     "prettify_string",
 ]
+
+_lazy_attributes(__name__, globals(), _submodules)
@@ -8,9 +8,15 @@ import json
 import os
 import shutil
 import struct
+import sys
+from itertools import chain
 
+import compas
+from compas.files.gltf.constants import COMPONENT_TYPE_BYTE
 from compas.files.gltf.constants import COMPONENT_TYPE_ENUM
 from compas.files.gltf.constants import COMPONENT_TYPE_FLOAT
+from compas.files.gltf.constants import COMPONENT_TYPE_SHORT
+from compas.files.gltf.constants import COMPONENT_TYPE_UNSIGNED_BYTE
 from compas.files.gltf.constants import COMPONENT_TYPE_UNSIGNED_INT
 from compas.files.gltf.constants import COMPONENT_TYPE_UNSIGNED_SHORT
 from compas.files.gltf.constants import NUM_COMPONENTS_BY_TYPE_ENUM
@@ -29,6 +35,15 @@ try:
 except TypeError:
     USE_BYTEARRAY_BUFFERS = False
 
+NUMPY_DTYPE_BY_COMPONENT_TYPE = {
+    COMPONENT_TYPE_BYTE: "<i1",
+    COMPONENT_TYPE_UNSIGNED_BYTE: "<u1",
+    COMPONENT_TYPE_SHORT: "<i2",
+    COMPONENT_TYPE_UNSIGNED_SHORT: "<u2",
+    COMPONENT_TYPE_UNSIGNED_INT: "<u4",
+    COMPONENT_TYPE_FLOAT: "<f4",
+}
+
 
 class GLTFExporter(object):
     """Export a glTF or glb file based on the supplied scene and ancillary data.
@@ -45,6 +60,14 @@ class GLTFExporter(object):
         with the exception of external image data.
         When ``False``, the data will be written to an external binary file or chunk.
 
+    Notes
+    -----
+    The binary data of the accessors, images and other buffer views is collected
+    as a list of chunks, which are only joined when the complete buffer is requested,
+    and which are written to the *.bin* file or the binary chunk of the *.glb* file one by one.
+    The data of the accessors is packed in bulk with NumPy if available,
+    and with :mod:`array` otherwise.
+
     """
 
     def __init__(self, filepath, content, embed_data=False):
@@ -66,7 +89,9 @@ class GLTFExporter(object):
         self._texture_index_by_key = {}
         self._sampler_index_by_key = {}
         self._image_index_by_key = {}
-        self._buffer = b""
+        self._buffer_chunks = []
+        self._buffer_length = 0
+        self._buffer_cache = None
 
         self.load()
 
@@ -80,6 +105,12 @@ class GLTFExporter(object):
             self._embed_data = value
             self.load()
 
+    @property
+    def _buffer(self):
+        if self._buffer_cache is None:
+            self._buffer_cache = bytes(bytearray().join(self._buffer_chunks))
+        return self._buffer_cache
+
     def load(self):
         """Creates the json object and the binary data (if any) to be written.
 
@@ -101,7 +132,9 @@ class GLTFExporter(object):
         self._texture_index_by_key = self._get_index_by_key(self._content.textures)
         self._sampler_index_by_key = self._get_index_by_key(self._content.samplers)
         self._image_index_by_key = self._get_index_by_key(self._content.images)
-        self._buffer = b""
+        self._buffer_chunks = []
+        self._buffer_length = 0
+        self._buffer_cache = None
 
         self._set_path_attributes()
         self._add_meshes()
@@ -133,9 +166,9 @@ class GLTFExporter(object):
         if self._ext == ".gltf":
             with open(self.gltf_filepath, "w") as f:
                 f.write(gltf_json)
-            if not self._embed_data and len(self._buffer) > 0:
+            if not self._embed_data and self._buffer_length > 0:
                 with open(self.get_bin_path(), "wb") as f:
-                    f.write(self._buffer)
+                    self._write_buffer(f)
 
         if self._ext == ".glb":
             with open(self.gltf_filepath, "wb") as f:
@@ -145,7 +178,7 @@ class GLTFExporter(object):
                 spaces_gltf = (4 - (length_gltf & 3)) & 3
                 length_gltf += spaces_gltf
 
-                length_bin = len(self._buffer)
+                length_bin = self._buffer_length
                 zeros_bin = (4 - (length_bin & 3)) & 3
                 length_bin += zeros_bin
 
@@ -166,10 +199,14 @@ class GLTFExporter(object):
                 if length_bin > 0:
                     f.write(struct.pack("<I", length_bin))
                     f.write("BIN\0".encode())
-                    f.write(self._buffer)
+                    self._write_buffer(f)
                     for i in range(0, zeros_bin):
                         f.write("\0".encode())
 
+    def _write_buffer(self, f):
+        for chunk in self._buffer_chunks:
+            f.write(chunk)
+
     def _add_extensions_recursively(self, item):
         # get the extensions that are in the attributes
         for a in dir(item):
@@ -269,9 +306,9 @@ class GLTFExporter(object):
         self._gltf_dict["meshes"] = mesh_list
 
     def _add_buffer(self):
-        if not self._buffer:
+        if not self._buffer_length:
             return
-        buffer = {"byteLength": len(self._buffer)}
+        buffer = {"byteLength": self._buffer_length}
         if self._embed_data:
             buffer["uri"] = "data:application/octet-stream;base64," + base64.b64encode(self._buffer).decode("ascii")
         elif self._ext == ".gltf":
@@ -344,7 +381,10 @@ class GLTFExporter(object):
     def _construct_primitives(self, mesh_data):
         primitives = []
         for primitive_data in mesh_data.primitive_data_list:
-            indices_accessor = self._construct_accessor(primitive_data.indices, COMPONENT_TYPE_UNSIGNED_SHORT, TYPE_SCALAR)
+            indices_component_type = COMPONENT_TYPE_UNSIGNED_SHORT
+            if primitive_data.indices and max(primitive_data.indices) > 65535:
+                indices_component_type = COMPONENT_TYPE_UNSIGNED_INT
+            indices_accessor = self._construct_accessor(primitive_data.indices, indices_component_type, TYPE_SCALAR)
 
             attributes = {}
             for attr in primitive_data.attributes:
@@ -375,33 +415,13 @@ class GLTFExporter(object):
             return None
         count = len(data)
 
-        fmt_char = COMPONENT_TYPE_ENUM[component_type]
-        fmt = "<" + fmt_char * NUM_COMPONENTS_BY_TYPE_ENUM[type_]
-
-        component_size = struct.calcsize("<" + fmt_char)
-        if component_type == "MAT2" and component_size == 1:
-            fmt = "<FFxxFFxx".replace("F", fmt_char)
-        elif component_type == "MAT3" and component_size == 1:
-            fmt = "<FFFxFFFxFFFx".replace("F", fmt_char)
-        elif component_type == "MAT3" and component_size == 2:
-            fmt = "<FFFxxFFFxxFFFxx".replace("F", fmt_char)
-
-        component_len = struct.calcsize(fmt)
-
-        # ensure bytes_ length is divisible by 4
-        size = count * component_len
-        size += (4 - size % 4) % 4
-
-        if USE_BYTEARRAY_BUFFERS:
-            bytes_ = bytearray(size)
+        if compas.IPY:
+            bytes_, minimum, maximum = self._pack_accessor_data(data, component_type, type_, include_bounds)
         else:
-            bytes_ = array.array("B", [0] * size)
+            bytes_, minimum, maximum = self._pack_accessor_data_numpy(data, component_type, type_, include_bounds)
 
-        for i, datum in enumerate(data):
-            if isinstance(datum, int) or isinstance(datum, float):
-                struct.pack_into(fmt, bytes_, (i * component_len), datum)
-            else:
-                struct.pack_into(fmt, bytes_, (i * component_len), *datum)
+        # ensure bytes_ length is divisible by 4
+        bytes_ += b"\0" * ((4 - len(bytes_) % 4) % 4)
 
         buffer_view_index = self._construct_buffer_view(bytes_)
         accessor_dict = {
@@ -411,17 +431,6 @@ class GLTFExporter(object):
             "type": type_,
         }
         if include_bounds:
-            try:
-                # Here we check if ``data`` contains tuples,
-                # and compute min/max per coordinate.
-                _ = [e for e in data[0]]
-                minimum = tuple(map(min, zip(*data)))
-                maximum = tuple(map(max, zip(*data)))
-            except TypeError:
-                # Here, ``data`` must contain primitives and not tuples,
-                # so min and max are more simply computed.
-                minimum = (min(data),)
-                maximum = (max(data),)
             accessor_dict["min"] = minimum
             accessor_dict["max"] = maximum
 
@@ -429,6 +438,41 @@ class GLTFExporter(object):
 
         return len(self._gltf_dict["accessors"]) - 1
 
+    def _pack_accessor_data_numpy(self, data, component_type, type_, include_bounds):
+        import numpy as np
+
+        dtype = np.float64 if component_type == COMPONENT_TYPE_FLOAT else np.int64
+        values = np.asarray(data, dtype=dtype).reshape(len(data), NUM_COMPONENTS_BY_TYPE_ENUM[type_])
+        bytes_ = values.astype(NUMPY_DTYPE_BY_COMPONENT_TYPE[component_type]).tobytes()
+
+        minimum = maximum = None
+        if include_bounds and len(data):
+            minimum = tuple(values.min(axis=0).tolist())
+            maximum = tuple(values.max(axis=0).tolist())
+        return bytes_, minimum, maximum
+
+    def _pack_accessor_data(self, data, component_type, type_, include_bounds):
+        if NUM_COMPONENTS_BY_TYPE_ENUM[type_] == 1 and isinstance(data[0], (int, float)):
+            values = list(data)
+            columns = [values]
+        else:
+            values = list(chain.from_iterable(data))
+            columns = list(zip(*data))
+
+        typecode = COMPONENT_TYPE_ENUM[component_type]
+        if typecode == "I" and array.array("I").itemsize != 4:
+            typecode = "L"
+        values = array.array(typecode, values)
+        if sys.byteorder == "big":
+            values.byteswap()
+        bytes_ = bytearray(values.tostring() if compas.IPY else values.tobytes())
+
+        minimum = maximum = None
+        if include_bounds:
+            minimum = tuple(map(min, columns))
+            maximum = tuple(map(max, columns))
+        return bytes_, minimum, maximum
+
     def _construct_buffer_view(self, bytes_):
         if not bytes_:
             return None
@@ -444,11 +488,18 @@ class GLTFExporter(object):
         return len(self._gltf_dict["bufferViews"]) - 1
 
     def _update_buffer(self, bytes_):
-        byte_offset = len(self._buffer)
+        # keep the start of every buffer view aligned to 4 bytes
+        padding = (4 - self._buffer_length % 4) % 4
+        if padding:
+            self._buffer_chunks.append(bytearray(padding))
+            self._buffer_length += padding
+        byte_offset = self._buffer_length
         # If bytes_ was not created as bytearray, cast now
         if not USE_BYTEARRAY_BUFFERS:
             bytes_ = bytearray(bytes_)
-        self._buffer += bytes_
+        self._buffer_chunks.append(bytes_)
+        self._buffer_length += len(bytes_)
+        self._buffer_cache = None
         return byte_offset
 
     def _set_path_attributes(self):
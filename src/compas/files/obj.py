@@ -2,7 +2,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from collections import OrderedDict
+import re
 from collections import defaultdict
 
 import compas
@@ -22,6 +22,10 @@ class OBJ(object):
         A path, a file-like object or a URL pointing to a file.
     precision : str, optional
         A COMPAS precision specification.
+    weld : bool, optional
+        If True, vertices with the same geometric key are merged.
+        If False, the vertices and their indices are kept as they are in the file,
+        which is considerably faster for files that are already indexed.
 
     Attributes
     ----------
@@ -87,11 +91,20 @@ class OBJ(object):
     ...     mesh.name = name
     ...     meshes.append(mesh)
 
+    Read the meshes one by one, without keeping all faces in memory.
+
+    >>> meshes = []
+    >>> for name, vertices, faces in OBJ("meshes.obj").iter_objects():
+    ...     mesh = Mesh.from_vertices_and_faces(vertices, faces)
+    ...     mesh.name = name
+    ...     meshes.append(mesh)
+
     """
 
-    def __init__(self, filepath, precision=None):
+    def __init__(self, filepath, precision=None, weld=True):
         self.filepath = filepath
         self.precision = precision
+        self.weld = weld
         self._is_parsed = False
         self._reader = None
         self._parser = None
@@ -105,7 +118,7 @@ class OBJ(object):
         None
         """
         self._reader = OBJReader(self.filepath)
-        self._parser = OBJParser(self._reader, precision=self.precision)
+        self._parser = OBJParser(self._reader, precision=self.precision, weld=self.weld)
         self._reader.open()
         self._reader.pre()
         self._reader.read()
@@ -137,6 +150,38 @@ class OBJ(object):
         self._writer = OBJWriter(self.filepath, mesh, precision=self.precision, unweld=unweld, **kwargs)
         self._writer.write()
 
+    def iter_objects(self):
+        """Read the objects of the file one by one.
+
+        Yields
+        ------
+        tuple[str | None, list[list[float]], list[list[int]]]
+            The name of the object, the vertices of its faces, and its faces as lists of indices into those vertices.
+            The name of faces that are defined before the first object is None.
+
+        Notes
+        -----
+        The faces of an object are discarded once the next object is read.
+        Only the vertex coordinates of the file are kept in memory,
+        since faces can refer to vertices defined anywhere before them.
+
+        """
+        reader = OBJReader(self.filepath)
+        parser = OBJParser(reader, precision=self.precision, weld=self.weld)
+        with _iotools.open_file(self.filepath, "r") as f:
+            reader.content = f
+            reader.pre()
+            for name in reader.iter_read():
+                faces = [reader.faces[index] for item, index in reader.objects.get(name, ()) if item == "f"]
+                if name is not None or faces:
+                    yield (name,) + parser.parse_object(faces)
+                # the faces of the object are no longer needed
+                del reader.points[:]
+                del reader.lines[:]
+                del reader.faces[:]
+                reader.groups.clear()
+                reader.objects.clear()
+
     @property
     def reader(self):
         if not self._is_parsed:
@@ -227,6 +272,9 @@ class OBJReader(object):
         self.objects = defaultdict(list)
         self.group = None
         self.object = None
+        # records that are converted in bulk
+        self._vertex_lines = []
+        self._face_lines = []
 
     def open(self):
         """Open the file and read its contents.
@@ -246,12 +294,27 @@ class OBJReader(object):
         -------
         None
 
+        Notes
+        -----
+        The contents are processed lazily, while they are read.
+
         """
-        lines = []
-        is_continuation = False
+        content = self.content
+        if isinstance(content, list) and content and not hasattr(content[0], "decode"):
+            text = "".join(content)
+            if "\\" not in text:
+                # without continued lines, the lines only have to be split
+                # trailing whitespace and empty lines are handled by the reader
+                self.content = text.split("\n")
+                return
+        self.content = self._join_lines(content)
+
+    def _join_lines(self, content):
+        # decode lines, skip empty lines, and join continued lines
+        previous = None
         needs_decode = None
 
-        for line in self.content:
+        for line in content:
             # Check this only one time
             if needs_decode is None:
                 needs_decode = hasattr(line, "decode")
@@ -260,15 +323,15 @@ class OBJReader(object):
             line = line.rstrip()
             if not line:
                 continue
-            if is_continuation:
-                lines[-1] = lines[-1][:-2] + line
-            else:
-                lines.append(line)
+            if previous is not None:
+                line = previous[:-1] + " " + line
             if line[-1] == "\\":
-                is_continuation = True
-            else:
-                is_continuation = False
-        self.content = iter(lines)
+                previous = line
+                continue
+            previous = None
+            yield line
+        if previous is not None:
+            yield previous
 
     def post(self):
         """Post-process the contents.
@@ -305,15 +368,54 @@ class OBJReader(object):
         -------
         None
 
+        Notes
+        -----
+        Vertex coordinates are collected as text, and converted to numbers in bulk.
+        Faces are converted line by line, but without further processing.
+
+        """
+        for _ in self.iter_read():
+            pass
+
+    def iter_read(self):
+        """Read the contents of the file, object by object.
+
+        Yields
+        ------
+        str | None
+            The name of an object, once all its data has been read.
+            The name of the data that is defined before the first object is None.
+
         """
         if not self.content:
             return
+        self._vertex_lines = vertex_lines = []
+        self._face_lines = face_lines = []
         for line in self.content:
+            head = line[:2]
+            # the most common records are collected as text, and converted in bulk
+            if head == "v ":
+                vertex_lines.append(line[2:])
+                continue
+            if head == "f ":
+                if "-" in line:
+                    # relative references depend on the number of vertices read so far
+                    self._read_face_lines()
+                    self._read_polygonal_geometry("f", line[2:].split())
+                else:
+                    face_lines.append(line[2:])
+                continue
             parts = line.split()
             if not parts:
                 continue
             head = parts[0]
             tail = parts[1:]
+            if head not in ("#", "vt", "vn", "vp", "s"):
+                # keep the collected records in order with the other records
+                self._read_vertex_lines()
+                self._read_face_lines()
+            if head == "o" and self.object in self.objects:
+                yield self.object
             if head == "#":
                 self._read_comment(tail)
                 continue
@@ -344,6 +446,68 @@ class OBJReader(object):
             if head in ("g", "s", "mg", "o"):
                 self._read_grouping(head, tail)
                 continue
+        self._read_vertex_lines()
+        self._read_face_lines()
+        yield self.object
+
+    def _read_vertex_lines(self):
+        """Convert the collected vertex coordinates to numbers, in bulk if possible."""
+        lines = self._vertex_lines
+        if not lines:
+            return
+        if not compas.IPY:
+            import numpy as np
+
+            values = np.fromstring(" ".join(lines), sep=" ")
+            if values.size == 3 * len(lines):
+                self.vertices += values.reshape(-1, 3).tolist()
+                self.weights += [1.0] * len(lines)
+                del lines[:]
+                return
+        for line in lines:
+            self._read_vertex_coordinates(line.split())
+        del lines[:]
+
+    def _read_face_lines(self):
+        """Convert the collected faces to lists of vertex references, in bulk if possible."""
+        lines = self._face_lines
+        if not lines:
+            return
+        faces = None
+        if not compas.IPY:
+            import numpy as np
+
+            text = "\n".join(lines)
+            if "/" in text:
+                # only the references to vertex coordinates are used
+                text = re.sub(r"/\S*", "", text)
+            values = np.fromstring(text, sep=" ", dtype=np.int64)
+            # count the number of values per line from the positions of the separators
+            chars = np.frombuffer(text.encode("ascii", "replace"), dtype=np.uint8)
+            space = (chars == 32) | (chars == 9) | (chars == 10) | (chars == 13)
+            starts = ~space
+            starts[1:] &= space[:-1]
+            counts = np.bincount(np.cumsum(chars == 10)[starts], minlength=len(lines))
+            if values.size == counts.sum():
+                values -= 1
+                if counts.min() == counts.max():
+                    faces = values.reshape(len(lines), -1).tolist() if counts[0] >= 3 else []
+                else:
+                    ends = np.cumsum(counts).tolist()
+                    values = values.tolist()
+                    faces = [values[end - count : end] for end, count in zip(ends, counts.tolist()) if count >= 3]
+        if faces is None:
+            faces = []
+            for line in lines:
+                data = line.split()
+                if len(data) >= 3:
+                    faces.append([int(d.split("/")[0]) - 1 for d in data])
+        start = len(self.faces)
+        self.faces += faces
+        refs = [("f", index) for index in range(start, len(self.faces))]
+        self.groups[self.group] += refs
+        self.objects[self.object] += refs
+        del lines[:]
 
     def _read_comment(self, data):
         """Read a comment.
@@ -401,7 +565,12 @@ class OBJReader(object):
             face = []
             for d in data:
                 parts = d.split("/")
-                i = int(parts[0]) - 1
+                i = int(parts[0])
+                if i < 0:
+                    # negative references are relative to the end of the vertex list
+                    i += len(self.vertices) + len(self._vertex_lines)
+                else:
+                    i -= 1
                 face.append(i)
             self.faces.append(face)
             ref = "f", len(self.faces) - 1
@@ -470,6 +639,9 @@ class OBJParser(object):
     precision : int, optional
         Precision for converting numbers to strings.
         Default is :attr:`TOL.precision`.
+    weld : bool, optional
+        If True, vertices with the same geometric key are merged.
+        If False, the vertices and the references to them are used as they are.
 
     Attributes
     ----------
@@ -477,7 +649,7 @@ class OBJParser(object):
         An OBJ file reader.
     vertices : list[list[float, float, float]]
         List of lists of parsed vertex coordinates.
-        Parsed vertices are unique up to the specified precision.
+        If `weld` is True, parsed vertices are unique up to the specified precision.
     points : list[int]
         List of references to parsed vertex coordinates.
     lines : list[tuple[int, int]]
@@ -493,8 +665,9 @@ class OBJParser(object):
 
     """
 
-    def __init__(self, reader, precision=None):
+    def __init__(self, reader, precision=None, weld=True):
         self.precision = precision
+        self.weld = weld
         self.reader = reader
         self.vertices = None
         # self.weights = None
@@ -518,35 +691,74 @@ class OBJParser(object):
         None
 
         """
-        index_key = OrderedDict()
-        vertex = OrderedDict()
-
-        for i, xyz in enumerate(iter(self.reader.vertices)):
-            key = TOL.geometric_key(xyz, self.precision)
-            index_key[i] = key
-            vertex[key] = xyz
-
-        vertex_index = {key: index for index, key in enumerate(vertex)}
-        index_index = {index: vertex_index[key] for index, key in iter(index_key.items())}
-
-        self.vertices = [xyz for xyz in iter(vertex.values())]
-        self.points = [index_index[index] for index in self.reader.points]
-        self.lines = [[index_index[index] for index in line] for line in self.reader.lines if len(line) == 2]
-        self.polylines = [[index_index[index] for index in line] for line in self.reader.lines if len(line) > 2]
-        self.faces = [[index_index[index] for index in face] for face in self.reader.faces]
+        if self.weld:
+            self.vertices, index_index = self._weld(self.reader.vertices)
+            self.points = [index_index[index] for index in self.reader.points]
+            self.lines = [[index_index[index] for index in line] for line in self.reader.lines if len(line) == 2]
+            self.polylines = [[index_index[index] for index in line] for line in self.reader.lines if len(line) > 2]
+            self.faces = [[index_index[index] for index in face] for face in self.reader.faces]
+        else:
+            self.vertices = self.reader.vertices
+            self.points = self.reader.points
+            self.lines = [line for line in self.reader.lines if len(line) == 2]
+            self.polylines = [line for line in self.reader.lines if len(line) > 2]
+            self.faces = self.reader.faces
         self.groups = self.reader.groups
         self.objects = {}
+        xyz = self.vertices
         for name in self.reader.objects:
-            faces = []
-            for item in self.reader.objects[name]:
-                if item[0] == "f":
-                    faces.append(self.faces[item[1]])
-            vertices = {}
-            for face in faces:
-                for vertex in face:
-                    vertices[vertex] = self.vertices[vertex]
+            faces = [self.faces[index] for item, index in self.reader.objects[name] if item == "f"]
+            vertices = {vertex: xyz[vertex] for face in faces for vertex in face}
             self.objects[name] = vertices, faces
 
+    def _weld(self, vertices):
+        # map the vertices to the unique geometric keys, in order of first occurrence
+        # the coordinates of a key are those of the last vertex with that key
+        precision = self.precision
+        geometric_key = TOL.geometric_key
+        key_index = {}
+        unique = []
+        index_index = []
+        for xyz in vertices:
+            key = geometric_key(xyz, precision)
+            index = key_index.get(key)
+            if index is None:
+                index = key_index[key] = len(unique)
+                unique.append(xyz)
+            else:
+                unique[index] = xyz
+            index_index.append(index)
+        return unique, index_index
+
+    def parse_object(self, faces):
+        """Parse the faces of a single object into a separate set of vertices and faces.
+
+        Parameters
+        ----------
+        faces : list[list[int]]
+            The faces of the object, as lists of references to the vertex coordinates of the reader.
+
+        Returns
+        -------
+        list[list[float]]
+            The vertices of the object.
+        list[list[int]]
+            The faces of the object, as lists of indices into its vertices.
+
+        """
+        index_index = {}
+        vertices = []
+        for face in faces:
+            for index in face:
+                if index not in index_index:
+                    index_index[index] = len(vertices)
+                    vertices.append(self.reader.vertices[index])
+        if self.weld:
+            vertices, welded = self._weld(vertices)
+            index_index = {index: welded[local] for index, local in index_index.items()}
+        faces = [[index_index[index] for index in face] for face in faces]
+        return vertices, faces
+
 
 class OBJWriter(object):
     """Class for writing geometric data to a OBJ file.
@@ -0,0 +1,454 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import struct
+
+import compas
+from compas import _iotools
+
+
+class PCD(object):
+    """Class for working with files in the Point Cloud Data format of the Point Cloud Library.
+
+    Parameters
+    ----------
+    filepath : path string | file-like object | URL string
+        A path, a file-like object or a URL pointing to a file.
+
+    Attributes
+    ----------
+    filepath : str
+        The path to the file.
+    reader : :class:`PCDReader`
+        A PCD file reader.
+
+    References
+    ----------
+    * https://pointclouds.org/documentation/tutorials/pcd_file_format.html
+
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self._is_read = False
+        self._reader = None
+        self._writer = None
+
+    @property
+    def reader(self):
+        if not self._is_read:
+            self.read()
+        return self._reader
+
+    def read(self):
+        """Read the contents of the file.
+
+        Returns
+        -------
+        None
+
+        """
+        self._reader = PCDReader(self.filepath)
+        self._reader.read()
+        self._is_read = True
+
+    def write(self, points, **kwargs):
+        """Write points to the file.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`compas.geometry.Point`]
+            The points.
+        binary : bool, optional
+            If True, write the data in binary format.
+
+        Returns
+        -------
+        None
+
+        """
+        self._writer = PCDWriter(self.filepath, points, **kwargs)
+        self._writer.write()
+
+    def iter_points(self, chunksize=1000000):
+        """Iterate over the point coordinates of the file in chunks,
+        without reading the entire file into memory.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            The maximum number of points per chunk.
+
+        Yields
+        ------
+        numpy.ndarray | list[list[float]]
+            The XYZ coordinates of the points of a chunk,
+            as an array of shape (n, 3) for binary files in environments with NumPy, or as a list of lists otherwise.
+
+        Notes
+        -----
+        Compressed files (``DATA binary_compressed``) are decompressed in full before the chunks are returned.
+
+        """
+        reader = PCDReader(self.filepath)
+        reader.read_header()
+        for chunk in reader.iter_points(chunksize):
+            yield chunk
+
+
+class PCDReader(object):
+    """Class for reading raw geometric data from PCD files.
+
+    Parameters
+    ----------
+    filepath : path string | file-like object | URL string
+        A path, a file-like object or a URL pointing to a file.
+
+    Attributes
+    ----------
+    version : str
+        The version of the file format.
+    fields : list[str]
+        The names of the fields of the points.
+    sizes : list[int]
+        The number of bytes of the values of every field.
+    types : list[str]
+        The type of the values of every field:
+        ``"I"`` for signed integers, ``"U"`` for unsigned integers, and ``"F"`` for floating point numbers.
+    counts : list[int]
+        The number of values of every field.
+    width : int
+        The width of the point cloud, or the number of points of an unorganized cloud.
+    height : int
+        The height of the point cloud, or 1 for an unorganized cloud.
+    viewpoint : list[float]
+        The position and orientation (quaternion) of the viewpoint from which the points were acquired.
+    number_of_points : int
+        The number of points in the file.
+    format : str
+        The format of the data: ``"ascii"``, ``"binary"`` or ``"binary_compressed"``.
+    points : list[list[float]]
+        The XYZ coordinates of the points.
+
+    """
+
+    struct_format_per_type = {
+        ("I", 1): "b",
+        ("I", 2): "h",
+        ("I", 4): "i",
+        ("I", 8): "q",
+        ("U", 1): "B",
+        ("U", 2): "H",
+        ("U", 4): "I",
+        ("U", 8): "Q",
+        ("F", 4): "f",
+        ("F", 8): "d",
+    }
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.version = None
+        self.fields = []
+        self.sizes = []
+        self.types = []
+        self.counts = []
+        self.width = 0
+        self.height = 1
+        self.viewpoint = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]
+        self.number_of_points = 0
+        self.format = None
+        self.end_header = None
+        self.points = []
+
+    def read(self):
+        """Read the contents of the file.
+
+        Returns
+        -------
+        None
+
+        """
+        self.read_header()
+        self.points = []
+        for chunk in self.iter_points():
+            self.points += chunk if isinstance(chunk, list) else chunk.tolist()
+
+    def read_header(self):
+        """Read the header of the file.
+
+        Returns
+        -------
+        None
+
+        """
+        with _iotools.open_file(self.filepath, "rb") as file:
+            offset = 0
+            for line in file:
+                offset += len(line)
+                line = line.decode("ascii").strip()
+                if not line or line.startswith("#"):
+                    continue
+                parts = line.split()
+                key, values = parts[0].upper(), parts[1:]
+                if key == "VERSION":
+                    self.version = values[0]
+                elif key == "FIELDS":
+                    self.fields = values
+                elif key == "SIZE":
+                    self.sizes = [int(value) for value in values]
+                elif key == "TYPE":
+                    self.types = [value.upper() for value in values]
+                elif key == "COUNT":
+                    self.counts = [int(value) for value in values]
+                elif key == "WIDTH":
+                    self.width = int(values[0])
+                elif key == "HEIGHT":
+                    self.height = int(values[0])
+                elif key == "VIEWPOINT":
+                    self.viewpoint = [float(value) for value in values]
+                elif key == "POINTS":
+                    self.number_of_points = int(values[0])
+                elif key == "DATA":
+                    self.format = values[0].lower()
+                    self.end_header = offset
+                    break
+
+        if self.end_header is None:
+            raise Exception("not a valid pcd file")
+        if not self.counts:
+            self.counts = [1] * len(self.fields)
+        if not self.number_of_points:
+            self.number_of_points = self.width * self.height
+        if not all(name in self.fields for name in "xyz"):
+            raise Exception("the points of the file have no XYZ coordinates")
+        if len(self.sizes) != len(self.fields) or len(self.types) != len(self.fields) or len(self.counts) != len(self.fields):
+            raise Exception("the number of sizes, types and counts does not match the number of fields")
+        if self.format not in ("ascii", "binary", "binary_compressed"):
+            raise Exception("unknown data format: {}".format(self.format))
+
+    def iter_points(self, chunksize=1000000):
+        """Iterate over the point coordinates of the file in chunks.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            The maximum number of points per chunk.
+
+        Yields
+        ------
+        numpy.ndarray | list[list[float]]
+            The XYZ coordinates of the points of a chunk.
+
+        """
+        if self.end_header is None:
+            self.read_header()
+        if self.format == "ascii":
+            chunks = self._iter_points_ascii(chunksize)
+        elif self.format == "binary":
+            chunks = self._iter_points_binary(chunksize)
+        else:
+            chunks = self._iter_points_compressed(chunksize)
+        for chunk in chunks:
+            yield chunk
+
+    # ==========================================================================
+    # read the data
+    # ==========================================================================
+
+    def _value_index(self, name):
+        # the position of the first value of a field among the values of a point
+        index = self.fields.index(name)
+        return sum(self.counts[:index])
+
+    def _struct_formats(self):
+        formats = []
+        for type_, size in zip(self.types, self.sizes):
+            try:
+                formats.append(self.struct_format_per_type[type_, size])
+            except KeyError:
+                raise Exception("unsupported field type: {}{}".format(type_, size))
+        return formats
+
+    def _iter_points_ascii(self, chunksize):
+        x, y, z = self._value_index("x"), self._value_index("y"), self._value_index("z")
+        remaining = self.number_of_points
+        with _iotools.open_file(self.filepath, "rb") as file:
+            file.seek(self.end_header)
+            chunk = []
+            for line in file:
+                if not remaining:
+                    break
+                values = line.split()
+                if not values:
+                    continue
+                chunk.append([float(values[x]), float(values[y]), float(values[z])])
+                remaining -= 1
+                if len(chunk) == chunksize:
+                    yield chunk
+                    chunk = []
+            if remaining:
+                raise Exception("the file has less data than specified in the header")
+            if chunk:
+                yield chunk
+
+    def _iter_points_binary(self, chunksize):
+        formats = self._struct_formats()
+        x, y, z = self._value_index("x"), self._value_index("y"), self._value_index("z")
+        itemsize = sum(size * count for size, count in zip(self.sizes, self.counts))
+        if not compas.IPY:
+            import numpy as np
+
+            dtype = np.dtype(
+                {
+                    "names": ["f{}".format(i) for i in range(sum(self.counts))],
+                    "formats": ["<" + format for format, count in zip(formats, self.counts) for _ in range(count)],
+                }
+            )
+        else:
+            point = struct.Struct("<" + "".join(format * count for format, count in zip(formats, self.counts)))
+
+        remaining = self.number_of_points
+        with _iotools.open_file(self.filepath, "rb") as file:
+            file.seek(self.end_header)
+            while remaining:
+                count = min(chunksize, remaining)
+                data = file.read(itemsize * count)
+                if len(data) < itemsize * count:
+                    raise Exception("the file has less data than specified in the header")
+                remaining -= count
+                if not compas.IPY:
+                    array = np.frombuffer(data, dtype=dtype, count=count)
+                    yield np.column_stack([array["f{}".format(x)], array["f{}".format(y)], array["f{}".format(z)]]).astype(np.float64)
+                else:
+                    values = [point.unpack_from(data, i) for i in range(0, len(data), itemsize)]
+                    yield [[float(value[x]), float(value[y]), float(value[z])] for value in values]
+
+    def _iter_points_compressed(self, chunksize):
+        # the decompressed data contains all values of the first field, then all values of the second field, etc.
+        formats = self._struct_formats()
+        n = self.number_of_points
+        with _iotools.open_file(self.filepath, "rb") as file:
+            file.seek(self.end_header)
+            compressed_size, size = struct.unpack("<II", file.read(8))
+            data = _lzf_decompress(file.read(compressed_size), size)
+
+        columns = []
+        for name in "xyz":
+            index = self.fields.index(name)
+            offset = n * sum(self.sizes[i] * self.counts[i] for i in range(index))
+            count = self.counts[index]
+            values = struct.unpack_from("<{}{}".format(n * count, formats[index]), data, offset)
+            columns.append(values[::count])
+
+        for start in range(0, n, chunksize):
+            stop = min(n, start + chunksize)
+            chunk = [[float(x), float(y), float(z)] for x, y, z in zip(*[column[start:stop] for column in columns])]
+            if not compas.IPY:
+                import numpy as np
+
+                chunk = np.array(chunk, dtype=np.float64).reshape((-1, 3))
+            yield chunk
+
+
+def _lzf_decompress(data, size):
+    """Decompress data compressed with the LZF algorithm.
+
+    Parameters
+    ----------
+    data : bytes
+        The compressed data.
+    size : int
+        The size of the decompressed data.
+
+    Returns
+    -------
+    bytearray
+
+    """
+    data = bytearray(data)
+    result = bytearray(size)
+    i = 0
+    o = 0
+    n = len(data)
+    while i < n:
+        control = data[i]
+        i += 1
+        if control < 32:
+            # a literal run of control + 1 bytes
+            length = control + 1
+            result[o : o + length] = data[i : i + length]
+            i += length
+            o += length
+        else:
+            # a back reference to a previous part of the output, which can overlap with the copied part
+            length = control >> 5
+            if length == 7:
+                length += data[i]
+                i += 1
+            reference = o - ((control & 0x1F) << 8) - data[i] - 1
+            i += 1
+            length += 2
+            if reference < 0:
+                raise Exception("the compressed data is corrupt")
+            for _ in range(length):
+                result[o] = result[reference]
+                o += 1
+                reference += 1
+    if o != size:
+        raise Exception("the compressed data is corrupt")
+    return result
+
+
+class PCDWriter(object):
+    """Class for writing points to a PCD file.
+
+    Parameters
+    ----------
+    filepath : path string | file-like object
+        A path or a file-like object pointing to a file.
+    points : sequence[[float, float, float] | :class:`compas.geometry.Point`]
+        The points.
+    binary : bool, optional
+        If True, write the data in binary format.
+
+    Notes
+    -----
+    The coordinates are written as 64-bit floats.
+
+    """
+
+    def __init__(self, filepath, points, binary=False):
+        self.filepath = filepath
+        self.points = points
+        self.binary = binary
+
+    def write(self):
+        """Write the data to a file.
+
+        Returns
+        -------
+        None
+
+        """
+        n = len(self.points)
+        header = [
+            "# .PCD v0.7 - Point Cloud Data file format",
+            "VERSION 0.7",
+            "FIELDS x y z",
+            "SIZE 8 8 8",
+            "TYPE F F F",
+            "COUNT 1 1 1",
+            "WIDTH {}".format(n),
+            "HEIGHT 1",
+            "VIEWPOINT 0 0 0 1 0 0 0",
+            "POINTS {}".format(n),
+            "DATA {}".format("binary" if self.binary else "ascii"),
+        ]
+        with _iotools.open_file(self.filepath, "wb") as file:
+            file.write("\n".join(header).encode("ascii") + b"\n")
+            if self.binary:
+                point = struct.Struct("<3d")
+                file.write(b"".join(point.pack(x, y, z) for x, y, z in self.points))
+            else:
+                file.write("".join("{!r} {!r} {!r}\n".format(float(x), float(y), float(z)) for x, y, z in self.points).encode("ascii"))
@@ -3,9 +3,12 @@ from __future__ import division
 from __future__ import print_function
 
 import struct
+from itertools import chain
+from itertools import islice
 
 import compas
 from compas import _iotools
+from compas.tolerance import TOL
 
 
 class PLY(object):
@@ -74,6 +77,8 @@ class PLY(object):
         ----------
         mesh : :class:`compas.datastructures.Mesh`
             The mesh.
+        binary : bool, optional
+            If True, write the data in binary little-endian format.
         author : str, optional
             The author name to include in the header.
         email : str, optional
@@ -91,6 +96,43 @@ class PLY(object):
         self._writer = PLYWriter(self.filepath, mesh, **kwargs)
         self._writer.write()
 
+    def iter_points(self, chunksize=1000000):
+        """Iterate over the vertex coordinates of the file in chunks,
+        without reading the entire file into memory.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            The maximum number of points per chunk.
+
+        Yields
+        ------
+        numpy.ndarray | list[list[float]]
+            The XYZ coordinates of the points of a chunk,
+            as an array of shape (n, 3) for binary files in environments with NumPy, or as a list of lists otherwise.
+
+        Notes
+        -----
+        Only the coordinates of the vertices are read.
+        Files in which the vertices are not the first element, or have list properties,
+        are read in full before the chunks are returned.
+
+        """
+        reader = PLYReader(self.filepath, header_only=True)
+        names = [prop[0] for prop in reader.vertex_properties]
+        if not reader.sections or not all(name in names for name in "xyz"):
+            return
+        streamable = reader.sections[0] == "vertex" and all(len(prop) == 2 for prop in reader.vertex_properties)
+        if streamable and reader.format == "ascii":
+            chunks = reader._iter_vertices_ascii(chunksize)
+        elif streamable and not compas.IPY:
+            chunks = reader._iter_vertices_binary(chunksize)
+        else:
+            vertices = PLYParser(PLYReader(self.filepath)).vertices
+            chunks = (vertices[i : i + chunksize] for i in range(0, len(vertices), chunksize))
+        for chunk in chunks:
+            yield chunk
+
 
 class PLYReader(object):
     """Class for reading raw geometric data from PLY files.
@@ -99,6 +141,8 @@ class PLYReader(object):
     ----------
     filepath : path string | file-like object | URL string
         A path, a file-like object or a URL pointing to a file.
+    header_only : bool, optional
+        If True, only the header of the file is read.
 
     Attributes
     ----------
@@ -143,6 +187,22 @@ class PLYReader(object):
     faces : list
         The faces found in the file.
         Each face is a dictionary of property names and property values.
+    vertex_data : dict[str, numpy.ndarray | list[list]] | None
+        The vertex properties of a binary file, as arrays of property values per property name.
+        List properties are lists of lists of values.
+        None for ASCII files, or in environments without NumPy.
+    edge_data : dict[str, numpy.ndarray | list[list]] | None
+        The edge properties of a binary file, in the same format as `vertex_data`.
+    face_data : dict[str, numpy.ndarray | list[list]] | None
+        The face properties of a binary file, in the same format as `vertex_data`.
+
+    Notes
+    -----
+    In environments with NumPy, the elements of binary files are read in bulk,
+    into arrays per property (`vertex_data`, `edge_data`, `face_data`).
+    Elements with list properties of variable length, such as faces with different numbers of vertices,
+    are read in two passes: one to find the length of every list, and one to collect all values at once.
+    The lists of element dictionaries (`vertices`, `edges`, `faces`) are then only created if they are accessed.
 
     """
 
@@ -185,30 +245,46 @@ class PLYReader(object):
     }
 
     number_of_bytes_per_type = {
+        "int8": 1,
         "char": 1,
+        "uint8": 1,
         "uchar": 1,
+        "int16": 2,
         "short": 2,
+        "uint16": 2,
         "ushort": 2,
+        "int32": 4,
         "int": 4,
+        "uint32": 4,
         "uint": 4,
+        "float32": 4,
         "float": 4,
+        "float64": 8,
         "double": 8,
     }
 
     struct_format_per_type = {
-        "char": "c",
+        "int8": "b",
+        "char": "b",
+        "uint8": "B",
         "uchar": "B",
+        "int16": "h",
         "short": "h",
+        "uint16": "H",
         "ushort": "H",
+        "int32": "i",
         "int": "i",
+        "uint32": "I",
         "uint": "I",
+        "float32": "f",
         "float": "f",
+        "float64": "d",
         "double": "d",
     }
 
     binary_byte_order = {"binary_big_endian": ">", "binary_little_endian": "<"}
 
-    def __init__(self, filepath):
+    def __init__(self, filepath, header_only=False):
         self.filepath = filepath
         self.file = None
         self.format = None
@@ -223,10 +299,52 @@ class PLYReader(object):
         self.edge_properties = []
         self.face_properties = []
         self.sections = []
-        self.vertices = []
-        self.edges = []
-        self.faces = []
-        self.read()
+        self.vertex_data = None
+        self.edge_data = None
+        self.face_data = None
+        self._vertices = []
+        self._edges = []
+        self._faces = []
+        if header_only:
+            self._read_header()
+        else:
+            self.read()
+
+    @property
+    def vertices(self):
+        if self._vertices is None:
+            self._vertices = self._rows_from_data(self.vertex_data)
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices):
+        self._vertices = vertices
+
+    @property
+    def edges(self):
+        if self._edges is None:
+            self._edges = self._rows_from_data(self.edge_data)
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges):
+        self._edges = edges
+
+    @property
+    def faces(self):
+        if self._faces is None:
+            self._faces = self._rows_from_data(self.face_data)
+        return self._faces
+
+    @faces.setter
+    def faces(self, faces):
+        self._faces = faces
+
+    @staticmethod
+    def _rows_from_data(data):
+        names = list(data)
+        columns = [data[name] if isinstance(data[name], list) else data[name].tolist() for name in names]
+        return [dict(zip(names, values)) for values in zip(*columns)]
 
     def is_valid(self):
         """Verify that the file is valid by reading the header.
@@ -287,83 +405,88 @@ class PLYReader(object):
 
     def _read_header(self):
         # the header is always in ascii format
-        # read it as text
-        # otherwise file.tell() can't be used reliably
-        # to figure out where the header ends
-        with _iotools.open_file(self.filepath) as file:
+        # it is read as bytes to find the exact position where the data starts,
+        # independently of the line endings used in the file
+        with _iotools.open_file(self.filepath, "rb") as file:
             file.seek(0)
+            data = b""
+            while b"end_header" not in data:
+                chunk = file.read(1024)
+                if not chunk:
+                    break
+                data += chunk
 
-            line = file.readline().rstrip()
-
-            if line.lower() != "ply":
-                raise Exception("not a valid ply file")
-
-            self.start_header = file.tell()
+        index = data.find(b"end_header")
+        if data[:3].lower() != b"ply" or index < 0:
+            raise Exception("not a valid ply file")
 
-            element_type = None
+        end = index + len(b"end_header")
+        if data[end : end + 2] == b"\r\n":
+            end += 2
+        elif data[end : end + 1] in (b"\n", b"\r"):
+            end += 1
 
-            while True:
-                line = file.readline()
-                line = line.rstrip()
+        start = 3
+        while data[start : start + 1] in (b"\n", b"\r"):
+            start += 1
+        self.start_header = start
 
-                self.header.append(line)
+        element_type = None
 
-                if line.startswith("format"):  # type: ignore
-                    element_type = None
-                    self.format = line[len("format") + 1 :].split()[0]
+        for line in data[start:end].decode("ascii").splitlines():
+            line = line.rstrip()
 
-                elif line.startswith("comment"):  # type: ignore
+            self.header.append(line)
+
+            if line.startswith("format"):  # type: ignore
+                element_type = None
+                self.format = line[len("format") + 1 :].split()[0]
+
+            elif line.startswith("comment"):  # type: ignore
+                element_type = None
+                self.comments.append(line[len("comment") + 1 :])
+
+            elif line.startswith("element"):  # type: ignore
+                parts = line.split()
+                element_type = parts[1]
+                if element_type == "vertex":
+                    self.sections.append("vertex")
+                    self.number_of_vertices = int(parts[2])
+                elif element_type == "edge":
+                    self.sections.append("edge")
+                    self.number_of_edges = int(parts[2])
+                elif element_type == "face":
+                    self.sections.append("face")
+                    self.number_of_faces = int(parts[2])
+                else:
                     element_type = None
-                    self.comments.append(line[len("comment") + 1 :])
-
-                elif line.startswith("element"):  # type: ignore
-                    parts = line.split()
-                    element_type = parts[1]
-                    if element_type == "vertex":
-                        self.sections.append("vertex")
-                        self.number_of_vertices = int(parts[2])
-                    elif element_type == "edge":
-                        self.sections.append("edge")
-                        self.number_of_edges = int(parts[2])
-                    elif element_type == "face":
-                        self.sections.append("face")
-                        self.number_of_faces = int(parts[2])
+                    raise Exception
+
+            elif line.startswith("property"):  # type: ignore
+                parts = line.split()
+                if element_type in ("vertex", "edge", "face"):
+                    properties = {"vertex": self.vertex_properties, "edge": self.edge_properties, "face": self.face_properties}[element_type]
+                    property_type = parts[1]
+                    if property_type == "list":
+                        property_length = parts[2]
+                        property_type = parts[3]
+                        property_name = parts[4]
+                        properties.append((property_name, property_type, property_length))
                     else:
-                        element_type = None
-                        raise Exception
-
-                elif line.startswith("property"):  # type: ignore
-                    parts = line.split()
-                    if element_type == "vertex":
-                        property_type = parts[1]
-                        property_name = parts[2]
-                        self.vertex_properties.append((property_name, property_type))
-                    elif element_type == "edge":
                         property_type = parts[1]
                         property_name = parts[2]
-                        self.edge_properties.append((property_name, property_type))
-                    elif element_type == "face":
-                        property_type = parts[1]
-                        if property_type == "list":
-                            property_length = parts[2]
-                            property_type = parts[3]
-                            property_name = parts[4]
-                            self.face_properties.append((property_name, property_type, property_length))
-                        else:
-                            property_type = parts[1]
-                            property_name = parts[2]
-                            self.face_properties.append((property_name, property_type))
-                    else:
-                        element_type = None
-                        raise Exception
-
-                elif line == "end_header":
+                        properties.append((property_name, property_type))
+                else:
                     element_type = None
-                    self.end_header = file.tell()
-                    break
+                    raise Exception
 
-                else:
-                    pass
+            elif line == "end_header":
+                element_type = None
+                self.end_header = end
+                break
+
+            else:
+                pass
 
     # ==========================================================================
     # read the data
@@ -392,11 +515,20 @@ class PLYReader(object):
             self.file.seek(self.end_header)
             for section in self.sections:
                 if section == "vertex":
-                    self._read_vertices_binary_wo_numpy()
+                    if compas.IPY:
+                        self._read_vertices_binary_wo_numpy()
+                    else:
+                        self._read_vertices_binary()
                 elif section == "edge":
-                    self._read_edges_binary_wo_numpy()
+                    if compas.IPY:
+                        self._read_edges_binary_wo_numpy()
+                    else:
+                        self._read_edges_binary()
                 elif section == "face":
-                    self._read_faces_binary_wo_numpy()
+                    if compas.IPY:
+                        self._read_faces_binary_wo_numpy()
+                    else:
+                        self._read_faces_binary()
                 else:
                     print("user-defined elements are not supported: {0}".format(section))
                     pass
@@ -418,18 +550,6 @@ class PLYReader(object):
                     vertex[prop_name] = self.property_types[prop_type](prop_str)
                     i += 1
             self.vertices.append(vertex)
-        # count = 0
-        # for line in self.file:
-        #     line = line.rstrip()
-        #     parts = line.split()
-        #     vertex = {}
-        #     for i, prop in enumerate(self.vertex_properties):
-        #         pname, ptype = prop
-        #         vertex[pname] = self.property_types[ptype](parts[i])
-        #     self.vertices.append(vertex)
-        #     count += 1
-        #     if count == self.number_of_vertices:
-        #         break
 
     def _read_edges(self):
         pass
@@ -452,133 +572,207 @@ class PLYReader(object):
     # binary read the individual section
     # ==========================================================================
 
-    # remove numpy dependency by reading the file in chuncks
-    # with each chunck equal to the size specified in the header?
-    # see: http://stackoverflow.com/questions/4566498/python-file-iterator-over-a-binary-file-with-newer-idiom
-    # see: http://stackoverflow.com/questions/27532738/python-iterate-through-binary-file-without-lines
+    def _iter_vertices_ascii(self, chunksize):
+        # the values of the vertices are read as a stream of tokens
+        # since a vertex is not necessarily on a single line
+        names = [prop[0] for prop in self.vertex_properties]
+        n = len(names)
+        x, y, z = names.index("x"), names.index("y"), names.index("z")
+        with _iotools.open_file(self.filepath) as file:
+            file.seek(self.end_header)
+            tokens = chain.from_iterable(line.split() for line in file)
+            remaining = self.number_of_vertices
+            while remaining:
+                count = min(chunksize, remaining)
+                chunk = []
+                for _ in range(count):
+                    values = list(islice(tokens, n))
+                    if len(values) < n:
+                        raise Exception("the file has less data than specified in the header")
+                    chunk.append([float(values[x]), float(values[y]), float(values[z])])
+                remaining -= count
+                yield chunk
+
+    def _iter_vertices_binary(self, chunksize):
+        import numpy as np
 
-    def _numpy_vertex_ptypes(self):
         ext = self.binary_byte_order[self.format]
-        dt = []
-        for prop in self.vertex_properties:
-            pname, ptype = prop
-            dt.append((pname, ext + self.binary_property_types[ptype]))
-        return dt
+        dtype = np.dtype([(pname, ext + self.binary_property_types[ptype]) for pname, ptype in self.vertex_properties])
+        with _iotools.open_file(self.filepath, "rb") as file:
+            file.seek(self.end_header)
+            remaining = self.number_of_vertices
+            while remaining:
+                count = min(chunksize, remaining)
+                data = file.read(dtype.itemsize * count)
+                if len(data) < dtype.itemsize * count:
+                    raise Exception("the file has less data than specified in the header")
+                array = np.frombuffer(data, dtype=dtype, count=count)
+                remaining -= count
+                yield np.column_stack([array["x"], array["y"], array["z"]]).astype(np.float64)
+
+    def _read_vertices_binary_wo_numpy(self):
+        self.vertices = self._read_element_binary_wo_numpy(self.vertex_properties, self.number_of_vertices)
+
+    def _read_edges_binary_wo_numpy(self):
+        self.edges = self._read_element_binary_wo_numpy(self.edge_properties, self.number_of_edges)
+
+    def _read_faces_binary_wo_numpy(self):
+        self.faces = self._read_element_binary_wo_numpy(self.face_properties, self.number_of_faces)
 
-    def _numpy_face_ptypes(self):
+    def _read_element_binary_wo_numpy(self, properties, count):
         ext = self.binary_byte_order[self.format]
-        dt = []
-        for prop in self.face_properties:
-            if len(prop) == 2:
-                pname, ptype = prop
-                dt.append((pname, ext + self.binary_property_types[ptype]))
-            elif len(prop) == 3:
-                pname, ptype, plen = prop
-                dt.append(("size", ext + self.binary_property_types[plen]))
-                # this seems a nit of a hack
-                dt.append(("v1", ext + self.binary_property_types[ptype]))
-                dt.append(("v2", ext + self.binary_property_types[ptype]))
-                dt.append(("v3", ext + self.binary_property_types[ptype]))
-            else:
-                pass
-        return dt
+        elements = []
+        for _ in range(count):
+            element = {}
+            for prop in properties:
+                if len(prop) == 2:
+                    pname, ptype = prop
+                    size = self.number_of_bytes_per_type[ptype]
+                    element[pname] = struct.unpack(ext + self.struct_format_per_type[ptype], self.file.read(size))[0]
+                else:
+                    pname, ptype, plen = prop
+                    size = self.number_of_bytes_per_type[plen]
+                    length = struct.unpack(ext + self.struct_format_per_type[plen], self.file.read(size))[0]
+                    size = self.number_of_bytes_per_type[ptype] * length
+                    element[pname] = list(struct.unpack(ext + self.struct_format_per_type[ptype] * length, self.file.read(size)))
+            elements.append(element)
+        return elements
 
-    def _read_vertices_binary_wo_numpy(self):
+    def _numpy_vertex_ptypes(self):
         ext = self.binary_byte_order[self.format]
-        fmt = ext
-        chunk = 0
+        dt = []
         for prop in self.vertex_properties:
             pname, ptype = prop
-            chunk += self.number_of_bytes_per_type[ptype]
-            fmt += self.struct_format_per_type[ptype]
-        for i in range(self.number_of_vertices):
-            data = self.file.read(chunk)
-            data = struct.unpack(fmt, data)
-            vertex = {}
-            for i, prop in enumerate(self.vertex_properties):
-                pname, ptype = prop
-                vertex[pname] = data[i]
-            self.vertices.append(vertex)
+            dt.append((pname, ext + self.binary_property_types[ptype]))
+        return dt
 
     def _read_vertices_binary(self):
-        # use pandas to read the data frames
-        import numpy as np
+        self.vertex_data = self._read_element_binary(self.vertex_properties, self.number_of_vertices)
+        self.vertices = None
 
-        for line in np.fromfile(
-            self.file,
-            dtype=np.dtype(self._numpy_vertex_ptypes()),
-            count=self.number_of_vertices,
-        ):
-            vertex = {}
-            for i, prop in enumerate(self.vertex_properties):
-                pname, ptype = prop
-                vertex[pname] = line[i]
-            self.vertices.append(vertex)
+    def _read_edges_binary(self):
+        self.edge_data = self._read_element_binary(self.edge_properties, self.number_of_edges)
+        self.edges = None
 
-    def _read_edges_binary_wo_numpy(self):
-        pass
+    def _read_faces_binary(self):
+        self.face_data = self._read_element_binary(self.face_properties, self.number_of_faces)
+        self.faces = None
 
-    def _read_edges_binary(self):
-        pass
+    def _read_element_binary(self, properties, count):
+        import numpy as np
 
-    def _read_faces_binary_wo_numpy(self):
         ext = self.binary_byte_order[self.format]
-        fmt = ext
-        chunk = 0
-        for prop in self.face_properties:
+
+        if all(len(prop) == 2 for prop in properties):
+            # all elements have the same size
+            dtype = np.dtype([(pname, ext + self.binary_property_types[ptype]) for pname, ptype in properties])
+            data = self.file.read(dtype.itemsize * count)
+            if len(data) < dtype.itemsize * count:
+                raise Exception("the file has less data than specified in the header")
+            array = np.frombuffer(data, dtype=dtype, count=count)
+            return {pname: array[pname] for pname, _ in properties}
+
+        # the size of the elements depends on the lengths of the lists
+        # which are only known once the data is read
+        start = self.file.tell()
+        data = self.file.read()
+        buffer = np.frombuffer(data, dtype=np.uint8)
+
+        result = self._read_element_binary_fixed(properties, count, buffer)
+        if result is not None:
+            self.file.seek(start + result.pop(None))
+            return result
+
+        # first pass: find the position of every property of every element
+        layout = []
+        for prop in properties:
             if len(prop) == 2:
-                pname, ptype = prop
-                chunk += self.number_of_bytes_per_type[ptype]
-                fmt += self.struct_format_per_type[ptype]
-            elif len(prop) == 3:
+                layout.append((self.number_of_bytes_per_type[prop[1]], None, 0))
+            else:
                 pname, ptype, plen = prop
-                chunk += self.number_of_bytes_per_type[plen]
-                chunk += self.number_of_bytes_per_type[ptype] * 3
-                fmt += self.struct_format_per_type[plen]
-                fmt += self.struct_format_per_type[ptype] * 3
+                layout.append((self.number_of_bytes_per_type[plen], struct.Struct(ext + self.struct_format_per_type[plen]), self.number_of_bytes_per_type[ptype]))
+        positions = [[] for _ in properties]
+        lengths = [[] for _ in properties]
+        offset = 0
+        try:
+            for _ in range(count):
+                for index, (size, length_format, item_size) in enumerate(layout):
+                    positions[index].append(offset)
+                    offset += size
+                    if length_format is not None:
+                        length = length_format.unpack_from(data, offset - size)[0]
+                        lengths[index].append(length)
+                        offset += length * item_size
+        except struct.error:
+            raise Exception("the file has less data than specified in the header")
+        if offset > len(data):
+            raise Exception("the file has less data than specified in the header")
+        self.file.seek(start + offset)
+
+        # second pass: collect the values of every property at once
+        result = {}
+        for index, prop in enumerate(properties):
+            if len(prop) == 2:
+                pname, ptype = prop
+                result[pname] = self._gather(buffer, np.array(positions[index], dtype=np.int64), np.dtype(ext + self.binary_property_types[ptype]))
             else:
-                pass
-        for i in range(self.number_of_faces):
-            data = self.file.read(chunk)
-            data = struct.unpack(fmt, data)
-            face = {}
-            for i, prop in enumerate(self.face_properties):
-                if len(prop) == 2:
-                    pname, ptype = prop
-                    face[pname] = data[i]
-                elif len(prop) == 3:
-                    pname, ptype, plen = prop
-                    face[pname] = list(data[2:])
-            self.faces.append(face)
+                pname, ptype, plen = prop
+                dtype = np.dtype(ext + self.binary_property_types[ptype])
+                counts = np.array(lengths[index], dtype=np.int64)
+                ends = np.cumsum(counts)
+                firsts = np.array(positions[index], dtype=np.int64) + layout[index][0]
+                items = np.arange(ends[-1] if count else 0) - np.repeat(ends - counts, counts)
+                values = self._gather(buffer, np.repeat(firsts, counts) + items * dtype.itemsize, dtype).tolist()
+                result[pname] = [values[end - length : end] for end, length in zip(ends.tolist(), lengths[index])]
+        return result
+
+    def _read_element_binary_fixed(self, properties, count, buffer):
+        # read the elements assuming all lists have the same length as those of the first element
+        # the result is None if that is not the case
+        import numpy as np
 
-    def _read_faces_binary(self):
-        # use pandas to read the data frames
-        # how to deal with faces of variable length?
+        ext = self.binary_byte_order[self.format]
+        fields = []
+        lengths = []
+        offset = 0
+        for index, prop in enumerate(properties):
+            if len(prop) == 2:
+                pname, ptype = prop
+                fields.append((pname, ext + self.binary_property_types[ptype]))
+                offset += self.number_of_bytes_per_type[ptype]
+            else:
+                pname, ptype, plen = prop
+                dtype = np.dtype(ext + self.binary_property_types[plen])
+                if not count or offset + dtype.itemsize > len(buffer):
+                    return None
+                length = int(buffer[offset : offset + dtype.itemsize].view(dtype)[0])
+                fields.append(("__length_{}".format(index), dtype))
+                fields.append((pname, ext + self.binary_property_types[ptype], (length,)))
+                lengths.append(("__length_{}".format(index), length))
+                offset += dtype.itemsize + length * self.number_of_bytes_per_type[ptype]
+
+        dtype = np.dtype(fields)
+        if dtype.itemsize * count > len(buffer):
+            return None
+        array = np.frombuffer(buffer, dtype=dtype, count=count)
+        if not all((array[name] == length).all() for name, length in lengths):
+            return None
+
+        result = {prop[0]: array[prop[0]] if len(prop) == 2 else array[prop[0]].tolist() for prop in properties}
+        result[None] = dtype.itemsize * count
+        return result
+
+    @staticmethod
+    def _gather(buffer, positions, dtype):
+        # collect the values of a given type at the given byte positions
         import numpy as np
 
-        for line in np.fromfile(
-            self.file,
-            dtype=np.dtype(self._numpy_face_ptypes()),
-            count=self.number_of_faces,
-        ):
-            face = {}
-            for i, prop in enumerate(self.face_properties):
-                if len(prop) == 2:
-                    pname, ptype = prop
-                    face[pname] = line[i]
-                elif len(prop) == 3:
-                    pname, ptype, plen = prop
-                    # type(line) => numpy.void
-                    # convert the line to a list
-                    line = list(line)
-                    face[pname] = line[2:]
-                else:
-                    pass
-            self.faces.append(face)
+        index = positions[:, None] + np.arange(dtype.itemsize)
+        return np.ascontiguousarray(buffer[index]).view(dtype).reshape(-1)
 
 
 class PLYParser(object):
-    """Class for parsing data from a OBJ file.
+    """Class for parsing data from a PLY file.
 
     The parser converts the raw geometric data of the file
     into corresponding COMPAS geometry objects and data structures.
@@ -592,12 +786,15 @@ class PLYParser(object):
 
     Attributes
     ----------
-    vertices : list[tuple[float, float, float]]
+    vertices : list[list[float]]
         The vertex coordinates.
     edges : list[tuple[int, int]]
         Pairs of vertex indices defining the start and end points of edges.
     faces : list[list[int]]
         Lists of vertex indices defining faces.
+    vertex_attributes : dict[str, list | numpy.ndarray]
+        The values of the other vertex properties, such as normals, colors or scalars, per property name.
+        For binary files, the values are NumPy arrays, if NumPy is available.
 
     """
 
@@ -607,6 +804,7 @@ class PLYParser(object):
         self.vertices = None
         self.edges = None
         self.faces = None
+        self.vertex_attributes = None
         self.parse()
 
     def parse(self):
@@ -617,8 +815,37 @@ class PLYParser(object):
         None
 
         """
-        self.vertices = [(vertex["x"], vertex["y"], vertex["z"]) for vertex in self.reader.vertices]
-        self.faces = [face["vertex_indices"] for face in self.reader.faces]
+        names = [prop[0] for prop in self.reader.vertex_properties if prop[0] not in ("x", "y", "z")]
+        data = self.reader.vertex_data
+        if data is not None:
+            import numpy as np
+
+            self.vertices = np.column_stack([data["x"], data["y"], data["z"]]).tolist()
+            self.vertex_attributes = {name: data[name] for name in names}
+        else:
+            vertices = self.reader.vertices
+            self.vertices = [[vertex["x"], vertex["y"], vertex["z"]] for vertex in vertices]
+            self.vertex_attributes = {name: [vertex[name] for vertex in vertices] for name in names}
+
+        names = [prop[0] for prop in self.reader.edge_properties]
+        if "vertex1" in names and "vertex2" in names:
+            data = self.reader.edge_data
+            if data is not None:
+                self.edges = list(zip(data["vertex1"].tolist(), data["vertex2"].tolist()))
+            else:
+                self.edges = [(edge["vertex1"], edge["vertex2"]) for edge in self.reader.edges]
+
+        # the name of the list of vertex indices is not standardized
+        names = [prop[0] for prop in self.reader.face_properties if len(prop) == 3]
+        if names:
+            name = "vertex_indices" if "vertex_indices" in names else names[0]
+            data = self.reader.face_data
+            if data is not None:
+                self.faces = data[name]
+            else:
+                self.faces = [face[name] for face in self.reader.faces]
+        else:
+            self.faces = []
 
 
 class PLYWriter(object):
@@ -630,25 +857,35 @@ class PLYWriter(object):
         A path, a file-like object or a URL pointing to a file.
     mesh : :class:`compas.datastructures.Mesh`
         Mesh to write to the file.
+    binary : bool, optional
+        If True, write the data in binary little-endian format,
+        with the vertex coordinates as doubles.
+        Otherwise, write the data in ASCII format.
     author : str, optional
         The author name to include in the header.
     email : str, optional
         The email of the author to include in the header.
     date : str, optional
         The date to include in the header.
-    precision : str, optional
-        COMPAS precision specification for parsing geometric data.
+    precision : int, optional
+        The number of decimals of the vertex coordinates in ASCII format.
+        Default is :attr:`TOL.precision`.
+
+    Notes
+    -----
+    In binary format, the vertices and faces are packed into a single buffer, with NumPy if it is available,
+    and written to the file at once.
 
     """
 
-    def __init__(self, filepath, mesh, author=None, email=None, date=None, precision=None):
+    def __init__(self, filepath, mesh, binary=False, author=None, email=None, date=None, precision=None):
         self.filepath = filepath
         self.mesh = mesh
+        self.binary = binary
         self.author = author
         self.email = email
         self.date = date
-        self.precision = precision or compas.PRECISION
-        self.vertex_tpl = "{0:." + self.precision + "}" + " {1:." + self.precision + "}" + " {2:." + self.precision + "}\n"
+        self.precision = precision or TOL.precision
         self.v = mesh.number_of_vertices()
         self.f = mesh.number_of_faces()
         self.e = mesh.number_of_edges()
@@ -662,36 +899,70 @@ class PLYWriter(object):
         None
 
         """
-        with _iotools.open_file(self.filepath, "w") as self.file:
-            self._write_header()
-            self._write_vertices()
-            self._write_faces()
-
-    def _write_header(self):
-        self.file.write("PLY\n")
-        self.file.write("format ascii 1.0\n")
+        vertices, faces = self.mesh.to_vertices_and_faces()
+        if self.binary:
+            with _iotools.open_file(self.filepath, "wb") as self.file:
+                self.file.write(self._header().encode("ascii"))
+                self._write_binary(vertices, faces)
+        else:
+            with _iotools.open_file(self.filepath, "w") as self.file:
+                self.file.write(self._header())
+                self._write_vertices(vertices)
+                self._write_faces(faces)
+
+    def _header(self):
+        lines = ["ply"]
+        lines.append("format {} 1.0".format("binary_little_endian" if self.binary else "ascii"))
         if self.author:
-            self.file.write("comment author: {}\n".format(self.author))
+            lines.append("comment author: {}".format(self.author))
         if self.email:
-            self.file.write("comment email: {}\n".format(self.email))
+            lines.append("comment email: {}".format(self.email))
         if self.date:
-            self.file.write("comment date: {}\n".format(self.date))
-        self.file.write("element vertex {}\n".format(self.v))
-        self.file.write("property float x\n")
-        self.file.write("property float y\n")
-        self.file.write("property float z\n")
-        self.file.write("element face {}\n".format(self.f))
-        self.file.write("property list uchar int vertex_indices\n")
-        self.file.write("end_header\n")
-
-    def _write_vertices(self):
-        for key in self.mesh.vertices():
-            x, y, z = self.mesh.vertex_coordinates(key)
-            self.file.write(self.vertex_tpl.format(x, y, z))
-
-    def _write_faces(self):
-        vertex_index = self.mesh.vertex_index()
-        for face in self.mesh.faces():
-            vertices = self.mesh.face_vertices(face)
-            v = len(vertices)
-            self.file.write("{0} {1}\n".format(v, " ".join([str(vertex_index[vertex]) for vertex in vertices])))
+            lines.append("comment date: {}".format(self.date))
+        lines.append("element vertex {}".format(self.v))
+        for axis in "xyz":
+            lines.append("property {} {}".format("double" if self.binary else "float", axis))
+        lines.append("element face {}".format(self.f))
+        lines.append("property list uchar int vertex_indices")
+        lines.append("end_header")
+        return "\n".join(lines) + "\n"
+
+    def _write_vertices(self, vertices):
+        template = "{0:.{3}f} {1:.{3}f} {2:.{3}f}\n"
+        self.file.write("".join(template.format(x, y, z, self.precision) for x, y, z in vertices))
+
+    def _write_faces(self, faces):
+        self.file.write("".join("{0} {1}\n".format(len(face), " ".join(str(index) for index in face)) for face in faces))
+
+    def _write_binary(self, vertices, faces):
+        if compas.IPY:
+            data = [struct.pack("<{}d".format(3 * len(vertices)), *[value for xyz in vertices for value in xyz])]
+            for face in faces:
+                data.append(struct.pack("<B{}i".format(len(face)), len(face), *face))
+            self.file.write(b"".join(data))
+            return
+
+        import numpy as np
+
+        self.file.write(np.asarray(vertices, dtype="<f8").reshape(-1, 3).tobytes())
+
+        if not faces:
+            return
+        counts = np.array([len(face) for face in faces], dtype=np.int64)
+        if (counts == counts[0]).all():
+            data = np.empty(len(faces), dtype=[("length", "u1"), ("vertices", "<i4", (int(counts[0]),))])
+            data["length"] = counts
+            data["vertices"] = faces
+            self.file.write(data.tobytes())
+            return
+
+        # one byte for the length of every face, and four bytes per vertex index
+        ends = np.cumsum(1 + 4 * counts)
+        starts = ends - (1 + 4 * counts)
+        buffer = np.empty(ends[-1], dtype=np.uint8)
+        buffer[starts] = counts
+        indices = np.array([index for face in faces for index in face], dtype="<i4").view(np.uint8).reshape(-1, 4)
+        items = np.arange(len(indices)) - np.repeat(np.cumsum(counts) - counts, counts)
+        positions = np.repeat(starts + 1, counts) + 4 * items
+        buffer[positions[:, None] + np.arange(4)] = indices
+        self.file.write(buffer.tobytes())
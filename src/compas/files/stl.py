@@ -4,10 +4,15 @@ from __future__ import print_function
 
 import struct
 
+import compas
 from compas import _iotools
 from compas.geometry import Translation
 from compas.tolerance import TOL
 
+# normal, three vertices, and attribute byte count of a facet of a binary file
+STL_FACET_DTYPE = [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attributes", "<u2")]
+STL_FACET_FORMAT = struct.Struct("<12fH")
+
 
 class STL(object):
     """Class for working with STL files.
@@ -84,6 +89,48 @@ class STL(object):
         self._writer = STLWriter(self.filepath, mesh, **kwargs)
         self._writer.write()
 
+    def iter_facets(self, chunksize=1000000):
+        """Iterate over the facets of a binary file in chunks,
+        without reading the entire file into memory.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            The maximum number of facets per chunk.
+
+        Yields
+        ------
+        numpy.ndarray
+            A structured array of facets, with fields ``"normal"`` (3 floats), ``"vertices"`` (3 x 3 floats),
+            and ``"attributes"`` (the attribute byte count).
+
+        Raises
+        ------
+        ValueError
+            If the file is not a valid binary STL file.
+
+        Notes
+        -----
+        The facets are not welded into a mesh.
+        This method is only available in environments with NumPy.
+
+        """
+        import numpy as np
+
+        dtype = np.dtype(STL_FACET_DTYPE)
+        with _iotools.open_file(self.filepath, "rb") as file:
+            header = file.read(84)
+            if len(header) < 84:
+                raise ValueError("The file is not a valid binary STL file.")
+            remaining = struct.unpack("<I", header[80:])[0]
+            while remaining:
+                count = min(chunksize, remaining)
+                data = file.read(count * dtype.itemsize)
+                if len(data) < count * dtype.itemsize:
+                    raise ValueError("The file is not a valid binary STL file.")
+                remaining -= count
+                yield np.frombuffer(data, dtype=dtype, count=count)
+
 
 class STLReader(object):
     """Class for reading raw geometric data from STL files.
@@ -93,6 +140,21 @@ class STLReader(object):
     filepath : path string | file-like object | URL string
         A path, a file-like object or a URL pointing to a file.
 
+    Attributes
+    ----------
+    header : bytes
+        The header of a binary file.
+    facets : list[dict]
+        The facets, as dicts with a ``"normal"`` and a list of ``"vertices"``.
+    data : numpy.ndarray | None
+        The facets of a binary file, as a structured array with fields ``"normal"``, ``"vertices"`` and ``"attributes"``.
+        None for ASCII files, or in environments without NumPy.
+
+    Notes
+    -----
+    In environments with NumPy, binary files are read into a structured array in one call.
+    The list of facet dicts is then only created if it is accessed.
+
     References
     ----------
     * http://paulbourke.net/dataformats/stl/
@@ -103,9 +165,20 @@ class STLReader(object):
         self.filepath = filepath
         self.file = None
         self.header = None
-        self.facets = []
+        self.data = None
+        self._facets = []
         self.read()
 
+    @property
+    def facets(self):
+        if self._facets is None:
+            self._facets = self._facets_from_data()
+        return self._facets
+
+    @facets.setter
+    def facets(self, facets):
+        self._facets = facets
+
     def read(self):
         """Read the data.
 
@@ -238,7 +311,11 @@ class STLReader(object):
             self.file = file
             self.file.seek(0)
             self.header = self._read_header_binary()
-            self.facets = self._read_facets_binary()
+            if compas.IPY:
+                self.facets = self._read_facets_binary()
+            else:
+                self.data = self._read_data_binary()
+                self.facets = None
 
     def _read_header_binary(self):
         bytes_ = self.file.read(80)
@@ -269,6 +346,26 @@ class STLReader(object):
             facets.append(self._read_facet_binary())
         return facets
 
+    def _read_data_binary(self):
+        import numpy as np
+
+        dtype = np.dtype(STL_FACET_DTYPE)
+        n = self._read_number_of_facets_binary()
+        data = self.file.read(n * dtype.itemsize)
+        if len(data) < n * dtype.itemsize:
+            raise ValueError("The number of facets does not match the size of the file.")
+        return np.frombuffer(data, dtype=dtype, count=n)
+
+    def _facets_from_data(self):
+        import numpy as np
+
+        facets = []
+        vertices = np.ascontiguousarray(self.data["vertices"])
+        keys = vertices.view(np.dtype((np.void, 12)))[..., 0]
+        for normal, xyz, keys in zip(self.data["normal"].tolist(), vertices.tolist(), keys):
+            facets.append({"normal": tuple(normal), "vertices": tuple(tuple(v) for v in xyz), "keys": tuple(key.tobytes() for key in keys)})
+        return facets
+
 
 class STLParser(object):
     """Class for parsing data from a STL file.
@@ -290,6 +387,14 @@ class STLParser(object):
     faces : list[list[int]]
         The faces as lists of vertex indices.
 
+    Notes
+    -----
+    The vertices of the facets are welded into a mesh.
+    Vertices of binary files are welded if their coordinates are identical, or, if a `precision` is specified,
+    if their coordinates are identical after rounding to that precision.
+    Vertices of ASCII files are welded if their geometric keys are identical (see :meth:`compas.tolerance.Tolerance.geometric_key`).
+    The vertices are numbered in order of first occurrence.
+
     """
 
     def __init__(self, reader, precision=None):
@@ -307,6 +412,10 @@ class STLParser(object):
         None
 
         """
+        if getattr(self.reader, "data", None) is not None:
+            self._parse_data()
+            return
+
         gkey_index = {}
         vertices = []
         faces = []
@@ -327,6 +436,32 @@ class STLParser(object):
         self.vertices = vertices
         self.faces = faces
 
+    def _parse_data(self):
+        import numpy as np
+
+        xyz = np.ascontiguousarray(self.reader.data["vertices"]).reshape(-1, 3)
+        if self.precision is None:
+            # identical coordinates have identical bits
+            keys = xyz.view(np.int32)
+        else:
+            # adding zero replaces negative zeros
+            keys = np.round(xyz.astype(np.float64), self.precision) + 0.0
+        # group identical keys by sorting them
+        # the sort is stable, so the first item of every group is its first occurrence
+        order = np.lexsort(keys.T[::-1])
+        keys = keys[order]
+        first = np.ones(len(keys), dtype=bool)
+        np.any(keys[1:] != keys[:-1], axis=1, out=first[1:])
+        group = np.cumsum(first) - 1
+        index = order[first]
+        # renumber the unique vertices in order of first occurrence
+        rank = np.empty(len(index), dtype=np.int64)
+        rank[np.argsort(index, kind="stable")] = np.arange(len(index))
+        inverse = np.empty(len(order), dtype=np.int64)
+        inverse[order] = rank[group]
+        self.vertices = xyz[np.sort(index)].tolist()
+        self.faces = inverse.reshape(-1, 3).tolist()
+
 
 class STLWriter(object):
     """Class for writing geometric data to a STL file.
@@ -345,6 +480,10 @@ class STLWriter(object):
     precision : str, optional
         COMPAS precision specification for parsing geometric data.
 
+    Notes
+    -----
+    Binary files are written with a single write of a buffer with all facets.
+
     """
 
     def __init__(self, filepath, mesh, binary=False, solid_name=None, precision=None):
@@ -427,10 +566,28 @@ class STLWriter(object):
     def _write_binary_faces(self):
         if not self.file:
             return
+        if not compas.IPY:
+            self.file.write(self._binary_faces_data().tobytes())
+            return
         vertex_xyz = self._vertex_xyz
-        for face in self.mesh.faces():
-            normal = list(self.mesh.face_normal(face))
-            self.file.write(struct.pack("<3f", *normal))
+        buffer = bytearray(STL_FACET_FORMAT.size * self.mesh.number_of_faces())
+        for index, face in enumerate(self.mesh.faces()):
+            values = list(self.mesh.face_normal(face))
             for vertex in self.mesh.face_vertices(face):
-                self.file.write(struct.pack("<3f", *vertex_xyz[vertex]))
-            self.file.write(b"\0\0")
+                values += vertex_xyz[vertex]
+            STL_FACET_FORMAT.pack_into(buffer, index * STL_FACET_FORMAT.size, *(values + [0]))
+        self.file.write(bytes(buffer))
+
+    def _binary_faces_data(self):
+        import numpy as np
+
+        vertices, faces = self.mesh.to_vertices_and_faces()
+        xyz = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)[np.asarray(faces, dtype=np.int64).reshape(-1, 3)]
+        normals = np.cross(xyz[:, 1] - xyz[:, 0], xyz[:, 2] - xyz[:, 0])
+        lengths = np.linalg.norm(normals, axis=1)
+        normals[lengths > 0] /= lengths[lengths > 0, None]
+        data = np.zeros(len(xyz), dtype=STL_FACET_DTYPE)
+        # without signed zeros, as in the normals written without NumPy
+        data["normal"] = normals + 0.0
+        data["vertices"] = xyz
+        return data
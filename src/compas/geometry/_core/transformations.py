@@ -190,6 +190,44 @@ def dehomogenize_and_unflatten_frames(points_and_vectors):
 # ==============================================================================
 
 
+def _transformation_matrix(T):
+    # the matrix of a transformation,
+    # or the product of a sequence of transformations, in the order in which they are applied
+    if hasattr(T, "matrix"):
+        return T.matrix
+    T = list(T)
+    if T and (hasattr(T[0], "matrix") or hasattr(T[0][0], "__len__")):
+        M = _transformation_matrix(T[0])
+        for other in T[1:]:
+            M = multiply_matrices(_transformation_matrix(other), M)
+        return M
+    return T
+
+
+def is_affine_matrix(T):
+    """Verify that a transformation matrix is affine, i.e. that it has no perspective component.
+
+    Parameters
+    ----------
+    T : list[list[float]] | :class:`compas.geometry.Transformation`
+        The transformation matrix.
+
+    Returns
+    -------
+    bool
+        True if the last row of the matrix is ``[0, 0, 0, 1]``.
+
+    Examples
+    --------
+    >>> T = matrix_from_axis_and_angle([0, 2, 0], math.radians(45), point=[4, 5, 6])
+    >>> is_affine_matrix(T)
+    True
+
+    """
+    m, n, o, p = _transformation_matrix(T)[3]
+    return m == 0 and n == 0 and o == 0 and p == 1
+
+
 def transform_points(points, T):
     """Transform multiple points with one transformation matrix.
 
@@ -197,14 +235,21 @@ def transform_points(points, T):
     ----------
     points : sequence[[float, float, float] | :class:`compas.geometry.Point`]
         A list of points to be transformed.
-    T : list[list[float]] | :class:`compas.geometry.Transformation`
-        The transformation to apply.
+    T : list[list[float]] | :class:`compas.geometry.Transformation` | sequence[:class:`compas.geometry.Transformation`]
+        The transformation to apply,
+        or a sequence of transformations that are applied one after the other.
 
     Returns
     -------
     list[[float, float, float]]
         Transformed points.
 
+    Notes
+    -----
+    The points are multiplied with the transformation matrix directly, without creating homogeneous coordinates.
+    The result is the same as ``dehomogenize(multiply_matrices(homogenize(points), transpose_matrix(T)))``.
+    The division by the homogeneous coordinate is skipped for affine transformations.
+
     Examples
     --------
     >>> points = [[1, 0, 0], [1, 2, 4], [4, 7, 1]]
@@ -212,7 +257,18 @@ def transform_points(points, T):
     >>> points_transformed = transform_points(points, T)
 
     """
-    return dehomogenize(multiply_matrices(homogenize(points, w=1.0), transpose_matrix(T)))
+    M = _transformation_matrix(T)
+    (m00, m01, m02, m03), (m10, m11, m12, m13), (m20, m21, m22, m23), (m30, m31, m32, m33) = M
+    if m30 == 0 and m31 == 0 and m32 == 0 and m33 == 1:
+        return [[m00 * x + m01 * y + m02 * z + m03, m10 * x + m11 * y + m12 * z + m13, m20 * x + m21 * y + m22 * z + m23] for x, y, z in points]
+    transformed = []
+    for x, y, z in points:
+        w = m30 * x + m31 * y + m32 * z + m33
+        if w:
+            transformed.append([(m00 * x + m01 * y + m02 * z + m03) / w, (m10 * x + m11 * y + m12 * z + m13) / w, (m20 * x + m21 * y + m22 * z + m23) / w])
+        else:
+            transformed.append([m00 * x + m01 * y + m02 * z + m03, m10 * x + m11 * y + m12 * z + m13, m20 * x + m21 * y + m22 * z + m23])
+    return transformed
 
 
 def transform_vectors(vectors, T):
@@ -222,14 +278,20 @@ def transform_vectors(vectors, T):
     ----------
     vectors : sequence[[float, float, float] | :class:`compas.geometry.Vector`]
         A list of vectors to be transformed.
-    T : list[list[float]] | :class:`compas.geometry.Transformation`
-        The transformation to apply.
+    T : list[list[float]] | :class:`compas.geometry.Transformation` | sequence[:class:`compas.geometry.Transformation`]
+        The transformation to apply,
+        or a sequence of transformations that are applied one after the other.
 
     Returns
     -------
     list[[float, float, float]]
         Transformed vectors.
 
+    Notes
+    -----
+    The translation component of the transformation is ignored.
+    The result is the same as ``dehomogenize(multiply_matrices(homogenize(vectors, w=0.0), transpose_matrix(T)))``.
+
     Examples
     --------
     >>> vectors = [[1, 0, 0], [1, 2, 4], [4, 7, 1]]
@@ -237,7 +299,112 @@ def transform_vectors(vectors, T):
     >>> vectors_transformed = transform_vectors(vectors, T)
 
     """
-    return dehomogenize(multiply_matrices(homogenize(vectors, w=0.0), transpose_matrix(T)))
+    M = _transformation_matrix(T)
+    (m00, m01, m02, _), (m10, m11, m12, _), (m20, m21, m22, _), (m30, m31, m32, _) = M
+    if m30 == 0 and m31 == 0 and m32 == 0:
+        return [[m00 * x + m01 * y + m02 * z, m10 * x + m11 * y + m12 * z, m20 * x + m21 * y + m22 * z] for x, y, z in vectors]
+    transformed = []
+    for x, y, z in vectors:
+        w = m30 * x + m31 * y + m32 * z
+        if w:
+            transformed.append([(m00 * x + m01 * y + m02 * z) / w, (m10 * x + m11 * y + m12 * z) / w, (m20 * x + m21 * y + m22 * z) / w])
+        else:
+            transformed.append([m00 * x + m01 * y + m02 * z, m10 * x + m11 * y + m12 * z, m20 * x + m21 * y + m22 * z])
+    return transformed
+
+
+def transform_points_buffer(xyz, T, affine=None):
+    """Transform the points of a flat buffer of coordinates in place.
+
+    Parameters
+    ----------
+    xyz : list[float] | array.array
+        The XYZ coordinates of the points, one after the other.
+        The buffer is modified in place.
+    T : list[list[float]] | :class:`compas.geometry.Transformation` | sequence[:class:`compas.geometry.Transformation`]
+        The transformation to apply,
+        or a sequence of transformations that are applied one after the other.
+    affine : bool, optional
+        If True, the division by the homogeneous coordinate is skipped.
+        If None, this is determined from the transformation matrix.
+
+    Returns
+    -------
+    None
+
+    See Also
+    --------
+    :func:`transform_points_buffer_numpy`
+
+    Examples
+    --------
+    >>> xyz = [1.0, 0.0, 0.0, 1.0, 2.0, 4.0]
+    >>> T = matrix_from_axis_and_angle([0, 0, 1], math.radians(90))
+    >>> transform_points_buffer(xyz, T)
+    >>> [round(value, 3) for value in xyz]
+    [0.0, 1.0, 0.0, -2.0, 1.0, 4.0]
+
+    """
+    M = _transformation_matrix(T)
+    if affine is None:
+        affine = is_affine_matrix(M)
+    (m00, m01, m02, m03), (m10, m11, m12, m13), (m20, m21, m22, m23), (m30, m31, m32, m33) = M
+    for index in range(0, len(xyz) - 2, 3):
+        x = xyz[index]
+        y = xyz[index + 1]
+        z = xyz[index + 2]
+        if affine:
+            xyz[index] = m00 * x + m01 * y + m02 * z + m03
+            xyz[index + 1] = m10 * x + m11 * y + m12 * z + m13
+            xyz[index + 2] = m20 * x + m21 * y + m22 * z + m23
+        else:
+            w = m30 * x + m31 * y + m32 * z + m33 or 1.0
+            xyz[index] = (m00 * x + m01 * y + m02 * z + m03) / w
+            xyz[index + 1] = (m10 * x + m11 * y + m12 * z + m13) / w
+            xyz[index + 2] = (m20 * x + m21 * y + m22 * z + m23) / w
+
+
+def transform_vectors_buffer(xyz, T):
+    """Transform the vectors of a flat buffer of components in place.
+
+    Parameters
+    ----------
+    xyz : list[float] | array.array
+        The XYZ components of the vectors, one after the other.
+        The buffer is modified in place.
+    T : list[list[float]] | :class:`compas.geometry.Transformation` | sequence[:class:`compas.geometry.Transformation`]
+        The transformation to apply,
+        or a sequence of transformations that are applied one after the other.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    The translation component of the transformation is ignored.
+
+    See Also
+    --------
+    :func:`transform_vectors_buffer_numpy`
+
+    """
+    M = _transformation_matrix(T)
+    (m00, m01, m02, _), (m10, m11, m12, _), (m20, m21, m22, _), (m30, m31, m32, _) = M
+    affine = m30 == 0 and m31 == 0 and m32 == 0
+    for index in range(0, len(xyz) - 2, 3):
+        x = xyz[index]
+        y = xyz[index + 1]
+        z = xyz[index + 2]
+        if affine:
+            xyz[index] = m00 * x + m01 * y + m02 * z
+            xyz[index + 1] = m10 * x + m11 * y + m12 * z
+            xyz[index + 2] = m20 * x + m21 * y + m22 * z
+        else:
+            w = m30 * x + m31 * y + m32 * z or 1.0
+            xyz[index] = (m00 * x + m01 * y + m02 * z) / w
+            xyz[index + 1] = (m10 * x + m11 * y + m12 * z) / w
+            xyz[index + 2] = (m20 * x + m21 * y + m22 * z) / w
 
 
 def transform_frames(frames, T):
@@ -1,11 +1,18 @@
+from numpy import array
 from numpy import asarray
+from numpy import float64
+from numpy import frombuffer
 from numpy import hstack
+from numpy import ndarray
 from numpy import ones
 from numpy import tile
-from numpy import vectorize
-from scipy.linalg import solve  # type: ignore
+from numpy import where
 
 from ._algebra import cross_vectors
+from .transformations import _transformation_matrix
+
+#: The number of points or vectors of a buffer that are transformed at once.
+CHUNK_SIZE = 2**16
 
 
 def transform_points_numpy(points, T):
@@ -15,8 +22,9 @@ def transform_points_numpy(points, T):
     ----------
     points : sequence[[float, float, float] | :class:`compas.geometry.Point`]
         A list of points to be transformed.
-    T : :class:`compas.geometry.Transformation` | list[list[float]]
-        The transformation to apply.
+    T : :class:`compas.geometry.Transformation` | list[list[float]] | sequence[:class:`compas.geometry.Transformation`]
+        The transformation to apply,
+        or a sequence of transformations that are applied one after the other.
 
     Returns
     -------
@@ -31,9 +39,9 @@ def transform_points_numpy(points, T):
     >>> points_transformed = transform_points_numpy(points, T)
 
     """
-    T = asarray(T)
-    points = homogenize_numpy(points, w=1.0)
-    return dehomogenize_numpy(points.dot(T.T))
+    points = array(points, dtype=float64).reshape((-1, 3))
+    transform_points_buffer_numpy(points, T)
+    return points
 
 
 def transform_vectors_numpy(vectors, T):
@@ -43,8 +51,9 @@ def transform_vectors_numpy(vectors, T):
     ----------
     vectors : sequence[[float, float, float] | :class:`compas.geometry.Vector`]
         A list of vectors to be transformed.
-    T : :class:`compas.geometry.Transformation`
-        The transformation to apply.
+    T : :class:`compas.geometry.Transformation` | list[list[float]] | sequence[:class:`compas.geometry.Transformation`]
+        The transformation to apply,
+        or a sequence of transformations that are applied one after the other.
 
     Returns
     -------
@@ -59,9 +68,115 @@ def transform_vectors_numpy(vectors, T):
     >>> vectors_transformed = transform_vectors_numpy(vectors, T)
 
     """
-    T = asarray(T)
-    vectors = homogenize_numpy(vectors, w=0.0)
-    return dehomogenize_numpy(vectors.dot(T.T))
+    vectors = array(vectors, dtype=float64).reshape((-1, 3))
+    transform_vectors_buffer_numpy(vectors, T)
+    return vectors
+
+
+def _coordinates_view(xyz):
+    # a writable view of shape (n, 3) on a buffer of coordinates
+    if not isinstance(xyz, ndarray):
+        xyz = frombuffer(xyz, dtype=float64)
+    if xyz.dtype != float64:
+        raise TypeError("The coordinates should be 64-bit floats, not {}.".format(xyz.dtype))
+    if not xyz.flags.writeable:
+        raise ValueError("The buffer of coordinates is read-only.")
+    if xyz.ndim == 2 and xyz.shape[1] == 3:
+        return xyz
+    if xyz.ndim == 1 and xyz.size % 3 == 0 and xyz.flags.c_contiguous:
+        return xyz.reshape((-1, 3))
+    raise ValueError("Expected an array of shape (n, 3) or a flat buffer of XYZ coordinates, not shape {}.".format(xyz.shape))
+
+
+def transform_points_buffer_numpy(xyz, T, affine=None):
+    """Transform the points of a buffer of coordinates in place using numpy.
+
+    Parameters
+    ----------
+    xyz : (N, 3) ndarray | (3 * N,) ndarray | array.array
+        The coordinates of the points,
+        as an array of 64-bit floats of shape (N, 3), or as a flat buffer with the XYZ coordinates of the points one after the other.
+        The buffer is modified in place.
+    T : :class:`compas.geometry.Transformation` | list[list[float]] | sequence[:class:`compas.geometry.Transformation`]
+        The transformation to apply,
+        or a sequence of transformations that are applied one after the other.
+    affine : bool, optional
+        If True, the division by the homogeneous coordinate is skipped.
+        If None, this is determined from the transformation matrix.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    The points are transformed in chunks of :attr:`CHUNK_SIZE` points,
+    without creating homogeneous coordinates or temporary arrays of the size of the entire buffer.
+
+    Examples
+    --------
+    >>> from array import array
+    >>> from compas.geometry import matrix_from_axis_and_angle
+    >>> xyz = array("d", [1.0, 0.0, 0.0, 1.0, 2.0, 4.0])
+    >>> T = matrix_from_axis_and_angle([0, 0, 1], math.radians(90))
+    >>> transform_points_buffer_numpy(xyz, T)
+    >>> [round(value, 3) for value in xyz]
+    [0.0, 1.0, 0.0, -2.0, 1.0, 4.0]
+
+    """
+    xyz = _coordinates_view(xyz)
+    M = asarray(_transformation_matrix(T), dtype=float64)
+    R = M[:3, :3].T
+    t = M[:3, 3]
+    p = M[3, :3]
+    if affine is None:
+        affine = not p.any() and M[3, 3] == 1.0
+    for start in range(0, xyz.shape[0], CHUNK_SIZE):
+        chunk = xyz[start : start + CHUNK_SIZE]
+        result = chunk.dot(R)
+        result += t
+        if not affine:
+            w = chunk.dot(p) + M[3, 3]
+            w[w == 0] = 1.0
+            result /= w.reshape((-1, 1))
+        chunk[:] = result
+
+
+def transform_vectors_buffer_numpy(xyz, T):
+    """Transform the vectors of a buffer of components in place using numpy.
+
+    Parameters
+    ----------
+    xyz : (N, 3) ndarray | (3 * N,) ndarray | array.array
+        The components of the vectors,
+        as an array of 64-bit floats of shape (N, 3), or as a flat buffer with the XYZ components of the vectors one after the other.
+        The buffer is modified in place.
+    T : :class:`compas.geometry.Transformation` | list[list[float]] | sequence[:class:`compas.geometry.Transformation`]
+        The transformation to apply,
+        or a sequence of transformations that are applied one after the other.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    The translation component of the transformation is ignored.
+
+    """
+    xyz = _coordinates_view(xyz)
+    M = asarray(_transformation_matrix(T), dtype=float64)
+    R = M[:3, :3].T
+    p = M[3, :3]
+    affine = not p.any()
+    for start in range(0, xyz.shape[0], CHUNK_SIZE):
+        chunk = xyz[start : start + CHUNK_SIZE]
+        result = chunk.dot(R)
+        if not affine:
+            w = chunk.dot(p)
+            w[w == 0] = 1.0
+            result /= w.reshape((-1, 1))
+        chunk[:] = result
 
 
 def transform_frames_numpy(frames, T):
@@ -121,6 +236,8 @@ def world_to_local_coordinates_numpy(frame, xyz):
     uvw = [frame[1], frame[2], cross_vectors(frame[1], frame[2])]
     uvw = asarray(uvw).T
     xyz = asarray(xyz).T - asarray(origin).reshape((-1, 1))
+    from scipy.linalg import solve  # type: ignore
+
     rst = solve(uvw, xyz)
     return rst.T
 
@@ -217,13 +334,9 @@ def dehomogenize_numpy(data):
 
     """
 
-    def func(a):
-        return a if a else 1.0
-
-    func = vectorize(func)
-
     data = asarray(data)
-    return data[:, :-1] / func(data[:, -1]).reshape((-1, 1))
+    w = data[:, -1]
+    return data[:, :-1] / where(w == 0, 1.0, w).reshape((-1, 1))
 
 
 def homogenize_and_flatten_frames_numpy(frames):
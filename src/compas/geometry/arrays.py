@@ -0,0 +1,566 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from array import array
+from itertools import chain
+from math import sqrt
+
+from compas.geometry import transform_points_buffer
+from compas.geometry import transform_vectors_buffer
+from compas.tolerance import TOL
+
+from .geometry import Geometry
+from .point import Point
+from .vector import Vector
+
+try:
+    import numpy as np
+except (ImportError, SyntaxError):
+    np = None
+
+
+def _flatten(values):
+    # the XYZ coordinates of a sequence of points or vectors, as a new buffer of 64-bit floats
+    if isinstance(values, _CoordinateArray):
+        return values._xyz[3 * values._start : 3 * values._stop]
+    if np is not None and isinstance(values, np.ndarray):
+        if values.ndim != 2 or values.shape[1] != 3:
+            raise ValueError("Expected an array of shape (n, 3), not {}.".format(values.shape))
+        xyz = array("d")
+        xyz.frombytes(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+        return xyz
+    if not hasattr(values, "__len__"):
+        values = list(values)
+    xyz = array("d", chain.from_iterable(values))
+    if len(xyz) != 3 * len(values):
+        raise ValueError("Every point or vector should have three coordinates.")
+    return xyz
+
+
+def _is_single(value):
+    # a single point or vector, rather than a sequence of points or vectors
+    if isinstance(value, _CoordinateArray):
+        return False
+    if np is not None and isinstance(value, np.ndarray):
+        return value.ndim == 1
+    return len(value) == 3 and not hasattr(value[0], "__len__")
+
+
+class _CoordinateArray(Geometry):
+    """Base class for arrays of points or vectors,
+    with the XYZ coordinates stored in a single contiguous buffer of 64-bit floats.
+
+    Slices with step 1 are views that share the buffer of the array they are taken from.
+    Indexing with an integer returns a new point or vector.
+
+    """
+
+    __slots__ = ("_xyz", "_start", "_stop")
+
+    DATASCHEMA = {
+        "type": "object",
+        "properties": {
+            "xyz": {"type": "array", "items": {"type": "number"}},
+        },
+        "required": ["xyz"],
+    }
+
+    # the type of the items of the array
+    ITEMTYPE = None
+
+    @property
+    def __data__(self):
+        return {"xyz": self.flat.tolist()}
+
+    @classmethod
+    def __from_data__(cls, data):
+        return cls.from_flat(data["xyz"])
+
+    def __copy_state__(self):
+        return self._from_buffer(self.flat)
+
+    def __init__(self, values=None, name=None):
+        super(_CoordinateArray, self).__init__(name=name)
+        self._xyz = array("d") if values is None else _flatten(values)
+        self._start = 0
+        self._stop = len(self._xyz) // 3
+
+    def __repr__(self):
+        return "{0}({1!r})".format(type(self).__name__, self.to_list())
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self._from_buffer(self._xyz, self._start + start, self._start + max(start, stop))
+            return self._from_buffer(array("d", chain.from_iterable(self[i] for i in range(start, stop, step))))
+        i = self._offset(key)
+        xyz = self._xyz
+        return self.ITEMTYPE(xyz[i], xyz[i + 1], xyz[i + 2])
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            if np is not None:
+                self.array[key] = value.array if isinstance(value, _CoordinateArray) else value
+                return
+            indices = range(*key.indices(len(self)))
+            values = _flatten([value] * len(indices) if _is_single(value) else value)
+            if len(values) != 3 * len(indices):
+                raise ValueError("Expected {} points or vectors, not {}.".format(len(indices), len(values) // 3))
+            xyz = self._xyz
+            for j, index in enumerate(indices):
+                i = 3 * (self._start + index)
+                xyz[i : i + 3] = values[3 * j : 3 * j + 3]
+            return
+        i = self._offset(key)
+        x, y, z = value
+        xyz = self._xyz
+        xyz[i] = x
+        xyz[i + 1] = y
+        xyz[i + 2] = z
+
+    def __iter__(self):
+        xyz = self._xyz
+        itemtype = self.ITEMTYPE
+        for i in range(3 * self._start, 3 * self._stop, 3):
+            yield itemtype(xyz[i], xyz[i + 1], xyz[i + 2])
+
+    def __eq__(self, other):
+        if not hasattr(other, "__len__") or len(self) != len(other):
+            return False
+        return all(TOL.is_allclose(a, b) for a, b in zip(self.to_list(), other))
+
+    # ==========================================================================
+    # Properties
+    # ==========================================================================
+
+    @property
+    def array(self):
+        if np is None:
+            raise ImportError("NumPy is required for the array view of a {}.".format(type(self).__name__))
+        if not self._xyz:
+            return np.empty((0, 3))
+        return np.frombuffer(self._xyz, dtype=np.float64)[3 * self._start : 3 * self._stop].reshape((-1, 3))
+
+    @property
+    def flat(self):
+        return self._xyz[3 * self._start : 3 * self._stop]
+
+    # ==========================================================================
+    # Constructors
+    # ==========================================================================
+
+    @classmethod
+    def _from_buffer(cls, xyz, start=0, stop=None):
+        obj = cls()
+        obj._xyz = xyz
+        obj._start = start
+        obj._stop = len(xyz) // 3 if stop is None else stop
+        return obj
+
+    @classmethod
+    def from_flat(cls, xyz):
+        """Construct an array from a flat sequence of coordinates.
+
+        Parameters
+        ----------
+        xyz : sequence[float]
+            The XYZ coordinates of all items, one after the other.
+
+        Returns
+        -------
+        :class:`compas.geometry.PointArray` | :class:`compas.geometry.VectorArray`
+
+        """
+        xyz = array("d", xyz)
+        if len(xyz) % 3:
+            raise ValueError("The number of coordinates should be a multiple of three.")
+        return cls._from_buffer(xyz)
+
+    # ==========================================================================
+    # Helpers
+    # ==========================================================================
+
+    def _offset(self, index):
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("{} index out of range".format(type(self).__name__))
+        return 3 * (self._start + index)
+
+    def _operand(self, other):
+        # another array of the same length, or a single item that is combined with every item of this array
+        if np is not None:
+            other = other.array if isinstance(other, _CoordinateArray) else np.asarray(other, dtype=np.float64)
+            if other.shape != (3,) and other.shape != (len(self), 3):
+                raise ValueError("Expected a single item or {} items, not an array of shape {}.".format(len(self), other.shape))
+            return other
+        if _is_single(other):
+            return [list(other)] * len(self)
+        other = other.to_list() if isinstance(other, _CoordinateArray) else [list(item) for item in other]
+        if len(other) != len(self):
+            raise ValueError("Expected a single item or {} items, not {}.".format(len(self), len(other)))
+        return other
+
+    def _transform(self, T, w):
+        if np is None:
+            transform = transform_points_buffer if w else transform_vectors_buffer
+            xyz = self.flat
+            transform(xyz, T)
+            self._xyz[3 * self._start : 3 * self._stop] = xyz
+            return
+        from compas.geometry import transform_points_buffer_numpy
+        from compas.geometry import transform_vectors_buffer_numpy
+
+        transform = transform_points_buffer_numpy if w else transform_vectors_buffer_numpy
+        transform(self.array, T)
+
+    # ==========================================================================
+    # Methods
+    # ==========================================================================
+
+    def to_list(self):
+        """Convert the array to a list of lists of coordinates.
+
+        Returns
+        -------
+        list[[float, float, float]]
+
+        """
+        if np is not None:
+            return self.array.tolist()
+        xyz = self._xyz
+        return [[xyz[i], xyz[i + 1], xyz[i + 2]] for i in range(3 * self._start, 3 * self._stop, 3)]
+
+
+class VectorArray(_CoordinateArray):
+    """An array of vectors, with the XYZ components stored in a single contiguous buffer of 64-bit floats.
+
+    Parameters
+    ----------
+    vectors : sequence[[float, float, float] | :class:`compas.geometry.Vector`] | numpy.ndarray, optional
+        The vectors, or an array of shape (n, 3).
+    name : str, optional
+        The name of the array.
+
+    Attributes
+    ----------
+    array : numpy.ndarray, read-only
+        The components as a NumPy array of shape (n, 3), sharing the buffer of this array.
+        Changes to the NumPy array change the vectors of this array, and vice versa.
+    flat : array.array, read-only
+        A copy of the components as a flat buffer.
+
+    Notes
+    -----
+    Slicing an array with step 1 returns a view that shares the buffer of the array.
+    Indexing an array with an integer returns a new :class:`compas.geometry.Vector`.
+
+    The operations on all vectors are computed with NumPy if it is available.
+
+    Examples
+    --------
+    >>> vectors = VectorArray([[1.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.0, 3.0]])
+    >>> vectors.lengths()
+    [1.0, 2.0, 3.0]
+    >>> vectors.dot([1.0, 1.0, 1.0])
+    [1.0, 2.0, 3.0]
+    >>> print(vectors[1])
+    Vector(x=0.000, y=2.000, z=0.000)
+
+    """
+
+    __slots__ = ()
+
+    ITEMTYPE = Vector
+
+    def __init__(self, vectors=None, name=None):
+        super(VectorArray, self).__init__(vectors, name=name)
+
+    def __str__(self):
+        return "{0}(len(vectors)={1})".format(type(self).__name__, len(self))
+
+    def __add__(self, other):
+        if np is not None:
+            return VectorArray(self.array + self._operand(other))
+        return VectorArray([[a[0] + b[0], a[1] + b[1], a[2] + b[2]] for a, b in zip(self.to_list(), self._operand(other))])
+
+    def __sub__(self, other):
+        if np is not None:
+            return VectorArray(self.array - self._operand(other))
+        return VectorArray([[a[0] - b[0], a[1] - b[1], a[2] - b[2]] for a, b in zip(self.to_list(), self._operand(other))])
+
+    def __mul__(self, n):
+        if np is not None:
+            return VectorArray(self.array * n)
+        return VectorArray([[x * n, y * n, z * n] for x, y, z in self.to_list()])
+
+    def __rmul__(self, n):
+        return self.__mul__(n)
+
+    def __neg__(self):
+        return self.__mul__(-1.0)
+
+    # ==========================================================================
+    # Transformations
+    # ==========================================================================
+
+    def transform(self, T):
+        """Transform the vectors of the array.
+
+        Parameters
+        ----------
+        T : :class:`compas.geometry.Transformation` | list[list[float]]
+            The transformation matrix.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        As with :meth:`compas.geometry.Vector.transform`, the translation component of the transformation is ignored.
+
+        """
+        self._transform(T, 0.0)
+
+    # ==========================================================================
+    # Methods
+    # ==========================================================================
+
+    def lengths(self):
+        """Compute the lengths of the vectors.
+
+        Returns
+        -------
+        list[float]
+
+        """
+        if np is not None:
+            return np.sqrt((self.array**2).sum(axis=1)).tolist()
+        return [sqrt(x * x + y * y + z * z) for x, y, z in self.to_list()]
+
+    def dot(self, other):
+        """Compute the dot products of the vectors with another vector, or with the corresponding vectors of another array.
+
+        Parameters
+        ----------
+        other : [float, float, float] | :class:`compas.geometry.Vector` | :class:`compas.geometry.VectorArray`
+            A single vector, or as many vectors as this array.
+
+        Returns
+        -------
+        list[float]
+
+        """
+        if np is not None:
+            return (self.array * self._operand(other)).sum(axis=1).tolist()
+        return [a[0] * b[0] + a[1] * b[1] + a[2] * b[2] for a, b in zip(self.to_list(), self._operand(other))]
+
+    def cross(self, other):
+        """Compute the cross products of the vectors with another vector, or with the corresponding vectors of another array.
+
+        Parameters
+        ----------
+        other : [float, float, float] | :class:`compas.geometry.Vector` | :class:`compas.geometry.VectorArray`
+            A single vector, or as many vectors as this array.
+
+        Returns
+        -------
+        :class:`compas.geometry.VectorArray`
+
+        """
+        if np is not None:
+            return VectorArray(np.cross(self.array, self._operand(other)))
+        return VectorArray(
+            [
+                [
+                    a[1] * b[2] - a[2] * b[1],
+                    a[2] * b[0] - a[0] * b[2],
+                    a[0] * b[1] - a[1] * b[0],
+                ]
+                for a, b in zip(self.to_list(), self._operand(other))
+            ]
+        )
+
+    def unitize(self):
+        """Scale the vectors to unit length.
+
+        Returns
+        -------
+        None
+
+        """
+        if np is not None:
+            xyz = self.array
+            xyz /= np.sqrt((xyz**2).sum(axis=1))[:, None]
+            return
+        self[:] = [[x / length, y / length, z / length] for (x, y, z), length in zip(self.to_list(), self.lengths())]
+
+    def unitized(self):
+        """Return a copy of the array with the vectors scaled to unit length.
+
+        Returns
+        -------
+        :class:`compas.geometry.VectorArray`
+
+        """
+        vectors = self.copy()
+        vectors.unitize()
+        return vectors
+
+
+class PointArray(_CoordinateArray):
+    """An array of points, with the XYZ coordinates stored in a single contiguous buffer of 64-bit floats.
+
+    Parameters
+    ----------
+    points : sequence[[float, float, float] | :class:`compas.geometry.Point`] | numpy.ndarray, optional
+        The points, or an array of shape (n, 3).
+        This can also be, for example, a :class:`compas.geometry.Pointcloud` or a :class:`compas.geometry.Polyline`,
+        or the vertex coordinates of a mesh, ``mesh.vertices_attributes("xyz")``.
+    name : str, optional
+        The name of the array.
+
+    Attributes
+    ----------
+    array : numpy.ndarray, read-only
+        The coordinates as a NumPy array of shape (n, 3), sharing the buffer of this array.
+        Changes to the NumPy array change the points of this array, and vice versa.
+    flat : array.array, read-only
+        A copy of the coordinates as a flat buffer.
+
+    Notes
+    -----
+    Slicing an array with step 1 returns a view that shares the buffer of the array.
+    Indexing an array with an integer returns a new :class:`compas.geometry.Point`.
+
+    The operations on all points are computed with NumPy if it is available.
+
+    Examples
+    --------
+    >>> points = PointArray([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0]])
+    >>> points.distance_to([0.0, 0.0, 0.0])
+    [0.0, 1.0, 1.4142135623730951]
+    >>> view = points[1:]
+    >>> view[0] = [2.0, 0.0, 0.0]
+    >>> print(points[1])
+    Point(x=2.000, y=0.000, z=0.000)
+
+    """
+
+    __slots__ = ()
+
+    ITEMTYPE = Point
+
+    def __init__(self, points=None, name=None):
+        super(PointArray, self).__init__(points, name=name)
+
+    def __str__(self):
+        return "{0}(len(points)={1})".format(type(self).__name__, len(self))
+
+    def __add__(self, other):
+        if np is not None:
+            return PointArray(self.array + self._operand(other))
+        return PointArray([[a[0] + b[0], a[1] + b[1], a[2] + b[2]] for a, b in zip(self.to_list(), self._operand(other))])
+
+    def __sub__(self, other):
+        if np is not None:
+            return VectorArray(self.array - self._operand(other))
+        return VectorArray([[a[0] - b[0], a[1] - b[1], a[2] - b[2]] for a, b in zip(self.to_list(), self._operand(other))])
+
+    # ==========================================================================
+    # Constructors
+    # ==========================================================================
+
+    @classmethod
+    def from_mesh(cls, mesh, keys=None):
+        """Construct an array from the coordinates of the vertices of a mesh.
+
+        Parameters
+        ----------
+        mesh : :class:`compas.datastructures.Mesh`
+            The mesh.
+        keys : list[int], optional
+            The identifiers of the vertices.
+            Defaults to all vertices, in the order of :meth:`compas.datastructures.Mesh.vertices`.
+
+        Returns
+        -------
+        :class:`compas.geometry.PointArray`
+
+        """
+        return cls(mesh.vertices_attributes("xyz", keys=keys))
+
+    # ==========================================================================
+    # Conversions
+    # ==========================================================================
+
+    def to_pointcloud(self):
+        """Convert the array to a pointcloud.
+
+        Returns
+        -------
+        :class:`compas.geometry.Pointcloud`
+
+        """
+        from .pointcloud import Pointcloud
+
+        return Pointcloud(list(self))
+
+    def to_polyline(self):
+        """Convert the array to a polyline.
+
+        Returns
+        -------
+        :class:`compas.geometry.Polyline`
+
+        """
+        from .curves.polyline import Polyline
+
+        return Polyline(list(self))
+
+    # ==========================================================================
+    # Transformations
+    # ==========================================================================
+
+    def transform(self, T):
+        """Transform the points of the array.
+
+        Parameters
+        ----------
+        T : :class:`compas.geometry.Transformation` | list[list[float]]
+            The transformation matrix.
+
+        Returns
+        -------
+        None
+
+        """
+        self._transform(T, 1.0)
+
+    # ==========================================================================
+    # Methods
+    # ==========================================================================
+
+    def distance_to(self, other):
+        """Compute the distances of the points to another point, or to the corresponding points of another array.
+
+        Parameters
+        ----------
+        other : [float, float, float] | :class:`compas.geometry.Point` | :class:`compas.geometry.PointArray`
+            A single point, or as many points as this array.
+
+        Returns
+        -------
+        list[float]
+
+        """
+        if np is not None:
+            return np.sqrt(((self.array - self._operand(other)) ** 2).sum(axis=1)).tolist()
+        return [sqrt((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2) for a, b in zip(self.to_list(), self._operand(other))]
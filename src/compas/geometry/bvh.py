@@ -0,0 +1,561 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from array import array
+from math import sqrt
+
+from compas.tolerance import TOL
+
+try:
+    import numpy as np
+except (ImportError, SyntaxError):
+    np = None
+
+CHUNK_SIZE = 2**14
+
+
+def _triangulated(vertices, faces):
+    # the vertex triples of the fan triangulations of the faces,
+    # and the index of the face of every triangle
+    triangles = []
+    labels = []
+    for index, face in enumerate(faces):
+        a = face[0]
+        for b, c in zip(face[1:-1], face[2:]):
+            triangles.append((a, b, c))
+            labels.append(index)
+    return triangles, labels
+
+
+def _to_buffer(typecode, values):
+    # a flat array with the values of a NumPy array
+    buffer = array(typecode)
+    buffer.frombytes(np.ascontiguousarray(values, dtype=_dtype(buffer)).tobytes())
+    return buffer
+
+
+def _dtype(buffer):
+    # the NumPy type of the items of a flat array
+    if buffer.typecode == "d":
+        return np.float64
+    return np.dtype("i{}".format(buffer.itemsize))
+
+
+def _view(buffer, columns=None):
+    # a NumPy view of a flat array
+    values = np.frombuffer(buffer, dtype=_dtype(buffer))
+    if columns:
+        return values.reshape((-1, columns))
+    return values
+
+
+class BVH(object):
+    """A bounding volume hierarchy of the triangles of a mesh, for ray casting.
+
+    Parameters
+    ----------
+    mesh : tuple[sequence[[float, float, float] | :class:`compas.geometry.Point`], sequence[sequence[int]]] | :class:`compas.datastructures.Mesh`, optional
+        The vertices and faces of a mesh.
+        If a mesh is provided, the hierarchy is built automatically.
+        Otherwise, use :meth:`build`.
+    leafsize : int, optional
+        The maximum number of triangles in a leaf node of the hierarchy.
+
+    Attributes
+    ----------
+    root : int | None
+        The index of the root node of the built hierarchy,
+        or None if the hierarchy is empty.
+
+    Notes
+    -----
+    Faces with more than three vertices are split into triangles with a fan triangulation,
+    which assumes that the faces are convex.
+
+    The hierarchy is stored in flat arrays.
+    The triangles are reordered such that the triangles of every node occupy a contiguous range,
+    and every node stores the start and end of this range, its axis-aligned bounding box,
+    and the indices of its children.
+    Internal nodes split their triangles at the median of the centers of the bounding boxes of the triangles,
+    along the axis with the largest extent.
+
+    If NumPy is available, the hierarchy is built one level at a time,
+    and batches of rays traverse it together, one level at a time.
+    Otherwise, the hierarchy is built one node at a time,
+    and every ray traverses it separately.
+
+    The intersections of a ray with the triangles are computed with the algorithm of Moller and Trumbore [1]_.
+    Rays that are parallel to the plane of a triangle do not intersect it.
+    Intersections with different triangles of the same face at the same distance along the ray,
+    for example on the diagonal of a quad, are reported only once.
+
+    References
+    ----------
+    .. [1] Moller, T. and Trumbore, B. *Fast, Minimum Storage Ray-Triangle Intersection*.
+           Journal of Graphics Tools 2(1), 1997, pp. 21-28.
+
+    Examples
+    --------
+    >>> from compas.geometry import BVH
+    >>> vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]]
+    >>> faces = [[0, 3, 2, 1], [4, 5, 6, 7]]
+    >>> bvh = BVH((vertices, faces))
+    >>> [(face, t) for face, u, v, t in bvh.intersect_ray(([0.5, 0.5, -1], [0, 0, 1]))]
+    [(0, 1.0), (1, 2.0)]
+    >>> [(face, t) for face, u, v, t in bvh.intersect_ray(([0.5, 0.5, -1], [0, 0, 1]), first=True)]
+    [(0, 1.0)]
+
+    """
+
+    def __init__(self, mesh=None, leafsize=4):
+        self.leafsize = max(1, leafsize)
+        self.root = None
+        self._clear()
+        if mesh is not None:
+            if hasattr(mesh, "to_vertices_and_faces"):
+                mesh = mesh.to_vertices_and_faces()
+            self.build(*mesh)
+
+    def __len__(self):
+        return len(self._labels)
+
+    def _clear(self):
+        self._bounds = array("d")
+        self._start = array("l")
+        self._end = array("l")
+        self._left = array("l")
+        self._right = array("l")
+        self._triangles = array("d")
+        self._labels = array("l")
+
+    def build(self, vertices, faces):
+        """Build the hierarchy of the triangles of a mesh.
+
+        Parameters
+        ----------
+        vertices : sequence[[float, float, float] | :class:`compas.geometry.Point`]
+            The XYZ coordinates of the vertices.
+        faces : sequence[sequence[int]]
+            The faces, as lists of indices of vertices.
+
+        Returns
+        -------
+        int or None
+            The index of the root node, or None if the mesh has no triangles.
+
+        """
+        self._clear()
+        self.root = None
+        triangles, labels = _triangulated(vertices, faces)
+        if not triangles:
+            return
+        if np is not None:
+            self._build_numpy(vertices, triangles, labels)
+        else:
+            self._build(vertices, triangles, labels)
+        self.root = 0
+        return self.root
+
+    def _build(self, vertices, triangles, labels):
+        vertices = [[float(value) for value in vertex] for vertex in vertices]
+        corners = [(vertices[a], vertices[b], vertices[c]) for a, b, c in triangles]
+        lower = [[min(a[i], b[i], c[i]) for i in range(3)] for a, b, c in corners]
+        upper = [[max(a[i], b[i], c[i]) for i in range(3)] for a, b, c in corners]
+        centers = [[lo[i] + hi[i] for i in range(3)] for lo, hi in zip(lower, upper)]
+        order = list(range(len(triangles)))
+
+        start, end, left, right = self._start, self._end, self._left, self._right
+
+        def add_node(lo, hi):
+            start.append(lo)
+            end.append(hi)
+            left.append(-1)
+            right.append(-1)
+            return len(start) - 1
+
+        stack = [add_node(0, len(order))]
+        while stack:
+            node = stack.pop()
+            lo, hi = start[node], end[node]
+            if hi - lo <= self.leafsize:
+                continue
+            extents = []
+            for i in range(3):
+                values = [centers[j][i] for j in order[lo:hi]]
+                extents.append(max(values) - min(values))
+            axis = extents.index(max(extents))
+            if extents[axis] == 0:
+                # the triangles of this node have the same center
+                continue
+            order[lo:hi] = sorted(order[lo:hi], key=lambda j: centers[j][axis])
+            mid = (lo + hi) // 2
+            left[node] = add_node(lo, mid)
+            right[node] = add_node(mid, hi)
+            stack.append(right[node])
+            stack.append(left[node])
+
+        # children are added after their parents
+        # so the bounds can be computed in reverse order of the nodes
+        bounds = [None] * len(start)
+        for node in range(len(start) - 1, -1, -1):
+            if left[node] == -1:
+                members = order[start[node] : end[node]]
+                bounds[node] = [min(lower[j][i] for j in members) for i in range(3)] + [max(upper[j][i] for j in members) for i in range(3)]
+            else:
+                a = bounds[left[node]]
+                b = bounds[right[node]]
+                bounds[node] = [min(a[i], b[i]) for i in range(3)] + [max(a[i], b[i]) for i in range(3, 6)]
+        for box in bounds:
+            self._bounds.extend(box)
+
+        for j in order:
+            a, b, c = corners[j]
+            self._triangles.extend(a)
+            self._triangles.extend([b[i] - a[i] for i in range(3)])
+            self._triangles.extend([c[i] - a[i] for i in range(3)])
+            self._labels.append(labels[j])
+
+    def _build_numpy(self, vertices, triangles, labels):
+        vertices = np.asarray(vertices, dtype=np.float64).reshape((-1, 3))
+        triangles = np.asarray(triangles, dtype=np.intp)
+        a = vertices[triangles[:, 0]]
+        b = vertices[triangles[:, 1]]
+        c = vertices[triangles[:, 2]]
+        lower = np.minimum(np.minimum(a, b), c)
+        upper = np.maximum(np.maximum(a, b), c)
+        centers = lower + upper
+        m = len(triangles)
+        order = np.arange(m)
+
+        # a hierarchy of m triangles has at most 2m - 1 nodes
+        size = 2 * m - 1
+        start = np.zeros(size, dtype=np.intp)
+        end = np.zeros(size, dtype=np.intp)
+        left = np.full(size, -1, dtype=np.intp)
+        right = np.full(size, -1, dtype=np.intp)
+        depth = np.zeros(size, dtype=np.intp)
+        end[0] = m
+        count = 1
+
+        # the nodes of the deepest level of the hierarchy built so far,
+        # sorted by the start of their range of triangles,
+        # such that the ranges cover all triangles
+        nodes = np.array([0])
+        active = np.array([True])
+        while True:
+            lo = start[nodes]
+            n = end[nodes] - lo
+            split = active & (n > self.leafsize)
+            if not split.any():
+                break
+            points = centers[order]
+            extents = np.maximum.reduceat(points, lo, axis=0) - np.minimum.reduceat(points, lo, axis=0)
+            axes = extents.argmax(axis=1)
+            split &= extents.max(axis=1) > 0
+            if not split.any():
+                break
+            # sort the triangles of every node along its axis
+            segments = np.repeat(np.arange(len(nodes)), n)
+            order = order[np.lexsort((points[np.arange(m), axes[segments]], segments))]
+
+            parents = nodes[split]
+            children = np.arange(count, count + 2 * len(parents))
+            mid = lo[split] + n[split] // 2
+            left[parents] = children[0::2]
+            right[parents] = children[1::2]
+            start[children[0::2]] = start[parents]
+            end[children[0::2]] = mid
+            start[children[1::2]] = mid
+            end[children[1::2]] = end[parents]
+            depth[children] = np.repeat(depth[parents] + 1, 2)
+            count += len(children)
+
+            # replace the split nodes by their children
+            repeats = np.where(split, 2, 1)
+            first = np.cumsum(repeats) - repeats
+            nodes = np.repeat(nodes, repeats)
+            nodes[first[split]] = children[0::2]
+            nodes[first[split] + 1] = children[1::2]
+            active = np.repeat(split, repeats)
+
+        start, end, left, right, depth = start[:count], end[:count], left[:count], right[:count], depth[:count]
+
+        bounds = np.empty((count, 6))
+        leaves = np.flatnonzero(left == -1)
+        leaves = leaves[np.argsort(start[leaves])]
+        bounds[leaves, :3] = np.minimum.reduceat(lower[order], start[leaves], axis=0)
+        bounds[leaves, 3:] = np.maximum.reduceat(upper[order], start[leaves], axis=0)
+        for level in range(depth.max() - 1, -1, -1):
+            parents = np.flatnonzero((depth == level) & (left != -1))
+            bounds[parents, :3] = np.minimum(bounds[left[parents], :3], bounds[right[parents], :3])
+            bounds[parents, 3:] = np.maximum(bounds[left[parents], 3:], bounds[right[parents], 3:])
+
+        self._bounds = _to_buffer("d", bounds)
+        self._start = _to_buffer("l", start)
+        self._end = _to_buffer("l", end)
+        self._left = _to_buffer("l", left)
+        self._right = _to_buffer("l", right)
+        self._triangles = _to_buffer("d", np.hstack([a, b - a, c - a])[order])
+        self._labels = _to_buffer("l", np.asarray(labels)[order])
+
+    def intersect_ray(self, ray, first=False):
+        """Compute the intersections of a ray with the triangles of the mesh.
+
+        Parameters
+        ----------
+        ray : tuple[[float, float, float] | :class:`compas.geometry.Point`, [float, float, float] | :class:`compas.geometry.Vector`]
+            The start point and direction of the ray.
+        first : bool, optional
+            If True, only return the intersection closest to the start of the ray.
+
+        Returns
+        -------
+        list[tuple[int, float, float, float]]
+            Per intersection, sorted by distance to the start of the ray:
+
+            0. the index of the intersected face
+            1. the u coordinate of the intersection in the barycentric coordinates of the intersected triangle
+            2. the v coordinate of the intersection in the barycentric coordinates of the intersected triangle
+            3. the distance between the start of the ray and the intersection
+
+        """
+        return self.intersect_rays([ray], first=first)[0]
+
+    def intersect_rays(self, rays, first=False):
+        """Compute the intersections of multiple rays with the triangles of the mesh.
+
+        Parameters
+        ----------
+        rays : sequence[tuple[[float, float, float] | :class:`compas.geometry.Point`, [float, float, float] | :class:`compas.geometry.Vector`]]
+            The start points and directions of the rays.
+        first : bool, optional
+            If True, only return the intersection of every ray closest to the start of the ray.
+
+        Returns
+        -------
+        list[list[tuple[int, float, float, float]]]
+            Per ray, the intersections sorted by distance to the start of the ray.
+            Every intersection is a tuple of the index of the intersected face,
+            the u and v coordinates of the intersection in the barycentric coordinates of the intersected triangle,
+            and the distance between the start of the ray and the intersection.
+
+        Notes
+        -----
+        The barycentric coordinates refer to the triangle of the fan triangulation of the face that contains the intersection,
+        such that the intersection is at ``(1 - u - v) * a + u * b + v * c``, with ``a``, ``b`` and ``c`` the corners of the triangle.
+        For triangles, these are the vertices of the face, in order.
+
+        """
+        if self.root is None:
+            return [[] for _ in rays]
+        if np is not None:
+            return self._intersect_rays_numpy(rays, first)
+        return [self._intersect_ray(ray, first) for ray in rays]
+
+    def _intersect_ray(self, ray, first):
+        (ox, oy, oz), (dx, dy, dz) = ray
+        length = sqrt(dx * dx + dy * dy + dz * dz)
+        if length == 0:
+            return []
+        o = ox, oy, oz = float(ox), float(oy), float(oz)
+        d = dx, dy, dz = dx / length, dy / length, dz / length
+        inv = [1.0 / value if value != 0 else None for value in d]
+
+        bounds, start, end, left, right = self._bounds, self._start, self._end, self._left, self._right
+        triangles = self._triangles
+        tmax = float("inf")
+        hits = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            tnear = 0.0
+            tfar = tmax
+            for i in range(3):
+                lo = bounds[6 * node + i]
+                hi = bounds[6 * node + 3 + i]
+                if inv[i] is None:
+                    if o[i] < lo or o[i] > hi:
+                        break
+                    continue
+                t1 = (lo - o[i]) * inv[i]
+                t2 = (hi - o[i]) * inv[i]
+                if t1 > t2:
+                    t1, t2 = t2, t1
+                if t1 > tnear:
+                    tnear = t1
+                if t2 < tfar:
+                    tfar = t2
+                if tnear > tfar:
+                    break
+            else:
+                if left[node] != -1:
+                    stack.append(right[node])
+                    stack.append(left[node])
+                    continue
+                for j in range(start[node], end[node]):
+                    ax, ay, az, e1x, e1y, e1z, e2x, e2y, e2z = triangles[9 * j : 9 * j + 9]
+                    px = dy * e2z - dz * e2y
+                    py = dz * e2x - dx * e2z
+                    pz = dx * e2y - dy * e2x
+                    det = e1x * px + e1y * py + e1z * pz
+                    if det == 0:
+                        continue
+                    sx, sy, sz = ox - ax, oy - ay, oz - az
+                    u = (sx * px + sy * py + sz * pz) / det
+                    if u < 0 or u > 1:
+                        continue
+                    qx = sy * e1z - sz * e1y
+                    qy = sz * e1x - sx * e1z
+                    qz = sx * e1y - sy * e1x
+                    v = (dx * qx + dy * qy + dz * qz) / det
+                    if v < 0 or u + v > 1:
+                        continue
+                    t = (e2x * qx + e2y * qy + e2z * qz) / det
+                    if t < 0 or t > tmax:
+                        continue
+                    if first:
+                        tmax = t
+                        hits = [(t, self._labels[j], u, v)]
+                    else:
+                        hits.append((t, self._labels[j], u, v))
+        hits.sort()
+        unique = []
+        for t, face, u, v in hits:
+            for other in reversed(unique):
+                if t - other[3] > TOL.absolute:
+                    unique.append((face, u, v, t))
+                    break
+                if other[0] == face:
+                    break
+            else:
+                unique.append((face, u, v, t))
+        return unique
+
+    def _intersect_rays_numpy(self, rays, first):
+        rays = np.asarray(rays, dtype=np.float64).reshape((-1, 2, 3))
+        origins = rays[:, 0]
+        directions = rays[:, 1]
+        lengths = np.linalg.norm(directions, axis=1)
+        valid = lengths > 0
+        directions = directions / np.where(valid, lengths, 1.0)[:, None]
+
+        hits = []
+        for i in range(0, len(rays), CHUNK_SIZE):
+            chunk = slice(i, i + CHUNK_SIZE)
+            hits.append(self._traverse_numpy(origins[chunk], directions[chunk], valid[chunk], first, i))
+        r, face, u, v, t = [np.concatenate(values) for values in zip(*hits)]
+
+        order = np.lexsort((t, face, r))
+        r, face, u, v, t = r[order], face[order], u[order], v[order], t[order]
+        unique = np.ones(len(r), dtype=bool)
+        unique[1:] = (r[1:] != r[:-1]) | (face[1:] != face[:-1]) | (t[1:] - t[:-1] > TOL.absolute)
+        r, face, u, v, t = r[unique], face[unique], u[unique], v[unique], t[unique]
+
+        order = np.lexsort((t, r))
+        r = r[order]
+        hits = list(zip(face[order].tolist(), u[order].tolist(), v[order].tolist(), t[order].tolist()))
+        ranges = np.searchsorted(r, np.arange(len(rays) + 1)).tolist()
+        return [hits[lo:hi] for lo, hi in zip(ranges[:-1], ranges[1:])]
+
+    def _traverse_numpy(self, origins, directions, valid, first, offset):
+        # the intersections of a chunk of rays with the triangles,
+        # computed for all pairs of rays and nodes of a level of the hierarchy at once
+        bounds = _view(self._bounds, 6)
+        start = _view(self._start)
+        end = _view(self._end)
+        left = _view(self._left)
+        right = _view(self._right)
+        triangles = _view(self._triangles, 9)
+        labels = _view(self._labels)
+
+        n = len(origins)
+        with np.errstate(divide="ignore"):
+            inverse = 1.0 / directions
+        tmax = np.full(n, np.inf)
+        best = np.full(n, -1, dtype=np.intp)
+        best_u = np.zeros(n)
+        best_v = np.zeros(n)
+        results = []
+
+        rays = np.flatnonzero(valid)
+        nodes = np.full(len(rays), self.root, dtype=np.intp)
+        while len(rays):
+            boxes = bounds[nodes]
+            o = origins[rays]
+            inv = inverse[rays]
+            tnear = np.zeros(len(rays))
+            tfar = tmax[rays]
+            with np.errstate(invalid="ignore"):
+                for i in range(3):
+                    t1 = (boxes[:, i] - o[:, i]) * inv[:, i]
+                    t2 = (boxes[:, 3 + i] - o[:, i]) * inv[:, i]
+                    # nan if the ray is parallel to and in a plane of the box,
+                    # which does not limit the range of the ray
+                    tnear = np.fmax(tnear, np.minimum(t1, t2))
+                    tfar = np.fmin(tfar, np.maximum(t1, t2))
+            keep = tnear <= tfar
+            rays = rays[keep]
+            nodes = nodes[keep]
+
+            leaf = left[nodes] == -1
+            if leaf.any():
+                # all pairs of rays and triangles of the leaves
+                counts = end[nodes[leaf]] - start[nodes[leaf]]
+                r = np.repeat(rays[leaf], counts)
+                j = np.repeat(start[nodes[leaf]] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+                r, j, u, v, t = self._intersect_triangles_numpy(origins, directions, triangles, r, j)
+                if first:
+                    order = np.lexsort((t, r))
+                    r, j, u, v, t = r[order], j[order], u[order], v[order], t[order]
+                    closest = np.ones(len(r), dtype=bool)
+                    closest[1:] = r[1:] != r[:-1]
+                    closest &= t < tmax[r]
+                    r, j, u, v, t = r[closest], j[closest], u[closest], v[closest], t[closest]
+                    tmax[r] = t
+                    best[r] = j
+                    best_u[r] = u
+                    best_v[r] = v
+                else:
+                    results.append((r + offset, labels[j], u, v, t))
+
+            internal = ~leaf
+            rays = np.repeat(rays[internal], 2)
+            nodes = np.column_stack((left[nodes[internal]], right[nodes[internal]])).ravel()
+
+        if first:
+            r = np.flatnonzero(best != -1)
+            return r + offset, labels[best[r]], best_u[r], best_v[r], tmax[r]
+        if not results:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=labels.dtype), np.zeros(0), np.zeros(0), np.zeros(0)
+        return tuple(np.concatenate(values) for values in zip(*results))
+
+    @staticmethod
+    def _intersect_triangles_numpy(origins, directions, triangles, r, j):
+        # Moller-Trumbore for pairs of rays and triangles
+        d = directions[r]
+        a = triangles[j, 0:3]
+        e1 = triangles[j, 3:6]
+        e2 = triangles[j, 6:9]
+        p = np.column_stack(
+            (
+                d[:, 1] * e2[:, 2] - d[:, 2] * e2[:, 1],
+                d[:, 2] * e2[:, 0] - d[:, 0] * e2[:, 2],
+                d[:, 0] * e2[:, 1] - d[:, 1] * e2[:, 0],
+            )
+        )
+        det = np.einsum("ij,ij->i", e1, p)
+        s = origins[r] - a
+        q = np.column_stack(
+            (
+                s[:, 1] * e1[:, 2] - s[:, 2] * e1[:, 1],
+                s[:, 2] * e1[:, 0] - s[:, 0] * e1[:, 2],
+                s[:, 0] * e1[:, 1] - s[:, 1] * e1[:, 0],
+            )
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            u = np.einsum("ij,ij->i", s, p) / det
+            v = np.einsum("ij,ij->i", d, q) / det
+            t = np.einsum("ij,ij->i", e2, q) / det
+            hit = (det != 0) & (u >= 0) & (u <= 1) & (v >= 0) & (u + v <= 1) & (t >= 0)
+        return r[hit], j[hit], u[hit], v[hit], t[hit]
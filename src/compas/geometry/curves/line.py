@@ -84,6 +84,9 @@ class Line(Curve):
     def __data__(self):
         return {"start": self.start.__data__, "end": self.end.__data__}
 
+    def __copy_state__(self):
+        return type(self)(self.start, self.end)
+
     def __init__(self, start, end, name=None):
         super(Line, self).__init__(name=name)
         self._point = None
@@ -83,6 +83,9 @@ class Polyline(Curve):
     def __data__(self):
         return {"points": [point.__data__ for point in self.points]}
 
+    def __copy_state__(self):
+        return type(self)(self.points)
+
     def __init__(self, points, name=None):
         super(Polyline, self).__init__(name=name)
         self._points = []
@@ -71,6 +71,8 @@ class Frame(Geometry):
 
     """
 
+    __slots__ = ("_point", "_xaxis", "_yaxis", "_zaxis")
+
     DATASCHEMA = {
         "type": "object",
         "properties": {
@@ -89,6 +91,9 @@ class Frame(Geometry):
             "yaxis": self.yaxis.__data__,
         }
 
+    def __copy_state__(self):
+        return type(self)(self.point, self.xaxis, self.yaxis)
+
     def __init__(self, point, xaxis=None, yaxis=None, name=None):
         super(Frame, self).__init__(name=name)
         self._point = None
@@ -15,6 +15,8 @@ from compas.data import Data
 class Geometry(Data):
     """Base class for all geometric objects."""
 
+    __slots__ = ("_aabb", "_obb")
+
     def __init__(self, name=None):
         super(Geometry, self).__init__(name=name)
         self._aabb = None
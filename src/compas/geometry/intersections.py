@@ -3,6 +3,7 @@ from __future__ import division
 from __future__ import print_function
 
 from math import fabs
+from math import floor
 from math import sqrt
 
 from compas.geometry import add_vectors
@@ -744,12 +745,22 @@ def intersection_ray_mesh(ray, mesh):
 
         0. the index of the intersected face
         1. the u coordinate of the intersection in the barycentric coordinates of the face
-        2. the u coordinate of the intersection in the barycentric coordinates of the face
+        2. the v coordinate of the intersection in the barycentric coordinates of the face
         3. the distance between the ray origin and the hit
 
+    Notes
+    -----
+    If no other plugin is installed, the intersections are computed with a :class:`compas.geometry.BVH` of the mesh.
+    To intersect many rays with the same mesh, use :func:`intersection_rays_mesh`,
+    or build the hierarchy once and use :meth:`compas.geometry.BVH.intersect_rays`.
+
     Examples
     --------
-    >>>
+    >>> from compas.geometry import intersection_ray_mesh
+    >>> vertices = [[0, 0, 0], [1, 0, 0], [0, 1, 0]]
+    >>> faces = [[0, 1, 2]]
+    >>> intersection_ray_mesh(([0.25, 0.25, 1], [0, 0, -1]), (vertices, faces))
+    [(0, 0.25, 0.25, 1.0)]
 
     """
     raise PluginNotInstalledError
@@ -758,6 +769,44 @@ def intersection_ray_mesh(ray, mesh):
 intersection_ray_mesh.__pluggable__ = True
 
 
+@pluggable(category="intersections")
+def intersection_rays_mesh(rays, mesh, first=False):
+    """Compute the intersection(s) between multiple rays and a mesh.
+
+    Parameters
+    ----------
+    rays : sequence of tuple of point and vector
+        The rays, each represented by a point and a direction vector.
+    mesh : tuple of vertices and faces
+        A mesh represented by a list of vertices and a list of faces.
+    first : bool, optional
+        If True, only return the intersection of every ray closest to the ray origin.
+
+    Returns
+    -------
+    list of list of tuple
+        Per ray, the intersections with the mesh, sorted by distance to the ray origin,
+        in the same format as the intersections returned by :func:`intersection_ray_mesh`.
+
+    Notes
+    -----
+    If no other plugin is installed, the intersections are computed with a :class:`compas.geometry.BVH` of the mesh.
+
+    Examples
+    --------
+    >>> from compas.geometry import intersection_rays_mesh
+    >>> vertices = [[0, 0, 0], [1, 0, 0], [0, 1, 0]]
+    >>> faces = [[0, 1, 2]]
+    >>> intersection_rays_mesh([([0.25, 0.25, 1], [0, 0, -1]), ([1, 1, 1], [0, 0, -1])], (vertices, faces))
+    [[(0, 0.25, 0.25, 1.0)], []]
+
+    """
+    raise PluginNotInstalledError
+
+
+intersection_rays_mesh.__pluggable__ = True
+
+
 # ==============================================================================
 # XY
 # ==============================================================================
@@ -936,6 +985,117 @@ def intersection_segment_segment_xy(ab, cd, tol=None):
     return intx_pt
 
 
+def intersection_segments_segments_xy(segments):
+    """Identify all pairs of intersecting segments in a collection of segments, assuming they lie in the XY plane.
+
+    Parameters
+    ----------
+    segments : sequence[[point, point] | :class:`compas.geometry.Line`]
+        The segments, each defined by two points, with at least XY coordinates.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The indices of the pairs of intersecting segments, with the smallest index first.
+
+    See Also
+    --------
+    :func:`compas.geometry.intersection_segment_segment_xy`
+
+    Notes
+    -----
+    Two segments intersect if the end points of each segment lie on opposite sides of the other segment,
+    with the same orientation test as ``compas.geometry._core.predicates_2.is_intersection_segment_segment_xy``.
+
+    The segments are distributed over the cells of a uniform grid, based on their bounding boxes,
+    and only the pairs of segments that share a cell are tested for intersection.
+    The size of the cells is the average size of the bounding boxes of the segments,
+    but not less than the size that results in one segment per cell on average.
+    For segments of similar size, the time complexity is therefore roughly linear in the number of segments and intersections,
+    instead of quadratic in the number of segments.
+
+    Examples
+    --------
+    >>> segments = [[[0, 0, 0], [1, 1, 0]], [[0, 1, 0], [1, 0, 0]], [[2, 0, 0], [3, 0, 0]]]
+    >>> intersection_segments_segments_xy(segments)
+    [(0, 1)]
+
+    """
+    return sorted(_intersection_segments_segments_xy(segments))
+
+
+def _intersection_segments_segments_xy(segments):
+    # generate the pairs of intersecting segments, in no particular order
+    # every pair is generated once, in the cell containing the minimum corner of the overlap of their bounding boxes
+    coordinates = []
+    boxes = []
+    for a, b in segments:
+        ax, ay, bx, by = a[0], a[1], b[0], b[1]
+        coordinates.append((ax, ay, bx, by))
+        boxes.append((min(ax, bx), min(ay, by), max(ax, bx), max(ay, by)))
+
+    if len(boxes) < 2:
+        return
+
+    xmin = min(box[0] for box in boxes)
+    ymin = min(box[1] for box in boxes)
+    xmax = max(box[2] for box in boxes)
+    ymax = max(box[3] for box in boxes)
+    # the average size of the boxes, but not less than the size of the cells of a grid with one segment per cell on average
+    size = sum(max(box[2] - box[0], box[3] - box[1]) for box in boxes) / len(boxes)
+    size = max(size, sqrt((xmax - xmin) * (ymax - ymin) / len(boxes)))
+    if size <= 0:
+        size = 1.0
+
+    grid = {}
+    for index, (x0, y0, x1, y1) in enumerate(boxes):
+        i0 = int(floor((x0 - xmin) / size))
+        i1 = int(floor((x1 - xmin) / size))
+        j0 = int(floor((y0 - ymin) / size))
+        j1 = int(floor((y1 - ymin) / size))
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                cell = grid.get((i, j))
+                if cell is None:
+                    grid[i, j] = [index]
+                else:
+                    cell.append(index)
+
+    for (i, j), cell in grid.items():
+        n = len(cell)
+        for k in range(n):
+            first = cell[k]
+            ax0, ay0, ax1, ay1 = boxes[first]
+            for m in range(k + 1, n):
+                second = cell[m]
+                bx0, by0, bx1, by1 = boxes[second]
+                if bx0 > ax1 or bx1 < ax0 or by0 > ay1 or by1 < ay0:
+                    continue
+                # the pair shares several cells if their bounding boxes overlap in more than one cell
+                if int(floor((max(ax0, bx0) - xmin) / size)) != i or int(floor((max(ay0, by0) - ymin) / size)) != j:
+                    continue
+                if _is_crossing_xy(coordinates[first], coordinates[second]):
+                    if first < second:
+                        yield first, second
+                    else:
+                        yield second, first
+
+
+def _is_crossing_xy(ab, cd):
+    # inlined version of is_intersection_segment_segment_xy
+    ax, ay, bx, by = ab
+    cx, cy, dx, dy = cd
+    acd = (cx - ax) * (dy - ay) - (cy - ay) * (dx - ax) > 0
+    bcd = (cx - bx) * (dy - by) - (cy - by) * (dx - bx) > 0
+    if acd == bcd:
+        return False
+    abx = bx - ax
+    aby = by - ay
+    abc = abx * (cy - ay) - aby * (cx - ax) > 0
+    abd = abx * (dy - ay) - aby * (dx - ax) > 0
+    return abc != abd
+
+
 def intersection_circle_circle_xy(circle1, circle2):
     """Calculates the intersection points of two circles in 2d lying in the XY plane.
 
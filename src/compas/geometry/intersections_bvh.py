@@ -0,0 +1,59 @@
+from compas.geometry.bvh import BVH
+from compas.plugins import plugin
+
+
+@plugin(category="intersections", trylast=True)
+def intersection_ray_mesh(ray, mesh):
+    """Compute the intersection(s) between a ray and a mesh,
+    using a bounding volume hierarchy of the triangles of the mesh.
+
+    Parameters
+    ----------
+    ray : tuple of point and vector
+        A ray represented by a point and a direction vector.
+    mesh : tuple of vertices and faces | :class:`compas.datastructures.Mesh`
+        A mesh represented by a list of vertices and a list of faces.
+
+    Returns
+    -------
+    list of tuple
+        Per intersection of the ray with the mesh, sorted by distance to the ray origin:
+
+        0. the index of the intersected face
+        1. the u coordinate of the intersection in the barycentric coordinates of the face
+        2. the v coordinate of the intersection in the barycentric coordinates of the face
+        3. the distance between the ray origin and the hit
+
+    See Also
+    --------
+    :class:`compas.geometry.BVH`
+
+    """
+    return BVH(mesh).intersect_ray(ray)
+
+
+@plugin(category="intersections", trylast=True)
+def intersection_rays_mesh(rays, mesh, first=False):
+    """Compute the intersection(s) between multiple rays and a mesh,
+    using a bounding volume hierarchy of the triangles of the mesh.
+
+    Parameters
+    ----------
+    rays : sequence of tuple of point and vector
+        The rays, each represented by a point and a direction vector.
+    mesh : tuple of vertices and faces | :class:`compas.datastructures.Mesh`
+        A mesh represented by a list of vertices and a list of faces.
+    first : bool, optional
+        If True, only return the intersection of every ray closest to the ray origin.
+
+    Returns
+    -------
+    list of list of tuple
+        Per ray, the intersections with the mesh, sorted by distance to the ray origin.
+
+    See Also
+    --------
+    :class:`compas.geometry.BVH`
+
+    """
+    return BVH(mesh).intersect_rays(rays, first=first)
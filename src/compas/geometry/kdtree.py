@@ -2,11 +2,9 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import collections
-
-from ._core.distance import distance_point_point_sqrd
-
-Node = collections.namedtuple("Node", "point axis label left right")
+from array import array
+from heapq import heappush
+from heapq import heapreplace
 
 
 class KDTree(object):
@@ -18,15 +16,27 @@ class KDTree(object):
         A list of objects to populate the tree with.
         If objects are provided, the tree is built automatically.
         Otherwise, use :meth:`build`.
+    leafsize : int, optional
+        The maximum number of points in a leaf node of the tree.
 
     Attributes
     ----------
-    root : Node
-        The root node of the built tree.
-        This is the median with respect to the different dimensions of the tree.
+    root : int | None
+        The index of the root node of the built tree,
+        or None if the tree is empty.
 
     Notes
     -----
+    The tree is stored in flat arrays.
+    The points are reordered such that the points of every node occupy a contiguous range,
+    and every node stores the start and end of this range,
+    the splitting axis and value, and the indices of its children.
+    Internal nodes split their points at the median of the axis with the largest extent.
+    Leaf nodes contain at most `leafsize` points, which are checked by brute force during a search.
+
+    The tree is built in O(n log n) time, using lists of the point indices presorted along every axis,
+    which are partitioned in linear time at every level of the tree.
+
     For more info, see [1]_ and [2]_.
 
     References
@@ -38,14 +48,36 @@ class KDTree(object):
 
     Examples
     --------
-    >>>
+    >>> from compas.geometry import KDTree
+    >>> tree = KDTree([[0, 0, 0], [1, 0, 0], [2, 0, 0], [3, 0, 0]])
+    >>> distances, indices = tree.query([[0.9, 0, 0], [2.8, 0, 0]], k=2)
+    >>> indices
+    [[1, 0], [3, 2]]
+    >>> tree.query_radius([[1.4, 0, 0]], 1.0)
+    [[1, 2]]
 
     """
 
-    def __init__(self, objects=None):
+    def __init__(self, objects=None, leafsize=8):
+        self.leafsize = max(1, leafsize)
         self.root = None
+        self._clear()
         if objects:
-            self.root = self.build([(o, i) for i, o in enumerate(objects)])
+            self.build([(o, i) for i, o in enumerate(objects)])
+
+    def __len__(self):
+        return len(self._labels)
+
+    def _clear(self):
+        self._points = []
+        self._labels = []
+        self._xyz = ([], [], [])
+        self._start = array("l")
+        self._end = array("l")
+        self._axis = array("l")
+        self._split = array("d")
+        self._left = array("l")
+        self._right = array("l")
 
     def build(self, objects, axis=0):
         """Populate a kd-tree with given objects.
@@ -55,29 +87,183 @@ class KDTree(object):
         objects : sequence[tuple[[float, float, float] | :class:`compas.geometry.Point`, int or str]]
             The tree objects as a sequence of point-label tuples.
         axis : int, optional
-            The axis along which to build.
+            The axis along which to split the root node, if all axes have the same extent.
 
         Returns
         -------
-        Node or None
-            The root node, or None if the sequence of objects is empty.
+        int or None
+            The index of the root node, or None if the sequence of objects is empty.
 
         """
+        self._clear()
+        self.root = None
         if not objects:
             return
 
-        objects.sort(key=lambda o: o[0][axis])
-        median_idx = len(objects) // 2
-        median_point, median_label = objects[median_idx]
-        next_axis = (axis + 1) % 3
+        points = [point for point, _ in objects]
+        labels = [label for _, label in objects]
+        n = len(points)
+        coordinates = [[float(point[i]) for point in points] for i in range(3)]
+        presorted = [sorted(range(n), key=coordinates[i].__getitem__) for i in range(3)]
+        side = bytearray(n)
+
+        start, end, split, left, right = self._start, self._end, self._split, self._left, self._right
+        axes = self._axis
+
+        def add_node(lo, hi):
+            start.append(lo)
+            end.append(hi)
+            axes.append(-1)
+            split.append(0.0)
+            left.append(-1)
+            right.append(-1)
+            return len(start) - 1
+
+        stack = [add_node(0, n)]
+        while stack:
+            node = stack.pop()
+            lo, hi = start[node], end[node]
+            if hi - lo <= self.leafsize:
+                continue
+
+            extents = [coordinates[i][presorted[i][hi - 1]] - coordinates[i][presorted[i][lo]] for i in range(3)]
+            best = axis if extents[axis] == max(extents) else extents.index(max(extents))
+            if extents[best] == 0:
+                # all points of this node coincide
+                continue
+
+            mid = (lo + hi) // 2
+            order = presorted[best]
+            for i in order[mid:hi]:
+                side[i] = 1
+            for i in range(3):
+                if i != best:
+                    indices = presorted[i][lo:hi]
+                    presorted[i][lo:hi] = [j for j in indices if not side[j]] + [j for j in indices if side[j]]
+            for i in order[mid:hi]:
+                side[i] = 0
+
+            axes[node] = best
+            split[node] = coordinates[best][order[mid]]
+            left[node] = add_node(lo, mid)
+            right[node] = add_node(mid, hi)
+            stack.append(right[node])
+            stack.append(left[node])
+
+        order = presorted[0]
+        self._points = [points[i] for i in order]
+        self._labels = [labels[i] for i in order]
+        self._xyz = tuple([coordinates[j][i] for i in order] for j in range(3))
+        self.root = 0
+        return self.root
+
+    def _search(self, point, k, radius2, exclude=None):
+        # return the (squared distance, position) pairs of the k points closest to a given point,
+        # and closer than the square root of radius2, in no particular order
+        if self.root is None or (k is not None and k < 1):
+            return []
+
+        X, Y, Z = self._xyz
+        start, end, axes, split, left, right = self._start, self._end, self._axis, self._split, self._left, self._right
+        labels = self._labels
+        qx, qy, qz = float(point[0]), float(point[1]), float(point[2])
+        q = (qx, qy, qz)
+
+        # max-heap of the best candidates found so far,
+        # with negative squared distances as priorities
+        heap = []
+        worst = radius2
+        stack = [(0.0, self.root)]
+        while stack:
+            bound, node = stack.pop()
+            if bound > worst:
+                continue
+            axis = axes[node]
+            if axis == -1:
+                for i in range(start[node], end[node]):
+                    dx = X[i] - qx
+                    dy = Y[i] - qy
+                    dz = Z[i] - qz
+                    d2 = dx * dx + dy * dy + dz * dz
+                    if d2 > worst:
+                        continue
+                    if exclude and labels[i] in exclude:
+                        continue
+                    if k is None or len(heap) < k:
+                        heappush(heap, (-d2, -i))
+                        if k is not None and len(heap) == k:
+                            worst = min(worst, -heap[0][0])
+                    elif d2 < -heap[0][0]:
+                        heapreplace(heap, (-d2, -i))
+                        worst = min(worst, -heap[0][0])
+                continue
+            d = q[axis] - split[node]
+            if d < 0:
+                near, far = left[node], right[node]
+            else:
+                near, far = right[node], left[node]
+            far_bound = max(bound, d * d)
+            if far_bound <= worst:
+                stack.append((far_bound, far))
+            stack.append((bound, near))
+
+        return [(-d2, -i) for d2, i in heap]
+
+    def query(self, points, k=1):
+        """Find the k nearest neighbors of multiple points.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`compas.geometry.Point`]
+            XYZ coordinates of the query points.
+        k : int, optional
+            The number of nearest neighbors per query point.
+
+        Returns
+        -------
+        tuple[list[list[float]], list[list[int or str]]]
+            Per query point, the distances to its nearest neighbors, sorted in increasing order,
+            and the labels of these neighbors.
+            If the tree contains less than `k` points, all points are returned.
 
-        return Node(
-            median_point,
-            axis,
-            median_label,
-            self.build(objects[:median_idx], next_axis),
-            self.build(objects[median_idx + 1 :], next_axis),
-        )
+        """
+        inf = float("inf")
+        distances = []
+        labels = []
+        for point in points:
+            nnbrs = sorted(self._search(point, k, inf))
+            distances.append([d2**0.5 for d2, _ in nnbrs])
+            labels.append([self._labels[i] for _, i in nnbrs])
+        return distances, labels
+
+    def query_radius(self, points, radius, distances=False):
+        """Find the neighbors of multiple points within a given radius.
+
+        Parameters
+        ----------
+        points : sequence[[float, float, float] | :class:`compas.geometry.Point`]
+            XYZ coordinates of the query points.
+        radius : float
+            The search radius.
+        distances : bool, optional
+            If True, also return the distances to the neighbors.
+
+        Returns
+        -------
+        list[list[int or str]] | tuple[list[list[float]], list[list[int or str]]]
+            Per query point, the labels of the neighbors within the search radius, sorted by distance.
+            If `distances` is True, the distances are returned as well, before the labels.
+
+        """
+        neighbors_distances = []
+        neighbors = []
+        for point in points:
+            nnbrs = sorted(self._search(point, None, radius**2))
+            neighbors_distances.append([d2**0.5 for d2, _ in nnbrs])
+            neighbors.append([self._labels[i] for _, i in nnbrs])
+        if distances:
+            return neighbors_distances, neighbors
+        return neighbors
 
     def nearest_neighbor(self, point, exclude=None):
         """Find the nearest neighbor to a given point,
@@ -98,31 +284,11 @@ class KDTree(object):
             Distance to the base point.
 
         """
-
-        def search(node):
-            if node is None:
-                return
-
-            d2 = distance_point_point_sqrd(point, node.point)
-            if d2 < best[2]:
-                if node.label not in exclude:
-                    best[:] = node.point, node.label, d2
-
-            d = point[node.axis] - node.point[node.axis]
-            if d <= 0:
-                close, far = node.left, node.right
-            else:
-                close, far = node.right, node.left
-
-            search(close)
-            if d**2 < best[2]:
-                search(far)
-
-        exclude = set(exclude or [])
-        best = [None, None, float("inf")]
-        search(self.root)
-        best[2] **= 0.5
-        return best
+        nnbrs = self._search(point, 1, float("inf"), set(exclude or []))
+        if not nnbrs:
+            return [None, None, float("inf")]
+        d2, i = nnbrs[0]
+        return [self._points[i], self._labels[i], d2**0.5]
 
     def nearest_neighbors(self, point, number, distance_sort=False):
         """Find the N nearest neighbors to a given point.
@@ -135,6 +301,7 @@ class KDTree(object):
             The number of nearest neighbors.
         distance_sort : bool, optional
             Sort the nearest neighbors by distance to the base point.
+            The neighbors are always returned in this order.
 
         Returns
         -------
@@ -142,12 +309,5 @@ class KDTree(object):
             A list of N nearest neighbors.
 
         """
-        nnbrs = []
-        exclude = set()
-        for i in range(number):
-            nnbr = self.nearest_neighbor(point, exclude)
-            nnbrs.append(nnbr)
-            exclude.add(nnbr[1])
-        if distance_sort:
-            return sorted(nnbrs, key=lambda nnbr: nnbr[2])
-        return nnbrs
+        nnbrs = sorted(self._search(point, number, float("inf")))
+        return [[self._points[i], self._labels[i], d2**0.5] for d2, i in nnbrs]
@@ -62,6 +62,9 @@ class Plane(Geometry):
             "normal": self.normal.__data__,
         }
 
+    def __copy_state__(self):
+        return type(self)(self.point, self.normal)
+
     def __init__(self, point, normal, name=None):
         super(Plane, self).__init__(name=name)
         self._point = None
@@ -109,6 +109,8 @@ class Point(Geometry):
 
     """
 
+    __slots__ = ("_x", "_y", "_z")
+
     DATASCHEMA = {
         "type": "array",
         "minItems": 3,
@@ -124,14 +126,15 @@ class Point(Geometry):
     def __from_data__(cls, data):
         return cls(*data)
 
+    def __copy_state__(self):
+        return type(self)(self.x, self.y, self.z)
+
     def __init__(self, x, y, z=0.0, name=None):
         super(Point, self).__init__(name=name)
-        self._x = 0.0
-        self._y = 0.0
-        self._z = 0.0
-        self.x = x
-        self.y = y
-        self.z = z
+        # coordinates that are already floats are not converted again
+        self._x = x if type(x) is float else float(x)
+        self._y = y if type(y) is float else float(y)
+        self._z = z if type(z) is float else float(z)
 
     def __repr__(self):
         return "{0}(x={1}, y={2}, z={3})".format(
@@ -157,11 +160,11 @@ class Point(Geometry):
             return [self[i] for i in range(*key.indices(len(self)))]
         i = key % 3
         if i == 0:
-            return self.x
+            return self._x
         if i == 1:
-            return self.y
+            return self._y
         if i == 2:
-            return self.z
+            return self._z
         raise KeyError
 
     def __setitem__(self, key, value):
@@ -178,25 +181,25 @@ class Point(Geometry):
         raise KeyError
 
     def __iter__(self):
-        return iter([self.x, self.y, self.z])
+        return iter([self._x, self._y, self._z])
 
     def __eq__(self, other):
         return TOL.is_allclose(self, other)
 
     def __add__(self, other):
-        return Point(self.x + other[0], self.y + other[1], self.z + other[2])
+        return Point(self._x + other[0], self._y + other[1], self._z + other[2])
 
     def __sub__(self, other):
-        x = self.x - other[0]
-        y = self.y - other[1]
-        z = self.z - other[2]
+        x = self._x - other[0]
+        y = self._y - other[1]
+        z = self._z - other[2]
         return Vector(x, y, z)
 
     def __mul__(self, n):
-        return Point(n * self.x, n * self.y, n * self.z)
+        return Point(n * self._x, n * self._y, n * self._z)
 
     def __truediv__(self, n):
-        return Point(self.x / n, self.y / n, self.z / n)
+        return Point(self._x / n, self._y / n, self._z / n)
 
     def __pow__(self, n):
         return Point(self.x**n, self.y**n, self.z**n)
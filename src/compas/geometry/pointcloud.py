@@ -2,25 +2,36 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from array import array
+from itertools import chain
 from random import uniform
 
 from compas.geometry import Geometry
 from compas.geometry import KDTree
 from compas.geometry import Point
+from compas.geometry import PointArray
+from compas.geometry import VectorArray
+from compas.geometry import bestfit_plane
 from compas.geometry import bounding_box
 from compas.geometry import centroid_points
-from compas.geometry import closest_point_in_cloud
-from compas.geometry import transform_points
 from compas.tolerance import TOL
 
+try:
+    import numpy as np
+except (ImportError, SyntaxError):
+    np = None
+
+#: The number of points for which normals are estimated at once with NumPy.
+CHUNK_SIZE = 2**14
+
 
 class Pointcloud(Geometry):
     """Class for working with pointclouds.
 
     Parameters
     ----------
-    points : sequence[point]
-        A sequence of points to add to the cloud.
+    points : sequence[point] | numpy.ndarray
+        A sequence of points to add to the cloud, or an array of shape (n, 3).
     name : str, optional
         The name of the pointcloud.
 
@@ -28,10 +39,30 @@ class Pointcloud(Geometry):
     ----------
     points : list[:class:`compas.geometry.Point`]
         The points of the cloud.
+    array : :class:`compas.geometry.PointArray`, read-only
+        The coordinates of the points of the cloud in a single contiguous buffer.
+    tree : :class:`compas.geometry.KDTree`, read-only
+        A kd-tree of the points of the cloud.
+
+    Notes
+    -----
+    Pointclouds that are read from files or computed by the bulk operations of a cloud
+    store the coordinates of their points only in the buffer of :attr:`array`.
+    The list of :attr:`points` is created from the buffer when it is first needed.
+
+    Nearest neighbor queries and bulk operations use the buffer and a spatial index of the points
+    that are built when they are first needed, and reused until the points change.
+    The index is a SciPy kd-tree if SciPy is available, and a :class:`compas.geometry.KDTree` otherwise.
+    Points that are added to, removed from, or replaced in the list of :attr:`points` directly are detected automatically.
+    Changes made to the coordinates of the items of :attr:`points` directly are not;
+    use :meth:`invalidate` after such changes, before the next query.
+    The data, copies, centroid and bounding boxes of the cloud always reflect the current points.
 
     Examples
     --------
-    >>>
+    >>> cloud = Pointcloud([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+    >>> print(cloud.closest_point([0.9, 0.2, 0.0]))
+    Point(x=1.000, y=0.000, z=0.000)
 
     """
 
@@ -45,22 +76,32 @@ class Pointcloud(Geometry):
 
     @property
     def __data__(self):
-        return {"points": [point.__data__ for point in self.points]}
+        return {"points": self._coordinates().to_list()}
+
+    def __copy_state__(self):
+        return type(self)(self._coordinates())
 
     def __init__(self, points, name=None):
         super(Pointcloud, self).__init__(name=name)
         self._points = None
+        self._snapshot = None
+        self._array = None
         self._tree = None
+        self._index = None
         self.points = points
 
     def __repr__(self):
         return "{0}(points={1!r})".format(type(self).__name__, self.points)
 
     def __str__(self):
-        return "{0}(len(points)={1})".format(type(self).__name__, len(self.points))
+        return "{0}(len(points)={1})".format(type(self).__name__, len(self))
 
     def __len__(self):
-        return len(self.points)
+        if self._points is not None:
+            return len(self._points)
+        if self._array is not None:
+            return len(self._array)
+        return 0
 
     def __getitem__(self, key):
         if key > len(self) - 1:
@@ -70,7 +111,8 @@ class Pointcloud(Geometry):
     def __setitem__(self, key, value):
         if key > len(self) - 1:
             raise KeyError
-        self.points[key] = value
+        self.points[key] = Point(*value)
+        self.invalidate()
 
     def __iter__(self):
         return iter(self.points)
@@ -89,79 +131,196 @@ class Pointcloud(Geometry):
     @property
     def points(self):
         if self._points is None:
-            self._points = []
+            self._points = list(self._array) if self._array is not None else []
+            self._snapshot = list(self._points)
         return self._points
 
     @points.setter
     def points(self, points):
-        self._points = [Point(*point) for point in points]
-        self._tree = None
+        self._points = None
+        self._snapshot = None
+        self._array = PointArray(points)
+        self.invalidate()
+
+    @property
+    def array(self):
+        if self._points is not None and (self._array is None or self._points_changed()):
+            self._array = PointArray(self._points)
+            self._snapshot = list(self._points)
+            self._tree = None
+            self._index = None
+        return self._array
 
     @property
     def tree(self):
+        array = self.array
         if not self._tree:
-            self._tree = KDTree(self.points)
+            self._tree = KDTree(array.to_list())
         return self._tree
 
     @property
     def centroid(self):
-        return centroid_points(self.points)
+        array = self._coordinates()
+        if np is not None and len(array):
+            return array.array.mean(axis=0).tolist()
+        return centroid_points(array.to_list())
 
     @property
     def aabb(self):
         from compas.geometry import Box
 
-        return Box.from_bounding_box(bounding_box(self.points))
+        return Box.from_bounding_box(bounding_box(self._coordinates().to_list()))
 
     @property
     def obb(self):
         from compas.geometry import Box
         from compas.geometry import oriented_bounding_box_numpy
 
-        return Box.from_bounding_box(oriented_bounding_box_numpy(self.points))
+        return Box.from_bounding_box(oriented_bounding_box_numpy(self._coordinates().array))
+
+    # ==========================================================================
+    # Helpers
+    # ==========================================================================
+
+    def invalidate(self):
+        """Discard the buffer and the spatial index of the points, such that they are rebuilt when they are needed again.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This is done automatically when the points are replaced or transformed through the cloud,
+        and when points are added to, removed from, or replaced in the list of :attr:`points`.
+        Use this method after changing the coordinates of the items of :attr:`points` directly.
+
+        """
+        if self._points is not None:
+            self._array = None
+        self._tree = None
+        self._index = None
+
+    def _points_changed(self):
+        # check if points were added to, removed from, or replaced in the list of points since the buffer was built from it
+        # the comparison of the lists compares the identities of the items first, and their coordinates only if they differ
+        return self._snapshot is None or self._points != self._snapshot
+
+    def _coordinates(self):
+        # the coordinates of the points as they are now, including changes made to the items of the list of points directly
+        if self._points is not None:
+            return PointArray(self._points)
+        return self.array
+
+    def _spatial_index(self):
+        # the spatial index of the points, built when it is first needed
+        array = self.array
+        if self._index is None:
+            if np is not None:
+                try:
+                    from scipy.spatial import cKDTree
+                except ImportError:
+                    pass
+                else:
+                    self._index = cKDTree(array.array, copy_data=True)
+            if self._index is None:
+                self._index = self.tree
+        return self._index
+
+    def _nearest(self, points, k=1):
+        # the distances to, and the indices of, the k nearest points of the cloud to every given point
+        if not len(self):
+            return [[] for _ in points], [[] for _ in points]
+        index = self._spatial_index()
+        if isinstance(index, KDTree):
+            return index.query(points, k)
+        points = np.asarray(points.array if isinstance(points, PointArray) else points, dtype=np.float64).reshape((-1, 3))
+        k = min(k, len(self))
+        distances, indices = index.query(points, k=k)
+        return distances.reshape((-1, k)).tolist(), indices.reshape((-1, k)).tolist()
+
+    def _neighbors(self, points, radius):
+        # the indices of the points of the cloud within a given distance of every given point
+        if not len(self):
+            return [[] for _ in points]
+        index = self._spatial_index()
+        if isinstance(index, KDTree):
+            return index.query_radius(points, radius)
+        points = np.asarray(points.array if isinstance(points, PointArray) else points, dtype=np.float64).reshape((-1, 3))
+        return index.query_ball_point(points, radius)
+
+    def _select(self, mask):
+        # a new cloud with the points for which the mask is True
+        if np is not None:
+            return type(self)(self.array.array[np.asarray(mask, dtype=bool)])
+        return type(self)([point for point, selected in zip(self.array.to_list(), mask) if selected])
+
+    @classmethod
+    def _from_chunks(cls, chunks):
+        # a new cloud from chunks of points, gathered in a single buffer
+        xyz = array("d")
+        for chunk in chunks:
+            if isinstance(chunk, list):
+                xyz.extend(chain.from_iterable(chunk))
+            else:
+                xyz.frombytes(np.ascontiguousarray(chunk, dtype=np.float64).tobytes())
+        cloud = cls([])
+        cloud._array = PointArray.from_flat(xyz)
+        return cloud
 
     # ==========================================================================
     # Constructors
     # ==========================================================================
 
     @classmethod
-    def from_ply(cls, filepath):
-        """Construct a pointcloud from a PLY file.
+    def from_ply(cls, filepath, chunksize=1000000):
+        """Construct a pointcloud from the vertices of a PLY file.
 
         Parameters
         ----------
         filepath : str | bytes | os.PathLike
             Path of the PLY file.
+        chunksize : int, optional
+            The maximum number of points that are read from the file at once.
 
         Returns
         -------
         :class:`compas.geometry.Pointcloud`
 
+        Notes
+        -----
+        The coordinates are read in chunks directly into the buffer of the cloud,
+        without reading the other elements of the file.
+
         """
         from compas.files import PLY
 
-        points = []
-        ply = PLY(filepath)
-        for vertex in ply.reader.vertices:  # type: ignore
-            points.append([vertex["x"], vertex["y"], vertex["z"]])
-        cloud = cls(points)
-        return cloud
+        return cls._from_chunks(PLY(filepath).iter_points(chunksize))
 
     @classmethod
-    def from_pcd(cls, filepath):
+    def from_pcd(cls, filepath, chunksize=1000000):
         """Construct a pointcloud from a PCD file.
 
         Parameters
         ----------
         filepath : str | bytes | os.PathLike
             Path of the PCD file.
+        chunksize : int, optional
+            The maximum number of points that are read from the file at once.
 
         Returns
         -------
         :class:`compas.geometry.Pointcloud`
 
+        Notes
+        -----
+        The coordinates are read in chunks directly into the buffer of the cloud.
+        The other fields of the points, such as colors or normals, are not read.
+
         """
-        pass
+        from compas.files import PCD
+
+        return cls._from_chunks(PCD(filepath).iter_points(chunksize))
 
     @classmethod
     def from_bounds(cls, x, y, z, n):
@@ -255,6 +414,29 @@ class Pointcloud(Geometry):
         z = [uniform(zmin, zmax) for i in range(n)]
         return cls(list(map(list, zip(x, y, z))))
 
+    # ==========================================================================
+    # Conversions
+    # ==========================================================================
+
+    def to_pcd(self, filepath, binary=False):
+        """Write the pointcloud to a PCD file.
+
+        Parameters
+        ----------
+        filepath : str | bytes | os.PathLike
+            Path of the PCD file.
+        binary : bool, optional
+            If True, write the data in binary format.
+
+        Returns
+        -------
+        None
+
+        """
+        from compas.files import PCD
+
+        PCD(filepath).write(self._coordinates().to_list(), binary=binary)
+
     # ==========================================================================
     # Transformations
     # ==========================================================================
@@ -272,10 +454,17 @@ class Pointcloud(Geometry):
         None
             The cloud is modified in place.
         """
-        for index, point in enumerate(transform_points(self.points, T)):
-            self.points[index].x = point[0]
-            self.points[index].y = point[1]
-            self.points[index].z = point[2]
+        array = self._coordinates()
+        array.transform(T)
+        if self._points is not None:
+            for point, (x, y, z) in zip(self._points, array.to_list()):
+                point.x = x
+                point.y = y
+                point.z = z
+            self._array = array
+            self._snapshot = list(self._points)
+        self._tree = None
+        self._index = None
 
     # ==========================================================================
     # Methods
@@ -295,8 +484,8 @@ class Pointcloud(Geometry):
             The closest point on the pointcloud.
 
         """
-        distance, point, index = closest_point_in_cloud(point, self.points)
-        return point
+        _, indices = self._nearest([point], 1)
+        return self.points[indices[0][0]]
 
     def closest_points(self, point, k=1):
         """Compute the closest point on the pointcloud to a given point.
@@ -314,8 +503,8 @@ class Pointcloud(Geometry):
             The closest points on the pointcloud.
 
         """
-        tree = self.tree
-        return [self.points[nbr[1]] for nbr in tree.nearest_neighbors(point, k, True)]
+        _, indices = self._nearest([point], k)
+        return [self.points[index] for index in indices[0]]
 
     def add(self, other, tol=None):
         """Add another pointcloud to this pointcloud.
@@ -338,10 +527,7 @@ class Pointcloud(Geometry):
         Duplicate points are not added.
 
         """
-        tol = tol or TOL.absolute
-
-        tree = self.tree
-        self.points += [point for point in other if tree.nearest_neighbor(point)[2] > tol]
+        self.points = self.union(other, tol=tol).array
 
     def union(self, other, tol=None):
         """Compute the union with another pointcloud.
@@ -359,11 +545,22 @@ class Pointcloud(Geometry):
         :class:`~compas.geometry.Pointcloud`
             The union pointcloud.
 
+        Notes
+        -----
+        The points of `other` are looked up in the spatial index of this pointcloud.
+
         """
         tol = tol or TOL.absolute
 
-        tree = self.tree
-        return Pointcloud(self.points + [point for point in other if tree.nearest_neighbor(point)[2] > tol])
+        other = other.array if isinstance(other, Pointcloud) else PointArray(other)
+        distances, _ = self._nearest(other, 1)
+        xyz = self.array.flat
+        for point, distance in zip(other.to_list(), distances):
+            if not distance or distance[0] > tol:
+                xyz.extend(point)
+        cloud = type(self)([])
+        cloud._array = PointArray.from_flat(xyz)
+        return cloud
 
     def subtract(self, other, tol=None):  # type: (Pointcloud, ...) -> None
         """Subtract another pointcloud from this pointcloud.
@@ -382,10 +579,7 @@ class Pointcloud(Geometry):
             The pointcloud is modified in place.
 
         """
-        tol = tol or TOL.absolute
-
-        tree = KDTree(other)
-        self.points = [point for point in self.points if tree.nearest_neighbor(point)[2] > tol]
+        self.points = self.difference(other, tol=tol).array
 
     def difference(self, other, tol=None):  # type: (Pointcloud, ...) -> Pointcloud
         """Compute the difference with another pointcloud.
@@ -403,8 +597,156 @@ class Pointcloud(Geometry):
         :class:`~compas.geometry.Pointcloud`
             The difference pointcloud.
 
+        Notes
+        -----
+        If `other` is a pointcloud, its spatial index is reused for subsequent operations.
+
         """
         tol = tol or TOL.absolute
 
-        tree = KDTree(other)
-        return Pointcloud([point for point in self.points if tree.nearest_neighbor(point)[2] > tol])
+        if not isinstance(other, Pointcloud):
+            other = Pointcloud(other)
+        distances, _ = other._nearest(self.array, 1)
+        return self._select([not distance or distance[0] > tol for distance in distances])
+
+    def voxel_downsample(self, size):
+        """Downsample the pointcloud by replacing the points in every cell of a regular grid of voxels by their centroid.
+
+        Parameters
+        ----------
+        size : float
+            The size of the voxels.
+
+        Returns
+        -------
+        :class:`~compas.geometry.Pointcloud`
+            A new pointcloud with one point per occupied voxel,
+            in the order in which the voxels are first occupied by the points of this cloud.
+
+        Notes
+        -----
+        The grid of voxels is aligned with the minimum corner of the axis-aligned bounding box of the cloud.
+
+        Examples
+        --------
+        >>> cloud = Pointcloud([[0.1, 0.1, 0.0], [0.3, 0.1, 0.0], [1.5, 0.0, 0.0]])
+        >>> cloud.voxel_downsample(1.0).array.to_list()
+        [[0.2, 0.1, 0.0], [1.5, 0.0, 0.0]]
+
+        """
+        if size <= 0:
+            raise ValueError("The size of the voxels should be positive.")
+        if not len(self):
+            return type(self)([])
+
+        if np is not None:
+            xyz = self.array.array
+            keys = np.floor((xyz - xyz.min(axis=0)) / size).astype(np.int64)
+            _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+            # renumber the voxels in the order of their first point
+            order = np.argsort(first)
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(order))
+            inverse = rank[inverse.reshape(-1)]
+            counts = np.bincount(inverse)
+            centroids = np.column_stack([np.bincount(inverse, weights=xyz[:, i]) for i in range(3)]) / counts[:, None]
+            return type(self)(centroids)
+
+        points = self.array.to_list()
+        x0 = min(point[0] for point in points)
+        y0 = min(point[1] for point in points)
+        z0 = min(point[2] for point in points)
+        voxels = {}
+        for x, y, z in points:
+            key = (int((x - x0) // size), int((y - y0) // size), int((z - z0) // size))
+            voxel = voxels.get(key)
+            if voxel is None:
+                voxels[key] = [x, y, z, 1]
+            else:
+                voxel[0] += x
+                voxel[1] += y
+                voxel[2] += z
+                voxel[3] += 1
+        return type(self)([[x / n, y / n, z / n] for x, y, z, n in voxels.values()])
+
+    def remove_radius_outliers(self, radius, min_neighbors=2):
+        """Remove the points that have less than a given number of neighbors within a given radius.
+
+        Parameters
+        ----------
+        radius : float
+            The search radius.
+        min_neighbors : int, optional
+            The minimum number of other points within the search radius.
+
+        Returns
+        -------
+        :class:`~compas.geometry.Pointcloud`
+            A new pointcloud without the outliers.
+
+        Examples
+        --------
+        >>> cloud = Pointcloud([[0.0, 0.0, 0.0], [0.1, 0.0, 0.0], [0.0, 0.1, 0.0], [5.0, 5.0, 5.0]])
+        >>> len(cloud.remove_radius_outliers(0.5, min_neighbors=2))
+        3
+
+        """
+        neighbors = self._neighbors(self.array, radius)
+        # the neighbors of a point include the point itself
+        return self._select([len(nbrs) > min_neighbors for nbrs in neighbors])
+
+    def estimate_normals(self, k=10, viewpoint=None):
+        """Estimate the normals of the points from the plane that best fits their nearest neighbors.
+
+        Parameters
+        ----------
+        k : int, optional
+            The number of nearest neighbors of a point used to fit a plane, including the point itself.
+        viewpoint : [float, float, float] | :class:`compas.geometry.Point`, optional
+            If provided, the normals are oriented towards this point.
+            Otherwise, the orientation of the normals is arbitrary.
+
+        Returns
+        -------
+        :class:`compas.geometry.VectorArray`
+            The unit normal vectors of the points.
+
+        Examples
+        --------
+        >>> cloud = Pointcloud.from_bounds(10, 10, 0, 100)
+        >>> normals = cloud.estimate_normals(k=5, viewpoint=[0, 0, 10])
+        >>> all(TOL.is_allclose(normal, [0, 0, 1]) for normal in normals)
+        True
+
+        """
+        if k < 3:
+            raise ValueError("At least three neighbors are needed to estimate a normal.")
+        if not len(self):
+            return VectorArray()
+
+        _, indices = self._nearest(self.array, k)
+
+        if np is not None:
+            xyz = self.array.array
+            indices = np.asarray(indices, dtype=np.intp)
+            normals = np.empty_like(xyz)
+            for start in range(0, len(xyz), CHUNK_SIZE):
+                neighbors = xyz[indices[start : start + CHUNK_SIZE]]
+                neighbors = neighbors - neighbors.mean(axis=1, keepdims=True)
+                covariance = np.einsum("nki,nkj->nij", neighbors, neighbors)
+                # the eigenvectors are sorted by increasing eigenvalue
+                _, eigenvectors = np.linalg.eigh(covariance)
+                normals[start : start + CHUNK_SIZE] = eigenvectors[:, :, 0]
+            if viewpoint is not None:
+                flip = np.einsum("ni,ni->n", normals, np.asarray(viewpoint, dtype=np.float64) - xyz) < 0
+                normals[flip] *= -1
+            return VectorArray(normals)
+
+        points = self.array.to_list()
+        normals = VectorArray([bestfit_plane([points[index] for index in nbrs])[1] for nbrs in indices])
+        normals.unitize()
+        if viewpoint is not None:
+            for index, (normal, point) in enumerate(zip(normals, points)):
+                if normal.dot([viewpoint[0] - point[0], viewpoint[1] - point[1], viewpoint[2] - point[2]]) < 0:
+                    normals[index] = -normal
+        return normals
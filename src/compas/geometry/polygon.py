@@ -94,6 +94,9 @@ class Polygon(Geometry):
     def __data__(self):
         return {"points": [point.__data__ for point in self.points]}
 
+    def __copy_state__(self):
+        return type(self)(self.points)
+
     def __init__(self, points, name=None):
         super(Polygon, self).__init__(name=name)
         self._points = []
@@ -119,6 +119,8 @@ class Quaternion(Geometry):
 
     """
 
+    __slots__ = ("_w", "_x", "_y", "_z")
+
     DATASCHEMA = {
         "type": "object",
         "properties": {
@@ -136,14 +138,11 @@ class Quaternion(Geometry):
 
     def __init__(self, w, x, y, z, name=None):
         super(Quaternion, self).__init__(name=name)
-        self._w = None
-        self._x = None
-        self._y = None
-        self._z = None
-        self.w = w
-        self.x = x
-        self.y = y
-        self.z = z
+        # components that are already floats are not converted again
+        self._w = w if type(w) is float else float(w)
+        self._x = x if type(x) is float else float(x)
+        self._y = y if type(y) is float else float(y)
+        self._z = z if type(z) is float else float(z)
 
     def __repr__(self):
         return "{0}({1}, {2}, {3}, {4})".format(type(self).__name__, self.w, self.x, self.y, self.z)
@@ -76,6 +76,8 @@ class Vector(Geometry):
 
     """
 
+    __slots__ = ("_x", "_y", "_z", "_direction", "_magnitude")
+
     DATASCHEMA = {
         "type": "array",
         "minItems": 3,
@@ -93,14 +95,12 @@ class Vector(Geometry):
 
     def __init__(self, x, y, z=0.0, name=None):
         super(Vector, self).__init__(name=name)
-        self._x = 0.0
-        self._y = 0.0
-        self._z = 0.0
+        # components that are already floats are not converted again
+        self._x = x if type(x) is float else float(x)
+        self._y = y if type(y) is float else float(y)
+        self._z = z if type(z) is float else float(z)
         self._direction = None
         self._magnitude = None
-        self.x = x
-        self.y = y
-        self.z = z
 
     def __repr__(self):
         return "{0}(x={1}, y={2}, z={3})".format(
@@ -126,11 +126,11 @@ class Vector(Geometry):
             return [self[i] for i in range(*key.indices(len(self)))]
         i = key % 3
         if i == 0:
-            return self.x
+            return self._x
         if i == 1:
-            return self.y
+            return self._y
         if i == 2:
-            return self.z
+            return self._z
         raise KeyError
 
     def __setitem__(self, key, value):
@@ -147,20 +147,20 @@ class Vector(Geometry):
         raise KeyError
 
     def __iter__(self):
-        return iter([self.x, self.y, self.z])
+        return iter([self._x, self._y, self._z])
 
     def __eq__(self, other):
         return TOL.is_allclose(self, other)
 
     def __add__(self, other):
-        return Vector(self.x + other[0], self.y + other[1], self.z + other[2])
+        return Vector(self._x + other[0], self._y + other[1], self._z + other[2])
 
     def __sub__(self, other):
-        return Vector(self.x - other[0], self.y - other[1], self.z - other[2])
+        return Vector(self._x - other[0], self._y - other[1], self._z - other[2])
 
     def __mul__(self, other):
         if isinstance(other, (int, float)):
-            return Vector(self.x * other, self.y * other, self.z * other)
+            return Vector(self._x * other, self._y * other, self._z * other)
 
         try:
             other = Vector(*other)
@@ -626,9 +626,11 @@ class Vector(Geometry):
 
         """
         length = self.length
-        self.x = self.x / length
-        self.y = self.y / length
-        self.z = self.z / length
+        self._x = self._x / length
+        self._y = self._y / length
+        self._z = self._z / length
+        self._direction = None
+        self._magnitude = None
 
     def unitized(self):
         """Returns a unitized copy of this vector.
@@ -773,6 +775,8 @@ class Vector(Geometry):
         0.0
 
         """
+        if isinstance(other, Vector):
+            return self._x * other._x + self._y * other._y + self._z * other._z
         return dot_vectors(self, other)
 
     def cross(self, other):
@@ -797,7 +801,8 @@ class Vector(Geometry):
         Vector(x=0.000, y=0.000, z=1.000)
 
         """
-        return Vector(*cross_vectors(self, other))
+        x, y, z = self._x, self._y, self._z
+        return Vector(y * other[2] - z * other[1], z * other[0] - x * other[2], x * other[1] - y * other[0])
 
     def angle(self, other, degrees=False):
         """Compute the smallest angle between this vector and another vector.
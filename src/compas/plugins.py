@@ -18,8 +18,12 @@ from __future__ import division
 from __future__ import print_function
 
 import functools
+import hashlib
 import inspect
+import json
+import os
 import pkgutil
+import sys
 import threading
 
 import compas
@@ -100,34 +104,182 @@ class PluginImpl(object):
         self.method = method
         self.opts = plugin_opts
 
-        if plugin_opts["tryfirst"]:
-            self.key = 1
-        elif plugin_opts["trylast"]:
-            self.key = 3
-        else:
-            self.key = 2
+    @property
+    def key(self):
+        """Sorting key of the plugin implementation, based on its declared priority."""
+        if self.opts["tryfirst"]:
+            return 1
+        if self.opts["trylast"]:
+            return 3
+        return 2
 
     @property
     def id(self):
         """Identifier of the plugin implementation."""
         return "{}.{}".format(self.plugin.__name__, self.method.__name__)
 
+    def load(self):
+        """Load the plugin implementation.
+
+        Returns
+        -------
+        bool
+            True if the plugin implementation is available.
+
+        """
+        return True
+
     def __repr__(self):
         return "<PluginImpl id={}, plugin_module={}>".format(self.id, self.plugin)
 
 
+class LazyPluginImpl(PluginImpl):
+    """Internal data class to keep track of a plugin implementation recorded in the plugin manifest.
+
+    The module containing the implementation is only imported when the implementation is used.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the module containing the plugin implementation.
+    name : str
+        Name of the plugin implementation in the module.
+    plugin_opts : dict
+        Dictionary containing plugin options, as recorded in the manifest.
+    importer : :class:`Importer`
+        The importer used to import the module.
+
+    """
+
+    def __init__(self, module_name, name, plugin_opts, importer):
+        self.module_name = module_name
+        self.name = name
+        self.importer = importer
+        self._opts = plugin_opts
+        self._plugin = None
+        self._method = None
+
+    @property
+    def plugin(self):
+        self.load()
+        return self._plugin
+
+    @property
+    def method(self):
+        self.load()
+        return self._method
+
+    @property
+    def opts(self):
+        # requirements that are callables are not recorded in the manifest
+        if self._opts.get("callable_requires"):
+            self.load()
+        return self._opts
+
+    @property
+    def id(self):
+        return "{}.{}".format(self.module_name, self._opts.get("method_name", self.name))
+
+    def load(self):
+        if self._method is not None:
+            return True
+        module = self.importer.try_import(self.module_name)
+        method = getattr(module, self.name, None) if module else None
+        if method is None:
+            return False
+        self._plugin = module
+        self._method = method
+        self._opts = getattr(method, "__plugin_spec__", None) or self._opts
+        return True
+
+    def __repr__(self):
+        return "<LazyPluginImpl id={}, plugin_module={}>".format(self.id, self.module_name)
+
+
+def _default_manifest_path():
+    # one manifest per Python environment
+    name = "plugins-{}.json".format(hashlib.sha256(sys.executable.encode()).hexdigest()[:16])
+    return os.path.join(compas.APPDATA, "plugins", name)
+
+
+def _mtime(filepath):
+    try:
+        return os.path.getmtime(filepath)
+    except (TypeError, OSError):
+        return None
+
+
+def _environment():
+    # the Python version, and the location and modification time of all installed COMPAS packages
+    packages = []
+    for importer, module_name, is_pkg in pkgutil.iter_modules():
+        if is_pkg and module_name.startswith("compas"):
+            path = getattr(importer, "path", None)
+            filepath = os.path.join(path, module_name, "__init__.py") if path else None
+            packages.append([module_name, path, _mtime(filepath)])
+    return {"python": sys.version, "packages": packages}
+
+
+def _importable(module_name):
+    # check if a module can be found, without importing it
+    # returns None if this cannot be checked without importing the module
+    try:
+        from importlib.util import find_spec
+    except ImportError:
+        return None
+    try:
+        return find_spec(module_name) is not None
+    except (ImportError, ValueError, AttributeError):
+        return False
+
+
+def _missing_module(error):
+    # the name of the module that could not be found, if that was the reason the import failed
+    if type(error).__name__ == "ModuleNotFoundError":
+        return getattr(error, "name", None)
+    return None
+
+
+def _manifest_entry(module_name, name, plugin_method, plugin_opts):
+    requires = plugin_opts["requires"] or []
+    opts = dict(plugin_opts)
+    opts["requires"] = [requirement for requirement in requires if not callable(requirement)] or None
+    opts["callable_requires"] = any(callable(requirement) for requirement in requires)
+    opts["method_name"] = getattr(plugin_method, "__name__", name)
+    return {"module": module_name, "name": name, "opts": opts}
+
+
 class PluginManager(object):
     """Plugin Manager handles discovery and registry of plugins.
 
     Usually there is only one instance of a plugin manager per host.
 
+    Parameters
+    ----------
+    manifest_path : str, optional
+        Path of the manifest file in which the result of the discovery of plugins is recorded.
+        Default is a file in the COMPAS application data folder, specific to the current Python environment.
+
+    Attributes
+    ----------
+    DEBUG : bool
+        If True, print information about the discovery and selection of plugins.
+    USE_MANIFEST : bool
+        If True (default), load the plugins from the manifest file if it is up to date,
+        instead of importing all plugin modules.
+
     """
 
     DEBUG = False
+    USE_MANIFEST = True
+    MANIFEST_VERSION = 2
 
-    def __init__(self):
+    def __init__(self, manifest_path=None):
         self.importer = Importer()
+        self.manifest_path = manifest_path or _default_manifest_path()
         self._registry = {}
+        self._selected_plugins = {}
+        self._collected_plugins = {}
         self._discovery_done = False
         self._discovery_lock = threading.Lock()
 
@@ -149,52 +301,188 @@ class PluginManager(object):
 
         return self._registry
 
-    def load_plugins(self):
+    def load_plugins(self, use_manifest=None):
         """Load available plugin modules.
 
+        The result of the discovery of plugins is recorded in a manifest file.
+        As long as the installed COMPAS packages and plugin modules do not change,
+        and the plugin modules that could not be imported still cannot be imported,
+        the plugins are loaded from the manifest, and their modules are only imported when they are used.
+
+        Parameters
+        ----------
+        use_manifest : bool, optional
+            If False, ignore the manifest and import all plugin modules.
+            Default is :attr:`USE_MANIFEST`.
+
         Returns
         -------
         int
             Number of loaded plugins.
 
         """
+        if use_manifest is None:
+            use_manifest = self.USE_MANIFEST
+
         # Since we modify global state,
         # let's lock around this.
         with self._discovery_lock:
-            count = 0
-
-            modules = [module_name for _importer, module_name, is_pkg in pkgutil.iter_modules() if is_pkg and module_name.startswith("compas")]
-
-            modules_to_inspect = dict()
-
-            for module_name in modules:
-                module = self.importer.try_import(module_name)
-                if module:
-                    modules_to_inspect[module_name] = module
-                else:
-                    if self.DEBUG:
-                        print("Error importing module {}, skipping entire package.".format(module_name))
-                    continue
-
-                if "__all_plugins__" in dir(module):
-                    for plugin_module_name in module.__all_plugins__:
-                        plugin_module = self.importer.try_import(plugin_module_name)
-                        if plugin_module:
-                            modules_to_inspect[plugin_module_name] = plugin_module
-                        else:
-                            if self.DEBUG:
-                                print("Error importing plugin {}, skipping.".format(plugin_module_name))
+            count = self._load_manifest() if use_manifest else None
 
-            if self.DEBUG:
-                print("Will inspect modules: {}".format(list(modules_to_inspect.keys())))
+            if count is None:
+                count = self._discover_plugins(write_manifest=use_manifest)
 
-            for plugin_module in modules_to_inspect.values():
-                count += self.register_module(plugin_module)
+            self._discovery_done = True
 
+        return count
+
+    def rebuild_manifest(self):
+        """Discover all plugins by importing the plugin modules, and rebuild the plugin manifest.
+
+        Returns
+        -------
+        int
+            Number of discovered plugins.
+
+        """
+        with self._discovery_lock:
+            self._registry = {}
+            self._selected_plugins = {}
+            self._collected_plugins = {}
+            count = self._discover_plugins(write_manifest=True)
             self._discovery_done = True
 
         return count
 
+    def clear_manifest(self):
+        """Delete the plugin manifest, such that the plugins are discovered again the next time they are loaded.
+
+        Returns
+        -------
+        None
+
+        """
+        if os.path.exists(self.manifest_path):
+            os.remove(self.manifest_path)
+
+    def _discover_plugins(self, write_manifest=False):
+        count = 0
+
+        modules = [module_name for _importer, module_name, is_pkg in pkgutil.iter_modules() if is_pkg and module_name.startswith("compas")]
+
+        modules_to_inspect = dict()
+        failed_modules = []
+
+        for module_name in modules:
+            module = self.importer.try_import(module_name)
+            if module:
+                modules_to_inspect[module_name] = module
+            else:
+                failed_modules.append(module_name)
+                if self.DEBUG:
+                    print("Error importing module {}, skipping entire package.".format(module_name))
+                continue
+
+            if "__all_plugins__" in dir(module):
+                for plugin_module_name in module.__all_plugins__:
+                    plugin_module = self.importer.try_import(plugin_module_name)
+                    if plugin_module:
+                        modules_to_inspect[plugin_module_name] = plugin_module
+                    else:
+                        failed_modules.append(plugin_module_name)
+                        if self.DEBUG:
+                            print("Error importing plugin {}, skipping.".format(plugin_module_name))
+
+        if self.DEBUG:
+            print("Will inspect modules: {}".format(list(modules_to_inspect.keys())))
+
+        plugins = []
+        for module_name, plugin_module in modules_to_inspect.items():
+            for name, plugin_method, plugin_opts in self._inspect_module(plugin_module):
+                self._register(PluginImpl(plugin_module, plugin_method, plugin_opts))
+                plugins.append(_manifest_entry(module_name, name, plugin_method, plugin_opts))
+                count += 1
+
+        if write_manifest:
+            self._write_manifest(modules_to_inspect, failed_modules, plugins)
+
+        return count
+
+    def _load_manifest(self):
+        # load the plugins recorded in the manifest, without importing their modules
+        # returns None if the manifest does not exist or is out of date
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if manifest.get("version") != self.MANIFEST_VERSION or manifest.get("environment") != _environment():
+            return None
+        for module_name, filepath, mtime in manifest["modules"]:
+            if _mtime(filepath) != mtime:
+                return None
+        for module_name, missing in manifest["failed"]:
+            if self._importable_now(module_name, missing):
+                return None
+
+        for entry in manifest["plugins"]:
+            self._register(LazyPluginImpl(entry["module"], entry["name"], entry["opts"], self.importer))
+
+        if self.DEBUG:
+            print("Loaded {} plugins from manifest: {}".format(len(manifest["plugins"]), self.manifest_path))
+
+        return len(manifest["plugins"])
+
+    def _importable_now(self, module_name, missing):
+        # check if a module that could not be imported when the manifest was written can be imported now
+        # if it failed because another module was missing, it is enough to check if that module can be found
+        if missing:
+            importable = _importable(missing)
+            if importable is not None:
+                return importable
+        return self.importer.try_import(module_name) is not None
+
+    def _write_manifest(self, modules, failed_modules, plugins):
+        # the modules that could not be imported are recorded with the name of the missing module that caused the failure, if any
+        manifest = {
+            "version": self.MANIFEST_VERSION,
+            "environment": _environment(),
+            "modules": [[name, getattr(module, "__file__", None), _mtime(getattr(module, "__file__", None))] for name, module in modules.items()],
+            "failed": [[name, _missing_module(self.importer.errors.get(name))] for name in failed_modules],
+            "plugins": plugins,
+        }
+        try:
+            dirname = os.path.dirname(self.manifest_path)
+            if dirname and not os.path.exists(dirname):
+                os.makedirs(dirname)
+            with open(self.manifest_path, "w") as f:
+                json.dump(manifest, f)
+        except (IOError, OSError):
+            if self.DEBUG:
+                print("Error writing plugin manifest: {}".format(self.manifest_path))
+
+    def _register(self, plugin_impl):
+        # the plugins selected for the extension points may change
+        self._selected_plugins.clear()
+        self._collected_plugins.clear()
+
+        plugins_list = self._registry.setdefault(plugin_impl.opts["extension_point_url"], [])
+        plugins_list.append(plugin_impl)
+        plugins_list.sort(key=lambda p: p.key)
+
+        if self.DEBUG:
+            print('Registered plugin with ID "{}" for extension point: {}'.format(plugin_impl.id, plugin_impl.opts["extension_point_url"]))
+
+    def _inspect_module(self, plugin_module):
+        # Iterate over the plugin to locate specific @plugin decorated methods
+        for name in dir(plugin_module):
+            plugin_method = getattr(plugin_module, name)
+            plugin_opts = self._parse_plugin_opts(plugin_method)
+
+            if plugin_opts is not None:
+                yield name, plugin_method, plugin_opts
+
     def register_module(self, plugin_module):
         """Register a module that potentially contains plugin implementations.
 
@@ -210,20 +498,9 @@ class PluginManager(object):
         """
         count = 0
 
-        # Iterate over the plugin to locate specific @plugin decorated methods
-        for name in dir(plugin_module):
-            plugin_method = getattr(plugin_module, name)
-            plugin_opts = self._parse_plugin_opts(plugin_method)
-
-            if plugin_opts is not None:
-                plugin_impl = PluginImpl(plugin_module, plugin_method, plugin_opts)
-                plugins_list = self._registry.setdefault(plugin_opts["extension_point_url"], [])
-                plugins_list.append(plugin_impl)
-                plugins_list.sort(key=lambda p: p.key)
-
-                if self.DEBUG:
-                    print('Registered plugin with ID "{}" for extension point: {}'.format(plugin_impl.id, plugin_opts["extension_point_url"]))
-                count += 1
+        for _name, plugin_method, plugin_opts in self._inspect_module(plugin_module):
+            self._register(PluginImpl(plugin_module, plugin_method, plugin_opts))
+            count += 1
 
         return count
 
@@ -280,10 +557,10 @@ def pluggable(
     """
 
     def pluggable_decorator(func):
+        extension_point_url = _get_extension_point_url_from_method(domain, category, func)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            extension_point_url = _get_extension_point_url_from_method(domain, category, func)
-
             # Select first matching plugin
             if selector == "first_match":
                 plugin_impl = _select_plugin(extension_point_url)
@@ -399,6 +676,8 @@ class Importer(object):
     def __init__(self):
         # dictionary of module_name => bool (importable yes/no)
         self._cache = {}
+        # dictionary of module_name => the exception raised by the last failed import
+        self.errors = {}
 
     def try_import(self, module_name):
         """Attempt to import a module, but do not raise in case of error.
@@ -422,8 +701,9 @@ class Importer(object):
         # 1) cannot be imported, or
         # 2) is a python 3 module and we're in IPY, which causes a SyntaxError
         # 3) in Rhino8 we may get a nasty DotNet Exception when trying to import a module
-        except (ImportError, SyntaxError, DotNetException):
+        except (ImportError, SyntaxError, DotNetException) as error:
             self._cache[module_name] = False
+            self.errors[module_name] = error
 
         return module
 
@@ -467,26 +747,66 @@ class PluginValidator(object):
                     print("Requirements not satisfied. Plugin will not be used: {}".format(plugin.id))
                 return False
 
+        if not plugin.load():
+            if self.manager.DEBUG:
+                print("Error loading plugin. Plugin will not be used: {}".format(plugin.id))
+            return False
+
         return True
 
     def select_plugin(self, extension_point_url):
         if self.manager.DEBUG:
             print("Extension Point URL {} invoked. Will select a matching plugin".format(extension_point_url))
 
+        # loading the registry clears the cache
         plugins = self.manager.registry.get(extension_point_url) or []
+
+        cache = self.manager._selected_plugins
+        if extension_point_url in cache:
+            return cache[extension_point_url]
+
+        selected = None
+        checked = []
         for plugin in plugins:
+            checked.append(plugin)
             if self.is_plugin_selectable(plugin):
-                return plugin
+                selected = plugin
+                break
+
+        if self.is_selection_cacheable(checked):
+            cache[extension_point_url] = selected
 
         # Nothing found, raise
         # raise PluginNotInstalledError("Plugin not found for extension point URL: {}".format(extension_point_url))
+        return selected
 
     def collect_plugins(self, extension_point_url):
         if self.manager.DEBUG:
             print("Extension Point URL {} invoked. Will select a matching plugin".format(extension_point_url))
 
+        # loading the registry clears the cache
         plugins = self.manager.registry.get(extension_point_url) or []
-        return [plugin for plugin in plugins if self.is_plugin_selectable(plugin)]
+
+        cache = self.manager._collected_plugins
+        if extension_point_url in cache:
+            return cache[extension_point_url]
+
+        selected = [plugin for plugin in plugins if self.is_plugin_selectable(plugin)]
+
+        if self.is_selection_cacheable(plugins):
+            cache[extension_point_url] = selected
+
+        return selected
+
+    @staticmethod
+    def is_selection_cacheable(plugins):
+        # the importability of packages is cached by the importer,
+        # but requirements that are callables can change their result
+        for plugin in plugins:
+            for requirement in plugin.opts["requires"] or []:
+                if callable(requirement):
+                    return False
+        return True
 
     @staticmethod
     def ensure_implementations(cls):
@@ -499,3 +819,52 @@ class PluginValidator(object):
 plugin_manager = PluginManager()
 _select_plugin = PluginValidator(plugin_manager).select_plugin
 _collect_plugins = PluginValidator(plugin_manager).collect_plugins
+
+
+def rebuild(**kwargs):
+    count = plugin_manager.rebuild_manifest()
+    print("Discovered {} plugins.".format(count))
+    print("Plugin manifest: {}".format(plugin_manager.manifest_path))
+
+
+def clear(**kwargs):
+    plugin_manager.clear_manifest()
+    print("Plugin manifest deleted: {}".format(plugin_manager.manifest_path))
+
+
+def show(**kwargs):
+    for extension_point_url, plugins in sorted(plugin_manager.registry.items()):
+        print(extension_point_url)
+        for plugin_impl in plugins:
+            print("    {}".format(plugin_impl.id))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="COMPAS plugins command-line utility")
+
+    commands = parser.add_subparsers(help="Valid plugin commands")
+
+    # Command: rebuild
+    rebuild_command = commands.add_parser("rebuild", help="Discover all plugins and rebuild the plugin manifest")
+    rebuild_command.set_defaults(func=rebuild)
+
+    # Command: clear
+    clear_command = commands.add_parser("clear", help="Delete the plugin manifest")
+    clear_command.set_defaults(func=clear)
+
+    # Command: list
+    list_command = commands.add_parser("list", help="List the available plugins")
+    list_command.set_defaults(func=show)
+
+    # Invoke
+    args = parser.parse_args()
+    if hasattr(args, "func"):
+        args.func(**vars(args))
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,10 @@ from __future__ import absolute_import
 from .errors import RPCClientError, RPCServerError
 from .proxy import Proxy
 from .server import Server
+from .server import BinaryServer
+from .workers import ThreadWorkerPool
+from .workers import ProcessWorkerPool
 from .dispatcher import Dispatcher
 
 
-__all__ = ["RPCClientError", "RPCServerError", "Proxy", "Server", "Dispatcher"]
+__all__ = ["RPCClientError", "RPCServerError", "Proxy", "Server", "BinaryServer", "ThreadWorkerPool", "ProcessWorkerPool", "Dispatcher"]
@@ -1,6 +1,7 @@
 import time
 
 from compas.rpc.services.default import start_service
+from compas.rpc.transport import BinaryServerProxy
 
 try:
     from xmlrpclib import ServerProxy  # type: ignore
@@ -8,13 +9,14 @@ except ImportError:
     from xmlrpc.client import ServerProxy
 
 
-def start(port, autoreload, **kwargs):
-    start_service(port, autoreload)
+def start(port, autoreload, transport="json", workers=None, executor="thread", timeout=None, **kwargs):
+    start_service(port, autoreload, transport, workers, executor, timeout)
 
 
-def stop(port, **kwargs):
+def stop(port, transport="json", **kwargs):
     print("Trying to stop remote RPC proxy...")
-    server = ServerProxy("http://127.0.0.1:{}".format(port))
+    address = "http://127.0.0.1:{}".format(port)
+    server = BinaryServerProxy(address) if transport == "binary" else ServerProxy(address)
 
     success = False
     count = 5
@@ -58,11 +60,16 @@ def main():
         action="store_false",
         help="Do not autoreload modules",
     )
+    start_command.add_argument("--transport", action="store", default="json", choices=["json", "binary"], help="RPC transport")
+    start_command.add_argument("--workers", action="store", default=None, type=int, help="Number of calls executed concurrently")
+    start_command.add_argument("--executor", action="store", default="thread", choices=["thread", "process"], help="Execute calls in a pool of threads or processes")
+    start_command.add_argument("--timeout", action="store", default=None, type=float, help="Maximum time in seconds for executing a call")
     start_command.set_defaults(autoreload=True, func=start)
 
     # Command: stop
     stop_command = commands.add_parser("stop", help="Try to stop a remote RPC server")
     stop_command.add_argument("--port", "-p", action="store", default=1753, type=int, help="RPC port number")
+    stop_command.add_argument("--transport", action="store", default="json", choices=["json", "binary"], help="RPC transport")
     stop_command.set_defaults(func=stop)
 
     # Invoke
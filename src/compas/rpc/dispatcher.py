@@ -35,6 +35,11 @@ class Dispatcher(object):
     message strings assigned to the `'error'` key of the output dictionary
     such that the errors can be rethrown on the client side.
 
+    The functions corresponding to API calls are cached after the first call.
+    A cached function is resolved again if its module is unloaded or replaced in ``sys.modules``,
+    for example by the autoreload mechanism of the default service.
+    Use :meth:`clear_cache` to force resolving all functions again.
+
     """
 
     def on_module_imported(self, module, newly_loaded_modules):
@@ -57,6 +62,16 @@ class Dispatcher(object):
         """
         pass
 
+    def clear_cache(self):
+        """Clear the cache of functions corresponding to API calls.
+
+        Returns
+        -------
+        None
+
+        """
+        self.__dict__.pop("_function_cache", None)
+
     def _dispatch(self, name, args):
         """Dispatcher method for XMLRPC API calls.
 
@@ -88,10 +103,83 @@ class Dispatcher(object):
         """
         odict = {"data": None, "error": None, "profile": None}
 
+        function = self._resolve(name, args, odict)
+
+        if function is not None:
+            try:
+                idict = json.loads(args[0], cls=DataDecoder)
+            except (IndexError, TypeError):
+                odict["error"] = "API methods require a single JSON encoded dictionary as input.\nFor example: input = json.dumps({'param_1': 1, 'param_2': [2, 3]})"
+
+            else:
+                self._call(function, idict, odict)
+
+        return json.dumps(odict, cls=DataEncoder)
+
+    def _dispatch_data(self, name, args):
+        """Dispatcher method for API calls through the binary transport.
+
+        This method is called by :class:`compas.rpc.BinaryServer` instead of :meth:`_dispatch`.
+        The input and output dictionaries are the same as for :meth:`_dispatch`,
+        but they are (de)serialized by the transport rather than passed as JSON strings.
+
+        Parameters
+        ----------
+        name : str
+            Name of the function.
+        args : list
+            List of positional arguments.
+            The first argument in the list should be the input dictionary.
+
+        Returns
+        -------
+        dict
+            The output dictionary.
+
+        """
+        odict = {"data": None, "error": None, "profile": None}
+
+        function = self._resolve(name, args, odict)
+
+        if function is not None:
+            if not args or not isinstance(args[0], dict):
+                odict["error"] = "API methods require a single dictionary as input.\nFor example: input = {'args': [1], 'kwargs': {'param_2': [2, 3]}}"
+            else:
+                self._call(function, args[0], odict)
+
+        return odict
+
+    def _resolve(self, name, args, odict):
+        """Find the function corresponding to an API call.
+
+        Parameters
+        ----------
+        name : str
+            Name of the function.
+        args : list
+            List of positional arguments of the API call.
+            The second argument, if any, is a path that is added to ``sys.path``.
+        odict : dict
+            The output dictionary, in which errors are recorded.
+
+        Returns
+        -------
+        callable | None
+            The function, or None if it could not be found.
+
+        """
         if len(args) > 1:
             if args[1] not in sys.path:
                 sys.path.insert(0, args[1])
 
+        # functions are cached as long as their module is not unloaded or replaced
+        cache = self.__dict__.setdefault("_function_cache", {})
+        if name in cache:
+            function, modulename, module = cache[name]
+            if modulename is None or sys.modules.get(modulename) is module:
+                return function
+            del cache[name]
+
         parts = name.split(".")
 
         functionname = parts[-1]
@@ -108,26 +196,20 @@ class Dispatcher(object):
                 newly_loaded_modules = set(sys.modules.keys()) - modules_before_import
                 self.on_module_imported(module, newly_loaded_modules)
             else:
+                modulename = None
                 module = self
         except Exception:
             odict["error"] = traceback.format_exc()
+            return None
 
-        else:
-            try:
-                function = getattr(module, functionname)
-            except AttributeError:
-                odict["error"] = "This function is not part of the API: {0}".format(functionname)
-
-            else:
-                try:
-                    idict = json.loads(args[0], cls=DataDecoder)
-                except (IndexError, TypeError):
-                    odict["error"] = "API methods require a single JSON encoded dictionary as input.\nFor example: input = json.dumps({'param_1': 1, 'param_2': [2, 3]})"
-
-                else:
-                    self._call(function, idict, odict)
+        try:
+            function = getattr(module, functionname)
+        except AttributeError:
+            odict["error"] = "This function is not part of the API: {0}".format(functionname)
+            return None
 
-        return json.dumps(odict, cls=DataEncoder)
+        cache[name] = function, modulename, module
+        return function
 
     def _call(self, function, idict, odict):
         """Method that handles the actual call to the function corresponding to the API call.
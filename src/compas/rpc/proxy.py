@@ -9,11 +9,17 @@ import compas
 import compas._os
 from compas.data import DataDecoder
 from compas.data import DataEncoder
+from compas.rpc import RPCClientError
 from compas.rpc import RPCServerError
+from compas.rpc.transport import BinaryServerProxy
 
 try:
+    from xmlrpclib import Fault
+    from xmlrpclib import MultiCall
     from xmlrpclib import ServerProxy
 except ImportError:
+    from xmlrpc.client import Fault
+    from xmlrpc.client import MultiCall
     from xmlrpc.client import ServerProxy
 
 try:
@@ -23,6 +29,103 @@ except ImportError:
     from System.Diagnostics import Process
 
 
+class BatchCall(object):
+    """The result of a remote function call that is part of a batch.
+
+    The result is available after the batch is executed,
+    at the end of the ``with`` block of :meth:`Proxy.batch`.
+
+    """
+
+    def __init__(self):
+        self._done = False
+        self._data = None
+        self._error = None
+
+    @property
+    def done(self):
+        return self._done
+
+    def result(self):
+        """Get the result of the call.
+
+        Returns
+        -------
+        object
+            The result returned by the remote function.
+
+        Raises
+        ------
+        RPCClientError
+            If the batch has not been executed yet.
+        RPCServerError
+            If the call failed on the server.
+
+        """
+        if not self._done:
+            raise RPCClientError("The batch of this call has not been executed yet.")
+        if self._error:
+            raise RPCServerError(self._error)
+        return self._data
+
+
+class ProxyBatch(object):
+    """Collection of remote function calls that are sent to the server in a single request.
+
+    Parameters
+    ----------
+    proxy : :class:`Proxy`
+        The proxy that executes the batch.
+
+    Notes
+    -----
+    Use :meth:`Proxy.batch` to create a batch.
+    Remote functions are called on the batch in the same way as on the proxy,
+    but return a :class:`BatchCall` instead of the actual result.
+
+    """
+
+    def __init__(self, proxy):
+        self._proxy = proxy
+        self._calls = []
+
+    def __len__(self):
+        return len(self._calls)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.execute()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._proxy.package:
+            name = "{}.{}".format(self._proxy.package, name)
+
+        def call(*args, **kwargs):
+            result = BatchCall()
+            self._calls.append((name, {"args": args, "kwargs": kwargs}, result))
+            return result
+
+        return call
+
+    def execute(self):
+        """Send all calls collected so far to the server, and collect the results.
+
+        Returns
+        -------
+        list[:class:`BatchCall`]
+            The executed calls.
+
+        """
+        calls, self._calls = self._calls, []
+        self._proxy._execute(calls)
+        return [result for _, _, result in calls]
+
+
 class Proxy(object):
     """Create a proxy object as intermediary between client code and remote functionality.
 
@@ -62,6 +165,21 @@ class Proxy(object):
     working_directory : str, optional
         Current working directory for the process that will be started to run the server.
         This is useful for cases where a custom service is used and the service is not on the PYTHONPATH.
+    transport : Literal["json", "binary"], optional
+        The transport used to communicate with the server.
+        With ``"json"``, the arguments and results are sent as JSON strings wrapped in XML-RPC requests.
+        With ``"binary"``, they are sent as length-prefixed binary frames over a persistent socket connection,
+        with numeric arrays as raw little-endian buffers (see :mod:`compas.rpc.transport`).
+        The binary transport requires a server that supports it, see :class:`compas.rpc.BinaryServer`.
+    workers : int, optional
+        The number of API calls the server started by the proxy can execute concurrently.
+        Default is to execute the calls one at a time.
+    executor : Literal["thread", "process"], optional
+        Execute the calls on the server started by the proxy in a pool of threads, or in a pool of processes.
+        Processes can execute CPU-bound calls on multiple cores.
+    timeout : float, optional
+        The maximum time in seconds for executing a call on the server.
+        Calls that take longer are cancelled by the server and raise an :class:`RPCServerError`.
 
     Attributes
     ----------
@@ -76,6 +194,10 @@ class Proxy(object):
         Fully qualified package name required for starting the server/service.
     python : str
         The type of Python executable that should be used to execute the code.
+    transport : str, read-only
+        The transport used to communicate with the server.
+    timeout : float
+        The maximum time in seconds for executing a call on the server.
 
     Notes
     -----
@@ -102,6 +224,18 @@ class Proxy(object):
     Starting a new proxy server...                          # doctest: +SKIP
     New proxy server started.                               # doctest: +SKIP
     Stopping the server proxy.                              # doctest: +SKIP
+
+    Many small calls can be combined in a single round trip to the server with a batch:
+
+    >>> with Proxy("compas.geometry") as geometry:  # doctest: +SKIP
+    ...     with geometry.batch() as batch:  # doctest: +SKIP
+    ...         a = batch.add_vectors([1, 0, 0], [0, 1, 0])  # doctest: +SKIP
+    ...         b = batch.cross_vectors([1, 0, 0], [0, 1, 0])  # doctest: +SKIP
+    ...     a.result(), b.result()  # doctest: +SKIP
+    ...     geometry.map("length_vector", [([1, 0, 0],), ([0, 3, 4],)])  # doctest: +SKIP
+    ([1, 1, 0], [0, 0, 1])                                  # doctest: +SKIP
+    [1.0, 5.0]                                              # doctest: +SKIP
+
     """
 
     def __init__(
@@ -116,7 +250,16 @@ class Proxy(object):
         capture_output=True,
         path=None,
         working_directory=None,
+        transport="json",
+        workers=None,
+        executor="thread",
+        timeout=None,
     ):
+        if transport not in ("json", "binary"):
+            raise ValueError("Unsupported transport: {}".format(transport))
+        if executor not in ("thread", "process"):
+            raise ValueError("Unsupported executor: {}".format(executor))
+
         self._package = None
         self._python = compas._os.select_python(python)
         self._url = url
@@ -128,7 +271,11 @@ class Proxy(object):
         self._profile = None
         self._path = path
         self._working_directory = working_directory
+        self._transport = transport
+        self._workers = workers
+        self._executor = executor
 
+        self.timeout = timeout
         self.service = service
         self.package = package
         self.autoreload = autoreload
@@ -148,6 +295,10 @@ class Proxy(object):
     def address(self):
         return "{}:{}".format(self._url, self._port)
 
+    @property
+    def transport(self):
+        return self._transport
+
     @property
     def profile(self):
         return self._profile
@@ -196,7 +347,7 @@ class Proxy(object):
         if self._implicitely_started_server:
             self.stop_server()
         else:
-            self._server.__close()
+            self._server("close")()
 
     def __getattr__(self, name):
         """Find server attributes (methods) corresponding to attributes that do not exist on the proxy itself.
@@ -223,6 +374,18 @@ class Proxy(object):
     # methods
     # ==========================================================================
 
+    def _server_proxy(self):
+        """Create a client for the server, for the selected transport.
+
+        Returns
+        -------
+        ServerProxy | :class:`compas.rpc.transport.BinaryServerProxy`
+
+        """
+        if self._transport == "binary":
+            return BinaryServerProxy(self.address)
+        return ServerProxy(self.address)
+
     def _try_reconnect(self):
         """Try and reconnect to an existing proxy server.
 
@@ -232,7 +395,7 @@ class Proxy(object):
             Instance of the proxy if reconnection succeeded, otherwise ``None``.
 
         """
-        server = ServerProxy(self.address)
+        server = self._server_proxy()
         try:
             server.ping()
         except Exception:
@@ -285,6 +448,10 @@ class Proxy(object):
             self._process.StartInfo.RedirectStandardError = self.capture_output
             self._process.StartInfo.FileName = self.python
             self._process.StartInfo.Arguments = "-m {0} --port {1} --{2}autoreload".format(self.service, self._port, "" if self.autoreload else "no-")
+            if self._transport != "json":
+                self._process.StartInfo.Arguments += " --transport {0}".format(self._transport)
+            if self._workers:
+                self._process.StartInfo.Arguments += " --workers {0} --executor {1}".format(self._workers, self._executor)
             self._process.Start()
         else:
             args = [
@@ -295,6 +462,10 @@ class Proxy(object):
                 str(self._port),
                 "--{}autoreload".format("" if self.autoreload else "no-"),
             ]
+            if self._transport != "json":
+                args += ["--transport", self._transport]
+            if self._workers:
+                args += ["--workers", str(self._workers), "--executor", self._executor]
             kwargs = dict(env=env)
             if self.capture_output:
                 kwargs["stdout"] = PIPE
@@ -307,7 +478,7 @@ class Proxy(object):
         # this starts the client side
         # it creates a proxy for the server
         # and tries to connect the proxy to the actual server
-        server = ServerProxy(self.address)
+        server = self._server_proxy()
 
         print("Starting a new proxy server...")
         success = False
@@ -347,6 +518,7 @@ class Proxy(object):
         print("Stopping the server proxy.")
         try:
             self._server.remote_shutdown()
+            self._server("close")()
         except Exception:
             pass
         self._terminate_process()
@@ -379,6 +551,93 @@ class Proxy(object):
         except Exception:
             pass
 
+    def batch(self):
+        """Create a batch of remote function calls that are sent to the server in a single request.
+
+        Returns
+        -------
+        :class:`ProxyBatch`
+            The batch, which is executed at the end of a ``with`` block,
+            or explicitly with :meth:`ProxyBatch.execute`.
+
+        Notes
+        -----
+        The calls are executed one after the other on the server, in the order in which they were made.
+        An error in one call does not affect the other calls.
+
+        """
+        return ProxyBatch(self)
+
+    def map(self, name, arguments):
+        """Call a remote function for every item in a list of arguments, in a single request.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, relative to :attr:`package`.
+        arguments : iterable
+            The arguments of the calls.
+            Every item is either a tuple of positional arguments,
+            or a single argument of any other type.
+
+        Returns
+        -------
+        list
+            The results of the calls.
+
+        Raises
+        ------
+        RPCServerError
+            If any of the calls failed on the server.
+
+        """
+        with self.batch() as batch:
+            function = getattr(batch, name)
+            calls = [function(*(args if isinstance(args, tuple) else (args,))) for args in arguments]
+        return [call.result() for call in calls]
+
+    def _execute(self, calls):
+        """Execute a list of calls in a single request, using the multicall extension of the server.
+
+        Parameters
+        ----------
+        calls : list[tuple[str, dict, :class:`BatchCall`]]
+            The name of the function, the input dictionary, and the result object of every call.
+
+        Returns
+        -------
+        None
+
+        """
+        if not calls:
+            return
+        multicall = MultiCall(self._server)
+        for name, idict, _ in calls:
+            if self._transport == "json":
+                idict = json.dumps(idict, cls=DataEncoder)
+            getattr(multicall, name)(*self._params(idict))
+
+        outputs = multicall()
+
+        for index, (_, _, result) in enumerate(calls):
+            result._done = True
+            try:
+                output = outputs[index]
+            except Fault as fault:
+                result._error = fault.faultString
+                continue
+            if self._transport == "json":
+                output = json.loads(output, cls=DataDecoder)
+            result._error = output["error"]
+            result._data = output["data"]
+
+    def _params(self, idict):
+        # the timeout is only sent if it is set, for compatibility with older servers
+        params = [idict, self._path or ""]
+        if self.timeout is not None:
+            params.append(self.timeout)
+        return params
+
     def _proxy(self, *args, **kwargs):
         """Callable replacement for the requested functionality.
 
@@ -410,25 +669,29 @@ class Proxy(object):
 
         """
         idict = {"args": args, "kwargs": kwargs}
-        istring = json.dumps(idict, cls=DataEncoder)
-        # it makes sense that there is a broken pipe error
-        # because the process is not the one receiving the feedback
-        # when there is a print statement on the server side
-        # this counts as output
-        # it should be sent as part of RPC communication
-        try:
-            ostring = self._function(istring, self._path or "")
-        except Exception:
-            # not clear what the point of this is
-            # self.stop_server()
-            # if this goes wrong, it means a Fault error was generated by the server
-            # no need to stop the server for this
-            raise
 
-        if not ostring:
-            raise RPCServerError("No output was generated.")
+        if self._transport == "binary":
+            # the binary transport (de)serializes the input and output dicts itself
+            result = self._function(*self._params(idict))
+            if not result:
+                raise RPCServerError("No output was generated.")
+        else:
+            istring = json.dumps(idict, cls=DataEncoder)
+            # it makes sense that there is a broken pipe error
+            # because the process is not the one receiving the feedback
+            # when there is a print statement on the server side
+            # this counts as output
+            # it should be sent as part of RPC communication
+            try:
+                ostring = self._function(*self._params(istring))
+            except Fault as fault:
+                # errors outside of the called function, for example timeouts
+                raise RPCServerError(fault.faultString)
+
+            if not ostring:
+                raise RPCServerError("No output was generated.")
 
-        result = json.loads(ostring, cls=DataDecoder)
+            result = json.loads(ostring, cls=DataDecoder)
 
         if result["error"]:
             raise RPCServerError(result["error"])
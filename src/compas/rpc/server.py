@@ -3,21 +3,124 @@ from __future__ import division
 from __future__ import print_function
 
 import threading
+import traceback
 
 try:
+    from SimpleXMLRPCServer import SimpleXMLRPCRequestHandler
     from SimpleXMLRPCServer import SimpleXMLRPCServer
 except ImportError:
+    from xmlrpc.server import SimpleXMLRPCRequestHandler
     from xmlrpc.server import SimpleXMLRPCServer
 
+try:
+    from SocketServer import StreamRequestHandler
+    from SocketServer import ThreadingMixIn
+    from SocketServer import ThreadingTCPServer
+except ImportError:
+    from socketserver import StreamRequestHandler
+    from socketserver import ThreadingMixIn
+    from socketserver import ThreadingTCPServer
+
+from .transport import read_message
+from .transport import write_message
+from .workers import ProcessWorkerPool
+from .workers import ThreadWorkerPool
+
+
+class WorkersMixIn(object):
+    """Mix-in for servers that execute the API calls dispatched to the registered instance in a pool of workers.
+
+    Parameters
+    ----------
+    workers : int, optional
+        The number of API calls that can be executed concurrently.
+        If None, the calls are executed one at a time, without a pool,
+        unless a `timeout` is specified.
+    executor : Literal["thread", "process"], optional
+        Execute the calls in a pool of threads, or in a pool of processes.
+        Processes can execute CPU-bound calls on multiple cores, but every process has its own copy of the registered instance.
+    timeout : float, optional
+        The maximum time in seconds for executing an API call.
+        Calls that take longer are cancelled and result in an error on the client side.
+        Clients can request a shorter timeout per call.
+
+    """
+
+    def _init_workers(self, workers=None, executor="thread", timeout=None):
+        if executor not in ("thread", "process"):
+            raise ValueError("Executor not supported: {}".format(executor))
+        self.workers = workers
+        self.executor = executor
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                cls = ProcessWorkerPool if self.executor == "process" else ThreadWorkerPool
+                self._pool = cls(self.instance, self.workers or 1)
+            return self._pool
+
+    def _call_instance(self, method, name, params):
+        # the client can request a timeout as third parameter of the call
+        timeout = self.timeout
+        if len(params) > 2 and params[2] is not None:
+            timeout = params[2] if timeout is None else min(timeout, params[2])
+        if self.workers is None and timeout is None:
+            with self._lock:
+                return getattr(self.instance, method)(name, params)
+        return self._get_pool().call(method, name, params, timeout)
+
+    def _start_workers(self):
+        # start the worker processes before serving requests
+        if self.workers is not None and self.executor == "process":
+            self._get_pool()
+
+    def server_close(self):
+        super(WorkersMixIn, self).server_close()
+        if self._pool is not None:
+            self._pool.shutdown()
 
-class Server(SimpleXMLRPCServer):
+
+class RequestHandler(SimpleXMLRPCRequestHandler):
+    """Handler for the connections to a :class:`Server`,
+    that keeps connections open for multiple requests (HTTP keep-alive).
+
+    """
+
+    protocol_version = "HTTP/1.1"
+
+
+class Server(WorkersMixIn, ThreadingMixIn, SimpleXMLRPCServer):
     """Version of a `SimpleXMLRPCServer` that can be cleanly terminated from the client side.
 
+    Parameters
+    ----------
+    address : tuple[str, int]
+        The host and port of the server.
+    workers : int, optional
+        The number of API calls that can be executed concurrently.
+        Default is to execute the calls one at a time.
+    executor : Literal["thread", "process"], optional
+        Execute the calls in a pool of threads, or in a pool of processes.
+    timeout : float, optional
+        The maximum time in seconds for executing an API call.
+
     Notes
     -----
     This class has to be used by a service to start the XMLRPC server in a way
     that can be pinged to check if the server is alive, and can be cleanly terminated.
 
+    Connections are kept open for multiple requests (HTTP keep-alive),
+    and every connection is handled in a separate thread.
+    By default, the API calls dispatched to the registered instance are executed one at a time.
+    With `workers`, they are executed concurrently, in a pool of threads or processes.
+    All workers are served on the same port.
+    With `timeout`, calls that take too long are cancelled, see :class:`compas.rpc.ProcessWorkerPool`
+    and :class:`compas.rpc.ThreadWorkerPool` for the details.
+    Multiple calls can be sent in a single request with ``system.multicall``.
+
     Examples
     --------
     .. code-block:: python
@@ -42,10 +145,31 @@ class Server(SimpleXMLRPCServer):
 
     """
 
+    daemon_threads = True
+
     def __init__(self, address, *args, **kwargs):
+        workers = kwargs.pop("workers", None)
+        executor = kwargs.pop("executor", "thread")
+        timeout = kwargs.pop("timeout", None)
+        self._init_workers(workers, executor, timeout)
+        if not args:
+            kwargs.setdefault("requestHandler", RequestHandler)
         super(Server, self).__init__(address, *args, **kwargs)
         self.register_function(self.ping)
         self.register_function(self.remote_shutdown)
+        self.register_multicall_functions()
+
+    def register_instance(self, instance, allow_dotted_names=False):
+        super(Server, self).register_instance(instance, allow_dotted_names)
+        self._start_workers()
+
+    def _dispatch(self, method, params):
+        if method in self.funcs:
+            return super(Server, self)._dispatch(method, params)
+        if hasattr(self.instance, "_dispatch"):
+            return self._call_instance("_dispatch", method, params)
+        with self._lock:
+            return super(Server, self)._dispatch(method, params)
 
     def ping(self):
         """Simple function used to check if a remote server can be reached.
@@ -77,3 +201,182 @@ class Server(SimpleXMLRPCServer):
 
     def _shutdown_thread(self):
         self.shutdown()
+
+
+class BinaryRequestHandler(StreamRequestHandler):
+    """Handler for the connections to a :class:`BinaryServer`.
+
+    Every connection is kept open until the client closes it,
+    and can be used for any number of requests.
+
+    """
+
+    disable_nagle_algorithm = True
+
+    def handle(self):
+        while True:
+            request = read_message(self.connection.recv)
+            if request is None:
+                break
+            try:
+                response = {"result": self.server._dispatch(request["method"], request["params"])}
+            except Exception:
+                response = {"fault": traceback.format_exc()}
+            write_message(self.connection.sendall, response)
+
+
+class BinaryServer(WorkersMixIn, ThreadingTCPServer):
+    """Server for the binary transport of :mod:`compas.rpc.transport`,
+    with the same interface as :class:`Server`.
+
+    Parameters
+    ----------
+    address : tuple[str, int]
+        The host and port of the server.
+    workers : int, optional
+        The number of API calls that can be executed concurrently.
+        Default is to execute the calls one at a time.
+    executor : Literal["thread", "process"], optional
+        Execute the calls in a pool of threads, or in a pool of processes.
+    timeout : float, optional
+        The maximum time in seconds for executing an API call.
+
+    Notes
+    -----
+    Requests are sent as length-prefixed binary frames over a plain TCP socket,
+    with numeric arrays as raw little-endian buffers instead of JSON text.
+    Use :class:`compas.rpc.Proxy` with ``transport="binary"`` to connect to this server.
+
+    Every client connection is handled in a separate thread,
+    and the API calls themselves are executed as with :class:`Server`.
+    Multiple calls can be sent in a single request with ``system.multicall``,
+    as with :class:`Server`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas.rpc import BinaryServer
+        from compas.rpc import Dispatcher
+
+
+        class DefaultService(Dispatcher):
+            pass
+
+
+        if __name__ == "__main__":
+            server = BinaryServer(("localhost", 8888))
+            server.register_instance(DefaultService())
+            server.serve_forever()
+
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address, *args, **kwargs):
+        workers = kwargs.pop("workers", None)
+        executor = kwargs.pop("executor", "thread")
+        timeout = kwargs.pop("timeout", None)
+        self._init_workers(workers, executor, timeout)
+        ThreadingTCPServer.__init__(self, address, BinaryRequestHandler, *args, **kwargs)
+        self.funcs = {}
+        self.instance = None
+        self.register_function(self.ping)
+        self.register_function(self.remote_shutdown)
+        self.register_function(self.system_multicall, "system.multicall")
+
+    def register_function(self, function, name=None):
+        """Register a function that can respond to API calls.
+
+        Parameters
+        ----------
+        function : callable
+            The function.
+        name : str, optional
+            The name of the function in API calls.
+            Default is the name of the function itself.
+
+        Returns
+        -------
+        callable
+            The function.
+
+        """
+        self.funcs[name or function.__name__] = function
+        return function
+
+    def register_instance(self, instance):
+        """Register an instance to respond to API calls that don't correspond to a registered function.
+
+        Parameters
+        ----------
+        instance : :class:`compas.rpc.Dispatcher` | object
+            If the instance is a dispatcher, calls are passed to its dispatch method.
+            Otherwise, calls are passed to the method with the same name.
+
+        Returns
+        -------
+        None
+
+        """
+        self.instance = instance
+        self._start_workers()
+
+    def _dispatch(self, method, params):
+        function = self.funcs.get(method)
+        if function is not None:
+            return function(*params)
+        if self.instance is None:
+            raise Exception('method "{}" is not supported'.format(method))
+        if hasattr(self.instance, "_dispatch_data"):
+            return self._call_instance("_dispatch_data", method, params)
+        with self._lock:
+            return getattr(self.instance, method)(*params)
+
+    def system_multicall(self, calls):
+        """Execute multiple API calls in a single request.
+
+        Parameters
+        ----------
+        calls : list[dict]
+            The calls, as dicts with the name of the function (``"methodName"``) and the list of arguments (``"params"``).
+
+        Returns
+        -------
+        list
+            Per call, a list with the result as single item,
+            or a dict with a ``"faultCode"`` and ``"faultString"`` if the call failed,
+            as with the XML-RPC multicall extension.
+
+        """
+        results = []
+        for call in calls:
+            try:
+                results.append([self._dispatch(call["methodName"], call["params"])])
+            except Exception:
+                results.append({"faultCode": 1, "faultString": traceback.format_exc()})
+        return results
+
+    def ping(self):
+        """Simple function used to check if a remote server can be reached.
+
+        Returns
+        -------
+        int
+            Always returns 1.
+
+        """
+        return 1
+
+    def remote_shutdown(self):
+        """Stop the server through a call from the client side.
+
+        Returns
+        -------
+        int
+            Always returns 1.
+
+        """
+        threading.Thread(target=self.shutdown).start()
+        return 1
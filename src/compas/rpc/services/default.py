@@ -1,10 +1,11 @@
-"""This script starts a XMLRPC server and registers the default service.
+"""This script starts a XMLRPC server (or a binary RPC server) and registers the default service.
 
 The server binds to all network interfaces (i.e. ``0.0.0.0``) and
 it listens to requests on port ``1753``.
 
 """
 
+from compas.rpc import BinaryServer
 from compas.rpc import Dispatcher
 from compas.rpc import Server
 
@@ -19,14 +20,15 @@ class DefaultService(Dispatcher):
         return "special"
 
 
-def start_service(port=1753, autoreload=True, **kwargs):
+def start_service(port=1753, autoreload=True, transport="json", workers=None, executor="thread", timeout=None, **kwargs):
     print("Starting default RPC service on port {0}...".format(port))
 
     # start the server on *localhost*
     # and listen to requests on port *1753*
     host = "0.0.0.0"
     address = host, port
-    server = Server(address)
+    cls = BinaryServer if transport == "binary" else Server
+    server = cls(address, workers=workers, executor=executor, timeout=timeout)
 
     # register an instance of the default service
     # the default service extends the base service
@@ -38,6 +40,8 @@ def start_service(port=1753, autoreload=True, **kwargs):
     server.register_instance(service)
 
     print("Listening{}...".format(" with autoreload of modules enabled" if autoreload else ""))
+    if workers:
+        print("Executing calls in {} {} workers".format(workers, executor))
     print("Press CTRL+C to abort")
     server.serve_forever()
 
@@ -74,6 +78,38 @@ if __name__ == "__main__":
         help="Do not autoreload modules",
     )
 
+    parser.add_argument(
+        "--transport",
+        action="store",
+        default="json",
+        choices=["json", "binary"],
+        help="RPC transport",
+    )
+
+    parser.add_argument(
+        "--workers",
+        action="store",
+        default=None,
+        type=int,
+        help="Number of calls executed concurrently",
+    )
+
+    parser.add_argument(
+        "--executor",
+        action="store",
+        default="thread",
+        choices=["thread", "process"],
+        help="Execute calls in a pool of threads or processes",
+    )
+
+    parser.add_argument(
+        "--timeout",
+        action="store",
+        default=None,
+        type=float,
+        help="Maximum time in seconds for executing a call",
+    )
+
     parser.set_defaults(
         autoreload=True,
         func=start_service,
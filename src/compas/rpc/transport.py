@@ -0,0 +1,429 @@
+"""Binary transport for RPC calls.
+
+Messages are sent as length-prefixed frames over a plain TCP socket.
+Every frame consists of a JSON header with the structure of the message,
+followed by a number of binary blocks with the contents of numeric arrays,
+as raw little-endian buffers.
+
+The following values are sent as binary blocks instead of as JSON text:
+
+* NumPy arrays with a numeric or boolean data type;
+* lists and tuples of (at least ``MIN_BLOCK_SIZE``) floats, or of integers;
+* lists and tuples of lists or tuples of the same length, with floats or integers;
+* dicts of which all values are lists or tuples of floats, or of integers (for example the faces of a mesh);
+* numeric columns of dicts of which all values are dicts with the same keys (for example the vertices of a mesh).
+
+On the receiving side, all blocks are converted back to (nested) lists and dicts,
+exactly as they would have been received through the JSON transport.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+import select
+import socket
+import struct
+from itertools import chain
+
+from compas.data import DataDecoder
+from compas.data import DataEncoder
+from compas.data._buffers import INT_MAX
+from compas.data._buffers import INT_MIN
+from compas.data._buffers import INT_TYPES
+from compas.data._buffers import _flatten_rows
+from compas.data._buffers import _frombytes
+from compas.data._buffers import _json_key
+from compas.data._buffers import _ndarray_tobytes
+from compas.data._buffers import _reshape
+from compas.data._buffers import _tobytes
+from compas.data._buffers import basestring
+from compas.data._buffers import long
+from compas.rpc.errors import RPCServerError
+
+try:
+    import numpy as np
+except (ImportError, SyntaxError):
+    np = None
+
+__all__ = ["BinaryServerProxy", "dumps", "loads", "read_message", "write_message"]
+
+MIN_BLOCK_SIZE = 16
+CHUNK_SIZE = 1 << 20
+ALIGNMENT = 8
+
+PREFIX = struct.Struct("<QI")
+
+
+# ==============================================================================
+# Encoding
+# ==============================================================================
+
+
+class _Encoder(object):
+    # convert an object to a JSON-serializable tree with references to binary blocks
+
+    def __init__(self):
+        self.blocks = []
+        self.size = 0
+        self.default = DataEncoder().default
+
+    def block(self, typecode, data, **info):
+        info["__block__"] = [self.size, len(data)]
+        info["type"] = typecode
+        self.blocks.append(data)
+        self.size += len(data)
+        padding = -len(data) % ALIGNMENT
+        if padding:
+            self.blocks.append(b"\0" * padding)
+            self.size += padding
+        return info
+
+    def typecode(self, values):
+        types = set(map(type, values))
+        if types == set([float]):
+            return "d"
+        if types and types <= INT_TYPES and INT_MIN <= min(values) and max(values) <= INT_MAX:
+            return "q"
+
+    def pack_list(self, values):
+        if len(values) < MIN_BLOCK_SIZE:
+            return
+        if set(map(type, values)) <= set([list, tuple]):
+            rows = _flatten_rows(values)
+            if not rows:
+                return
+            flat, size = rows
+            typecode = self.typecode(flat)
+            if typecode:
+                return self.block(typecode, _tobytes(typecode, flat), shape=[len(values), size])
+            return
+        typecode = self.typecode(values)
+        if typecode:
+            return self.block(typecode, _tobytes(typecode, values))
+
+    def pack_dict(self, obj):
+        if len(obj) < MIN_BLOCK_SIZE:
+            return
+        values = list(obj.values())
+        types = set(map(type, values))
+        if types <= set([list, tuple]):
+            flat = list(chain.from_iterable(values))
+            typecode = self.typecode(flat)
+            if not typecode:
+                return
+            sizes = [len(value) for value in values]
+            return {
+                "__ragged__": [_json_key(key) for key in obj],
+                "sizes": self.block("q", _tobytes("q", sizes)),
+                "values": self.block(typecode, _tobytes(typecode, flat)),
+            }
+        if types == set([dict]):
+            names = list(values[0])
+            if not all(len(value) == len(names) for value in values):
+                return
+            try:
+                columns = [[value[name] for value in values] for name in names]
+            except KeyError:
+                return
+            packed = [self.pack_list(column) for column in columns]
+            if not any(packed):
+                return
+            return {
+                "__table__": [_json_key(key) for key in obj],
+                "names": names,
+                "columns": [block or self.encode(column) for block, column in zip(packed, columns)],
+            }
+
+    def pack_ndarray(self, obj):
+        packed = _ndarray_tobytes(obj)
+        if not packed:
+            return self.encode(obj.tolist())
+        typecode, data = packed
+        return self.block(typecode, data, shape=list(obj.shape))
+
+    def encode(self, obj):
+        if obj is None or isinstance(obj, (basestring, bool, int, long, float)):
+            return obj
+        if isinstance(obj, (list, tuple)):
+            packed = self.pack_list(obj)
+            if packed:
+                return packed
+            return [self.encode(item) for item in obj]
+        if isinstance(obj, dict):
+            packed = self.pack_dict(obj)
+            if packed:
+                return packed
+            return {key: self.encode(value) for key, value in obj.items()}
+        if np is not None and isinstance(obj, np.ndarray):
+            return self.pack_ndarray(obj)
+        return self.encode(self.default(obj))
+
+
+class _Decoder(DataDecoder):
+    # reconstruct the blocks referenced in the JSON tree of a message,
+    # and the COMPAS data objects, as the JSON decoder would
+
+    def __init__(self, blocks, *args, **kwargs):
+        super(_Decoder, self).__init__(*args, **kwargs)
+        self.blocks = blocks
+
+    def object_hook(self, o):
+        if "__block__" in o:
+            offset, size = o["__block__"]
+            values = _frombytes(o["type"], self.blocks[offset : offset + size])
+            if "shape" in o:
+                if not o["shape"]:
+                    # zero-dimensional array
+                    return values[0]
+                values = _reshape(values, o["shape"])
+            return values
+        if "__ragged__" in o:
+            values = o["values"]
+            ends = []
+            end = 0
+            for size in o["sizes"]:
+                end += size
+                ends.append(end)
+            starts = [0] + ends[:-1]
+            return {key: values[start:end] for key, start, end in zip(o["__ragged__"], starts, ends)}
+        if "__table__" in o:
+            names = o["names"]
+            rows = zip(o["__table__"], zip(*o["columns"]))
+            if "dtype" in names:
+                hook = super(_Decoder, self).object_hook
+                return {key: hook(dict(zip(names, row))) for key, row in rows}
+            return {key: dict(zip(names, row)) for key, row in rows}
+        return super(_Decoder, self).object_hook(o)
+
+
+def dumps(obj):
+    """Serialize an object to a list of buffers.
+
+    Parameters
+    ----------
+    obj : object
+        Any object that can be serialized with :class:`compas.data.DataEncoder`.
+
+    Returns
+    -------
+    list[bytes]
+        The buffers of the message: the length prefix, the JSON header, and the binary blocks, including padding.
+
+    """
+    encoder = _Encoder()
+    tree = encoder.encode(obj)
+    header = json.dumps(tree, cls=DataEncoder, separators=(",", ":"))
+    if not isinstance(header, bytes):
+        header = header.encode("utf-8")
+    header += b" " * (-(PREFIX.size + len(header)) % ALIGNMENT)
+    return [PREFIX.pack(len(header) + encoder.size, len(header)), header] + encoder.blocks
+
+
+def loads(header, data):
+    """Deserialize a message from its header and blocks.
+
+    Parameters
+    ----------
+    header : bytes
+        The JSON header of the message.
+    data : bytes | bytearray | memoryview
+        The binary blocks of the message, including padding.
+
+    Returns
+    -------
+    object
+
+    """
+    if not isinstance(header, str):
+        header = bytes(header).decode("utf-8")
+    return _Decoder(data).decode(header)
+
+
+# ==============================================================================
+# Framing
+# ==============================================================================
+
+
+def _recv(read, size):
+    # read exactly size bytes, in chunks
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    offset = 0
+    while offset < size:
+        chunk = read(min(CHUNK_SIZE, size - offset))
+        if not chunk:
+            if offset == 0:
+                return None
+            raise EOFError("Connection closed in the middle of a message.")
+        view[offset : offset + len(chunk)] = chunk
+        offset += len(chunk)
+    return buffer
+
+
+def read_message(read):
+    """Read a single message.
+
+    Parameters
+    ----------
+    read : callable
+        A function that reads at most a given number of bytes from a stream or socket,
+        for example ``socket.recv`` or ``file.read``.
+
+    Returns
+    -------
+    object | None
+        The deserialized message, or None if the stream was closed before a new message.
+
+    """
+    prefix = _recv(read, PREFIX.size)
+    if prefix is None:
+        return None
+    length, size = PREFIX.unpack(bytes(prefix))
+    message = _recv(read, length)
+    if message is None:
+        raise EOFError("Connection closed in the middle of a message.")
+    view = memoryview(message)
+    return loads(view[:size].tobytes(), view[size:])
+
+
+def write_message(write, obj):
+    """Write a single message.
+
+    Parameters
+    ----------
+    write : callable
+        A function that writes all given bytes to a stream or socket,
+        for example ``socket.sendall`` or ``file.write``.
+    obj : object
+        The message.
+
+    Returns
+    -------
+    None
+
+    """
+    parts = dumps(obj)
+    # combine the small parts to avoid sending many small packets
+    small = b"".join(part for part in parts if len(part) < CHUNK_SIZE)
+    if len(small) == sum(len(part) for part in parts):
+        write(small)
+        return
+    buffer = []
+    for part in parts:
+        if len(part) < CHUNK_SIZE:
+            buffer.append(part)
+            continue
+        if buffer:
+            write(b"".join(buffer))
+            buffer = []
+        write(part)
+    if buffer:
+        write(b"".join(buffer))
+
+
+# ==============================================================================
+# Client
+# ==============================================================================
+
+
+class _Method(object):
+    def __init__(self, request, name):
+        self._request = request
+        self._name = name
+
+    def __getattr__(self, name):
+        return _Method(self._request, "{}.{}".format(self._name, name))
+
+    def __call__(self, *params):
+        return self._request(self._name, params)
+
+
+class BinaryServerProxy(object):
+    """Client for a :class:`compas.rpc.BinaryServer`, with the same interface as :class:`xmlrpc.client.ServerProxy`.
+
+    Parameters
+    ----------
+    address : str
+        The address of the server, for example ``"http://127.0.0.1:1753"``.
+        The scheme, if any, is ignored.
+    timeout : float, optional
+        Timeout in seconds for connecting to the server.
+
+    Notes
+    -----
+    The connection to the server is opened on the first call, and kept open for subsequent calls.
+
+    """
+
+    def __init__(self, address, timeout=None):
+        address = address.split("://")[-1]
+        host, _, port = address.rpartition(":")
+        self._host = host
+        self._port = int(port)
+        self._timeout = timeout
+        self._socket = None
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Method(self._request, name)
+
+    def __call__(self, attr):
+        if attr == "close":
+            return self._close
+        raise AttributeError("Attribute {} not found".format(attr))
+
+    def _connect(self):
+        sock = socket.create_connection((self._host, self._port), self._timeout)
+        sock.settimeout(None)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket = sock
+
+    def _close(self):
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            finally:
+                self._socket = None
+
+    def _is_stale(self):
+        # a connection that was closed by the server while it was kept open
+        # is readable before a request was sent, without any data
+        try:
+            readable, _, _ = select.select([self._socket], [], [], 0)
+            return bool(readable) and not self._socket.recv(1, socket.MSG_PEEK)
+        except (socket.error, ValueError):
+            return True
+
+    def _request(self, method, params):
+        if self._socket is not None and self._is_stale():
+            self._close()
+        reused = self._socket is not None
+        if not reused:
+            self._connect()
+        try:
+            write_message(self._socket.sendall, {"method": method, "params": list(params)})
+        except socket.timeout:
+            self._close()
+            raise
+        except socket.error:
+            self._close()
+            if not reused:
+                raise
+            # the server closed the connection that was kept open before the request was sent
+            return self._request(method, params)
+        try:
+            response = read_message(self._socket.recv)
+            if response is None:
+                raise EOFError("Connection closed by the server.")
+        except (socket.error, EOFError):
+            # the request may already have been executed by the server,
+            # so it is not sent again
+            self._close()
+            raise
+        if "fault" in response:
+            raise RPCServerError(response["fault"])
+        return response["result"]
@@ -0,0 +1,279 @@
+"""Pools of workers for executing API calls concurrently on a server.
+
+Both pools execute a dispatch method of the service instance that is registered with a server,
+for example :meth:`compas.rpc.Dispatcher._dispatch`.
+The thread pool shares the service instance between all workers.
+The process pool starts a number of worker processes that each have their own copy of the service instance,
+such that CPU-bound calls can use multiple cores.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import sys
+import threading
+import time
+import traceback
+
+from compas.rpc.errors import RPCServerError
+
+try:
+    from Queue import Empty
+    from Queue import Queue
+except ImportError:
+    from queue import Empty
+    from queue import Queue
+
+__all__ = ["ThreadWorkerPool", "ProcessWorkerPool"]
+
+
+def _timeout_error(name, timeout):
+    return RPCServerError("The call to {} did not finish within {} seconds and was cancelled.".format(name, timeout))
+
+
+class ThreadWorkerPool(object):
+    """Pool of threads for executing API calls.
+
+    Parameters
+    ----------
+    instance : :class:`compas.rpc.Dispatcher`
+        The service instance.
+    workers : int
+        The number of threads.
+
+    Notes
+    -----
+    Calls that are still waiting for a free thread when their timeout expires, or when the pool is stopped, are cancelled.
+    Calls that are already running at that time cannot be interrupted.
+    Their result is discarded, but they keep occupying a thread until they are finished.
+
+    """
+
+    def __init__(self, instance, workers):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.instance = instance
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        # before Python 3.9, the executor cannot cancel the calls that have not started when it is shut down
+        # the futures of these calls are therefore kept until they are done
+        self._futures = None if sys.version_info >= (3, 9) else set()
+        self._lock = threading.Lock()
+
+    def _track(self, future):
+        with self._lock:
+            self._futures.add(future)
+
+        def discard(future):
+            with self._lock:
+                self._futures.discard(future)
+
+        future.add_done_callback(discard)
+
+    def call(self, method, name, params, timeout=None):
+        """Execute an API call.
+
+        Parameters
+        ----------
+        method : str
+            The name of the dispatch method of the service instance.
+        name : str
+            The name of the API function.
+        params : list
+            The parameters of the API call.
+        timeout : float, optional
+            The maximum time in seconds to wait for the result.
+
+        Returns
+        -------
+        object
+            The result of the dispatch method.
+
+        Raises
+        ------
+        RPCServerError
+            If the call timed out, or if it was cancelled because the pool was stopped.
+
+        """
+        from concurrent.futures import CancelledError
+        from concurrent.futures import TimeoutError
+
+        future = self._executor.submit(getattr(self.instance, method), name, params)
+        if self._futures is not None:
+            self._track(future)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise _timeout_error(name, timeout)
+        except CancelledError:
+            raise RPCServerError("The call to {} was cancelled because the server is shutting down.".format(name))
+
+    def shutdown(self):
+        """Stop the pool, and cancel all calls that have not started yet.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._futures is None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            return
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+        self._executor.shutdown(wait=False)
+
+
+def _work(instance, connection):
+    # main loop of a worker process
+    while True:
+        try:
+            request = connection.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if request is None:
+            break
+        method, name, params = request
+        try:
+            response = True, getattr(instance, method)(name, params)
+        except Exception:
+            response = False, traceback.format_exc()
+        connection.send(response)
+
+
+class ProcessWorkerPool(object):
+    """Pool of processes for executing API calls.
+
+    Parameters
+    ----------
+    instance : :class:`compas.rpc.Dispatcher`
+        The service instance.
+        Every worker process gets its own copy of the instance.
+    workers : int
+        The number of processes.
+
+    Notes
+    -----
+    The parameters and results of the calls are sent to and from the worker processes through pipes,
+    and should therefore be picklable.
+
+    Calls that are still waiting for a free worker when their timeout expires are cancelled.
+    If a call is running when its timeout expires, the worker process is terminated and replaced by a new one.
+
+    """
+
+    def __init__(self, instance, workers):
+        self.instance = instance
+        self.workers = workers
+        self._idle = Queue()
+        self._busy = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(workers):
+            self._idle.put(self._start())
+
+    def _start(self):
+        import multiprocessing
+
+        connection, child = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=_work, args=(self.instance, child))
+        process.daemon = True
+        process.start()
+        child.close()
+        return process, connection
+
+    def _stop(self, worker):
+        process, connection = worker
+        try:
+            connection.close()
+        finally:
+            process.terminate()
+            process.join(1)
+
+    def _release(self, worker):
+        with self._lock:
+            self._busy.discard(worker)
+            if self._closed:
+                self._stop(worker)
+            else:
+                self._idle.put(worker)
+
+    def call(self, method, name, params, timeout=None):
+        """Execute an API call.
+
+        Parameters
+        ----------
+        method : str
+            The name of the dispatch method of the service instance.
+        name : str
+            The name of the API function.
+        params : list
+            The parameters of the API call.
+        timeout : float, optional
+            The maximum time in seconds to wait for the result.
+
+        Returns
+        -------
+        object
+            The result of the dispatch method.
+
+        Raises
+        ------
+        RPCServerError
+            If the call timed out, or if the worker process crashed.
+
+        """
+        start = time.time()
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except Empty:
+            raise _timeout_error(name, timeout)
+        with self._lock:
+            self._busy.add(worker)
+
+        process, connection = worker
+        try:
+            connection.send((method, name, params))
+            remaining = None if timeout is None else max(0, timeout - (time.time() - start))
+            if not connection.poll(remaining):
+                raise _timeout_error(name, timeout)
+            success, result = connection.recv()
+        except (RPCServerError, EOFError, IOError, OSError) as error:
+            # the state of the worker is unknown, so it is replaced
+            with self._lock:
+                self._busy.discard(worker)
+            self._stop(worker)
+            if not self._closed:
+                self._idle.put(self._start())
+            if isinstance(error, RPCServerError):
+                raise
+            raise RPCServerError("The worker process executing the call to {} stopped unexpectedly.".format(name))
+
+        self._release(worker)
+        if not success:
+            raise RPCServerError(result)
+        return result
+
+    def shutdown(self):
+        """Stop all worker processes, and cancel all calls that are still running.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            self._closed = True
+            workers = list(self._busy)
+            while True:
+                try:
+                    workers.append(self._idle.get_nowait())
+                except Empty:
+                    break
+        for worker in workers:
+            self._stop(worker)
@@ -60,10 +60,10 @@ def _closest_faces(vertices, faces, nmax, max_distance):
             from compas.geometry import KDTree
 
             tree = KDTree(points)
-            closest = [tree.nearest_neighbors(point, k) for point in points]
+            distances, closest = tree.query(points, k)
             if max_distance is None:
                 return closest
-            return [[index for xyz, index, d in nnbrs if d < max_distance] for nnbrs in closest]
+            return [[index for index, d in zip(indices, ds) if d < max_distance] for indices, ds in zip(closest, distances)]
 
 
 def _face_adjacency(vertices, faces, nmax=None, max_distance=None):
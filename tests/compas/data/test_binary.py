@@ -0,0 +1,110 @@
+import pytest
+
+import compas
+from compas.data import binary_dump
+from compas.data import binary_dumps
+from compas.data import binary_load
+from compas.data import binary_loads
+from compas.datastructures import Graph
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Vector
+
+
+def test_binary_native():
+    before = [[], (), {}, "", "ü", 1, -(2**40), 2**70, 1.0, True, False, None, {1: "a", 2.5: "b", None: "c"}]
+    after = binary_loads(binary_dumps(before))
+    assert after == compas.json_loads(compas.json_dumps(before))
+
+
+def test_binary_arrays():
+    before = {
+        "floats": [0.1 * i for i in range(20)],
+        "ints": list(range(-500, 500)),
+        "large": [2**40] * 10,
+        "points": [[i, i + 1, i + 2] for i in range(10)],
+        "ragged": {str(i): list(range(i % 5)) for i in range(10)},
+        "table": {str(i): {"x": float(i), "y": 2.0 * i, "z": "none"} for i in range(10)},
+        "mixed": [1, 2.0, "3", None, 4, 5, 6, 7, 8],
+    }
+    after = binary_loads(binary_dumps(before))
+    assert after == compas.json_loads(compas.json_dumps(before))
+
+
+def test_binary_primitive():
+    before = Point(0, 0, 0)
+    after = binary_loads(binary_dumps(before))  # type: Point
+    assert before.__dtype__ == after.__dtype__
+    assert all(a == b for a, b in zip(before, after))
+    assert before.guid == after.guid
+
+
+def test_binary_minimal():
+    before = Box(frame=Frame(Point(0, 0, 0), Vector(1, 0, 0), Vector(0, 1, 0)), xsize=1, ysize=2, zsize=3)
+    after = binary_loads(binary_dumps(before, minimal=True))  # type: Box
+    assert before.__dtype__ == after.__dtype__
+    assert after.ysize == 2
+    assert before.guid != after.guid
+
+
+def test_binary_graph():
+    before = Graph()
+    a = before.add_node()
+    b = before.add_node()
+    before.add_edge(a, b, weight=1.5)
+    after = binary_loads(binary_dumps(before))  # type: Graph
+    assert before.__dtype__ == after.__dtype__
+    assert all(after.has_node(node) for node in before.nodes())
+    assert after.edge_attribute((a, b), "weight") == 1.5
+    assert before.guid == after.guid
+
+
+def test_binary_mesh(tmp_path):
+    before = Mesh.from_meshgrid(dx=10, nx=10)
+    before.name = "grid"
+    before.vertex_attribute(0, "z", 1.0 / 3.0)
+    filepath = str(tmp_path / "mesh.bin")
+    before.to_binary(filepath)
+    after = Mesh.from_binary(filepath)
+    assert before.__dtype__ == after.__dtype__
+    assert before.name == after.name
+    assert before.guid == after.guid
+    assert after.vertex_attribute(0, "z") == 1.0 / 3.0
+    assert all(before.vertex_coordinates(vertex) == after.vertex_coordinates(vertex) for vertex in before.vertices())
+    assert all(before.face_vertices(face) == after.face_vertices(face) for face in before.faces())
+    assert len(binary_dumps(before)) < len(compas.json_dumps(before))
+
+
+def test_binary_file_type(tmp_path):
+    filepath = str(tmp_path / "point.bin")
+    binary_dump(Point(1, 2, 3), filepath)
+    assert binary_load(filepath) == [1, 2, 3]
+    with pytest.raises(TypeError):
+        Mesh.from_binary(filepath)
+
+
+def test_binary_invalid():
+    with pytest.raises(ValueError):
+        binary_loads(compas.json_dumps([1, 2, 3]).encode())
+    with pytest.raises(ValueError):
+        binary_loads(binary_dumps([1.0] * 100)[:-1])
+
+
+try:
+    import numpy as np
+
+    def test_binary_numpy():
+        before = [
+            np.array([1, 2, 3]),
+            np.array([[1.0, 2.0], [3.0, 4.0]], dtype=np.float32),
+            np.array([True, False]),
+            np.float64(1.0),
+            np.int32(1),
+        ]
+        after = binary_loads(binary_dumps(before))
+        assert after == [[1, 2, 3], [[1.0, 2.0], [3.0, 4.0]], [True, False], 1.0, 1]
+
+except ImportError:
+    pass
@@ -1,4 +1,5 @@
 from compas.data import Data
+from compas.geometry import Point
 
 
 class TestData(Data):
@@ -61,3 +62,33 @@ def test_copy():
 
     assert data.to_jsonstring(minimal=True) == data.copy().to_jsonstring(minimal=True)
     assert data.to_jsonstring(minimal=True) == data.copy(copy_guid=False).to_jsonstring(minimal=True)
+
+
+class WeightedPoint(Point):
+    def __init__(self, x, y, z=0.0, weight=1.0, name=None):
+        super(WeightedPoint, self).__init__(x, y, z, name=name)
+        self.weight = weight
+
+    @property
+    def __data__(self):
+        return {"x": self.x, "y": self.y, "z": self.z, "weight": self.weight}
+
+    @classmethod
+    def __from_data__(cls, data):
+        return cls(**data)
+
+
+def test_copy_state():
+    point = Point(1, 2, 3, name="point")
+    other = point.copy()
+    assert type(other) is Point
+    assert other.__data__ == point.__data__
+    assert other.name == "point"
+    assert other.guid != point.guid
+    assert point.copy(copy_guid=True).guid == point.guid
+
+    # subclasses that define their own data are copied through their data
+    point = WeightedPoint(1, 2, 3, weight=2.0)
+    other = point.copy()
+    assert type(other) is WeightedPoint
+    assert other.weight == 2.0
@@ -1,4 +1,12 @@
+import gc
+import weakref
+
+from compas.colors import Color
 from compas.data import Data
+from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Pointcloud
+from compas.geometry import Vector
 
 
 def test_string_casting():
@@ -11,3 +19,16 @@ def test_string_casting():
 
     test = TestClass(42)
     assert str(test) == "TestClass 42"
+
+
+def test_weakref():
+    for obj in (Point(1, 2, 3), Vector(1, 0, 0), Frame.worldXY(), Color.red(), Pointcloud([[0, 0, 0]])):
+        ref = weakref.ref(obj)
+        assert ref() is obj
+
+    cache = weakref.WeakValueDictionary()
+    point = Point(1, 2, 3)
+    cache[point.guid] = point
+    del point
+    gc.collect()
+    assert len(cache) == 0
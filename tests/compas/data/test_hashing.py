@@ -0,0 +1,72 @@
+import hashlib
+
+import pytest
+
+import compas
+from compas.datastructures import Graph
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Point
+
+
+@pytest.fixture
+def mesh():
+    mesh = Mesh.from_meshgrid(10, 20)
+    for vertex in mesh.vertices():
+        mesh.vertex_attribute(vertex, "weight", 0.1 * vertex)
+    return mesh
+
+
+@pytest.fixture
+def graph():
+    return Graph.from_obj(compas.get("lines.obj"))
+
+
+def test_sha256_json(mesh, graph):
+    for obj in [mesh, graph, Point(1, 2, 3), Frame.worldXY(), Box(1)]:
+        assert obj.sha256() == hashlib.sha256(compas.json_dumps(obj).encode()).digest()
+        assert obj.sha256(as_string=True) == hashlib.sha256(compas.json_dumps(obj).encode()).hexdigest()
+
+
+def test_sha256_structural(mesh, graph):
+    for obj in [mesh, graph, Point(1, 2, 3), Box(1)]:
+        other = obj.copy()
+        assert other.guid != obj.guid
+        assert other.sha256() != obj.sha256()
+        assert other.sha256(version=2) == obj.sha256(version=2)
+
+
+def test_sha256_structural_changes(mesh):
+    other = mesh.copy()
+    other.vertex_attribute(0, "weight", 1.0)
+    assert other.sha256(version=2) != mesh.sha256(version=2)
+
+    other = mesh.copy()
+    other.name = "other"
+    assert other.sha256(version=2) == mesh.sha256(version=2)
+
+    assert Point(1, 2, 3).sha256(version=2) != Point(1, 2, 4).sha256(version=2)
+
+
+def test_sha256_structural_order():
+    a = Graph()
+    a.add_node(0, x=0.0, y=1.0)
+    a.add_node(1, y=1.0, x=0.0)
+    b = Graph()
+    b.add_node(1, x=0.0, y=1.0)
+    b.add_node(0, y=1.0, x=0.0)
+    assert a.sha256(version=2) == b.sha256(version=2)
+
+
+def test_sha256_version(mesh):
+    with pytest.raises(ValueError):
+        mesh.sha256(version=3)
+
+
+def test_sha256_structural_mixed_keys(mesh):
+    mesh.attributes["table"] = {i: {0: i, "a": 0.5 * i} for i in range(10)}
+    other = mesh.copy()
+    assert mesh.sha256(version=2) == other.sha256(version=2)
+    other.attributes["table"][9][0] = 0
+    assert mesh.sha256(version=2) != other.sha256(version=2)
@@ -1,5 +1,14 @@
+import copy
 import pickle
+from compas.colors import Color
 from compas.geometry import Frame
+from compas.geometry import Point
+from compas.geometry import Quaternion
+from compas.geometry import Vector
+
+
+class WeightedPoint(Point):
+    pass
 
 
 def test_pickling():
@@ -11,3 +20,22 @@ def test_pickling():
     assert all(a == b for a, b in zip(f1.yaxis, f2.yaxis))
     assert all(a == b for a, b in zip(f1.zaxis, f2.zaxis))
     assert f1.guid == f2.guid
+
+
+def test_pickling_slots():
+    # the attributes of primitives are stored in slots, those of subclasses can be stored in the instance dict
+    point = WeightedPoint(1.0, 2.0, 3.0, name="point")
+    point.weight = 2.0
+    assert not hasattr(Point(1.0, 2.0, 3.0), "__dict__")
+
+    for other in (pickle.loads(pickle.dumps(point, protocol=pickle.HIGHEST_PROTOCOL)), copy.deepcopy(point)):
+        assert type(other) is WeightedPoint
+        assert other == point
+        assert other.weight == 2.0
+        assert other.name == "point"
+        assert other.guid == point.guid
+
+    for obj in (Vector(1.0, 2.0, 3.0), Quaternion(1.0, 0.0, 0.0, 0.0), Color(1.0, 0.5, 0.0)):
+        other = pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+        assert other == obj
+        assert other.guid == obj.guid
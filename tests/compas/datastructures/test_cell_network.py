@@ -1,6 +1,7 @@
 import pytest
 from compas.datastructures import CellNetwork
 from compas.geometry import Point
+from compas.geometry import Translation
 
 
 @pytest.fixture
@@ -76,6 +77,24 @@ def test_cell_network_data(example_cell_network):
     assert other.face_attribute(11, "canopy") is True
 
 
+def test_cell_network_copy(example_cell_network):
+    ds = example_cell_network
+    ds.cell_attribute(1, "heated", True)
+    ds.edge_attribute((12, 14), "column", True)
+
+    other = ds.copy()
+    assert other.__data__ == ds.__data__
+    assert other.number_of_cells() == ds.number_of_cells()
+    assert other.edge_attribute((12, 14), "column") is True
+
+    other.cell_attribute(1, "heated", False)
+    other.edge_attribute((12, 14), "column", False)
+    other.delete_cell(1)
+    assert ds.cell_attribute(1, "heated") is True
+    assert ds.edge_attribute((12, 14), "column") is True
+    assert 1 in ds.cells()
+
+
 def test_cell_network_boundary(example_cell_network):
     ds = example_cell_network
     assert set(ds.cells_on_boundaries()) == {0, 1}
@@ -85,6 +104,13 @@ def test_cell_network_boundary(example_cell_network):
     assert set(ds.nonmanifold_edges()) == {(6, 7), (4, 5), (5, 6), (7, 4)}
 
 
+def test_cell_network_transform(example_cell_network):
+    ds = example_cell_network
+    points = ds.vertices_attributes("xyz")
+    ds.transform(Translation.from_vector([1, 2, 3]))
+    assert ds.vertices_attributes("xyz") == [[x + 1, y + 2, z + 3] for x, y, z in points]
+
+
 # ==============================================================================
 # Conversion
 # ==============================================================================
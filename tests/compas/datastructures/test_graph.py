@@ -7,6 +7,9 @@ import pytest
 import compas
 from compas.datastructures import Graph
 from compas.geometry import Pointcloud
+from compas.geometry import Rotation
+from compas.geometry import transform_points
+from compas.tolerance import TOL
 
 # ==============================================================================
 # Fixtures
@@ -86,6 +89,18 @@ def test_graph_from_pointcloud():
         assert graph.degree(node) <= 3
 
 
+def test_graph_from_pointcloud_nearest():
+    cloud = Pointcloud.from_bounds(random.random(), random.random(), random.random(), random.randint(10, 100))
+    graph = Graph.from_pointcloud(cloud=cloud, degree=3, nearest=True)
+    assert graph.number_of_nodes() == len(cloud)
+    for node in graph.nodes():
+        assert graph.degree(node) >= 3
+        point = graph.node_coordinates(node)
+        distances = sorted(graph.edge_length((node, nbr)) for nbr in graph.neighbors(node))
+        others = sorted(cloud.points, key=lambda other: other.distance_to_point(point))
+        assert distances[0] == pytest.approx(others[1].distance_to_point(point))
+
+
 # ==============================================================================
 # Data
 # ==============================================================================
@@ -117,6 +132,19 @@ def test_graph_data2():
         assert Graph.validate_data(other.__data__)
 
 
+def test_graph_copy(graph):
+    graph.edge_attribute(list(graph.edges())[0], "weight", 2.0)
+    other = graph.copy()
+    assert other.__data__ == graph.__data__
+    assert other.adjacency == graph.adjacency
+
+    edge = list(other.edges())[0]
+    other.edge_attribute(edge, "weight", 1.0)
+    other.delete_node(0)
+    assert graph.edge_attribute(edge, "weight") == 2.0
+    assert graph.has_node(0)
+
+
 def test_shortest_path():
     graph = Graph()
     graph.add_edge(1, 2)
@@ -306,3 +334,31 @@ def test_planar(k5_graph, planar_graph):
         k5_graph.delete_edge(("a", "b"))  # Delete (a, b) edge to make K5 planar
         assert k5_graph.is_planar() is True
         assert planar_graph.is_planar() is True
+
+
+def test_crossings():
+    graph = Graph()
+    for key, xyz in enumerate([[0, 0, 0], [1, 1, 0], [0, 1, 0], [1, 0, 0], [2, 0, 0], [2, 1, 0]]):
+        graph.add_node(key, x=xyz[0], y=xyz[1], z=xyz[2])
+    graph.add_edge(0, 1)
+    graph.add_edge(2, 3)
+    graph.add_edge(1, 5)
+    graph.add_edge(3, 4)
+    graph.add_edge(1, 3)
+
+    assert graph.is_crossed()
+    assert graph.count_crossings() == 1
+    assert graph.find_crossings() == [((0, 1), (2, 3))]
+
+    graph.delete_edge((2, 3))
+    assert not graph.is_crossed()
+    assert graph.find_crossings() == []
+
+
+def test_transform(graph):
+    graph.update_default_node_attributes(z=1.0)
+    graph.unset_node_attribute(0, "z")
+    R = Rotation.from_axis_and_angle([1, 1, 0], 0.3)
+    points = transform_points(graph.nodes_attributes("xyz"), R)
+    graph.transform(R)
+    assert TOL.is_allclose(graph.nodes_attributes("xyz"), points)
@@ -1,3 +1,5 @@
+import pytest
+
 from compas.datastructures import HashTree
 from compas.datastructures import Mesh
 
@@ -23,3 +25,33 @@ def test_hashtree_from_mesh():
     assert diff["added"] == []
     assert diff["removed"] == [{"path": ".face.3", "value": [1, 3, 2]}, {"path": ".facedata.3", "value": None}]
     assert diff["modified"] == [{"path": ".vertex.0.x", "old": -0.8164965809277261, "new": 1.0}]
+
+
+def test_hashtree_previous():
+    mesh = Mesh.from_meshgrid(10, 10)
+    vertices = mesh.face_vertices(3)[:]
+    tree1 = HashTree.from_object(mesh)
+    mesh.vertex_attribute(0, "x", 1.0)
+    mesh.face[3] = vertices[::-1]
+    tree2 = HashTree.from_object(mesh, previous=tree1)
+    tree3 = HashTree.from_object(mesh)
+
+    assert tree2.signatures == tree3.signatures
+    assert tree2.get_node(".vertex.1").signature == tree1.get_node(".vertex.1").signature
+    diff = tree2.diff(tree1)
+    assert diff["modified"] == [{"path": ".vertex.0.x", "old": 0.0, "new": 1.0}, {"path": ".face.3", "old": vertices, "new": vertices[::-1]}]
+
+
+def test_hashtree_update():
+    tree = HashTree.from_dict({"a": {"b": 1, "c": 3}, "d": [1, 2, 3], "e": 2})
+    tree.update(".a.c", 2)
+    tree.update(".e", {"x": 1.0})
+    other = HashTree.from_dict({"a": {"b": 1, "c": 2}, "d": [1, 2, 3], "e": {"x": 1.0}})
+
+    assert tree.root.signature == other.root.signature
+    assert tree.signatures == other.signatures
+    assert tree.get_node(".e.x").value == 1.0
+    assert tree.diff(other) == {"added": [], "removed": [], "modified": []}
+
+    with pytest.raises(KeyError):
+        tree.update(".f", 1)
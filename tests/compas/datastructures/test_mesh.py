@@ -3,13 +3,18 @@ import pytest
 import json
 import random
 import compas
+from itertools import product
 
 from compas.datastructures import Mesh
+from compas.datastructures.mesh.operations.insert import mesh_add_vertex_to_face_edge
+from compas.datastructures.mesh.subdivision import mesh_fast_copy
 from compas.geometry import Sphere
 from compas.geometry import Box
 from compas.geometry import Polygon
 from compas.geometry import Polyhedron
+from compas.geometry import Rotation
 from compas.geometry import Translation
+from compas.geometry import transform_points
 
 from compas.tolerance import TOL
 
@@ -248,6 +253,52 @@ def test_from_points():
         assert mesh.number_of_edges() == 7
 
 
+def _mesh_incremental(vertices, faces):
+    mesh = Mesh()
+    for x, y, z in vertices:
+        mesh.add_vertex(x=x, y=y, z=z)
+    for face in faces:
+        mesh.add_face(face)
+    return mesh
+
+
+def test_from_vertices_and_faces_matches_incremental():
+    vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0]]
+    faces = [[0, 1, 2, 3, 0], [1, 4, 4, 5, 2], [0, 1], [4, 5, 2, 2]]
+
+    mesh = Mesh.from_vertices_and_faces(vertices, faces)
+    other = _mesh_incremental(vertices, faces)
+
+    assert mesh.face == other.face == {0: [0, 1, 2, 3], 1: [1, 4, 5, 2], 2: [4, 5, 2]}
+    assert mesh.halfedge == other.halfedge
+    assert list(mesh.edges()) == list(other.edges())
+    assert mesh.facedata == other.facedata
+    assert mesh._max_vertex == other._max_vertex
+    assert mesh._max_face == other._max_face
+
+
+def test_from_vertices_and_faces_trusted():
+    grid = Mesh.from_meshgrid(dx=10, nx=10)
+    vertices, faces = grid.to_vertices_and_faces()
+
+    mesh = Mesh.from_vertices_and_faces(vertices, faces, trusted=True)
+    assert mesh.face[0] is faces[0]
+    assert mesh.halfedge == grid.halfedge
+    assert list(mesh.edges()) == list(grid.edges())
+
+
+def test_from_vertices_and_faces_dicts():
+    vertices = {3: [0, 0, 0], 5: [1, 0, 0], 7: [1, 1, 0]}
+    faces = {4: [3, 5, 7]}
+
+    mesh = Mesh.from_vertices_and_faces(vertices, faces)
+    assert list(mesh.vertices()) == [3, 5, 7]
+    assert list(mesh.faces()) == [4]
+    assert mesh._max_vertex == 7
+    assert mesh._max_face == 4
+    assert mesh.add_face([7, 5, 3]) == 5
+
+
 def test_from_ploygons():
     polygon = [
         [[1.0, 0.0, 3.0], [1.0, 1.25, 0.0], [1.5, 0.5, 0.0]],
@@ -291,6 +342,17 @@ def test_mesh_data(halfedge):
         assert Mesh.validate_data(other.__data__)
 
 
+def test_mesh_from_data_halfedges():
+    mesh = Mesh.from_obj(compas.get("faces.obj"))
+    other = Mesh.__from_data__(mesh.__data__)
+
+    assert other.halfedge == mesh.halfedge
+    assert list(other.edges()) == list(mesh.edges())
+
+    other.vertex_attribute(0, "x", 100.0)
+    assert mesh.vertex_attribute(0, "x") != 100.0
+
+
 # --------------------------------------------------------------------------
 # converters
 # --------------------------------------------------------------------------
@@ -370,6 +432,28 @@ def test_copy():
     assert mesh1.number_of_edges() == mesh2.number_of_edges()
 
 
+def test_copy_independent():
+    mesh1 = Mesh.from_meshgrid(dx=10, nx=10)
+    mesh1.vertex_attribute(0, "tags", ["a"])
+    mesh1.face_attribute(0, "weight", 2.0)
+    mesh1.edge_attribute((0, 1), "weight", 3.0)
+    mesh2 = mesh1.copy()
+    assert mesh2.__data__ == mesh1.__data__
+    assert mesh2.halfedge == mesh1.halfedge
+
+    mesh2.vertex_attribute(0, "tags").append("b")
+    mesh2.vertex_attribute(1, "x", 100.0)
+    mesh2.face_attribute(0, "weight", 1.0)
+    mesh2.edge_attribute((0, 1), "weight", 1.0)
+    mesh2.delete_face(1)
+    assert mesh1.vertex_attribute(0, "tags") == ["a"]
+    assert mesh1.vertex_attribute(1, "x") != 100.0
+    assert mesh1.face_attribute(0, "weight") == 2.0
+    assert mesh1.edge_attribute((0, 1), "weight") == 3.0
+    assert mesh1.has_face(1)
+    assert mesh1.halfedge != mesh2.halfedge
+
+
 def test_clear():
     mesh = Mesh.from_obj(compas.get("faces.obj"))
     mesh.clear()
@@ -467,6 +551,58 @@ def test_cull_vertices():
     assert mesh.number_of_vertices() == v - 1
 
 
+def _unwelded_grid(shift=0.0, jitter=0.0):
+    # a 3x3 grid of quads, with every face having its own vertices
+    # the x coordinates of the vertices are shifted and alternately jittered
+    vertices = []
+    faces = []
+    for i, j in product(range(3), range(3)):
+        corners = [[i, j, 0], [i + 1, j, 0], [i + 1, j + 1, 0], [i, j + 1, 0]]
+        face = []
+        for x, y, z in corners:
+            face.append(len(vertices))
+            vertices.append([x + shift + jitter * (-1) ** len(vertices), y, z])
+        faces.append(face)
+    return Mesh.from_vertices_and_faces(vertices, faces)
+
+
+def test_remove_duplicate_vertices():
+    mesh = _unwelded_grid()
+    assert mesh.number_of_vertices() == 36
+    assert mesh.number_of_edges() == 36
+    mesh.remove_duplicate_vertices()
+    assert mesh.number_of_vertices() == 16
+    assert mesh.number_of_faces() == 9
+    assert mesh.number_of_edges() == 24
+    assert mesh.is_valid()
+    assert len(set(mesh.vertices_on_boundary())) == 12
+    for u in mesh.halfedge:
+        for v in mesh.halfedge[u]:
+            assert u in mesh.vertex and v in mesh.vertex
+            assert mesh.halfedge[u][v] is not None or mesh.halfedge[v][u] is not None
+
+
+def test_remove_duplicate_vertices_tolerance():
+    # the jittered duplicates straddle the rounding boundary at the default precision
+    shift = 0.5 * 10**-TOL.precision
+    mesh = _unwelded_grid(shift=shift, jitter=1e-7)
+    mesh.remove_duplicate_vertices()
+    assert mesh.number_of_vertices() > 16
+    mesh = _unwelded_grid(shift=shift, jitter=1e-7)
+    mesh.weld(tolerance=1e-6)
+    assert mesh.number_of_vertices() == 16
+    assert mesh.number_of_edges() == 24
+    assert mesh.is_valid()
+
+
+def test_remove_duplicate_vertices_degenerate_faces():
+    mesh = Mesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [1, 0, 0], [1, 1, 0]], [[0, 1, 2, 3], [1, 4, 5, 2]])
+    mesh.remove_duplicate_vertices()
+    assert mesh.number_of_vertices() == 4
+    assert mesh.number_of_faces() == 1
+    assert mesh.number_of_edges() == 4
+
+
 # --------------------------------------------------------------------------
 # info
 # --------------------------------------------------------------------------
@@ -1257,6 +1393,42 @@ def test_face_curvature():
     assert mesh.face_curvature(0) == 0
 
 
+# --------------------------------------------------------------------------
+# bulk geometry
+# --------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("ipy", [False, True])
+def test_bulk_geometry(monkeypatch, ipy):
+    monkeypatch.setattr(compas, "IPY", ipy)
+
+    mesh = Mesh.from_obj(compas.get("tubemesh.obj"))
+    mesh.delete_vertex(mesh.vertex_sample(1)[0])
+    vertices = [vertex for vertex in mesh.vertices() if mesh.vertex_degree(vertex)]
+    mesh.add_vertex()
+
+    assert TOL.is_allclose(mesh.faces_normals(), [mesh.face_normal(face) for face in mesh.faces()])
+    assert TOL.is_allclose(mesh.faces_normals(unitized=False), [mesh.face_normal(face, unitized=False) for face in mesh.faces()])
+    assert TOL.is_allclose(mesh.faces_areas(), [mesh.face_area(face) for face in mesh.faces()])
+    assert TOL.is_allclose(mesh.faces_centroids(), [mesh.face_centroid(face) for face in mesh.faces()])
+    assert TOL.is_allclose(mesh.edges_lengths(), [mesh.edge_length(edge) for edge in mesh.edges()])
+
+    normals = dict(zip(mesh.vertices(), mesh.vertices_normals()))
+    assert TOL.is_allclose([normals[vertex] for vertex in vertices], [mesh.vertex_normal(vertex) for vertex in vertices])
+    assert normals[mesh._max_vertex] == [0.0, 0.0, 0.0]
+
+
+def test_bulk_geometry_compact():
+    mesh = Mesh.from_polyhedron(12)
+    compact = Mesh.from_vertices_and_faces(*mesh.to_vertices_and_faces(), compact=True)
+    compact.delete_face(3)
+    mesh.delete_face(3)
+
+    assert TOL.is_allclose(compact.faces_normals(), mesh.faces_normals())
+    assert TOL.is_allclose(compact.faces_areas(), mesh.faces_areas())
+    assert TOL.is_allclose(compact.vertices_normals(), mesh.vertices_normals())
+
+
 # --------------------------------------------------------------------------
 # boundary
 # --------------------------------------------------------------------------
@@ -1352,3 +1524,182 @@ if not compas.IPY:
         assert isinstance(obb, Box)
         assert len(obb.points) == 8
         assert obb.contains_points(mesh.to_points())
+
+
+# --------------------------------------------------------------------------
+# compact storage
+# --------------------------------------------------------------------------
+
+
+def test_compact_from_vertices_and_faces():
+    mesh = Mesh.from_obj(compas.get("faces.obj"))
+    vertices, faces = mesh.to_vertices_and_faces()
+    compact = Mesh.from_vertices_and_faces(vertices, faces, compact=True)
+
+    assert compact.compact
+    assert not mesh.compact
+    assert compact.vertices_attributes("xyz") == mesh.vertices_attributes("xyz")
+    assert compact.vertex_coordinates(7) == mesh.vertex_coordinates(7)
+    assert [compact.face_vertices(face) for face in compact.faces()] == faces
+    assert list(compact.edges()) == list(mesh.edges())
+    assert TOL.is_close(compact.area(), mesh.area())
+
+
+def test_compact_vertex_attributes():
+    mesh = Mesh(compact=True)
+    mesh.update_default_vertex_attributes(is_fixed=False)
+    a = mesh.add_vertex(x=1, y=2, z=3)
+    b = mesh.add_vertex()
+
+    mesh.vertex_attribute(a, "is_fixed", True)
+    assert mesh.vertex_attribute(a, "is_fixed")
+    assert not mesh.vertex_attribute(b, "is_fixed")
+    assert mesh.vertex_attributes(a, "xyz") == [1.0, 2.0, 3.0]
+    assert mesh.vertex_attributes(b, "xyz") == [0.0, 0.0, 0.0]
+    assert dict(mesh.vertex[a]) == {"x": 1.0, "y": 2.0, "z": 3.0, "is_fixed": True}
+
+    mesh.unset_vertex_attribute(a, "x")
+    assert mesh.vertex_attribute(a, "x") == 0.0
+    assert "x" not in mesh.vertex[a]
+
+    mesh.delete_vertex(b)
+    c = mesh.add_vertex(x=4, y=5, z=6)
+    assert mesh.vertices_attributes("xyz") == [[0.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    assert mesh.vertex_attribute(c, "is_fixed") is False
+
+
+def test_compact_vertex_nan():
+    mesh = Mesh(compact=True)
+    mesh.update_default_vertex_attributes(z=1.0)
+    a = mesh.add_vertex(x=1, y=2)
+    mesh.vertex_attribute(a, "x", float("nan"))
+
+    x, y, z = mesh.vertex_attributes(a, "xyz")
+    assert x != x and y == 2.0 and z == 1.0
+    x, y, z = mesh.vertices_attributes("xyz")[0]
+    assert x != x and y == 2.0 and z == 1.0
+    assert "x" in mesh.vertex[a] and "z" not in mesh.vertex[a]
+    if not compas.IPY:
+        x, y, z = mesh.vertex.points_numpy()[0]
+        assert x != x and y == 2.0 and z == 1.0
+
+    mesh.unset_vertex_attribute(a, "x")
+    assert mesh.vertex_attribute(a, "x") == 0.0
+
+
+def test_compact_modifiers():
+    mesh = Mesh.from_meshgrid(dx=10, nx=5)
+    compact = Mesh.from_vertices_and_faces(*mesh.to_vertices_and_faces(), compact=True)
+
+    for other in (mesh, compact):
+        other.split_edge((0, 1), allow_boundary=True)
+        other.merge_faces([0, 1])
+        other.insert_vertex(3)
+        other.flip_cycles()
+        other.delete_face(4)
+        other.quads_to_triangles()
+
+    assert compact.is_valid()
+    assert compact.to_vertices_and_faces() == mesh.to_vertices_and_faces()
+
+
+def test_compact_collapse_edge():
+    mesh = Mesh.from_meshgrid(dx=10, nx=4)
+    compact = Mesh.from_vertices_and_faces(*mesh.to_vertices_and_faces(), compact=True)
+
+    for other in (mesh, compact):
+        other.collapse_edge((5, 6), allow_boundary=True)
+
+    assert mesh.is_valid()
+    assert compact.is_valid()
+    assert compact.to_vertices_and_faces() == mesh.to_vertices_and_faces()
+
+
+def test_compact_add_vertex_to_face_edge():
+    mesh = Mesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], [[0, 1, 2, 3]])
+    compact = Mesh.from_vertices_and_faces(*mesh.to_vertices_and_faces(), compact=True)
+
+    for other in (mesh, compact):
+        key = other.add_vertex(x=0.5, y=0.0, z=0.0)
+        mesh_add_vertex_to_face_edge(other, key, 0, 1)
+        assert other.face_vertices(0) == [0, key, 1, 2, 3]
+        assert other.is_valid()
+
+
+def test_compact_data():
+    mesh = Mesh.from_polyhedron(8)
+    compact = Mesh.from_vertices_and_faces(*mesh.to_vertices_and_faces(), compact=True)
+    compact.vertex_attribute(0, "weight", 2.0)
+
+    other = Mesh.from_jsonstring(compact.to_jsonstring())
+    assert other.compact
+    assert other.vertex_attribute(0, "weight") == 2.0
+    assert other.to_vertices_and_faces() == compact.to_vertices_and_faces()
+
+    other = compact.copy()
+    assert other.compact
+    assert other.to_vertices_and_faces() == compact.to_vertices_and_faces()
+    assert other.vertex_attribute(0, "weight") == 2.0
+    other.vertex_attribute(0, "x", 10.0)
+    other.face_vertices(0)
+    other.delete_face(0)
+    assert compact.vertex_attribute(0, "x") != 10.0
+    assert compact.has_face(0)
+
+    assert "compact" not in mesh.__data__
+    assert Mesh.validate_data(compact.__data__)
+
+
+def test_compact_fast_copy():
+    mesh = Mesh.from_polyhedron(6)
+    compact = Mesh.from_vertices_and_faces(*mesh.to_vertices_and_faces(), compact=True)
+    subd = mesh_fast_copy(compact)
+    assert subd.compact
+    assert subd.vertex.defaults is subd.default_vertex_attributes
+    assert subd.vertices_attributes("xyz") == compact.vertices_attributes("xyz")
+    assert [subd.face_vertices(face) for face in subd.faces()] == [compact.face_vertices(face) for face in compact.faces()]
+
+    subd.split_edge((0, 1), allow_boundary=True)
+    assert compact.number_of_vertices() == 8
+    assert TOL.is_allclose(compact.subdivided("catmullclark", k=2).vertices_attributes("xyz"), mesh.subdivided("catmullclark", k=2).vertices_attributes("xyz"))
+
+
+def test_compact_transform():
+    mesh = Mesh.from_polyhedron(8)
+    mesh.update_default_vertex_attributes(z=1.0)
+    compact = Mesh.from_vertices_and_faces(*mesh.to_vertices_and_faces(), compact=True)
+    compact.update_default_vertex_attributes(z=1.0)
+    for other in (mesh, compact):
+        other.unset_vertex_attribute(0, "z")
+        other.delete_vertex(5)
+
+    T = Translation.from_vector([1, 2, 3]) * Rotation.from_axis_and_angle([1, 1, 0], 0.3)
+    points = transform_points(mesh.vertices_attributes("xyz"), T)
+    for other in (mesh, compact):
+        other.transform(T)
+        assert TOL.is_allclose(other.vertices_attributes("xyz"), points)
+    assert "z" in compact.vertex[0]
+
+    mesh.transform_numpy(T)
+    compact.transform_numpy(T)
+    assert TOL.is_allclose(compact.vertices_attributes("xyz"), mesh.vertices_attributes("xyz"))
+
+
+# --------------------------------------------------------------------------
+# hashing
+# --------------------------------------------------------------------------
+
+
+def test_elements_sha256():
+    mesh = Mesh.from_meshgrid(10, 10)
+    vertices = mesh.vertices_sha256()
+    faces = mesh.faces_sha256()
+    edges = mesh.edges_sha256(as_string=True)
+
+    mesh.vertex_attribute(0, "z", 1.0)
+    mesh.edge_attribute((0, 1), "weight", 2.0)
+    mesh.face_attribute(0, "color", "red")
+
+    assert [vertex for vertex, h in mesh.vertices_sha256().items() if h != vertices[vertex]] == [0]
+    assert [face for face, h in mesh.faces_sha256().items() if h != faces[face]] == [0]
+    assert [set(edge) for edge, h in mesh.edges_sha256(as_string=True).items() if h != edges[edge]] == [{0, 1}]
@@ -2,6 +2,7 @@ import pytest
 import json
 import compas
 from compas.datastructures import VolMesh
+from compas.geometry import Scale
 
 # ==============================================================================
 # Fixtures
@@ -60,6 +61,19 @@ def test_volmesh_data():
         assert VolMesh.validate_data(other.__data__)
 
 
+def test_volmesh_copy():
+    volmesh = VolMesh.from_meshgrid(1, 1, 1, 2, 2, 2)
+    volmesh.cell_attribute(0, "weight", 2.0)
+    other = volmesh.copy()
+    assert other.__data__ == volmesh.__data__
+
+    other.cell_attribute(0, "weight", 1.0)
+    other.delete_cell(1)
+    assert volmesh.cell_attribute(0, "weight") == 2.0
+    assert 1 in volmesh.cells()
+    assert volmesh.number_of_cells() == 8
+
+
 # ==============================================================================
 # Builders
 # ==============================================================================
@@ -420,3 +434,9 @@ def test_delete_cell_of_volmesh_with_3_1_1(c):
         assert volmesh.number_of_cells() == noc - 1
         assert volmesh.number_of_edges() == noe - 8
         assert volmesh.number_of_faces() == nof - 5
+
+
+def test_transform(halfface):
+    points = halfface.vertices_attributes("xyz")
+    halfface.transform(Scale.from_factors([2, 3, 4]))
+    assert halfface.vertices_attributes("xyz") == [[2 * x, 3 * y, 4 * z] for x, y, z in points]
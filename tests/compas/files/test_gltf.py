@@ -1,8 +1,13 @@
 import json
 import os
 import pytest
+from compas.datastructures import Mesh
 from compas.files import GLTF
 from compas.files import GLTFContent
+from compas.files.gltf.constants import COMPONENT_TYPE_FLOAT
+from compas.files.gltf.constants import COMPONENT_TYPE_UNSIGNED_INT
+from compas.files.gltf.constants import TYPE_SCALAR
+from compas.files.gltf.constants import TYPE_VEC3
 from compas.tolerance import TOL
 
 # Temporary change the global precision in the TOL class to 12
@@ -155,6 +160,48 @@ def test_specular(specular_gltf):
     assert exporter._content.extensions_used == ["KHR_materials_specular"]
 
 
+def test_export_roundtrip(tmp_path):
+    mesh = Mesh.from_meshgrid(dx=10, nx=10)
+    mesh.quads_to_triangles()
+    content = GLTFContent()
+    scene = content.add_scene()
+    node = scene.add_child()
+    node.add_mesh(mesh)
+
+    for filename in ("mesh.gltf", "mesh.glb"):
+        filepath = str(tmp_path / filename)
+        gltf = GLTF(filepath)
+        gltf.content = content
+        gltf.export()
+
+        exporter = gltf.exporter
+        assert len(exporter._buffer) == exporter._gltf_dict["buffers"][0]["byteLength"]
+        assert all(view["byteOffset"] % 4 == 0 for view in exporter._gltf_dict["bufferViews"])
+
+        other = GLTF(filepath)
+        other.read()
+        assert len(other.content.meshes[0].vertices) == mesh.number_of_vertices()
+        assert len(other.content.meshes[0].faces) == mesh.number_of_faces()
+
+
+def test_export_accessor_packing(simple_gltf):
+    gltf = GLTF(simple_gltf)
+    gltf.read()
+    exporter = gltf.exporter
+
+    data = [(0.0, 1.5, -2.0), (3.0, -4.0, 5.25)]
+    assert exporter._pack_accessor_data_numpy(data, COMPONENT_TYPE_FLOAT, TYPE_VEC3, True) == exporter._pack_accessor_data(data, COMPONENT_TYPE_FLOAT, TYPE_VEC3, True)
+    bytes_, minimum, maximum = exporter._pack_accessor_data(data, COMPONENT_TYPE_FLOAT, TYPE_VEC3, True)
+    assert len(bytes_) == 24
+    assert minimum == (0.0, -4.0, -2.0)
+    assert maximum == (3.0, 1.5, 5.25)
+
+    indices = [0, 1, 70000]
+    packed_numpy, _, _ = exporter._pack_accessor_data_numpy(indices, COMPONENT_TYPE_UNSIGNED_INT, TYPE_SCALAR, False)
+    packed, _, _ = exporter._pack_accessor_data(indices, COMPONENT_TYPE_UNSIGNED_INT, TYPE_SCALAR, False)
+    assert packed_numpy == bytes(packed)
+
+
 def test_gltf_content():
     content = GLTFContent()
     scene = content.add_scene()
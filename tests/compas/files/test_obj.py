@@ -0,0 +1,75 @@
+import pytest
+
+from compas.datastructures import Mesh
+from compas.files import OBJ
+
+
+@pytest.fixture
+def meshes():
+    meshes = []
+    for index in range(3):
+        mesh = Mesh.from_meshgrid(dx=1.0, nx=3)
+        mesh.name = "part {}".format(index)
+        meshes.append(mesh)
+    return meshes
+
+
+@pytest.fixture
+def duplicates(tmp_path):
+    filepath = str(tmp_path / "duplicates.obj")
+    with open(filepath, "w") as f:
+        f.write("v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 0 0\nv 1 1 0\nv 0 1 0\n")
+        f.write("f 1/1/1 2/1/1 3/1/1\nf -3 -2 -1\n")
+    return filepath
+
+
+def test_read_weld(duplicates):
+    obj = OBJ(duplicates)
+    obj.read()
+    assert len(obj.vertices) == 4
+    assert obj.faces == [[0, 1, 2], [0, 2, 3]]
+
+
+def test_read_no_weld(duplicates):
+    obj = OBJ(duplicates, weld=False)
+    obj.read()
+    assert len(obj.vertices) == 6
+    assert obj.vertices[3] == [0.0, 0.0, 0.0]
+    assert obj.faces == [[0, 1, 2], [3, 4, 5]]
+
+    mesh = Mesh.from_obj(duplicates, weld=False)
+    assert mesh.number_of_vertices() == 6
+    assert mesh.number_of_faces() == 2
+
+
+def test_read_continued_lines(tmp_path):
+    filepath = str(tmp_path / "continued.obj")
+    with open(filepath, "w") as f:
+        f.write("v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\nf 1 2 \\\n3 4\n")
+    obj = OBJ(filepath)
+    obj.read()
+    assert obj.faces == [[0, 1, 2, 3]]
+
+
+def test_iter_objects(tmp_path, meshes):
+    filepath = str(tmp_path / "meshes.obj")
+    OBJ(filepath).write(meshes)
+
+    objects = list(OBJ(filepath).iter_objects())
+    assert [name for name, _, _ in objects] == ["part 0", "part 1", "part 2"]
+    for (_, vertices, faces), mesh in zip(objects, meshes):
+        assert len(vertices) == mesh.number_of_vertices()
+        assert len(faces) == mesh.number_of_faces()
+        assert Mesh.from_vertices_and_faces(vertices, faces).area() == pytest.approx(mesh.area(), abs=1e-3)
+
+
+def test_mesh_from_obj_name(tmp_path, meshes):
+    filepath = str(tmp_path / "meshes.obj")
+    OBJ(filepath).write(meshes)
+
+    mesh = Mesh.from_obj(filepath, name="part 1")
+    assert mesh.name == "part 1"
+    assert mesh.number_of_faces() == meshes[1].number_of_faces()
+
+    with pytest.raises(ValueError):
+        Mesh.from_obj(filepath, name="part 3")
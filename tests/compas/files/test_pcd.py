@@ -0,0 +1,83 @@
+import struct
+
+import pytest
+
+from compas.files import PCD
+from compas.files.pcd import _lzf_decompress
+
+HEADER = [
+    "# .PCD v0.7 - Point Cloud Data file format",
+    "VERSION 0.7",
+    "FIELDS rgb x y z normal",
+    "SIZE 4 4 4 8 4",
+    "TYPE U F F F F",
+    "COUNT 1 1 1 1 3",
+    "WIDTH 3",
+    "HEIGHT 1",
+    "VIEWPOINT 0 0 0 1 0 0 0",
+    "POINTS 3",
+]
+
+POINTS = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [-1.5, 0.25, 1e-3]]
+
+
+def _write(tmp_path, data, format):
+    filepath = str(tmp_path / "points.pcd")
+    with open(filepath, "wb") as f:
+        f.write("\n".join(HEADER + ["DATA " + format]).encode("ascii") + b"\n" + data)
+    return filepath
+
+
+def test_read_ascii(tmp_path):
+    data = "".join("255 {} {} {} 0 0 1\n".format(x, y, z) for x, y, z in POINTS).encode("ascii")
+    pcd = PCD(_write(tmp_path, data, "ascii"))
+    assert pcd.reader.fields == ["rgb", "x", "y", "z", "normal"]
+    assert pcd.reader.counts == [1, 1, 1, 1, 3]
+    assert pcd.reader.points == POINTS
+
+
+def test_read_binary(tmp_path):
+    data = b"".join(struct.pack("<I2fd3f", 255, x, y, z, 0, 0, 1) for x, y, z in POINTS)
+    filepath = _write(tmp_path, data, "binary")
+    assert PCD(filepath).reader.points == [[x, y, z] for x, y, z in (struct.unpack("<2fd", struct.pack("<2fd", *point)) for point in POINTS)]
+
+    chunks = list(PCD(filepath).iter_points(chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+
+
+def test_read_binary_compressed(tmp_path):
+    # the values are stored per field, and compressed with literal runs of at most 32 bytes only
+    columns = [
+        struct.pack("<3I", 255, 255, 255),
+        struct.pack("<3f", *[point[0] for point in POINTS]),
+        struct.pack("<3f", *[point[1] for point in POINTS]),
+        struct.pack("<3d", *[point[2] for point in POINTS]),
+        struct.pack("<9f", *[0, 0, 1] * 3),
+    ]
+    raw = b"".join(columns)
+    compressed = b"".join(bytes(bytearray([len(raw[i : i + 32]) - 1])) + raw[i : i + 32] for i in range(0, len(raw), 32))
+    data = struct.pack("<II", len(compressed), len(raw)) + compressed
+    points = PCD(_write(tmp_path, data, "binary_compressed")).reader.points
+    assert points == [[x, y, z] for x, y, z in (struct.unpack("<2fd", struct.pack("<2fd", *point)) for point in POINTS)]
+
+
+def test_lzf_decompress():
+    # a literal run of three bytes, followed by a reference to six bytes, starting three bytes back
+    assert _lzf_decompress(b"\x02abc\x80\x02", 9) == b"abcabcabc"
+    with pytest.raises(Exception):
+        _lzf_decompress(b"\x02abc\x80\x05", 9)
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_write_read(tmp_path, binary):
+    filepath = str(tmp_path / "points.pcd")
+    PCD(filepath).write(POINTS, binary=binary)
+    assert PCD(filepath).reader.points == POINTS
+
+
+def test_read_invalid(tmp_path):
+    filepath = str(tmp_path / "points.pcd")
+    with open(filepath, "wb") as f:
+        f.write(b"VERSION 0.7\nFIELDS a b c\n")
+    with pytest.raises(Exception):
+        PCD(filepath).reader
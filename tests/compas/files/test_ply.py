@@ -0,0 +1,91 @@
+import os
+import struct
+
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+from compas.files import PLY
+from compas.geometry import Pointcloud
+
+BASE_FOLDER = os.path.dirname(__file__)
+
+
+@pytest.fixture
+def triangle_binary():
+    return os.path.join(BASE_FOLDER, "fixtures", "triangle_binary.ply")
+
+
+@pytest.fixture
+def mesh():
+    vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0], [2.0, 0.0, 0.5]]
+    faces = [[0, 1, 2, 3], [1, 4, 2]]
+    return Mesh.from_vertices_and_faces(vertices, faces)
+
+
+def test_read_binary(triangle_binary):
+    ply = PLY(triangle_binary)
+    assert ply.reader.format == "binary_little_endian"
+    assert ply.parser.vertices == [[0.0, 0.0, 0.0], [10.0, 0.0, 0.0], [5.0, 10.0, 0.0]]
+    assert ply.parser.faces == [[0, 1, 2]]
+    assert ply.reader.faces == [{"vertex_index": [0, 1, 2]}]
+
+
+def test_read_from_ply_ascii():
+    mesh = Mesh.from_ply(compas.get("tubemesh.ply"))
+    assert mesh.number_of_vertices() == 200
+    assert mesh.is_trimesh()
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_write_read(tmp_path, mesh, binary):
+    filepath = str(tmp_path / "mesh.ply")
+    mesh.to_ply(filepath, binary=binary)
+
+    other = Mesh.from_ply(filepath)
+    assert other.to_vertices_and_faces() == mesh.to_vertices_and_faces()
+
+
+@pytest.mark.parametrize("byteorder", ["<", ">"])
+def test_read_binary_vertex_properties(tmp_path, byteorder):
+    header = [
+        "ply",
+        "format binary_{}_endian 1.0".format("little" if byteorder == "<" else "big"),
+        "element vertex 2",
+        "property float x",
+        "property float y",
+        "property float z",
+        "property float nx",
+        "property uchar red",
+        "element face 2",
+        "property uchar flags",
+        "property list uchar int vertex_indices",
+        "end_header",
+    ]
+    data = struct.pack(byteorder + "3ffB", 1, 2, 3, 0.5, 255)
+    data += struct.pack(byteorder + "3ffB", 4, 5, 6, -0.5, 0)
+    data += struct.pack(byteorder + "BB3i", 7, 3, 0, 1, 0)
+    data += struct.pack(byteorder + "BB4i", 8, 4, 1, 0, 0, 1)
+    filepath = str(tmp_path / "points.ply")
+    with open(filepath, "wb") as f:
+        f.write("\n".join(header).encode("ascii") + b"\n" + data)
+
+    ply = PLY(filepath)
+    assert ply.parser.vertices == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    assert list(ply.parser.vertex_attributes["nx"]) == [0.5, -0.5]
+    assert list(ply.parser.vertex_attributes["red"]) == [255, 0]
+    assert ply.parser.faces == [[0, 1, 0], [1, 0, 0, 1]]
+    assert ply.reader.faces[1] == {"flags": 8, "vertex_indices": [1, 0, 0, 1]}
+
+    cloud = Pointcloud.from_ply(filepath)
+    assert len(cloud) == 2
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_iter_points(tmp_path, mesh, binary):
+    filepath = str(tmp_path / "mesh.ply")
+    mesh.to_ply(filepath, binary=binary)
+
+    chunks = list(PLY(filepath).iter_points(chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [list(point) for chunk in chunks for point in chunk] == PLY(filepath).parser.vertices
@@ -46,5 +46,37 @@ def test_binary_read_write_fidelity():
     assert mesh.vertex == mesh_2.vertex
 
 
+def test_binary_weld(tmp_path):
+    mesh = Mesh.from_meshgrid(dx=1.0, nx=5)
+    mesh.quads_to_triangles()
+    filepath = str(tmp_path / "grid.stl")
+    mesh.to_stl(filepath, binary=True)
+
+    stl = STL(filepath)
+    assert len(stl.parser.vertices) == 36
+    assert len(stl.parser.faces) == 50
+    # vertices are numbered in order of first occurrence
+    assert stl.parser.faces[0] == [0, 1, 2]
+    for face, facet in zip(stl.parser.faces, stl.reader.facets):
+        assert [stl.parser.vertices[index] for index in face] == [list(xyz) for xyz in facet["vertices"]]
+
+
+def test_binary_weld_precision(tmp_path):
+    mesh = Mesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0], [0, 1, 0], [1.0001, 0, 0], [1, 1, 0]], [[0, 1, 2], [3, 4, 2]])
+    filepath = str(tmp_path / "triangles.stl")
+    mesh.to_stl(filepath, binary=True)
+
+    assert len(STL(filepath).parser.vertices) == 5
+    assert len(STL(filepath, precision=3).parser.vertices) == 4
+
+
+def test_binary_iter_facets(binary_stl):
+    stl = STL(binary_stl)
+    chunks = list(stl.iter_facets(chunksize=5))
+    assert all(len(chunk) <= 5 for chunk in chunks)
+    assert sum(len(chunk) for chunk in chunks) == len(stl.reader.facets)
+    assert chunks[0]["vertices"][0].tolist() == [list(xyz) for xyz in stl.reader.facets[0]["vertices"]]
+
+
 # Reset the precision to its default value
 TOL.precision = TOL.PRECISION
@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    # run the tests with and without NumPy
+    # the modules of which NumPy is disabled are listed in NUMPY_MODULES of the test module
+    if request.param == "python":
+        for name in request.module.NUMPY_MODULES:
+            monkeypatch.setattr(name + ".np", None)
+    return request.param
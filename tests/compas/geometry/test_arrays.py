@@ -0,0 +1,174 @@
+import math
+import pickle
+
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+from compas.geometry import Point
+from compas.geometry import PointArray
+from compas.geometry import Pointcloud
+from compas.geometry import Polyline
+from compas.geometry import Rotation
+from compas.geometry import Scale
+from compas.geometry import Translation
+from compas.geometry import Vector
+from compas.geometry import VectorArray
+from compas.tolerance import TOL
+
+NUMPY_MODULES = ["compas.geometry.arrays"]
+
+
+def test_pointarray(backend):
+    points = PointArray([[0, 0, 0], [1, 0, 0], Point(1, 1, 0), (0, 1, 2)])
+    assert len(points) == 4
+    assert points.to_list() == [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 2.0]]
+    assert isinstance(points[0], Point)
+    assert points[-1] == [0.0, 1.0, 2.0]
+    assert all(isinstance(point, Point) for point in points)
+
+    with pytest.raises(IndexError):
+        points[4]
+    with pytest.raises(ValueError):
+        PointArray([[0, 0, 0], [1, 0]])
+
+    points[0] = [1, 2, 3]
+    assert points[0] == [1.0, 2.0, 3.0]
+    points[2:] = [[5, 5, 5], [6, 6, 6]]
+    assert points.to_list()[2:] == [[5.0, 5.0, 5.0], [6.0, 6.0, 6.0]]
+    points[:2] = [0, 0, 0]
+    assert points.to_list()[:2] == [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+
+
+def test_pointarray_views(backend):
+    points = PointArray([[i, 0, 0] for i in range(10)])
+    view = points[2:5]
+    assert len(view) == 3
+    assert view[0] == [2.0, 0.0, 0.0]
+
+    # changes to a view change the array it was taken from, and vice versa
+    view[1] = [0.0, 1.0, 0.0]
+    assert points[3] == [0.0, 1.0, 0.0]
+    points[4] = [0.0, 0.0, 1.0]
+    assert view[2] == [0.0, 0.0, 1.0]
+    view.transform(Translation.from_vector([1.0, 0.0, 0.0]))
+    assert points[2] == [3.0, 0.0, 0.0]
+    assert points[5] == [5.0, 0.0, 0.0]
+
+    # slices with another step are copies
+    other = points[::3]
+    assert other.to_list() == [[0.0, 0.0, 0.0], [1.0, 1.0, 0.0], [6.0, 0.0, 0.0], [9.0, 0.0, 0.0]]
+    other[0] = [1.0, 1.0, 1.0]
+    assert points[0] == [0.0, 0.0, 0.0]
+
+    # copies of views only contain the items of the view
+    assert view.copy().to_list() == view.to_list()
+    assert view.__data__ == {"xyz": [3.0, 0.0, 0.0, 1.0, 1.0, 0.0, 1.0, 0.0, 1.0]}
+
+
+def test_pointarray_numpy():
+    if compas.IPY:
+        return
+
+    import numpy as np
+
+    xyz = np.random.rand(100, 3)
+    points = PointArray(xyz)
+    assert np.array_equal(points.array, xyz)
+
+    # the array shares the buffer of the points
+    points.array[0] = [1.0, 2.0, 3.0]
+    assert points[0] == [1.0, 2.0, 3.0]
+    points[10:20].array[:] = 0.0
+    assert points[15] == [0.0, 0.0, 0.0]
+
+    with pytest.raises(ValueError):
+        PointArray(np.zeros((10, 2)))
+
+
+def test_pointarray_methods(backend):
+    points = PointArray([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 2]])
+    assert TOL.is_allclose(points.distance_to([0, 0, 0]), [0.0, 1.0, math.sqrt(2), math.sqrt(5)])
+    assert points.distance_to(points) == [0.0, 0.0, 0.0, 0.0]
+
+    vectors = points - [1, 1, 1]
+    assert isinstance(vectors, VectorArray)
+    assert vectors.to_list() == [[-1.0, -1.0, -1.0], [0.0, -1.0, -1.0], [0.0, 0.0, -1.0], [-1.0, 0.0, 1.0]]
+    assert (points - points).lengths() == [0.0, 0.0, 0.0, 0.0]
+
+    moved = points + vectors
+    assert isinstance(moved, PointArray)
+    assert moved.to_list() == [[-1.0, -1.0, -1.0], [1.0, -1.0, -1.0], [1.0, 1.0, -1.0], [-1.0, 1.0, 3.0]]
+
+    with pytest.raises(ValueError):
+        points.distance_to(points[:2])
+
+
+def test_pointarray_transform(backend):
+    points = PointArray([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 2]])
+    T = Translation.from_vector([1, 2, 3]) * Rotation.from_axis_and_angle([0, 0, 1], math.radians(30)) * Scale.from_factors([1, 2, 3])
+    transformed = points.transformed(T)
+    assert transformed == [point.transformed(T) for point in points]
+    assert points == [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 2]]
+
+    vectors = VectorArray(points)
+    assert vectors.transformed(T) == [Vector(*point).transformed(T) for point in points]
+
+
+def test_vectorarray_methods(backend):
+    vectors = VectorArray([[1, 0, 0], [0, 2, 0], [3, 4, 0]])
+    assert vectors.lengths() == [1.0, 2.0, 5.0]
+    assert vectors.dot([1, 1, 1]) == [1.0, 2.0, 7.0]
+    assert vectors.dot(vectors) == [1.0, 4.0, 25.0]
+    assert vectors.cross([0, 0, 1]) == [Vector(*vector).cross([0, 0, 1]) for vector in vectors]
+    assert vectors.cross(vectors).lengths() == [0.0, 0.0, 0.0]
+    assert (vectors * 2).to_list() == [[2.0, 0.0, 0.0], [0.0, 4.0, 0.0], [6.0, 8.0, 0.0]]
+    assert (2 * vectors + vectors).lengths() == [3.0, 6.0, 15.0]
+
+    unitized = vectors.unitized()
+    assert TOL.is_allclose(unitized.lengths(), [1.0, 1.0, 1.0])
+    assert vectors.lengths() == [1.0, 2.0, 5.0]
+    vectors[1:].unitize()
+    assert TOL.is_allclose(vectors.lengths(), [1.0, 1.0, 1.0])
+
+
+def test_pointarray_data(backend):
+    points = PointArray([[i, 2 * i, 3 * i] for i in range(10)], name="points")
+    data = points.__data__
+    assert data["xyz"][:6] == [0.0, 0.0, 0.0, 1.0, 2.0, 3.0]
+    assert PointArray.__from_data__(data) == points
+
+    other = compas.json_loads(compas.json_dumps(points))
+    assert isinstance(other, PointArray)
+    assert other == points
+    assert other.name == "points"
+
+    other = compas.data.binary_loads(compas.data.binary_dumps(points))
+    assert isinstance(other, PointArray)
+    assert other == points
+
+    other = pickle.loads(pickle.dumps(points[5:]))
+    assert other.to_list() == points.to_list()[5:]
+
+    assert points.sha256(version=2) == points.copy().sha256(version=2)
+
+    with pytest.raises(ValueError):
+        PointArray.from_flat([0.0, 1.0])
+
+
+def test_pointarray_conversions(backend):
+    polyline = Polyline([[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+    points = PointArray(polyline)
+    assert points == polyline.points
+    assert points.to_polyline() == polyline
+
+    cloud = Pointcloud.from_bounds(10, 5, 3, 20)
+    points = PointArray(cloud)
+    assert points == cloud.points
+    assert points.to_pointcloud() == cloud
+
+    mesh = Mesh.from_polyhedron(6)
+    points = PointArray.from_mesh(mesh)
+    assert points.to_list() == mesh.vertices_attributes("xyz")
+    keys = list(mesh.vertices())[2:5]
+    assert PointArray.from_mesh(mesh, keys=keys).to_list() == mesh.vertices_attributes("xyz", keys=keys)
@@ -0,0 +1,122 @@
+import pytest
+from random import random
+from random import seed
+
+from compas.datastructures import Mesh
+from compas.geometry import BVH
+from compas.geometry import Box
+from compas.geometry import Sphere
+from compas.geometry import intersection_ray_mesh
+from compas.geometry import intersection_rays_mesh
+from compas.tolerance import TOL
+
+NUMPY_MODULES = ["compas.geometry.bvh"]
+
+
+@pytest.fixture
+def sphere():
+    return Mesh.from_shape(Sphere(radius=1.0), u=32, v=32, triangulated=True).to_vertices_and_faces()
+
+
+def random_rays(n):
+    seed(0)
+    return [([4 * random() - 2, 4 * random() - 2, 4 * random() - 2], [random() - 0.5, random() - 0.5, random() - 0.5]) for _ in range(n)]
+
+
+def assert_hits(hits, expected):
+    assert len(hits) == len(expected)
+    for a, b in zip(hits, expected):
+        assert [hit[0] for hit in a] == [hit[0] for hit in b]
+        for hit, other in zip(a, b):
+            assert TOL.is_allclose(hit[1:], other[1:])
+
+
+def test_bvh_empty(backend):
+    bvh = BVH(([], []))
+    assert bvh.root is None
+    assert len(bvh) == 0
+    assert bvh.intersect_rays([([0, 0, 0], [0, 0, 1])]) == [[]]
+
+
+def test_bvh_triangle(backend):
+    bvh = BVH(([[0, 0, 0], [2, 0, 0], [0, 2, 0]], [[0, 1, 2]]))
+    assert bvh.intersect_ray(([0.5, 1.0, 2.0], [0, 0, -3])) == [(0, 0.25, 0.5, 2.0)]
+    assert bvh.intersect_ray(([0.5, 1.0, -2.0], [0, 0, 1])) == [(0, 0.25, 0.5, 2.0)]
+    assert bvh.intersect_ray(([0.5, 1.0, 2.0], [0, 0, 1])) == []
+    assert bvh.intersect_ray(([2.0, 2.0, 2.0], [0, 0, -1])) == []
+    # parallel to the triangle
+    assert bvh.intersect_ray(([-1.0, 0.5, 0.0], [1, 0, 0])) == []
+    # no direction
+    assert bvh.intersect_ray(([0.5, 1.0, 2.0], [0, 0, 0])) == []
+
+
+def test_bvh_faces(backend):
+    vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]]
+    faces = [[0, 3, 2, 1], [4, 5, 6, 7]]
+    bvh = BVH((vertices, faces), leafsize=1)
+    assert len(bvh) == 4
+
+    # on the diagonal of both quads
+    hits = bvh.intersect_ray(([0.5, 0.5, -1], [0, 0, 1]))
+    assert [(face, t) for face, _, _, t in hits] == [(0, 1.0), (1, 2.0)]
+    hits = bvh.intersect_ray(([0.5, 0.5, 2], [0, 0, -1]), first=True)
+    assert [(face, t) for face, _, _, t in hits] == [(1, 1.0)]
+
+    # in the planes of the sides of the bounding boxes
+    hits = bvh.intersect_ray(([0.0, 0.5, -1], [0, 0, 1]))
+    assert [face for face, _, _, _ in hits] == [0, 1]
+    hits = bvh.intersect_ray(([1.0, 1.0, -1], [0, 0, 1]))
+    assert [face for face, _, _, _ in hits] == [0, 1]
+
+
+def test_bvh_mesh(backend, sphere):
+    mesh = Mesh.from_vertices_and_faces(*sphere)
+    bvh = BVH(mesh)
+    assert len(bvh) == mesh.number_of_faces()
+
+    hits = bvh.intersect_ray(([-5, 0.01, 0.02], [1, 0, 0]))
+    assert len(hits) == 2
+    assert TOL.is_close(hits[0][3], 4.0, atol=1e-2)
+    assert TOL.is_close(hits[1][3], 6.0, atol=1e-2)
+
+    # all faces around the pole
+    hits = bvh.intersect_ray(([0, 0, -5], [0, 0, 1]))
+    assert len(hits) == 2 * 32
+    assert all(TOL.is_close(t, 4.0) for _, _, _, t in hits[:32])
+    assert all(TOL.is_close(t, 6.0) for _, _, _, t in hits[32:])
+
+
+@pytest.mark.parametrize("first", [False, True])
+def test_bvh_brute_force(backend, sphere, first):
+    rays = random_rays(200)
+    # a single leaf checks all triangles
+    expected = BVH(sphere, leafsize=len(sphere[1])).intersect_rays(rays, first=first)
+    hits = BVH(sphere).intersect_rays(rays, first=first)
+    assert any(hits)
+    assert_hits(hits, expected)
+    bvh = BVH(sphere, leafsize=2)
+    for ray, ray_hits in zip(rays, hits):
+        assert ray_hits == bvh.intersect_ray(ray, first=first)
+        if first:
+            assert len(ray_hits) <= 1
+        assert [hit[3] for hit in ray_hits] == sorted(hit[3] for hit in ray_hits)
+
+
+def test_bvh_backends(monkeypatch, sphere):
+    rays = random_rays(100)
+    box = Box(1.5).to_vertices_and_faces()
+    hits = BVH(sphere).intersect_rays(rays) + BVH(box).intersect_rays(rays)
+    monkeypatch.setattr("compas.geometry.bvh.np", None)
+    expected = BVH(sphere).intersect_rays(rays) + BVH(box).intersect_rays(rays)
+    assert_hits(hits, expected)
+
+
+def test_intersection_ray_mesh(sphere):
+    box = Box(2.0).to_vertices_and_faces()
+    hits = intersection_ray_mesh(([0.1, 0.2, -5], [0, 0, 2]), box)
+    assert [t for _, _, _, t in hits] == [4.0, 6.0]
+
+    rays = random_rays(50)
+    hits = intersection_rays_mesh(rays, sphere)
+    assert hits == [intersection_ray_mesh(ray, sphere) for ray in rays]
+    assert intersection_rays_mesh(rays, sphere, first=True) == [ray_hits[:1] for ray_hits in hits]
@@ -1,11 +1,16 @@
+from array import array
+
 import pytest
 
 # from compas.geometry import homogenize
 # from compas.geometry import dehomogenize
+from compas.geometry import Projection
 from compas.geometry import Rotation
+from compas.geometry import Scale
 from compas.geometry import Translation
 from compas.tolerance import TOL
 from compas.geometry import intersection_segment_segment_xy
+from compas.geometry import is_affine_matrix
 from compas.geometry import mirror_points_line
 from compas.geometry import mirror_points_line_xy
 from compas.geometry import mirror_points_plane
@@ -25,10 +30,16 @@ from compas.geometry import rotate_points
 from compas.geometry import rotate_points_xy
 from compas.geometry import scale_points
 from compas.geometry import scale_points_xy
+from compas.geometry import multiply_matrices
 from compas.geometry import transform_points
+from compas.geometry import transform_points_buffer
 from compas.geometry import transform_vectors
+from compas.geometry import transform_vectors_buffer
+from compas.geometry import transpose_matrix
 from compas.geometry import translate_points
 from compas.geometry import translate_points_xy
+from compas.geometry._core.transformations import dehomogenize
+from compas.geometry._core.transformations import homogenize
 
 
 @pytest.fixture
@@ -58,6 +69,52 @@ def test_transform_vectors(R):
         assert TOL.is_allclose(a, b)
 
 
+@pytest.mark.parametrize(
+    "M",
+    [
+        Translation.from_vector([1, 2, 3]) * Rotation.from_axis_and_angle([1, 1, 0], 0.3) * Scale.from_factors([1, 2, 3]),
+        Projection.from_plane_and_point(([0, 0, 0], [0, 0, 1]), [1, 2, 10]),
+    ],
+)
+def test_transform_points_reference(M):
+    # the fused implementation has the same result as the multiplication of homogeneous coordinates
+    points = [[0, 0, 1], [1, 0, 0], [1, 2, 3], [-4.5, 0.25, 7]]
+    assert transform_points(points, M) == dehomogenize(multiply_matrices(homogenize(points, w=1.0), transpose_matrix(M)))
+    assert transform_vectors(points, M) == dehomogenize(multiply_matrices(homogenize(points, w=0.0), transpose_matrix(M)))
+
+
+def test_transform_points_stack(T, R):
+    points = [[0, 0, 1], [1, 0, 0], [1, 2, 3]]
+    assert TOL.is_allclose(transform_points(points, [T, R]), transform_points(points, R * T))
+    assert TOL.is_allclose(transform_points(points, [T.matrix, R.matrix]), transform_points(transform_points(points, T), R))
+    assert TOL.is_allclose(transform_vectors(points, [T, R]), transform_vectors(points, R))
+
+
+def test_is_affine_matrix(T, R):
+    assert is_affine_matrix(T)
+    assert is_affine_matrix(R.matrix)
+    assert is_affine_matrix([T, R])
+    assert not is_affine_matrix(Projection.from_plane_and_point(([0, 0, 0], [0, 0, 1]), [1, 2, 10]))
+
+
+def test_transform_points_buffer(R):
+    points = [[0, 0, 1], [1, 0, 0], [1, 2, 3]]
+    P = Projection.from_plane_and_point(([0, 0, 0], [0, 0, 1]), [1, 2, 10])
+    for M in (R, P, [R, P]):
+        xyz = array("d", [value for point in points for value in point])
+        transform_points_buffer(xyz, M)
+        assert TOL.is_allclose([xyz[i : i + 3] for i in range(0, 9, 3)], transform_points(points, M))
+
+        xyz = [float(value) for point in points for value in point]
+        transform_vectors_buffer(xyz, M)
+        assert TOL.is_allclose([xyz[i : i + 3] for i in range(0, 9, 3)], transform_vectors(points, M))
+
+    # the affine fast path skips the division by the homogeneous coordinate
+    xyz = [1.0, 2.0, 3.0]
+    transform_points_buffer(xyz, [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 2]], affine=True)
+    assert xyz == [1.0, 2.0, 3.0]
+
+
 # def test_homogenize():
 #     assert homogenize([[1, 2, 3]], 0.5) == [[0.5, 1.0, 1.5, 0.5]]
 
@@ -1 +1,62 @@
 # numpy helper will be created separated first
+from array import array
+
+import pytest
+
+import compas
+from compas.geometry import Projection
+from compas.geometry import Rotation
+from compas.geometry import Translation
+from compas.geometry import transform_points
+from compas.geometry import transform_vectors
+from compas.tolerance import TOL
+
+if not compas.IPY:
+    import numpy as np
+
+    from compas.geometry import transform_points_buffer_numpy
+    from compas.geometry import transform_points_numpy
+    from compas.geometry import transform_vectors_buffer_numpy
+    from compas.geometry import transform_vectors_numpy
+    from compas.geometry._core import transformations_numpy
+
+
+@pytest.fixture
+def transformations():
+    T = Translation.from_vector([1, 2, 3]) * Rotation.from_axis_and_angle([1, 1, 0], 0.3)
+    P = Projection.from_plane_and_point(([0, 0, 0], [0, 0, 1]), [1, 2, 10])
+    return [T, P, [T, P]]
+
+
+@pytest.mark.skipif(compas.IPY, reason="NumPy is not available in IronPython")
+def test_transform_points_numpy(transformations):
+    points = [[0, 0, 1], [1, 0, 0], [1, 2, 3], [-4.5, 0.25, 7]]
+    for M in transformations:
+        assert TOL.is_allclose(transform_points_numpy(points, M).tolist(), transform_points(points, M))
+        assert TOL.is_allclose(transform_vectors_numpy(points, M).tolist(), transform_vectors(points, M))
+
+
+@pytest.mark.skipif(compas.IPY, reason="NumPy is not available in IronPython")
+def test_transform_points_buffer_numpy(transformations, monkeypatch):
+    # use small chunks to test the chunked transformation
+    monkeypatch.setattr(transformations_numpy, "CHUNK_SIZE", 7)
+    points = np.random.rand(100, 3).tolist()
+    for M in transformations:
+        xyz = array("d", [value for point in points for value in point])
+        transform_points_buffer_numpy(xyz, M)
+        assert TOL.is_allclose(np.frombuffer(xyz).reshape((-1, 3)).tolist(), transform_points(points, M))
+
+        xyz = np.array(points)
+        transform_vectors_buffer_numpy(xyz, M)
+        assert TOL.is_allclose(xyz.tolist(), transform_vectors(points, M))
+
+
+@pytest.mark.skipif(compas.IPY, reason="NumPy is not available in IronPython")
+def test_transform_points_buffer_numpy_errors(transformations):
+    T = transformations[0]
+    with pytest.raises(TypeError):
+        transform_points_buffer_numpy(np.zeros((10, 3), dtype=np.float32), T)
+    with pytest.raises(ValueError):
+        transform_points_buffer_numpy(np.zeros((10, 2)), T)
+    with pytest.raises(ValueError):
+        transform_points_buffer_numpy(bytes(24), T)
@@ -1,7 +1,11 @@
+import random
+from itertools import combinations
+
 from compas.tolerance import TOL
 from compas.geometry import intersection_sphere_line
 from compas.geometry import intersection_plane_circle
 from compas.geometry import intersection_circle_circle_xy
+from compas.geometry import intersection_segments_segments_xy
 
 
 def test_intersection_sphere_line():
@@ -26,3 +30,21 @@ def test_intersection_circle_circle_xy():
     ipt1, ipt2 = intersection_circle_circle_xy(circle1, circle2)
     assert TOL.is_allclose(ipt1, (9.999, -0.142, 0.000), atol=1e-3)
     assert TOL.is_allclose(ipt2, (-6.999, 7.142, 0.000), atol=1e-3)
+
+
+def test_intersection_segments_segments_xy():
+    from compas.geometry._core.predicates_2 import is_intersection_segment_segment_xy
+
+    random.seed(0)
+    segments = []
+    for _ in range(200):
+        x, y = random.uniform(0, 10), random.uniform(0, 10)
+        segments.append([[x, y, 0], [x + random.uniform(-2, 2), y + random.uniform(-2, 2), 0]])
+    segments.append([[0, 5, 0], [10, 5, 0]])
+    segments.append([[5, 0, 0], [5, 10, 0]])
+
+    pairs = [(i, j) for i, j in combinations(range(len(segments)), 2) if is_intersection_segment_segment_xy(segments[i], segments[j])]
+    assert intersection_segments_segments_xy(segments) == pairs
+
+    assert intersection_segments_segments_xy([]) == []
+    assert intersection_segments_segments_xy([[[0, 0, 0], [0, 0, 0]], [[0, 0, 0], [0, 0, 0]]]) == []
@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from compas.geometry import KDTree
+from compas.geometry import distance_point_point
+
+
+@pytest.fixture
+def points():
+    random.seed(0)
+    points = [[random.random(), random.random(), random.random()] for _ in range(200)]
+    # duplicates and points on a plane
+    points += points[:20]
+    points += [[random.random(), random.random(), 0.0] for _ in range(50)]
+    return points
+
+
+@pytest.mark.parametrize("leafsize", [1, 8, 1000])
+def test_kdtree_query(points, leafsize):
+    tree = KDTree(points, leafsize=leafsize)
+    queries = [[random.random(), random.random(), random.random()] for _ in range(20)]
+    distances, indices = tree.query(queries, k=5)
+    for query, query_distances, query_indices in zip(queries, distances, indices):
+        expected = sorted(distance_point_point(query, point) for point in points)[:5]
+        assert query_distances == pytest.approx(expected)
+        assert [distance_point_point(query, points[index]) for index in query_indices] == pytest.approx(query_distances)
+
+
+def test_kdtree_query_radius(points):
+    tree = KDTree(points)
+    queries = [[random.random(), random.random(), random.random()] for _ in range(20)]
+    distances, indices = tree.query_radius(queries, 0.2, distances=True)
+    for query, query_distances, query_indices in zip(queries, distances, indices):
+        expected = [index for index, point in enumerate(points) if distance_point_point(query, point) <= 0.2]
+        assert sorted(query_indices) == expected
+        assert query_distances == sorted(query_distances)
+        assert all(distance <= 0.2 for distance in query_distances)
+
+
+def test_kdtree_nearest_neighbor(points):
+    tree = KDTree(points)
+    point, label, distance = tree.nearest_neighbor(points[5])
+    assert distance == 0
+    assert point == points[5]
+    _, label, distance = tree.nearest_neighbor(points[50], exclude=[50])
+    assert label != 50
+    assert distance == pytest.approx(min(distance_point_point(points[50], point) for index, point in enumerate(points) if index != 50))
+    nnbrs = tree.nearest_neighbors(points[0], 3)
+    assert len(nnbrs) == 3
+    assert sorted([nnbrs[0][1], nnbrs[1][1]]) == [0, 200]
+
+
+def test_kdtree_empty():
+    tree = KDTree()
+    assert tree.root is None
+    assert tree.nearest_neighbor([0, 0, 0])[2] == float("inf")
+    assert tree.query([[0, 0, 0]], k=3) == ([[]], [[]])
+    assert KDTree([[1, 0, 0]]).query([[0, 0, 0]], k=3) == ([[1.0]], [[0]])
@@ -20,6 +20,7 @@ def test_point(x, y, z):
     p = Point(x, y, z)
     x, y, z = float(x), float(y), float(z)
     assert p.x == x and p.y == y and p.z == z
+    assert type(p.x) is float and type(p.y) is float and type(p.z) is float
     assert p[0] == x and p[1] == y and p[2] == z
 
     if not compas.IPY:
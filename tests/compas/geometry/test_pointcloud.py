@@ -2,9 +2,15 @@ import pytest
 import json
 import compas
 from random import random, shuffle
+from compas.datastructures import Mesh
 from compas.geometry import Box
-from compas.geometry import Point  # noqa: F401
+from compas.geometry import Point
 from compas.geometry import Pointcloud
+from compas.geometry import Translation
+from compas.geometry import Vector
+from compas.tolerance import TOL
+
+NUMPY_MODULES = ["compas.geometry.arrays", "compas.geometry.pointcloud"]
 
 
 @pytest.mark.parametrize(
@@ -65,3 +71,149 @@ def test_pointcloud_from_box():
     pointcloud = Pointcloud.from_box(box, 100)
     assert len(pointcloud.points) == 100
     assert all((-x_size / 2 < x < x_size / 2) and (-y_size / 2 < y < y_size / 2) and (-z_size / 2 < z < z_size / 2) for x, y, z in pointcloud.points)
+
+
+def test_pointcloud_closest_points(backend):
+    cloud = Pointcloud([[x, y, 0] for x in range(10) for y in range(10)])
+    assert cloud.closest_point([3.1, 4.2, 1.0]) == [3.0, 4.0, 0.0]
+    assert sorted(list(point) for point in cloud.closest_points([3.4, 4.0, 0.0], k=2)) == [[3.0, 4.0, 0.0], [4.0, 4.0, 0.0]]
+
+    # the index is reused, and rebuilt when the points change
+    index = cloud._spatial_index()
+    cloud.closest_point([0, 0, 0])
+    assert cloud._spatial_index() is index
+    cloud.transform(Translation.from_vector([0, 0, 5]))
+    assert cloud._index is None
+    assert cloud.closest_point([3.1, 4.2, 1.0]) == [3.0, 4.0, 5.0]
+    cloud[0] = [3.1, 4.2, 1.0]
+    assert cloud.closest_point([3.1, 4.2, 1.0]) == [3.1, 4.2, 1.0]
+
+    # changes made to the points directly are used after invalidating the cloud
+    cloud.points[1].x = 20.0
+    cloud.invalidate()
+    assert cloud.closest_point([20.0, 1.0, 5.0]) is cloud.points[1]
+
+
+def test_pointcloud_points(backend):
+    cloud = Pointcloud([[0, 0, 0], [1, 0, 0], [2, 0, 0]])
+    assert all(isinstance(point, Point) for point in cloud.points)
+    assert cloud[1] is cloud.points[1]
+
+    cloud.points[0].x = 5
+    cloud[1].y = 7
+    assert cloud.points == [[5, 0, 0], [1, 7, 0], [2, 0, 0]]
+    cloud.invalidate()
+    assert cloud.array.to_list() == [[5, 0, 0], [1, 7, 0], [2, 0, 0]]
+
+    assert cloud.points + [[3, 0, 0]] == [[5, 0, 0], [1, 7, 0], [2, 0, 0], [3, 0, 0]]
+    # points that are added to or replaced in the list are detected without invalidating the cloud
+    cloud.points.append(Point(3, 0, 0))
+    assert len(cloud) == 4
+    assert cloud.closest_point([3, 1, 0]) == [3, 0, 0]
+    cloud.points[3] = Point(3, 3, 0)
+    assert cloud.closest_point([3, 2.5, 0]) == [3, 3, 0]
+    del cloud.points[3]
+    assert cloud.closest_point([3, 1, 0]) == [2, 0, 0]
+    cloud.points.append(Point(3, 0, 0))
+
+    # the points of a cloud computed from another cloud are created when they are first needed
+    cloud = cloud.union(Pointcloud([[4, 0, 0]]))
+    assert cloud._points is None
+    assert len(cloud) == 5
+    cloud.transform(Translation.from_vector([0, 0, 1]))
+    points = cloud.points
+    cloud.transform(Translation.from_vector([0, 0, 1]))
+    assert cloud.points is points
+    assert points[4] == [4, 0, 2]
+
+
+def test_pointcloud_edited_points(backend):
+    cloud = Pointcloud([[0, 0, 0], [1, 0, 0], [2, 0, 0]])
+    cloud.closest_point([0, 0, 0])
+    cloud.points[0].x = 9
+    cloud.points.append(Point(5, 5, 5))
+    points = [[9, 0, 0], [1, 0, 0], [2, 0, 0], [5, 5, 5]]
+
+    assert len(cloud) == 4
+    assert cloud.__data__ == {"points": points}
+    assert Pointcloud.__from_data__(json.loads(json.dumps(cloud.__data__))).points == points
+    assert cloud.copy().points == points
+    assert TOL.is_allclose(cloud.centroid, [4.25, 1.25, 1.25])
+    assert TOL.is_close(cloud.aabb.xsize, 8)
+    assert cloud.closest_point([5, 5, 4]) == [5, 5, 5]
+
+    cloud.transform(Translation.from_vector([0, 0, 1]))
+    assert cloud.points == [[x, y, z + 1] for x, y, z in points]
+    assert cloud.closest_point([9, 0, 0]) == [9, 0, 1]
+
+
+def test_pointcloud_boolean(backend):
+    a = Pointcloud([[0, 0, 0], [1, 0, 0], [2, 0, 0]])
+    b = Pointcloud([[1, 0, 0], [2, 0, 0], [3, 0, 0]])
+    assert a.union(b) == [[0, 0, 0], [1, 0, 0], [2, 0, 0], [3, 0, 0]]
+    assert a.difference(b) == [[0, 0, 0]]
+    assert a.difference([[5, 0, 0]]) == a
+    assert Pointcloud([]).union(a) == a
+
+    a.add(b)
+    assert len(a) == 4
+    a.subtract(b)
+    assert a.points == [[0, 0, 0]]
+
+
+def test_pointcloud_voxel_downsample(backend):
+    cloud = Pointcloud([[0.1, 0.1, 0.1], [0.3, 0.1, 0.1], [1.5, 0.2, 0.1], [0.2, 0.4, 0.1], [1.7, 0.4, 0.3]])
+    downsampled = cloud.voxel_downsample(1.0)
+    assert TOL.is_allclose(downsampled.array.to_list(), [[0.2, 0.2, 0.1], [1.6, 0.3, 0.2]])
+    assert len(cloud.voxel_downsample(0.01)) == len(cloud)
+
+    with pytest.raises(ValueError):
+        cloud.voxel_downsample(0)
+
+
+def test_pointcloud_remove_radius_outliers(backend):
+    cloud = Pointcloud([[0.1 * i, 0, 0] for i in range(10)] + [[5, 5, 5], [5.05, 5, 5]])
+    assert len(cloud.remove_radius_outliers(0.15, min_neighbors=1)) == 12
+    assert cloud.remove_radius_outliers(0.15, min_neighbors=2).points == [[0.1 * i, 0, 0] for i in range(1, 9)]
+    assert len(cloud.remove_radius_outliers(1.0, min_neighbors=2)) == 10
+
+
+def test_pointcloud_estimate_normals(backend):
+    cloud = Pointcloud([[x, y, 0.5 * x] for x in range(5) for y in range(5)])
+    normals = cloud.estimate_normals(k=6, viewpoint=[0, 0, 100])
+    assert len(normals) == len(cloud)
+    assert TOL.is_allclose(normals.lengths(), [1.0] * len(cloud))
+    normal = Vector(-0.5, 0, 1).unitized()
+    assert all(TOL.is_allclose(n, normal) for n in normals)
+
+    normals = cloud.estimate_normals(k=6, viewpoint=[0, 0, -100])
+    assert all(TOL.is_allclose(n, -normal) for n in normals)
+
+    with pytest.raises(ValueError):
+        cloud.estimate_normals(k=2)
+
+
+def test_pointcloud_from_files(tmp_path):
+    points = [[random(), random(), random()] for i in range(100)]
+    for binary in (False, True):
+        filepath = str(tmp_path / "cloud.pcd")
+        Pointcloud(points).to_pcd(filepath, binary=binary)
+        cloud = Pointcloud.from_pcd(filepath, chunksize=7)
+        assert cloud.array.to_list() == points
+
+    # the coordinates are written to PLY files with the precision of the global tolerance
+    points = [[round(x, 3) for x in point] for point in points]
+    mesh = Mesh.from_vertices_and_faces(points, [[0, 1, 2]])
+    for binary in (False, True):
+        filepath = str(tmp_path / "cloud.ply")
+        mesh.to_ply(filepath, binary=binary)
+        cloud = Pointcloud.from_ply(filepath, chunksize=7)
+        assert TOL.is_allclose(cloud.array.to_list(), points)
+
+
+def test_pointcloud_copy():
+    cloud = Pointcloud.from_bounds(10, 10, 10, 10)
+    other = cloud.copy()
+    assert other == cloud
+    other.transform(Translation.from_vector([1, 0, 0]))
+    assert other != cloud
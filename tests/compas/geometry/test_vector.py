@@ -20,6 +20,7 @@ def test_vector(x, y, z):
     v = Vector(x, y, z)
     x, y, z = float(x), float(y), float(z)
     assert v.x == x and v.y == y and v.z == z
+    assert type(v.x) is float and type(v.y) is float and type(v.z) is float
     assert v[0] == x and v[1] == y and v[2] == z
 
     if not compas.IPY:
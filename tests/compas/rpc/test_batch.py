@@ -0,0 +1,90 @@
+import sys
+import threading
+import types
+
+import pytest
+
+from compas.rpc import BinaryServer
+from compas.rpc import Dispatcher
+from compas.rpc import Proxy
+from compas.rpc import RPCServerError
+from compas.rpc import Server
+
+
+class Service(Dispatcher):
+    def add(self, a, b):
+        return a + b
+
+    def fail(self):
+        raise ValueError("fail")
+
+
+@pytest.fixture(params=["json", "binary"])
+def proxy(request):
+    if request.param == "json":
+        server = Server(("127.0.0.1", 0), logRequests=False)
+    else:
+        server = BinaryServer(("127.0.0.1", 0))
+    server.register_instance(Service())
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    with Proxy(port=server.server_address[1], transport=request.param) as proxy:
+        yield proxy
+    server.shutdown()
+    server.server_close()
+
+
+def test_batch(proxy):
+    with proxy.batch() as batch:
+        a = batch.add(1, 2)
+        b = batch.fail()
+        c = batch.add(a=[1], b=[2, 3])
+        assert not a.done
+    assert a.result() == 3
+    with pytest.raises(RPCServerError):
+        b.result()
+    assert c.result() == [1, 2, 3]
+
+
+def test_batch_package(proxy):
+    proxy.package = "compas.geometry"
+    with proxy.batch() as batch:
+        a = batch.add_vectors([1, 0, 0], [0, 1, 0])
+        b = batch.not_a_function()
+    assert a.result() == [1, 1, 0]
+    with pytest.raises(RPCServerError):
+        b.result()
+
+
+def test_map(proxy):
+    assert proxy.map("add", [(i, i) for i in range(100)]) == [2 * i for i in range(100)]
+    assert proxy.map("add", []) == []
+    proxy.package = "compas.geometry"
+    assert proxy.map("length_vector", [([0, 3, 4],), ([1, 0, 0],)]) == [5.0, 1.0]
+    assert proxy.map("centroid_points", [[[0, 0, 0], [2, 0, 0]]]) == [[1.0, 0.0, 0.0]]
+    with pytest.raises(RPCServerError):
+        proxy.map("not_a_function", [1])
+
+
+def test_dispatcher_cache(monkeypatch):
+    module = types.ModuleType("_compas_rpc_test_module")
+    module.f = lambda: 1
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    dispatcher = Dispatcher()
+    odict = {}
+    assert dispatcher._resolve("_compas_rpc_test_module.f", [], odict)() == 1
+
+    module.f = lambda: 2
+    assert dispatcher._resolve("_compas_rpc_test_module.f", [], odict)() == 1
+
+    # replacing the module invalidates the cache
+    other = types.ModuleType(module.__name__)
+    other.f = lambda: 3
+    monkeypatch.setitem(sys.modules, module.__name__, other)
+    assert dispatcher._resolve("_compas_rpc_test_module.f", [], odict)() == 3
+
+    other.f = lambda: 4
+    dispatcher.clear_cache()
+    assert dispatcher._resolve("_compas_rpc_test_module.f", [], odict)() == 4
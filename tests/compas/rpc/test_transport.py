@@ -0,0 +1,169 @@
+import json
+import socket
+import threading
+
+import pytest
+
+import compas
+from compas.data import DataDecoder
+from compas.data import DataEncoder
+from compas.datastructures import Mesh
+from compas.geometry import Point
+from compas.rpc import BinaryServer
+from compas.rpc import Dispatcher
+from compas.rpc import Proxy
+from compas.rpc import RPCServerError
+from compas.rpc.transport import dumps
+from compas.rpc.transport import loads
+from compas.rpc.transport import PREFIX
+from compas.rpc.transport import BinaryServerProxy
+from compas.rpc.transport import read_message
+from compas.rpc.transport import write_message
+
+
+def _roundtrip(obj):
+    message = b"".join(dumps(obj))
+    length, size = PREFIX.unpack(message[: PREFIX.size])
+    assert length == len(message) - PREFIX.size
+    message = memoryview(message)[PREFIX.size :]
+    return loads(message[:size].tobytes(), message[size:])
+
+
+def _json_roundtrip(obj):
+    return json.loads(json.dumps(obj, cls=DataEncoder), cls=DataDecoder)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        None,
+        [1, "a", 2.0, True, None],
+        list(range(100)),
+        [0.5 * i for i in range(100)],
+        [[0.5 * i, 1.0, 2.0] for i in range(100)],
+        [(i, i + 1) for i in range(100)],
+        [[i, 1.0] for i in range(100)],
+        [2**70] * 20,
+        [True, False] * 20,
+        {i: [i, i + 1, i + 2] for i in range(100)},
+        {str(i): {"x": 1.0 * i, "y": 2.0, "z": 3.0, "name": "v"} for i in range(100)},
+        {"args": [[[1.0, 2.0, 3.0]] * 100], "kwargs": {"tol": 1e-3}},
+    ],
+)
+def test_transport_roundtrip(obj):
+    result = _roundtrip(obj)
+    assert result == _json_roundtrip(obj)
+    assert json.dumps(result) == json.dumps(_json_roundtrip(obj))
+
+
+def test_transport_roundtrip_data():
+    mesh = Mesh.from_meshgrid(1.0, 10)
+    result = _roundtrip({"mesh": mesh, "points": [Point(i, 0, 0) for i in range(20)]})
+    assert result["mesh"].__data__ == mesh.__data__
+    assert result["points"] == [Point(i, 0, 0) for i in range(20)]
+
+
+@pytest.mark.skipif(compas.IPY, reason="NumPy is not available in IronPython")
+def test_transport_roundtrip_numpy():
+    import numpy as np
+
+    for array in [np.arange(30.0).reshape((10, 3)), np.arange(10, dtype=np.int32), np.zeros((0, 3)), np.array(2.5), np.array([True, False])]:
+        assert _roundtrip(array) == _json_roundtrip(array)
+
+
+class Service(Dispatcher):
+    def add(self, a, b):
+        return a + b
+
+    def fail(self):
+        raise ValueError("fail")
+
+
+@pytest.fixture
+def server():
+    server = BinaryServer(("127.0.0.1", 0))
+    server.register_instance(Service())
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_binary_proxy(server):
+    with Proxy(port=server.server_address[1], transport="binary") as proxy:
+        assert proxy.add(1, 2) == 3
+        assert proxy.add([1.0] * 50, [2.0] * 50) == [1.0] * 50 + [2.0] * 50
+        assert proxy.add(b=[[1, 2]] * 20, a=[[3, 4]] * 20) == [[3, 4]] * 20 + [[1, 2]] * 20
+        with pytest.raises(RPCServerError):
+            proxy.fail()
+        proxy.package = "compas.geometry"
+        assert proxy.add_vectors([1, 0, 0], [0, 1, 0]) == [1, 1, 0]
+
+
+def _scripted_server(handlers):
+    # a server that handles the n-th connection with the n-th handler,
+    # and records the methods of all requests it receives
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(5)
+    requests = []
+
+    def serve():
+        for handler in handlers:
+            connection, _ = listener.accept()
+            handler(connection, requests)
+
+    thread = threading.Thread(target=serve)
+    thread.daemon = True
+    thread.start()
+    return listener, requests
+
+
+def _respond(connection, requests, count=None, close=None):
+    while count is None or len(requests) < count:
+        request = read_message(connection.recv)
+        if request is None:
+            break
+        requests.append(request["method"])
+        write_message(connection.sendall, {"result": len(requests)})
+    if close is not None:
+        connection.close()
+        close.set()
+
+
+def test_binary_proxy_stale_connection():
+    closed = threading.Event()
+    listener, requests = _scripted_server([lambda c, r: _respond(c, r, count=1, close=closed), _respond])
+    proxy = BinaryServerProxy("127.0.0.1:{}".format(listener.getsockname()[1]), timeout=5)
+    try:
+        assert proxy.ping() == 1
+        # the server closes the connection that is kept open by the client
+        assert closed.wait(5)
+        assert proxy.ping() == 2
+        assert requests == ["ping", "ping"]
+    finally:
+        proxy("close")()
+        listener.close()
+
+
+def test_binary_proxy_no_resend():
+    def fail(connection, requests):
+        # respond to the first request, and close the connection after receiving the second
+        _respond(connection, requests, count=1)
+        requests.append(read_message(connection.recv)["method"])
+        connection.close()
+
+    listener, requests = _scripted_server([fail, _respond])
+    proxy = BinaryServerProxy("127.0.0.1:{}".format(listener.getsockname()[1]), timeout=5)
+    try:
+        assert proxy.ping() == 1
+        with pytest.raises(EOFError):
+            proxy.slow()
+        assert requests == ["ping", "slow"]
+        # the next request uses a new connection
+        assert proxy.ping() == 3
+    finally:
+        proxy("close")()
+        listener.close()
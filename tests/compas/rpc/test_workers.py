@@ -0,0 +1,143 @@
+import os
+import threading
+import time
+
+import pytest
+
+from compas.rpc import BinaryServer
+from compas.rpc import Dispatcher
+from compas.rpc import Proxy
+from compas.rpc import RPCServerError
+from compas.rpc import Server
+from compas.rpc import ThreadWorkerPool
+
+
+class Service(Dispatcher):
+    def sleep(self, seconds):
+        time.sleep(seconds)
+        return os.getpid()
+
+
+def serve(transport, **kwargs):
+    if transport == "json":
+        server = Server(("127.0.0.1", 0), logRequests=False, **kwargs)
+    else:
+        server = BinaryServer(("127.0.0.1", 0), **kwargs)
+    server.register_instance(Service())
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def stop(server):
+    server.shutdown()
+    server.server_close()
+
+
+def call_concurrently(server, transport, calls, seconds):
+    results = []
+
+    def call():
+        with Proxy(port=server.server_address[1], transport=transport) as proxy:
+            results.append(proxy.sleep(seconds))
+
+    threads = [threading.Thread(target=call) for _ in range(calls)]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, time.time() - start
+
+
+@pytest.mark.parametrize("transport", ["json", "binary"])
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_workers(transport, executor):
+    server = serve(transport, workers=3, executor=executor)
+    try:
+        results, duration = call_concurrently(server, transport, 3, 0.5)
+    finally:
+        stop(server)
+    assert len(results) == 3
+    assert duration < 1.0
+    if executor == "process":
+        assert os.getpid() not in results
+        assert len(set(results)) == 3
+
+
+@pytest.mark.parametrize("transport", ["json", "binary"])
+def test_serialized(transport):
+    server = serve(transport)
+    try:
+        results, duration = call_concurrently(server, transport, 2, 0.3)
+    finally:
+        stop(server)
+    assert results == [os.getpid(), os.getpid()]
+    assert duration >= 0.6
+
+
+@pytest.mark.parametrize("transport", ["json", "binary"])
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_timeout(transport, executor):
+    server = serve(transport, workers=1, executor=executor, timeout=5)
+    try:
+        with Proxy(port=server.server_address[1], transport=transport, timeout=0.2) as proxy:
+            start = time.time()
+            with pytest.raises(RPCServerError) as error:
+                proxy.sleep(2)
+            assert time.time() - start < 1.5
+            assert "cancelled" in str(error.value)
+
+            if executor == "process":
+                # the worker running the cancelled call is replaced
+                proxy.timeout = None
+                assert proxy.sleep(0) != os.getpid()
+    finally:
+        stop(server)
+
+
+class Sleeper(object):
+    def run(self, name, params):
+        time.sleep(params[0])
+        return name
+
+
+@pytest.mark.parametrize("track", [False, True])
+def test_thread_pool_shutdown(track):
+    pool = ThreadWorkerPool(Sleeper(), 1)
+    if track:
+        # the cancellation of the queued calls before Python 3.9
+        pool._futures = set()
+    results = []
+    errors = []
+
+    def call(name, seconds):
+        try:
+            results.append(pool.call("run", name, [seconds]))
+        except RPCServerError as error:
+            errors.append(str(error))
+
+    threads = [threading.Thread(target=call, args=("running", 0.3))]
+    threads[0].start()
+    time.sleep(0.1)
+    threads += [threading.Thread(target=call, args=("queued", 0)) for _ in range(3)]
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.1)
+
+    pool.shutdown()
+    for thread in threads:
+        thread.join(2)
+
+    # the running call finishes, the queued calls are cancelled
+    assert results == ["running"]
+    assert len(errors) == 3
+    assert all("cancelled" in error for error in errors)
+    if track:
+        assert not pool._futures
+
+
+def test_invalid_executor():
+    with pytest.raises(ValueError):
+        Server(("127.0.0.1", 0), executor="fiber")
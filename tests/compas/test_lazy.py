@@ -0,0 +1,63 @@
+import subprocess
+import sys
+
+import pytest
+
+import compas
+
+PACKAGES = ["compas.colors", "compas.datastructures", "compas.files", "compas.geometry"]
+
+
+def run(statement):
+    return subprocess.check_output([sys.executable, "-c", statement]).decode().strip()
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_lazy_public_names(package):
+    module = __import__(package, fromlist=["__all__"])
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+    assert "lazy_attributes" not in dir(module)
+
+
+@pytest.mark.skipif(compas.IPY, reason="Attributes are imported immediately on IronPython.")
+def test_lazy_import():
+    statement = "print(sorted(name for name in sys.modules if name.startswith(('compas.geometry', 'compas.datastructures'))))"
+    output = run("import sys; import compas.geometry; import compas.datastructures; " + statement)
+    assert output == str(["compas.datastructures", "compas.geometry"])
+
+    output = run("import sys; from compas.datastructures import Mesh; print('scipy' in sys.modules, 'compas.geometry.icp_numpy' in sys.modules)")
+    assert output == "False False"
+
+
+def test_eager_import():
+    # the attributes are imported immediately on IronPython and on Python versions before 3.7
+    statement = "print([name for module in modules for name in module.__all__ if name not in vars(module)])"
+    output = run("import importlib; import compas._lazy; compas._lazy.LAZY = False; modules = [importlib.import_module(name) for name in {!r}]; ".format(PACKAGES) + statement)
+    assert output == "[]"
+
+
+def test_lazy_submodule_name():
+    import compas.geometry
+    import compas.geometry.icp_numpy  # noqa: F401
+
+    assert callable(compas.geometry.icp_numpy)
+    assert callable(compas.geometry.pca_numpy)
+
+
+def test_lazy_alias():
+    from compas.datastructures import Graph
+    from compas.datastructures import Network
+
+    assert Network is Graph
+
+
+def test_lazy_errors():
+    import compas.geometry
+
+    with pytest.raises(AttributeError):
+        compas.geometry.Pointt
+
+    with pytest.raises(ImportError):
+        from compas.geometry import Pointt  # noqa: F401
@@ -71,3 +71,131 @@ def test_importer_fail_silently():
 
     is_importable = importer.check_importable("module_which_does_not_exist")
     assert not is_importable
+
+
+def test_plugin_manifest(tmp_path):
+    import json
+
+    from compas.plugins import LazyPluginImpl
+    from compas.plugins import PluginManager
+
+    path = str(tmp_path / "plugins.json")
+
+    manager = PluginManager(manifest_path=path)
+    count = manager.load_plugins()
+    registry = {url: [plugin.id for plugin in plugins] for url, plugins in manager.registry.items()}
+
+    other = PluginManager(manifest_path=path)
+    assert other.load_plugins() == count
+    assert {url: [plugin.id for plugin in plugins] for url, plugins in other.registry.items()} == registry
+
+    url = "https://plugins.compas.dev/factories/register_scene_objects".replace("//", "/")
+    plugin = other.registry[url][0]
+    assert isinstance(plugin, LazyPluginImpl)
+    assert plugin.method is manager.registry[url][0].method
+
+    # the manifest is discarded if the environment changes
+    with open(path) as f:
+        manifest = json.load(f)
+    manifest["environment"]["python"] = "0.0.0"
+    with open(path, "w") as f:
+        json.dump(manifest, f)
+
+    other = PluginManager(manifest_path=path)
+    assert other.load_plugins() == count
+    assert not isinstance(other.registry[url][0], LazyPluginImpl)
+
+    other.clear_manifest()
+    assert not (tmp_path / "plugins.json").exists()
+    assert other.rebuild_manifest() == count
+    assert (tmp_path / "plugins.json").exists()
+
+
+def test_plugin_manifest_failed_modules(tmp_path, monkeypatch):
+    import importlib
+    import sys
+
+    from compas.plugins import LazyPluginImpl
+    from compas.plugins import PluginManager
+
+    # a package with a plugin module that depends on a module that is not installed yet
+    package = tmp_path / "packages" / "compas_manifest_test"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text('__all_plugins__ = ["compas_manifest_test.plugins"]\n')
+    (package / "plugins.py").write_text(
+        "import manifest_test_dependency  # noqa: F401\n"
+        "from compas.plugins import plugin\n\n\n"
+        '@plugin(category="tests", pluggable_name="manifest_pluggable")\n'
+        "def manifest_plugin():\n"
+        "    pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path / "packages"))
+    for name in ("compas_manifest_test", "compas_manifest_test.plugins", "manifest_test_dependency"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    path = str(tmp_path / "plugins.json")
+    url = "https://plugins.compas.dev/tests/manifest_pluggable".replace("//", "/")
+
+    manager = PluginManager(manifest_path=path)
+    count = manager.load_plugins()
+    assert url not in manager.registry
+
+    # the manifest is used as long as the plugin module cannot be imported
+    other = PluginManager(manifest_path=path)
+    assert other.load_plugins() == count
+    assert all(isinstance(plugin, LazyPluginImpl) for plugins in other.registry.values() for plugin in plugins)
+
+    # the plugins are discovered again once the missing module is installed
+    dependencies = tmp_path / "dependencies"
+    dependencies.mkdir()
+    (dependencies / "manifest_test_dependency.py").write_text("")
+    monkeypatch.syspath_prepend(str(dependencies))
+    importlib.invalidate_caches()
+
+    other = PluginManager(manifest_path=path)
+    assert other.load_plugins() == count + 1
+    assert [plugin.id for plugin in other.registry[url]] == ["compas_manifest_test.plugins.manifest_plugin"]
+
+    other = PluginManager(manifest_path=path)
+    assert other.load_plugins() == count + 1
+    assert isinstance(other.registry[url][0], LazyPluginImpl)
+
+
+def test_plugin_selection_cache(tmp_path):
+    import types
+
+    from compas.plugins import PluginManager
+    from compas.plugins import PluginValidator
+    from compas.plugins import plugin
+
+    manager = PluginManager(manifest_path=str(tmp_path / "plugins.json"))
+    validator = PluginValidator(manager)
+    url = "https://plugins.compas.dev/tests/cached_pluggable".replace("//", "/")
+
+    assert validator.select_plugin(url) is None
+    assert url in manager._selected_plugins
+
+    def first():
+        pass
+
+    module = types.ModuleType("first_plugins")
+    module.first = plugin(first, category="tests", pluggable_name="cached_pluggable")
+    manager.register_module(module)
+
+    assert url not in manager._selected_plugins
+    assert validator.select_plugin(url).method is first
+    assert [impl.method for impl in validator.collect_plugins(url)] == [first]
+
+    available = [False]
+
+    def second():
+        pass
+
+    module = types.ModuleType("second_plugins")
+    module.second = plugin(second, category="tests", pluggable_name="cached_pluggable", requires=[lambda: available[0]], tryfirst=True)
+    manager.register_module(module)
+
+    assert validator.select_plugin(url).method is first
+    available[0] = True
+    assert validator.select_plugin(url).method is second
+    assert url not in manager._selected_plugins